@@ -0,0 +1,103 @@
+"""
+Simple latency load test for the julee API.
+
+Issues a fixed number of GET requests against one or more endpoints of a
+running API, with bounded concurrency, and reports per-request latency
+percentiles for each endpoint. Run it against two builds of the API to
+compare the request-path overhead, e.g.::
+
+    python scripts/load_test_api.py --base-url http://localhost:8000 \\
+        --path /knowledge_service_queries/ --path /documents/ \\
+        --requests 2000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/knowledge_service_queries/",
+    "/knowledge_service_configs/",
+    "/assembly_specifications/",
+    "/documents/",
+]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    index = max(0, min(len(samples) - 1, round(pct / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+async def run_path(
+    client: httpx.AsyncClient, path: str, requests: int, concurrency: int
+) -> tuple[list[float], int, float]:
+    """Request a path repeatedly; return latencies, error count and duration."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one() -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return sorted(latencies), errors, time.perf_counter() - started
+
+
+async def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument(
+        "--path",
+        action="append",
+        dest="paths",
+        help="Endpoint to request (repeatable); defaults to the list endpoints",
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--warmup", type=int, default=20, help="Unmeasured requests per path"
+    )
+    args = parser.parse_args(argv)
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=30.0
+    ) as client:
+        print(
+            f"{'path':<32} {'reqs':>6} {'errs':>5} {'rps':>8} "
+            f"{'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for path in args.paths or DEFAULT_PATHS:
+            if args.warmup:
+                await run_path(client, path, args.warmup, args.concurrency)
+            latencies, errors, duration = await run_path(
+                client, path, args.requests, args.concurrency
+            )
+            print(
+                f"{path:<32} {len(latencies):>6} {errors:>5} "
+                f"{len(latencies) / duration:>8.1f} "
+                f"{statistics.fmean(latencies) * 1000:>8.2f} "
+                f"{percentile(latencies, 50) * 1000:>8.2f} "
+                f"{percentile(latencies, 95) * 1000:>8.2f} "
+                f"{percentile(latencies, 99) * 1000:>8.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
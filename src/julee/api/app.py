@@ -28,6 +28,7 @@ from fastapi_pagination.utils import disable_installed_extensions_check
 from julee.api.dependencies import (
     get_knowledge_service_config_repository,
     get_startup_dependencies,
+    initialize_repositories,
 )
 from julee.api.routers import (
     assembly_specifications_router,
@@ -81,6 +82,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if get_knowledge_service_config_repository in app.dependency_overrides:
             logger.info("Test mode detected, skipping system initialization")
         else:
+            # Build the shared request-path repositories, verifying their
+            # buckets once here instead of on every request
+            await resolve_dependency(app, initialize_repositories)
+
             # Normal production initialization
             startup_deps = await resolve_dependency(app, get_startup_dependencies)
             service = await startup_deps.get_system_initialization_service()
@@ -110,7 +115,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     yield
 
-    # Shutdown (if needed)
+    # Shutdown
+    prober = getattr(app.state, "health_prober", None)
+    if prober is not None:
+        await prober.stop()
+        del app.state.health_prober
     logger.info("Application shutdown")
 
 
@@ -10,6 +10,7 @@ The dependencies focus on real Minio implementations for production use,
 with test overrides available through FastAPI's dependency override system.
 """
 
+import asyncio
 import logging
 import os
 from typing import TYPE_CHECKING, Any
@@ -18,8 +19,8 @@ if TYPE_CHECKING:
     from julee.api.services.system_initialization import (
         SystemInitializationService,
     )
+    from julee.api.services.workflow_progress import WorkflowProgressHub
 
-from fastapi import Depends
 from minio import Minio
 from temporalio.client import Client
 from temporalio.contrib.pydantic import pydantic_data_converter
@@ -61,11 +62,18 @@ class DependencyContainer:
 
     def __init__(self) -> None:
         self._instances: dict[str, Any] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
 
     async def get_or_create(self, key: str, factory: Any) -> Any:
-        """Get or create a singleton instance."""
-        if key not in self._instances:
-            self._instances[key] = await factory()
+        """Get or create a singleton instance.
+
+        Concurrent first calls for the same key share a single factory call.
+        """
+        if key in self._instances:
+            return self._instances[key]
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            if key not in self._instances:
+                self._instances[key] = await factory()
         return self._instances[key]
 
     async def get_temporal_client(self) -> Client:
@@ -98,6 +106,21 @@ class DependencyContainer:
         )
         return client
 
+    async def get_workflow_progress_hub(self) -> "WorkflowProgressHub":
+        """Get or create the shared workflow progress hub."""
+        hub = await self.get_or_create(
+            "workflow_progress_hub", self._create_workflow_progress_hub
+        )
+        return hub  # type: ignore[no-any-return]
+
+    async def _create_workflow_progress_hub(self) -> "WorkflowProgressHub":
+        """Create the workflow progress hub on the shared Temporal client."""
+        from julee.api.services.workflow_progress import WorkflowProgressHub
+
+        poll_interval = float(os.environ.get("JULEE_PROGRESS_POLL_INTERVAL", "1.0"))
+        client = await self.get_temporal_client()
+        return WorkflowProgressHub(client, poll_interval=poll_interval)
+
     async def get_minio_client(self) -> MinioClient:
         """Get or create Minio client."""
         client = await self.get_or_create("minio_client", self._create_minio_client)
@@ -130,6 +153,72 @@ class DependencyContainer:
         logger.debug("Minio client created", extra={"endpoint": endpoint})
         return client  # type: ignore[return-value]
 
+    async def _get_minio_repository(self, key: str, repository_cls: type) -> Any:
+        """Get or create a Minio-backed repository on the shared client.
+
+        Repository constructors verify (and if needed create) their buckets,
+        which is blocking I/O, so construction runs in a worker thread and
+        happens once per process rather than once per request.
+        """
+
+        async def create() -> Any:
+            minio_client = await self.get_minio_client()
+            repository = await asyncio.to_thread(repository_cls, client=minio_client)
+            logger.debug("Repository created", extra={"repository": key})
+            return repository
+
+        return await self.get_or_create(key, create)
+
+    async def get_knowledge_service_query_repository(
+        self,
+    ) -> KnowledgeServiceQueryRepository:
+        """Get or create the knowledge service query repository."""
+        repo = await self._get_minio_repository(
+            "knowledge_service_query_repository",
+            MinioKnowledgeServiceQueryRepository,
+        )
+        return repo  # type: ignore[no-any-return]
+
+    async def get_knowledge_service_config_repository(
+        self,
+    ) -> KnowledgeServiceConfigRepository:
+        """Get or create the knowledge service config repository."""
+        repo = await self._get_minio_repository(
+            "knowledge_service_config_repository",
+            MinioKnowledgeServiceConfigRepository,
+        )
+        return repo  # type: ignore[no-any-return]
+
+    async def get_assembly_specification_repository(
+        self,
+    ) -> AssemblySpecificationRepository:
+        """Get or create the assembly specification repository."""
+        repo = await self._get_minio_repository(
+            "assembly_specification_repository",
+            MinioAssemblySpecificationRepository,
+        )
+        return repo  # type: ignore[no-any-return]
+
+    async def get_document_repository(self) -> DocumentRepository:
+        """Get or create the document repository."""
+        repo = await self._get_minio_repository(
+            "document_repository", MinioDocumentRepository
+        )
+        return repo  # type: ignore[no-any-return]
+
+    async def initialize_repositories(self) -> None:
+        """Create every request-scoped repository up front.
+
+        Called at application startup so bucket verification happens before
+        the first request rather than during it.
+        """
+        await asyncio.gather(
+            self.get_knowledge_service_query_repository(),
+            self.get_knowledge_service_config_repository(),
+            self.get_assembly_specification_repository(),
+            self.get_document_repository(),
+        )
+
 
 # Global container instance
 _container = DependencyContainer()
@@ -145,32 +234,34 @@ async def get_minio_client() -> MinioClient:
     return await _container.get_minio_client()
 
 
-async def get_knowledge_service_query_repository(
-    minio_client: MinioClient = Depends(get_minio_client),
-) -> KnowledgeServiceQueryRepository:
+async def get_workflow_progress_hub() -> "WorkflowProgressHub":
+    """FastAPI dependency for the shared workflow progress hub."""
+    return await _container.get_workflow_progress_hub()
+
+
+async def get_knowledge_service_query_repository() -> KnowledgeServiceQueryRepository:
     """FastAPI dependency for KnowledgeServiceQueryRepository."""
-    return MinioKnowledgeServiceQueryRepository(client=minio_client)
+    return await _container.get_knowledge_service_query_repository()
 
 
-async def get_knowledge_service_config_repository(
-    minio_client: MinioClient = Depends(get_minio_client),
-) -> KnowledgeServiceConfigRepository:
+async def get_knowledge_service_config_repository() -> KnowledgeServiceConfigRepository:
     """FastAPI dependency for KnowledgeServiceConfigRepository."""
-    return MinioKnowledgeServiceConfigRepository(client=minio_client)
+    return await _container.get_knowledge_service_config_repository()
 
 
-async def get_assembly_specification_repository(
-    minio_client: MinioClient = Depends(get_minio_client),
-) -> AssemblySpecificationRepository:
+async def get_assembly_specification_repository() -> AssemblySpecificationRepository:
     """FastAPI dependency for AssemblySpecificationRepository."""
-    return MinioAssemblySpecificationRepository(client=minio_client)
+    return await _container.get_assembly_specification_repository()
 
 
-async def get_document_repository(
-    minio_client: MinioClient = Depends(get_minio_client),
-) -> DocumentRepository:
+async def get_document_repository() -> DocumentRepository:
     """FastAPI dependency for DocumentRepository."""
-    return MinioDocumentRepository(client=minio_client)
+    return await _container.get_document_repository()
+
+
+async def initialize_repositories() -> None:
+    """Create the shared repositories (and verify their buckets) at startup."""
+    await _container.initialize_repositories()
 
 
 class StartupDependenciesProvider:
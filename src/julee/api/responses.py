@@ -42,3 +42,5 @@ class HealthCheckResponse(BaseModel):
     status: SystemStatus
     timestamp: str
     services: ServiceHealthStatus
+    checked_at: str | None = None  # when the dependent services were probed
+    age_seconds: float | None = None
@@ -8,6 +8,7 @@ Routes defined at root level:
 - GET / - List all documents with pagination
 - GET /{document_id} - Get document metadata by ID
 - GET /{document_id}/content - Get document content by ID
+- POST / - Upload a document (streaming multipart/form-data)
 
 These routes are mounted with '/documents' prefix in the main app.
 """
@@ -15,11 +16,18 @@ These routes are mounted with '/documents' prefix in the main app.
 import logging
 from typing import cast
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Request
 from fastapi.responses import Response
 from fastapi_pagination import Page, paginate
 
 from julee.api.dependencies import get_document_repository
+from julee.api.uploads import (
+    SNIFF_BYTES,
+    MultipartFileStream,
+    StreamingDocumentRepository,
+    peek,
+    sniff_content_type,
+)
 from julee.contrib.ceap.domain.models.document import Document
 from julee.contrib.ceap.domain.repositories.document import DocumentRepository
 
@@ -62,6 +70,73 @@ async def list_documents(
         ) from e
 
 
+@router.post("/", response_model=Document, status_code=201)
+async def upload_document(
+    request: Request,
+    repository: DocumentRepository = Depends(get_document_repository),
+) -> Document:
+    """
+    Upload a document as multipart/form-data with a single ``file`` part.
+
+    The body is parsed as it arrives and the file is streamed to storage,
+    with its multihash calculated on the way, so uploads are never held in
+    memory as a whole. The content type is sniffed from the first bytes of
+    the file, falling back to the declared part type when nothing more
+    specific is recognised.
+
+    Args:
+        request: Incoming request, read as a stream
+        repository: Document repository dependency
+
+    Returns:
+        Metadata of the stored document
+
+    Raises:
+        HTTPException: If the upload is malformed or storage fails
+    """
+    if not isinstance(repository, StreamingDocumentRepository):
+        raise HTTPException(
+            status_code=501,
+            detail="Document storage does not support streaming uploads",
+        )
+
+    try:
+        upload = MultipartFileStream(
+            request.stream(), request.headers.get("content-type", "")
+        )
+        await upload.open()
+        head, chunks = await peek(upload, SNIFF_BYTES)
+        content_type = sniff_content_type(head, upload.declared_content_type)
+
+        document_id = await repository.generate_id()
+        logger.info(
+            "Uploading document %s (%s, %s)",
+            document_id,
+            upload.filename,
+            content_type,
+        )
+        document = await repository.save_stream(
+            document_id,
+            chunks,
+            original_filename=upload.filename or document_id,
+            content_type=content_type,
+        )
+
+    except ValueError as e:
+        logger.warning("Rejected document upload: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error("Failed to upload document: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to upload document") from e
+
+    # Only metadata is returned; release the content stream
+    if document.content is not None:
+        document.content.stream.close()
+
+    logger.info("Uploaded document %s (%d bytes)", document_id, document.size_bytes)
+    return document
+
+
 @router.get("/{document_id}", response_model=Document)
 async def get_document(
     document_id: str = Path(..., description="Document ID"),
@@ -5,7 +5,7 @@ This module provides system-level API endpoints including health checks,
 status information, and other operational endpoints.
 
 Routes defined at root level:
-- GET /health - Health check endpoint
+- GET /health - Health check endpoint (served from a background probe)
 
 These routes are mounted at the root level in the main app.
 """
@@ -13,18 +13,18 @@ These routes are mounted at the root level in the main app.
 import asyncio
 import logging
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter
-from minio import Minio
-from temporalio.client import Client
+from fastapi import APIRouter, Request
 
+from julee.api.dependencies import get_minio_client, get_temporal_client
 from julee.api.responses import (
     HealthCheckResponse,
     ServiceHealthStatus,
     ServiceStatus,
     SystemStatus,
 )
+from julee.api.services.health_prober import HealthProber
 
 logger = logging.getLogger(__name__)
 
@@ -35,15 +35,12 @@ router = APIRouter()
 async def check_temporal_health() -> ServiceStatus:
     """Check if Temporal service is available."""
     try:
-        # Get Temporal server address from environment or use default
-        temporal_address = os.getenv(
-            "TEMPORAL_ENDPOINT", os.getenv("TEMPORAL_HOST", "localhost:7233")
+        # Reuse the shared client rather than opening a new connection
+        client = await get_temporal_client()
+        healthy = await client.service_client.check_health(
+            timeout=timedelta(seconds=_health_probe_timeout())
         )
-
-        # Create a client and try to connect
-        _ = await Client.connect(temporal_address, namespace="default")
-        # Simple check - if we can connect, assume it's working
-        return ServiceStatus.UP
+        return ServiceStatus.UP if healthy else ServiceStatus.DOWN
     except Exception as e:
         logger.warning("Temporal health check failed: %s", e)
         return ServiceStatus.DOWN
@@ -52,22 +49,10 @@ async def check_temporal_health() -> ServiceStatus:
 async def check_storage_health() -> ServiceStatus:
     """Check if storage service (Minio) is available."""
     try:
-        # Get Minio configuration (prioritize Docker network address)
-        endpoint = os.environ.get("MINIO_ENDPOINT", "localhost:9000")
-        access_key = os.environ.get("MINIO_ACCESS_KEY", "minioadmin")
-        secret_key = os.environ.get("MINIO_SECRET_KEY", "minioadmin")
-        secure = os.environ.get("MINIO_SECURE", "false").lower() == "true"
-
-        # Create Minio client
-        client = Minio(
-            endpoint=endpoint,
-            access_key=access_key,
-            secret_key=secret_key,
-            secure=secure,
-        )
+        client = await get_minio_client()
 
-        # Test connection by listing buckets
-        _ = list(client.list_buckets())
+        # Test connection by listing buckets (blocking call, so off the loop)
+        _ = await asyncio.to_thread(client.list_buckets)  # type: ignore[attr-defined]
         return ServiceStatus.UP
     except Exception as e:
         logger.warning("Storage health check failed: %s", e)
@@ -92,47 +77,64 @@ def determine_overall_status(services: ServiceHealthStatus) -> SystemStatus:
         return SystemStatus.UNHEALTHY
 
 
-@router.get("/health", response_model=HealthCheckResponse)
-async def health_check() -> HealthCheckResponse:
-    """Comprehensive health check endpoint that checks all services."""
-    logger.info("Performing health check")
-
-    # Check all services concurrently
-    results = await asyncio.gather(
-        check_api_health(),
-        check_temporal_health(),
-        check_storage_health(),
-        return_exceptions=True,
+def _health_probe_interval() -> float:
+    return float(os.environ.get("JULEE_HEALTH_PROBE_INTERVAL", "10.0"))
+
+
+def _health_probe_timeout() -> float:
+    return float(os.environ.get("JULEE_HEALTH_PROBE_TIMEOUT", "2.0"))
+
+
+def create_health_prober() -> HealthProber:
+    """Create a prober for the services reported by the health endpoint.
+
+    The checks are looked up on this module at call time, so patching
+    check_temporal_health or check_storage_health affects the prober too.
+    """
+    return HealthProber(
+        {
+            "temporal": lambda: check_temporal_health(),
+            "storage": lambda: check_storage_health(),
+        },
+        interval_seconds=_health_probe_interval(),
+        timeout_seconds=_health_probe_timeout(),
     )
 
-    # Handle any exceptions from the health checks
-    api_status = results[0]
-    temporal_status = results[1]
-    storage_status = results[2]
-
-    if isinstance(api_status, Exception):
-        logger.error("API health check error: %s", api_status)
-        api_status = ServiceStatus.DOWN
-    if isinstance(temporal_status, Exception):
-        logger.error("Temporal health check error: %s", temporal_status)
-        temporal_status = ServiceStatus.DOWN
-    if isinstance(storage_status, Exception):
-        logger.error("Storage health check error: %s", storage_status)
-        storage_status = ServiceStatus.DOWN
-
-    # Create service health status with proper typing
+
+def get_health_prober(request: Request) -> HealthProber:
+    """Get the app's health prober, creating it on first use."""
+    prober: HealthProber | None = getattr(request.app.state, "health_prober", None)
+    if prober is None:
+        prober = create_health_prober()
+        request.app.state.health_prober = prober
+    return prober
+
+
+@router.get("/health", response_model=HealthCheckResponse)
+async def health_check(request: Request) -> HealthCheckResponse:
+    """Health check endpoint reporting the status of all services.
+
+    Dependent services are probed in the background; this endpoint serves
+    the most recent results along with when they were gathered, so it
+    answers immediately regardless of the state of those services.
+    """
+    snapshot = await get_health_prober(request).get_snapshot()
+
     services = ServiceHealthStatus(
-        api=ServiceStatus(api_status),
-        temporal=ServiceStatus(temporal_status),
-        storage=ServiceStatus(storage_status),
+        api=await check_api_health(),
+        temporal=snapshot.statuses.get("temporal", ServiceStatus.DOWN),
+        storage=snapshot.statuses.get("storage", ServiceStatus.DOWN),
     )
 
     # Determine overall status
     overall_status = determine_overall_status(services)
 
     # Return response with string timestamp as expected by frontend
+    now = datetime.now(timezone.utc)
     return HealthCheckResponse(
         status=overall_status,
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=now.isoformat(),
         services=services,
+        checked_at=snapshot.checked_at.isoformat(),
+        age_seconds=snapshot.age_seconds(now),
     )
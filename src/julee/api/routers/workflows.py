@@ -6,20 +6,33 @@ monitoring, and managing workflows in the system.
 
 Routes defined at root level:
 - POST /extract-assemble - Start extract-assemble workflow
+- POST /extract-assemble/batch - Start many extract-assemble workflows
 - GET /{workflow_id}/status - Get workflow status
+- GET /progress - Stream progress for many workflows (server-sent events)
+- GET /batches/{batch_id}/status - Get aggregated batch status
 - GET / - List workflows
 
 These routes are mounted with '/workflows' prefix in the main app.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import re
 import uuid
+from collections.abc import AsyncIterator
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from temporalio.client import Client
+from temporalio.client import Client, WorkflowExecution
+from temporalio.common import WorkflowIDReusePolicy
+from temporalio.exceptions import WorkflowAlreadyStartedError
 
-from julee.api.dependencies import get_temporal_client
+from julee.api.dependencies import get_temporal_client, get_workflow_progress_hub
+from julee.api.services.workflow_progress import WorkflowProgressHub
 from julee.contrib.ceap.apps.worker.extract_assemble import (
     EXTRACT_ASSEMBLE_RETRY_POLICY,
     ExtractAssembleWorkflow,
@@ -29,6 +42,57 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+EXTRACT_ASSEMBLE_TASK_QUEUE = "julee-extract-assemble-queue"
+
+# Batch ids end up in visibility queries, so keep them to a safe alphabet
+BATCH_ID_PATTERN = r"^[A-Za-z0-9_-]+$"
+MAX_BATCH_SIZE = 10_000
+
+# Resubmitting a batch re-runs only its items that failed, were cancelled,
+# terminated or timed out: running and completed items are rejected by
+# Temporal rather than started, and paid for, again
+BATCH_ID_REUSE_POLICY = WorkflowIDReusePolicy.ALLOW_DUPLICATE_FAILED_ONLY
+
+MAX_PROGRESS_WORKFLOWS = 200
+PROGRESS_HEARTBEAT_SECONDS = 15.0
+
+
+def _batch_start_concurrency() -> int:
+    """Maximum number of workflow starts in flight for one batch request."""
+    try:
+        return max(1, int(os.environ.get("JULEE_BATCH_START_CONCURRENCY", "32")))
+    except ValueError:
+        return 32
+
+
+def batch_workflow_id_prefix(batch_id: str) -> str:
+    """Workflow id prefix shared by every workflow in a batch.
+
+    The prefix ends in a character batch ids cannot contain, so no batch's
+    prefix is a prefix of another batch's workflow ids.
+    """
+    return f"extract-assemble-batch-{batch_id}:"
+
+
+def batch_workflow_id(
+    batch_id: str, document_id: str, assembly_specification_id: str
+) -> str:
+    """Deterministic workflow id for one item of a batch.
+
+    Resubmitting the same batch yields the same ids, so Temporal rejects
+    duplicates of running and completed items (see
+    BATCH_ID_REUSE_POLICY) instead of starting the work twice. The ids
+    are readable, and end in a digest of the pair so that different pairs
+    joining to the same text still get different ids.
+    """
+    digest = hashlib.sha256(
+        json.dumps([document_id, assembly_specification_id]).encode("utf-8")
+    ).hexdigest()[:16]
+    return (
+        f"{batch_workflow_id_prefix(batch_id)}"
+        f"{document_id}-{assembly_specification_id}-{digest}"
+    )
+
 
 class StartExtractAssembleRequest(BaseModel):
     """Request model for starting extract-assemble workflow."""
@@ -44,6 +108,65 @@ class StartExtractAssembleRequest(BaseModel):
     )
 
 
+class ExtractAssembleBatchItem(BaseModel):
+    """One document/specification pair in a batch request."""
+
+    document_id: str = Field(..., min_length=1, description="Document ID to process")
+    assembly_specification_id: str = Field(
+        ..., min_length=1, description="Assembly specification ID to use"
+    )
+
+
+class StartExtractAssembleBatchRequest(BaseModel):
+    """Request model for starting a batch of extract-assemble workflows."""
+
+    items: list[ExtractAssembleBatchItem] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE
+    )
+    batch_id: str | None = Field(
+        None,
+        min_length=1,
+        max_length=64,
+        pattern=BATCH_ID_PATTERN,
+        description=(
+            "Optional batch ID (auto-generated if not provided). Reusing a "
+            "batch ID makes resubmission idempotent: only items whose "
+            "workflow is missing or did not complete are started again."
+        ),
+    )
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of starting one workflow in a batch."""
+
+    document_id: str
+    assembly_specification_id: str
+    workflow_id: str
+    # "STARTED", "ALREADY_STARTED" (running or completed) or "FAILED"
+    status: str
+    run_id: str | None = None
+    error: str | None = None
+
+
+class StartBatchResponse(BaseModel):
+    """Response model for starting a batch of workflows."""
+
+    batch_id: str
+    started: int
+    already_started: int
+    failed: int
+    items: list[BatchItemResult]
+
+
+class BatchStatusResponse(BaseModel):
+    """Aggregated status of the workflows in a batch."""
+
+    batch_id: str
+    total: int
+    status_counts: dict[str, int]
+    completed: bool
+
+
 class WorkflowStatusResponse(BaseModel):
     """Response model for workflow status."""
 
@@ -106,7 +229,7 @@ async def start_extract_assemble_workflow(
             ExtractAssembleWorkflow.run,
             args=[request.document_id, request.assembly_specification_id],
             id=workflow_id,
-            task_queue="julee-extract-assemble-queue",
+            task_queue=EXTRACT_ASSEMBLE_TASK_QUEUE,
             retry_policy=EXTRACT_ASSEMBLE_RETRY_POLICY,
         )
 
@@ -137,6 +260,207 @@ async def start_extract_assemble_workflow(
         raise HTTPException(status_code=500, detail="Failed to start workflow") from e
 
 
+@router.post("/extract-assemble/batch", response_model=StartBatchResponse)
+async def start_extract_assemble_batch(
+    request: StartExtractAssembleBatchRequest,
+    temporal_client: Client = Depends(get_temporal_client),
+) -> StartBatchResponse:
+    """
+    Start an extract-assemble workflow for every item in a batch.
+
+    Workflows are started concurrently, with at most
+    JULEE_BATCH_START_CONCURRENCY starts in flight. Workflow ids are
+    derived from the batch id and the item, so resubmitting a batch only
+    starts the workflows that are missing or did not complete; running
+    and completed ones are reported as ALREADY_STARTED. Duplicate items
+    are started once.
+
+    Args:
+        request: Items to process and an optional batch id
+        temporal_client: Temporal client dependency
+
+    Returns:
+        Batch id and the per-item start outcome
+    """
+    batch_id = request.batch_id or uuid.uuid4().hex
+    semaphore = asyncio.Semaphore(_batch_start_concurrency())
+
+    items = list(
+        {
+            (item.document_id, item.assembly_specification_id): item
+            for item in request.items
+        }.values()
+    )
+
+    logger.info(
+        "Starting extract-assemble batch",
+        extra={"batch_id": batch_id, "item_count": len(items)},
+    )
+
+    async def start_item(item: ExtractAssembleBatchItem) -> BatchItemResult:
+        workflow_id = batch_workflow_id(
+            batch_id, item.document_id, item.assembly_specification_id
+        )
+        result = BatchItemResult(
+            document_id=item.document_id,
+            assembly_specification_id=item.assembly_specification_id,
+            workflow_id=workflow_id,
+            status="STARTED",
+        )
+        async with semaphore:
+            try:
+                handle = await temporal_client.start_workflow(
+                    ExtractAssembleWorkflow.run,
+                    args=[item.document_id, item.assembly_specification_id],
+                    id=workflow_id,
+                    task_queue=EXTRACT_ASSEMBLE_TASK_QUEUE,
+                    retry_policy=EXTRACT_ASSEMBLE_RETRY_POLICY,
+                    id_reuse_policy=BATCH_ID_REUSE_POLICY,
+                )
+                result.run_id = handle.run_id
+            except WorkflowAlreadyStartedError:
+                result.status = "ALREADY_STARTED"
+            except Exception as e:
+                logger.error(
+                    "Failed to start batch workflow: %s",
+                    e,
+                    extra={"batch_id": batch_id, "workflow_id": workflow_id},
+                )
+                result.status = "FAILED"
+                result.error = "Failed to start workflow"
+        return result
+
+    results = await asyncio.gather(*(start_item(item) for item in items))
+
+    response = StartBatchResponse(
+        batch_id=batch_id,
+        started=sum(r.status == "STARTED" for r in results),
+        already_started=sum(r.status == "ALREADY_STARTED" for r in results),
+        failed=sum(r.status == "FAILED" for r in results),
+        items=results,
+    )
+
+    logger.info(
+        "Extract-assemble batch submitted",
+        extra={
+            "batch_id": batch_id,
+            "started": response.started,
+            "already_started": response.already_started,
+            "failed": response.failed,
+        },
+    )
+
+    return response
+
+
+@router.get("/batches/{batch_id}/status", response_model=BatchStatusResponse)
+async def get_batch_status(
+    batch_id: str,
+    temporal_client: Client = Depends(get_temporal_client),
+) -> BatchStatusResponse:
+    """
+    Get the aggregated status of a batch from Temporal visibility.
+
+    Args:
+        batch_id: Batch id returned when the batch was started
+        temporal_client: Temporal client dependency
+
+    Returns:
+        Workflow counts by execution status
+
+    Raises:
+        HTTPException: If the batch id is invalid, unknown or the
+            visibility query fails
+    """
+    if not re.match(BATCH_ID_PATTERN, batch_id):
+        raise HTTPException(status_code=422, detail="Invalid batch ID")
+
+    # Restrict to the parent type so query-group child workflows, whose ids
+    # extend the parent's, are not counted
+    query = (
+        f'WorkflowId STARTS_WITH "{batch_workflow_id_prefix(batch_id)}" '
+        f'AND WorkflowType = "{ExtractAssembleWorkflow.__name__}"'
+    )
+
+    # Visibility lists every run, so each workflow retried by its retry
+    # policy or re-run by a resubmission is counted by its latest run
+    latest: dict[str, WorkflowExecution] = {}
+    try:
+        async for execution in temporal_client.list_workflows(query=query):
+            current = latest.get(execution.id)
+            if current is None or execution.start_time > current.start_time:
+                latest[execution.id] = execution
+    except Exception as e:
+        logger.error(
+            "Failed to query batch status: %s",
+            e,
+            extra={"batch_id": batch_id},
+        )
+        raise HTTPException(
+            status_code=500, detail="Failed to retrieve batch status"
+        ) from e
+
+    status_counts: dict[str, int] = {}
+    for execution in latest.values():
+        status = execution.status.name if execution.status else "UNKNOWN"
+        status_counts[status] = status_counts.get(status, 0) + 1
+
+    total = len(latest)
+    if total == 0:
+        raise HTTPException(
+            status_code=404, detail=f"Batch with ID '{batch_id}' not found"
+        )
+
+    return BatchStatusResponse(
+        batch_id=batch_id,
+        total=total,
+        status_counts=status_counts,
+        completed=status_counts.get("RUNNING", 0) == 0,
+    )
+
+
+@router.get("/progress")
+async def stream_workflow_progress(
+    workflow_id: list[str] = Query(
+        ..., min_length=1, max_length=MAX_PROGRESS_WORKFLOWS
+    ),
+    hub: WorkflowProgressHub = Depends(get_workflow_progress_hub),
+) -> StreamingResponse:
+    """
+    Stream progress for one or more workflows as server-sent events.
+
+    Pass each workflow as a repeated ``workflow_id`` query parameter. A
+    ``progress`` event carrying the workflow's status and current step is
+    sent whenever either changes; an ``end`` event is sent and the stream
+    closed once every workflow has finished. Polling Temporal is shared
+    across all connected clients, so the cost per watched workflow does not
+    grow with the number of watchers.
+
+    Args:
+        workflow_id: Workflow IDs to watch
+        hub: Shared workflow progress hub
+
+    Returns:
+        text/event-stream response
+    """
+
+    async def events() -> AsyncIterator[str]:
+        async for progress in hub.watch(
+            workflow_id, heartbeat_seconds=PROGRESS_HEARTBEAT_SECONDS
+        ):
+            if progress is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: progress\ndata: {progress.model_dump_json()}\n\n"
+        yield "event: end\ndata: {}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{workflow_id}/status", response_model=WorkflowStatusResponse)
 async def get_workflow_status(
     workflow_id: str,
@@ -13,8 +13,14 @@ Services follow clean architecture principles:
 - Maintain separation between API and domain layers
 """
 
+from .health_prober import HealthProber, HealthSnapshot
 from .system_initialization import SystemInitializationService
+from .workflow_progress import WorkflowProgress, WorkflowProgressHub
 
 __all__ = [
+    "HealthProber",
+    "HealthSnapshot",
     "SystemInitializationService",
+    "WorkflowProgress",
+    "WorkflowProgressHub",
 ]
@@ -0,0 +1,119 @@
+"""
+Background health prober for the julee CEAP system.
+
+This module provides a prober that checks dependent services on an interval
+and keeps the latest results in memory, so health endpoints can answer from
+a snapshot instead of contacting every dependency on every request. Each
+check is bounded by a timeout, so a slow dependency is reported as down
+rather than slowing down the health endpoint.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime, timezone
+
+from pydantic import BaseModel
+
+from julee.api.responses import ServiceStatus
+
+logger = logging.getLogger(__name__)
+
+HealthCheck = Callable[[], Awaitable[ServiceStatus]]
+
+
+class HealthSnapshot(BaseModel):
+    """Result of one round of health checks."""
+
+    statuses: dict[str, ServiceStatus]
+    checked_at: datetime
+
+    def age_seconds(self, now: datetime | None = None) -> float:
+        """Seconds since the checks in this snapshot ran."""
+        now = now or datetime.now(timezone.utc)
+        return max(0.0, (now - self.checked_at).total_seconds())
+
+
+class HealthProber:
+    """
+    Periodically runs health checks and caches the latest snapshot.
+
+    The background loop is started on first use. Until its first round has
+    finished, callers of get_snapshot() wait for it (bounded by the probe
+    timeout); afterwards they always get the cached snapshot immediately.
+    """
+
+    def __init__(
+        self,
+        checks: Mapping[str, HealthCheck],
+        interval_seconds: float = 10.0,
+        timeout_seconds: float = 2.0,
+    ) -> None:
+        self._checks = dict(checks)
+        self._interval = interval_seconds
+        self._timeout = timeout_seconds
+        self._snapshot: HealthSnapshot | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._first_round = asyncio.Event()
+
+    @property
+    def snapshot(self) -> HealthSnapshot | None:
+        """Latest snapshot, or None if no round has completed yet."""
+        return self._snapshot
+
+    async def get_snapshot(self) -> HealthSnapshot:
+        """Return the cached snapshot, waiting for the first round if needed."""
+        self.start()
+        if self._snapshot is None:
+            await self._first_round.wait()
+        assert self._snapshot is not None
+        return self._snapshot
+
+    def start(self) -> None:
+        """Start the background probe loop if it is not running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background probe loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refresh(self) -> HealthSnapshot:
+        """Run every check once and store the result.
+
+        Concurrent callers share a single round of checks.
+        """
+        async with self._refresh_lock:
+            names = list(self._checks)
+            results = await asyncio.gather(*(self._probe(name) for name in names))
+            self._snapshot = HealthSnapshot(
+                statuses=dict(zip(names, results, strict=True)),
+                checked_at=datetime.now(timezone.utc),
+            )
+            self._first_round.set()
+            return self._snapshot
+
+    async def _probe(self, name: str) -> ServiceStatus:
+        try:
+            return await asyncio.wait_for(self._checks[name](), self._timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Health check timed out",
+                extra={"service": name, "timeout_seconds": self._timeout},
+            )
+        except Exception as e:
+            logger.warning("Health check for %s failed: %s", name, e)
+        return ServiceStatus.DOWN
+
+    async def _run(self) -> None:
+        while True:
+            if self._snapshot is None or self._snapshot.age_seconds() >= self._interval:
+                await self.refresh()
+            await asyncio.sleep(self._interval)
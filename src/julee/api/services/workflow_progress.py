@@ -0,0 +1,166 @@
+"""
+Workflow progress hub for the julee CEAP system.
+
+This module provides a shared, server-side poller for workflow progress.
+Any number of API clients can watch any number of workflows; each watched
+workflow is described (and its current step queried) at most once per poll
+interval no matter how many watchers it has, and watchers only receive an
+update when the workflow's progress actually changes.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Iterable
+
+from pydantic import BaseModel
+from temporalio.client import Client, WorkflowExecutionStatus
+
+logger = logging.getLogger(__name__)
+
+
+class WorkflowProgress(BaseModel):
+    """Snapshot of a workflow's progress."""
+
+    workflow_id: str
+    run_id: str | None = None
+    status: str  # "RUNNING", "COMPLETED", "FAILED", ..., or "NOT_FOUND"
+    current_step: str | None = None
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the workflow will make no further progress."""
+        return self.status != WorkflowExecutionStatus.RUNNING.name
+
+
+class WorkflowProgressHub:
+    """
+    Multiplexes workflow progress to many watchers with one poller.
+
+    The poll loop runs only while there are watchers. Each iteration
+    refreshes every watched, non-terminal workflow concurrently and fans
+    changed snapshots out to the watchers' queues.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        poll_interval: float = 1.0,
+        max_concurrent_describes: int = 20,
+    ) -> None:
+        self._client = client
+        self._poll_interval = poll_interval
+        self._describe_semaphore = asyncio.Semaphore(max_concurrent_describes)
+        self._watchers: dict[str, set[asyncio.Queue[WorkflowProgress]]] = {}
+        self._latest: dict[str, WorkflowProgress] = {}
+        self._poller: asyncio.Task[None] | None = None
+
+    @property
+    def watched_workflow_ids(self) -> set[str]:
+        """Workflow ids that currently have at least one watcher."""
+        return set(self._watchers)
+
+    async def watch(
+        self,
+        workflow_ids: Iterable[str],
+        heartbeat_seconds: float | None = None,
+    ) -> AsyncIterator[WorkflowProgress | None]:
+        """Yield progress snapshots for the given workflows as they change.
+
+        The latest known snapshot of each workflow is yielded first. The
+        iterator finishes once every watched workflow is terminal. If
+        heartbeat_seconds is set, None is yielded whenever that long passes
+        without an update, so callers can keep idle connections alive.
+        """
+        ids = list(dict.fromkeys(workflow_ids))
+        queue: asyncio.Queue[WorkflowProgress] = asyncio.Queue()
+        pending = set(ids)
+
+        for workflow_id in ids:
+            self._watchers.setdefault(workflow_id, set()).add(queue)
+            latest = self._latest.get(workflow_id)
+            if latest is not None:
+                queue.put_nowait(latest)
+        self._ensure_poller()
+
+        try:
+            while pending:
+                try:
+                    progress = await asyncio.wait_for(queue.get(), heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if progress.is_terminal:
+                    pending.discard(progress.workflow_id)
+                yield progress
+        finally:
+            for workflow_id in ids:
+                watchers = self._watchers.get(workflow_id)
+                if watchers is None:
+                    continue
+                watchers.discard(queue)
+                if not watchers:
+                    del self._watchers[workflow_id]
+                    self._latest.pop(workflow_id, None)
+
+    def _ensure_poller(self) -> None:
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll_loop())
+
+    async def _poll_loop(self) -> None:
+        while self._watchers:
+            await self.poll_once()
+            await asyncio.sleep(self._poll_interval)
+        self._poller = None
+
+    async def poll_once(self) -> None:
+        """Refresh every watched, non-terminal workflow once."""
+        workflow_ids = [
+            workflow_id
+            for workflow_id in self._watchers
+            if workflow_id not in self._latest
+            or not self._latest[workflow_id].is_terminal
+        ]
+        snapshots = await asyncio.gather(
+            *(self._fetch(workflow_id) for workflow_id in workflow_ids)
+        )
+        for progress in snapshots:
+            if progress is None or progress == self._latest.get(progress.workflow_id):
+                continue
+            self._latest[progress.workflow_id] = progress
+            for queue in self._watchers.get(progress.workflow_id, ()):
+                queue.put_nowait(progress)
+
+    async def _fetch(self, workflow_id: str) -> WorkflowProgress | None:
+        """Describe a workflow and query its current step."""
+        async with self._describe_semaphore:
+            handle = self._client.get_workflow_handle(workflow_id)
+            try:
+                description = await handle.describe()
+            except Exception as e:
+                error_message = str(e).lower()
+                if "not found" in error_message or "notfound" in error_message:
+                    return WorkflowProgress(workflow_id=workflow_id, status="NOT_FOUND")
+                logger.warning(
+                    "Failed to describe watched workflow: %s",
+                    e,
+                    extra={"workflow_id": workflow_id},
+                )
+                return None
+
+            status = description.status.name if description.status else "UNKNOWN"
+            current_step = None
+            try:
+                current_step = await handle.query("get_current_step")
+            except Exception as query_error:
+                logger.debug(
+                    "Could not query workflow step: %s",
+                    query_error,
+                    extra={"workflow_id": workflow_id},
+                )
+
+            return WorkflowProgress(
+                workflow_id=workflow_id,
+                run_id=description.run_id,
+                status=status,
+                current_step=current_step,
+            )
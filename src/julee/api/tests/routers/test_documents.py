@@ -17,6 +17,8 @@ from julee.api.dependencies import get_document_repository
 from julee.api.routers.documents import router
 from julee.contrib.ceap.domain.models.document import Document, DocumentStatus
 from julee.repositories.memory import MemoryDocumentRepository
+from julee.repositories.minio.document import MinioDocumentRepository
+from julee.repositories.minio.tests.fake_client import FakeMinioClient
 
 pytestmark = pytest.mark.unit
 
@@ -302,3 +304,94 @@ class TestGetDocumentContent:
         assert response.status_code == 422
         data = response.json()
         assert "has no content" in data["detail"].lower()
+
+
+class TestUploadDocument:
+    """Test streaming document uploads."""
+
+    @pytest.fixture
+    def minio_client(self) -> FakeMinioClient:
+        return FakeMinioClient()
+
+    @pytest.fixture
+    def upload_client(
+        self, minio_client: FakeMinioClient
+    ) -> Generator[TestClient, None, None]:
+        """Create a test client backed by streaming-capable storage."""
+        app = FastAPI()
+        repository = MinioDocumentRepository(minio_client)
+        app.dependency_overrides[get_document_repository] = lambda: repository
+        app.include_router(router, prefix="/documents")
+        with TestClient(app) as test_client:
+            yield test_client
+
+    def test_upload_document(
+        self, upload_client: TestClient, minio_client: FakeMinioClient
+    ) -> None:
+        """Test a multipart upload is stored and its metadata returned."""
+        content = b"%PDF-1.4\n" + b"0" * 100_000
+
+        response = upload_client.post(
+            "/documents/",
+            files={"file": ("report.pdf", content, "application/octet-stream")},
+            data={"note": "ignored"},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["original_filename"] == "report.pdf"
+        assert data["content_type"] == "application/pdf"  # sniffed
+        assert data["size_bytes"] == len(content)
+
+        stored = minio_client.get_stored_objects("documents-content")
+        assert stored[data["content_multihash"]]["data"] == content
+        assert list(stored) == [data["content_multihash"]]
+
+        content_response = upload_client.get(
+            f"/documents/{data['document_id']}/content"
+        )
+        assert content_response.content == content
+
+    def test_upload_prefers_declared_type_when_sniffing_is_generic(
+        self, upload_client: TestClient
+    ) -> None:
+        """Test a specific declared type is kept for generic-looking content."""
+        response = upload_client.post(
+            "/documents/",
+            files={"file": ("notes.md", b"# Notes\n\nplain words", "text/markdown")},
+        )
+
+        assert response.status_code == 201
+        assert response.json()["content_type"] == "text/markdown"
+
+    def test_upload_without_file_part(self, upload_client: TestClient) -> None:
+        """Test a multipart body without a file part is rejected."""
+        response = upload_client.post(
+            "/documents/", files={"other": ("a.txt", b"data", "text/plain")}
+        )
+
+        assert response.status_code == 400
+        assert "'file'" in response.json()["detail"]
+
+    def test_upload_empty_file(self, upload_client: TestClient) -> None:
+        """Test an empty file is rejected."""
+        response = upload_client.post(
+            "/documents/", files={"file": ("empty.txt", b"", "text/plain")}
+        )
+
+        assert response.status_code == 400
+        assert "no content" in response.json()["detail"]
+
+    def test_upload_requires_multipart(self, upload_client: TestClient) -> None:
+        """Test a non-multipart body is rejected."""
+        response = upload_client.post("/documents/", content=b"raw bytes")
+
+        assert response.status_code == 400
+
+    def test_upload_not_supported_by_repository(self, client: TestClient) -> None:
+        """Test storage without streaming support answers 501."""
+        response = client.post(
+            "/documents/", files={"file": ("a.txt", b"data", "text/plain")}
+        )
+
+        assert response.status_code == 501
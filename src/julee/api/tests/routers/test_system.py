@@ -180,3 +180,15 @@ class TestHealthEndpoint:
         # Health check should complete within 10 seconds even with external
         # service checks
         assert end_time - start_time < 10.0
+
+    def test_health_check_serves_cached_probe(self, client: TestClient) -> None:
+        """Test that repeated health checks reuse the background probe."""
+        from julee.api.routers import system
+
+        first = client.get("/health").json()
+        second = client.get("/health").json()
+
+        assert first["checked_at"] == second["checked_at"]
+        assert second["age_seconds"] >= 0
+        assert system.check_temporal_health.call_count == 1  # type: ignore[attr-defined]
+        assert system.check_storage_health.call_count == 1  # type: ignore[attr-defined]
@@ -6,6 +6,7 @@ focusing on workflow triggering, status monitoring, and error handling.
 """
 
 from collections.abc import Generator
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -14,7 +15,7 @@ from fastapi.testclient import TestClient
 from fastapi_pagination import add_pagination
 
 from julee.api.dependencies import get_temporal_client
-from julee.api.routers.workflows import router
+from julee.api.routers.workflows import batch_workflow_id, router
 
 pytestmark = pytest.mark.unit
 
@@ -394,3 +395,246 @@ class TestWorkflowValidation:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "RUNNING"
+
+
+class TestExtractAssembleBatch:
+    """Test cases for the batch extract-assemble endpoints."""
+
+    def test_start_batch_uses_deterministic_ids(
+        self,
+        client: TestClient,
+        mock_temporal_client: MagicMock,
+    ) -> None:
+        """Test batch start derives workflow ids from the batch id."""
+        mock_handle = MagicMock()
+        mock_handle.run_id = "run-1"
+        mock_temporal_client.start_workflow.return_value = mock_handle
+
+        request_data = {
+            "batch_id": "nightly",
+            "items": [
+                {"document_id": "doc-1", "assembly_specification_id": "spec-1"},
+                {"document_id": "doc-2", "assembly_specification_id": "spec-1"},
+                {"document_id": "doc-1", "assembly_specification_id": "spec-1"},
+            ],
+        }
+        response = client.post("/workflows/extract-assemble/batch", json=request_data)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["batch_id"] == "nightly"
+        assert data["started"] == 2
+        assert data["failed"] == 0
+
+        started_ids = {
+            call.kwargs["id"]
+            for call in mock_temporal_client.start_workflow.call_args_list
+        }
+        assert started_ids == {
+            batch_workflow_id("nightly", "doc-1", "spec-1"),
+            batch_workflow_id("nightly", "doc-2", "spec-1"),
+        }
+        assert all(
+            workflow_id.startswith("extract-assemble-batch-nightly:doc-")
+            for workflow_id in started_ids
+        )
+
+    def test_batch_workflow_ids_are_unambiguous(self) -> None:
+        """Test items and batches that join to the same text stay distinct."""
+        assert batch_workflow_id("b", "doc-1", "spec") != batch_workflow_id(
+            "b", "doc", "1-spec"
+        )
+        assert not batch_workflow_id("abc-def", "doc", "spec").startswith(
+            "extract-assemble-batch-abc:"
+        )
+
+    def test_start_batch_reports_already_started_and_failures(
+        self,
+        client: TestClient,
+        mock_temporal_client: MagicMock,
+    ) -> None:
+        """Test resubmission is idempotent and failures are per item."""
+        from temporalio.exceptions import WorkflowAlreadyStartedError
+
+        async def start_workflow(*args, **kwargs):
+            if kwargs["args"][0] == "doc-1":
+                raise WorkflowAlreadyStartedError(kwargs["id"], "ExtractAssemble")
+            raise RuntimeError("temporal unavailable")
+
+        mock_temporal_client.start_workflow.side_effect = start_workflow
+
+        request_data = {
+            "items": [
+                {"document_id": "doc-1", "assembly_specification_id": "spec-1"},
+                {"document_id": "doc-2", "assembly_specification_id": "spec-1"},
+            ],
+        }
+        response = client.post("/workflows/extract-assemble/batch", json=request_data)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["batch_id"]
+        assert data["already_started"] == 1
+        assert data["failed"] == 1
+        statuses = {item["document_id"]: item["status"] for item in data["items"]}
+        assert statuses == {"doc-1": "ALREADY_STARTED", "doc-2": "FAILED"}
+
+    def test_resubmitted_batch_reruns_only_unsuccessful_items(
+        self,
+        client: TestClient,
+        mock_temporal_client: MagicMock,
+    ) -> None:
+        """Test closed items are not started again unless they failed."""
+        from temporalio.common import WorkflowIDReusePolicy
+        from temporalio.exceptions import WorkflowAlreadyStartedError
+
+        closed = {"doc-1": "COMPLETED", "doc-2": "FAILED"}
+
+        async def start_workflow(*args, **kwargs):
+            # Temporal's handling of a reused workflow id
+            status = closed.get(kwargs["args"][0])
+            policy = kwargs.get("id_reuse_policy")
+            if status and policy in (None, WorkflowIDReusePolicy.ALLOW_DUPLICATE):
+                return MagicMock(run_id="rerun")
+            if status == "COMPLETED" or (
+                status and policy == WorkflowIDReusePolicy.REJECT_DUPLICATE
+            ):
+                raise WorkflowAlreadyStartedError(kwargs["id"], "ExtractAssemble")
+            return MagicMock(run_id="rerun")
+
+        mock_temporal_client.start_workflow.side_effect = start_workflow
+
+        request_data = {
+            "batch_id": "nightly",
+            "items": [
+                {"document_id": "doc-1", "assembly_specification_id": "spec-1"},
+                {"document_id": "doc-2", "assembly_specification_id": "spec-1"},
+                {"document_id": "doc-3", "assembly_specification_id": "spec-1"},
+            ],
+        }
+        response = client.post("/workflows/extract-assemble/batch", json=request_data)
+
+        assert response.status_code == 200
+        data = response.json()
+        statuses = {item["document_id"]: item["status"] for item in data["items"]}
+        assert statuses == {
+            "doc-1": "ALREADY_STARTED",
+            "doc-2": "STARTED",
+            "doc-3": "STARTED",
+        }
+
+    def test_start_batch_rejects_unsafe_batch_id(self, client: TestClient) -> None:
+        """Test batch ids are restricted to a query-safe alphabet."""
+        request_data = {
+            "batch_id": 'x" OR WorkflowId != "',
+            "items": [{"document_id": "doc-1", "assembly_specification_id": "s"}],
+        }
+        response = client.post("/workflows/extract-assemble/batch", json=request_data)
+
+        assert response.status_code == 422
+
+    def test_batch_status_aggregates_visibility_results(
+        self,
+        client: TestClient,
+        mock_temporal_client: MagicMock,
+    ) -> None:
+        """Test batch status counts workflows by execution status."""
+        from temporalio.client import WorkflowExecutionStatus
+
+        def execution(workflow_id, started, status):
+            return MagicMock(
+                id=workflow_id,
+                start_time=datetime(2026, 1, 1, started, tzinfo=timezone.utc),
+                status=status,
+            )
+
+        # wf-3 failed and was re-run by a resubmission: only its latest
+        # run counts
+        executions = [
+            execution("wf-1", 1, WorkflowExecutionStatus.COMPLETED),
+            execution("wf-2", 1, WorkflowExecutionStatus.COMPLETED),
+            execution("wf-3", 2, WorkflowExecutionStatus.RUNNING),
+            execution("wf-3", 1, WorkflowExecutionStatus.FAILED),
+        ]
+
+        async def list_workflows(query: str):
+            for execution in executions:
+                yield execution
+
+        mock_temporal_client.list_workflows = MagicMock(side_effect=list_workflows)
+
+        response = client.get("/workflows/batches/nightly/status")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert data["status_counts"] == {"COMPLETED": 2, "RUNNING": 1}
+        assert data["completed"] is False
+        query = mock_temporal_client.list_workflows.call_args.kwargs["query"]
+        assert 'STARTS_WITH "extract-assemble-batch-nightly:"' in query
+        assert 'WorkflowType = "ExtractAssembleWorkflow"' in query
+
+    def test_batch_status_unknown_batch_returns_404(
+        self,
+        client: TestClient,
+        mock_temporal_client: MagicMock,
+    ) -> None:
+        """Test a batch with no workflows is reported as not found."""
+
+        async def list_workflows(query: str):
+            return
+            yield
+
+        mock_temporal_client.list_workflows = MagicMock(side_effect=list_workflows)
+
+        response = client.get("/workflows/batches/missing/status")
+
+        assert response.status_code == 404
+
+
+class TestStreamWorkflowProgress:
+    """Test cases for the workflow progress event stream."""
+
+    def test_streams_progress_events_until_all_finished(
+        self, app_with_router: FastAPI
+    ) -> None:
+        """Test progress snapshots are framed as server-sent events."""
+        from julee.api.dependencies import get_workflow_progress_hub
+        from julee.api.services.workflow_progress import WorkflowProgress
+
+        class StubHub:
+            async def watch(self, workflow_ids, heartbeat_seconds=None):
+                assert workflow_ids == ["wf-1", "wf-2"]
+                yield WorkflowProgress(
+                    workflow_id="wf-1", status="RUNNING", current_step="x"
+                )
+                yield None
+                yield WorkflowProgress(workflow_id="wf-1", status="COMPLETED")
+                yield WorkflowProgress(workflow_id="wf-2", status="FAILED")
+
+        app_with_router.dependency_overrides[get_workflow_progress_hub] = StubHub
+
+        with TestClient(app_with_router) as test_client:
+            response = test_client.get(
+                "/workflows/progress?workflow_id=wf-1&workflow_id=wf-2"
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = response.text.strip().split("\n\n")
+        assert frames[0].startswith("event: progress\ndata: ")
+        assert '"current_step":"x"' in frames[0]
+        assert frames[1] == ": keep-alive"
+        assert frames[-1] == "event: end\ndata: {}"
+        assert len(frames) == 5
+
+    def test_requires_workflow_ids(self, app_with_router: FastAPI) -> None:
+        """Test at least one workflow id is required."""
+        from julee.api.dependencies import get_workflow_progress_hub
+
+        app_with_router.dependency_overrides[get_workflow_progress_hub] = MagicMock
+
+        with TestClient(app_with_router) as test_client:
+            response = test_client.get("/workflows/progress")
+
+        assert response.status_code == 422
@@ -0,0 +1,3 @@
+"""
+Tests for API services in the julee CEAP system.
+"""
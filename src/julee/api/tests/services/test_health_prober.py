@@ -0,0 +1,96 @@
+"""
+Tests for the background health prober.
+"""
+
+import asyncio
+
+import pytest
+
+from julee.api.responses import ServiceStatus
+from julee.api.services.health_prober import HealthProber
+
+pytestmark = pytest.mark.unit
+
+
+class CountingCheck:
+    """Health check that records how often it was called."""
+
+    def __init__(self, status: ServiceStatus = ServiceStatus.UP) -> None:
+        self.status = status
+        self.calls = 0
+
+    async def __call__(self) -> ServiceStatus:
+        self.calls += 1
+        return self.status
+
+
+async def test_get_snapshot_probes_once_then_serves_cache() -> None:
+    check = CountingCheck()
+    prober = HealthProber({"storage": check}, interval_seconds=60)
+
+    try:
+        first = await prober.get_snapshot()
+        second = await prober.get_snapshot()
+    finally:
+        await prober.stop()
+
+    assert first.statuses == {"storage": ServiceStatus.UP}
+    assert second is first
+    assert check.calls == 1
+
+
+async def test_concurrent_first_requests_share_one_probe() -> None:
+    check = CountingCheck()
+    prober = HealthProber({"storage": check}, interval_seconds=60)
+
+    try:
+        await asyncio.gather(*(prober.get_snapshot() for _ in range(10)))
+    finally:
+        await prober.stop()
+
+    assert check.calls == 1
+
+
+async def test_failing_and_slow_checks_are_reported_down() -> None:
+    async def failing() -> ServiceStatus:
+        raise RuntimeError("connection refused")
+
+    async def slow() -> ServiceStatus:
+        await asyncio.sleep(10)
+        return ServiceStatus.UP
+
+    prober = HealthProber(
+        {"temporal": failing, "storage": slow, "api": CountingCheck()},
+        timeout_seconds=0.01,
+    )
+
+    snapshot = await prober.refresh()
+
+    assert snapshot.statuses == {
+        "temporal": ServiceStatus.DOWN,
+        "storage": ServiceStatus.DOWN,
+        "api": ServiceStatus.UP,
+    }
+
+
+async def test_background_loop_refreshes_snapshot() -> None:
+    check = CountingCheck()
+    prober = HealthProber({"storage": check}, interval_seconds=0.01)
+
+    prober.start()
+    try:
+        for _ in range(100):
+            if check.calls >= 3:
+                break
+            await asyncio.sleep(0.01)
+        check.status = ServiceStatus.DOWN
+        calls = check.calls
+        while check.calls == calls:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+    finally:
+        await prober.stop()
+
+    assert check.calls >= 3
+    assert prober.snapshot is not None
+    assert prober.snapshot.statuses["storage"] == ServiceStatus.DOWN
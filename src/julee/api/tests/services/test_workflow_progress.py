@@ -0,0 +1,122 @@
+"""
+Tests for the workflow progress hub.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from temporalio.client import WorkflowExecutionStatus
+
+from julee.api.services.workflow_progress import WorkflowProgress, WorkflowProgressHub
+
+pytestmark = pytest.mark.unit
+
+
+class FakeWorkflow:
+    """Scripted workflow whose status and step can be advanced by tests."""
+
+    def __init__(self) -> None:
+        self.status = WorkflowExecutionStatus.RUNNING
+        self.step = "initialized"
+        self.describe_calls = 0
+
+    def handle(self) -> MagicMock:
+        handle = MagicMock()
+
+        async def describe() -> MagicMock:
+            self.describe_calls += 1
+            return MagicMock(status=self.status, run_id="run-1")
+
+        handle.describe = describe
+        handle.query = AsyncMock(side_effect=lambda name: self.step)
+        return handle
+
+
+@pytest.fixture
+def workflows() -> dict[str, FakeWorkflow]:
+    return {"wf-1": FakeWorkflow(), "wf-2": FakeWorkflow()}
+
+
+@pytest.fixture
+def hub(workflows: dict[str, FakeWorkflow]) -> WorkflowProgressHub:
+    client = MagicMock()
+    client.get_workflow_handle = lambda workflow_id: workflows[workflow_id].handle()
+    return WorkflowProgressHub(client, poll_interval=3600)
+
+
+async def _next(watch) -> WorkflowProgress:
+    return await asyncio.wait_for(watch.__anext__(), 1)
+
+
+class TestWorkflowProgressHub:
+    """Test cases for WorkflowProgressHub."""
+
+    @pytest.mark.asyncio
+    async def test_emits_only_changes(
+        self, hub: WorkflowProgressHub, workflows: dict[str, FakeWorkflow]
+    ) -> None:
+        """Watchers receive the first snapshot and then only changes."""
+        watch = hub.watch(["wf-1"])
+
+        first = await _next(watch)
+        assert (first.status, first.current_step) == ("RUNNING", "initialized")
+
+        await hub.poll_once()  # unchanged: nothing emitted
+        workflows["wf-1"].step = "executing_assembly"
+        await hub.poll_once()
+
+        second = await _next(watch)
+        assert second.current_step == "executing_assembly"
+
+        workflows["wf-1"].status = WorkflowExecutionStatus.COMPLETED
+        workflows["wf-1"].step = "completed"
+        await hub.poll_once()
+
+        last = await _next(watch)
+        assert last.is_terminal
+        with pytest.raises(StopAsyncIteration):
+            await _next(watch)
+        assert hub.watched_workflow_ids == set()
+
+    @pytest.mark.asyncio
+    async def test_describes_are_shared_between_watchers(
+        self, hub: WorkflowProgressHub, workflows: dict[str, FakeWorkflow]
+    ) -> None:
+        """Many watchers of one workflow cost one describe per poll."""
+        watches = [hub.watch(["wf-1", "wf-2"]) for _ in range(10)]
+        for watch in watches:
+            await _next(watch)
+            await _next(watch)
+
+        calls_before = workflows["wf-1"].describe_calls
+        await hub.poll_once()
+
+        assert workflows["wf-1"].describe_calls == calls_before + 1
+        for watch in watches:
+            await watch.aclose()
+        assert hub.watched_workflow_ids == set()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_when_idle(self, hub: WorkflowProgressHub) -> None:
+        """None is yielded when nothing changes within the heartbeat."""
+        watch = hub.watch(["wf-1"], heartbeat_seconds=0.01)
+
+        # Heartbeats may arrive before the first poll completes
+        while await _next(watch) is None:
+            pass
+        assert await _next(watch) is None
+        await watch.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unknown_workflow_is_terminal(self) -> None:
+        """Workflows that do not exist end the watch with NOT_FOUND."""
+        handle = MagicMock()
+        handle.describe = AsyncMock(side_effect=RuntimeError("workflow not found"))
+        client = MagicMock()
+        client.get_workflow_handle.return_value = handle
+        hub = WorkflowProgressHub(client, poll_interval=3600)
+
+        progress = [p async for p in hub.watch(["missing"])]
+
+        assert [p.status for p in progress] == ["NOT_FOUND"]
@@ -6,6 +6,7 @@ StartupDependenciesProvider that provides clean access to dependencies
 during application startup without exposing internal container details.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -246,3 +247,53 @@ class TestStartupDependenciesProviderEdgeCases:
             provider = StartupDependenciesProvider(None)  # type: ignore
             # Any operation should fail gracefully
             provider.container.get_minio_client()  # type: ignore
+
+
+class TestDependencyContainerRepositories:
+    """Test repository singletons held by the DependencyContainer."""
+
+    @pytest.fixture
+    def container(self, mock_minio_client: MagicMock) -> DependencyContainer:
+        """Create a container whose Minio client is mocked."""
+        container = DependencyContainer()
+        container.get_minio_client = AsyncMock(  # type: ignore[method-assign]
+            return_value=mock_minio_client
+        )
+        return container
+
+    @pytest.mark.asyncio
+    async def test_repository_is_created_once(
+        self,
+        container: DependencyContainer,
+        mock_minio_client: MagicMock,
+    ) -> None:
+        """Test that buckets are verified only when the repository is built."""
+        repo1 = await container.get_document_repository()
+        bucket_checks = mock_minio_client.bucket_exists.call_count
+        repo2 = await container.get_document_repository()
+
+        assert repo1 is repo2
+        assert bucket_checks > 0
+        assert mock_minio_client.bucket_exists.call_count == bucket_checks
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_requests_share_one_repository(
+        self, container: DependencyContainer
+    ) -> None:
+        """Test that concurrent first requests do not build duplicates."""
+        repos = await asyncio.gather(
+            *(container.get_knowledge_service_query_repository() for _ in range(10))
+        )
+
+        assert all(repo is repos[0] for repo in repos)
+
+    @pytest.mark.asyncio
+    async def test_initialize_repositories(
+        self, container: DependencyContainer
+    ) -> None:
+        """Test that startup initialization builds every repository."""
+        await container.initialize_repositories()
+
+        repo = await container.get_assembly_specification_repository()
+        assert repo is await container.get_assembly_specification_repository()
+        assert container.get_minio_client.call_count == 4  # type: ignore[attr-defined]
@@ -0,0 +1,80 @@
+"""
+Tests for streaming upload parsing.
+"""
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from julee.api.uploads import MultipartFileStream, UploadError, peek
+
+pytestmark = pytest.mark.unit
+
+BOUNDARY = "----julee-test-boundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def multipart_body(*parts: tuple[str, str | None, str | None, bytes]) -> bytes:
+    """Build a multipart body from (name, filename, content_type, data) parts."""
+    body = b""
+    for name, filename, content_type, data in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        body += f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n".encode()
+        if content_type:
+            body += f"Content-Type: {content_type}\r\n".encode()
+        body += b"\r\n" + data + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+async def in_chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def test_file_part_is_streamed_across_arbitrary_chunking() -> None:
+    content = bytes(range(256)) * 50
+    body = multipart_body(
+        ("title", None, None, b"A title"),
+        ("file", "data.bin", "application/octet-stream", content),
+        ("trailer", None, None, b"after"),
+    )
+    upload = MultipartFileStream(in_chunks(body, 7), CONTENT_TYPE)
+
+    await upload.open()
+    received = [chunk async for chunk in upload]
+
+    assert upload.filename == "data.bin"
+    assert upload.declared_content_type == "application/octet-stream"
+    assert b"".join(received) == content
+    assert len(received) > 1
+
+
+async def test_missing_file_part() -> None:
+    body = multipart_body(("title", None, None, b"A title"))
+    upload = MultipartFileStream(in_chunks(body, 64), CONTENT_TYPE)
+
+    with pytest.raises(UploadError, match="no 'file' file part"):
+        await upload.open()
+
+
+async def test_truncated_body() -> None:
+    body = multipart_body(("file", "a.txt", "text/plain", b"x" * 100))
+    upload = MultipartFileStream(in_chunks(body[:120], 64), CONTENT_TYPE)
+
+    await upload.open()
+    with pytest.raises(UploadError, match="ended before"):
+        _ = [chunk async for chunk in upload]
+
+
+def test_non_multipart_content_type() -> None:
+    with pytest.raises(UploadError):
+        MultipartFileStream(in_chunks(b"", 1), "application/json")
+
+
+async def test_peek_replays_consumed_chunks() -> None:
+    head, chunks = await peek(in_chunks(b"abcdefghij", 3), 4)
+
+    assert head == b"abcdef"
+    assert b"".join([chunk async for chunk in chunks]) == b"abcdefghij"
@@ -0,0 +1,203 @@
+"""
+Streaming upload handling for the julee CEAP API.
+
+This module parses multipart/form-data request bodies incrementally, so an
+uploaded file can be handed on chunk by chunk as it arrives instead of being
+buffered in memory or spooled to disk first, and sniffs the content type of
+an upload from its first bytes.
+"""
+
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
+from typing import Any, Protocol, runtime_checkable
+
+import magic
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from julee.contrib.ceap.domain.models.document import Document
+
+# Bytes of an upload inspected to sniff its content type
+SNIFF_BYTES = 2048
+
+# Sniffed types that only mean "no specific type recognised"; a more specific
+# type declared by the client is preferred over these.
+GENERIC_CONTENT_TYPES = frozenset(
+    {"application/octet-stream", "text/plain", "application/x-empty"}
+)
+
+
+class UploadError(ValueError):
+    """Raised when an upload request body is malformed."""
+
+
+@runtime_checkable
+class StreamingDocumentRepository(Protocol):
+    """Document repository that can save content from a chunk stream."""
+
+    async def generate_id(self) -> str: ...
+
+    async def save_stream(
+        self,
+        document_id: str,
+        chunks: AsyncIterable[bytes],
+        original_filename: str,
+        content_type: str,
+        additional_metadata: Mapping[str, Any] | None = None,
+    ) -> Document: ...
+
+
+class MultipartFileStream:
+    """
+    Incremental reader for one file field of a multipart/form-data body.
+
+    Call open() to read up to the file part's headers (making filename and
+    declared_content_type available), then iterate to receive the file's
+    bytes as they arrive. Other form fields are skipped.
+    """
+
+    def __init__(
+        self,
+        body: AsyncIterable[bytes],
+        content_type_header: str,
+        field_name: str = "file",
+    ) -> None:
+        content_type, params = parse_options_header(content_type_header)
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise UploadError("Expected a multipart/form-data request body")
+
+        self.field_name = field_name
+        self.filename: str | None = None
+        self.declared_content_type: str | None = None
+
+        self._body = aiter(body)
+        self._body_done = False
+        self._events: deque[tuple[str, Any]] = deque()
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: dict[bytes, bytes] = {}
+        self._parser = MultipartParser(
+            params[b"boundary"],
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+
+    async def open(self) -> None:
+        """Read up to the headers of the file part.
+
+        Raises:
+            UploadError: If the body has no file part with a filename
+        """
+        while (event := await self._next_event()) is not None:
+            kind, payload = event
+            if kind != "headers":
+                continue
+            _, params = parse_options_header(payload.get(b"content-disposition", b""))
+            if params.get(b"name", b"").decode() != self.field_name:
+                continue
+            filename = params.get(b"filename", b"").decode().strip()
+            if not filename:
+                raise UploadError(f"Part '{self.field_name}' has no filename")
+            self.filename = filename
+            declared = payload.get(b"content-type", b"").decode().strip()
+            self.declared_content_type = declared or None
+            return
+        raise UploadError(f"Request body has no '{self.field_name}' file part")
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iter_file()
+
+    async def _iter_file(self) -> AsyncIterator[bytes]:
+        if self.filename is None:
+            raise UploadError("open() must be called before reading the file")
+        while (event := await self._next_event()) is not None:
+            kind, payload = event
+            if kind == "end":
+                return
+            if kind == "data" and payload:
+                yield payload
+        raise UploadError("Request body ended before the file part was complete")
+
+    async def _next_event(self) -> tuple[str, Any] | None:
+        while not self._events:
+            if self._body_done:
+                return None
+            try:
+                chunk = await anext(self._body)
+            except StopAsyncIteration:
+                self._parser.finalize()
+                self._body_done = True
+                continue
+            self._parser.write(chunk)
+        return self._events.popleft()
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        self._events.append(("headers", self._headers))
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self._events.append(("data", bytes(data[start:end])))
+
+    def _on_part_end(self) -> None:
+        self._events.append(("end", None))
+
+
+async def peek(
+    chunks: AsyncIterable[bytes], size: int
+) -> tuple[bytes, AsyncIterator[bytes]]:
+    """Read at least size bytes (or everything) from a chunk stream.
+
+    Returns the bytes read and an iterator that yields the whole stream,
+    including those bytes, from the start.
+    """
+    iterator = aiter(chunks)
+    head: list[bytes] = []
+    head_size = 0
+    while head_size < size:
+        try:
+            chunk = await anext(iterator)
+        except StopAsyncIteration:
+            break
+        head.append(chunk)
+        head_size += len(chunk)
+
+    async def replay() -> AsyncIterator[bytes]:
+        for chunk in head:
+            yield chunk
+        async for chunk in iterator:
+            yield chunk
+
+    return b"".join(head), replay()
+
+
+def sniff_content_type(head: bytes, declared: str | None = None) -> str:
+    """Determine an upload's content type from its first bytes.
+
+    The sniffed type wins unless it is generic and the client declared a
+    more specific one.
+    """
+    sniffed = magic.from_buffer(head, mime=True) if head else "application/x-empty"
+    if sniffed in GENERIC_CONTENT_TYPES and declared:
+        declared_type = declared.split(";")[0].strip().lower()
+        if declared_type and declared_type not in GENERIC_CONTENT_TYPES:
+            return declared_type
+    return str(sniffed)
@@ -7,10 +7,15 @@ navigating to the target sub-schema and bundling the parent $defs so
 that internal $ref values within the sub-schema remain valid.
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 import jsonpointer  # type: ignore
 
+# Keywords describing a whole schema document, hoisted out of nested schemas
+_DOCUMENT_KEYWORDS = ("$schema", "$id")
+_DEFINITION_KEYWORDS = ("definitions", "$defs")
+
 
 def extract_schema_from_fetched(
     full_schema: dict[str, Any], fragment: str
@@ -33,3 +38,43 @@ def extract_schema_from_fetched(
     if parent_defs:
         result["$defs"] = {**parent_defs, **result.get("$defs", {})}
     return result
+
+
+def object_schema(properties: Mapping[str, Mapping[str, Any]]) -> dict[str, Any]:
+    """Return a schema of an object with exactly the given properties.
+
+    Local ``$ref`` values resolve against the document root, so the
+    properties' definitions (usually from one specification) move to the
+    root of the new schema, as does a ``$schema`` dialect; ``$id`` is
+    dropped, as the properties are no longer documents of their own.
+
+    Raises:
+        ValueError: If the properties define the same name differently
+    """
+    schema: dict[str, Any] = {}
+    nested: dict[str, Any] = {}
+    for name, property_schema in properties.items():
+        part = dict(property_schema)
+        for keyword in _DOCUMENT_KEYWORDS:
+            value = part.pop(keyword, None)
+            if value is not None and keyword == "$schema":
+                schema.setdefault(keyword, value)
+        for keyword in _DEFINITION_KEYWORDS:
+            shared = schema.setdefault(keyword, {})
+            for def_name, definition in part.pop(keyword, {}).items():
+                if shared.setdefault(def_name, definition) != definition:
+                    raise ValueError(f"Conflicting schema definition: {def_name}")
+        nested[name] = part
+
+    for keyword in _DEFINITION_KEYWORDS:
+        if not schema[keyword]:
+            del schema[keyword]
+    schema.update(
+        {
+            "type": "object",
+            "properties": nested,
+            "required": list(nested),
+            "additionalProperties": False,
+        }
+    )
+    return schema
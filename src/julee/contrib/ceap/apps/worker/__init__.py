@@ -6,8 +6,13 @@ CEAP use cases with durability guarantees, retry logic, and state management.
 """
 
 from .extract_assemble import (
+    BATCH_EXTRACT_ASSEMBLE_DOCUMENTS_PER_RUN,
+    EXTRACT_ASSEMBLE_QUERY_GROUP_SIZE,
     EXTRACT_ASSEMBLE_RETRY_POLICY,
+    BatchExtractAssembleProgress,
+    BatchExtractAssembleWorkflow,
     ExtractAssembleWorkflow,
+    ExtractQueryGroupWorkflow,
 )
 from .validate_document import (
     VALIDATE_DOCUMENT_RETRY_POLICY,
@@ -15,7 +20,12 @@ from .validate_document import (
 )
 
 __all__ = [
+    "BATCH_EXTRACT_ASSEMBLE_DOCUMENTS_PER_RUN",
+    "BatchExtractAssembleProgress",
+    "BatchExtractAssembleWorkflow",
     "ExtractAssembleWorkflow",
+    "ExtractQueryGroupWorkflow",
+    "EXTRACT_ASSEMBLE_QUERY_GROUP_SIZE",
     "EXTRACT_ASSEMBLE_RETRY_POLICY",
     "ValidateDocumentWorkflow",
     "VALIDATE_DOCUMENT_RETRY_POLICY",
@@ -4,16 +4,36 @@ Temporal workflow for extract and assemble data operations.
 This workflow orchestrates the ExtractAssembleDataUseCase with Temporal's
 durability guarantees, providing retry logic, state management, and
 compensation for the complex document assembly process.
+
+Specifications with many knowledge service queries are partitioned into
+groups that each run as an ExtractQueryGroupWorkflow child, so the parent's
+history grows with the number of groups rather than the number of queries.
+Compatible queries are coalesced, so each group asks the knowledge service
+fewer, larger questions.
+
+BatchExtractAssembleWorkflow assembles many documents at once through
+knowledge service query batches, for offline bulk re-assembly. Large
+corpora are assembled a slice of documents per run, continuing as new
+between slices, so no run's history grows with the size of the corpus.
 """
 
 import logging
 from datetime import timedelta
+from typing import Any
 
+from pydantic import BaseModel
 from temporalio import workflow
 from temporalio.common import RetryPolicy
 
-from julee.contrib.ceap.domain.models.assembly import Assembly
-from julee.contrib.ceap.use_cases import ExtractAssembleDataUseCase
+from julee.contrib.ceap.domain.models.assembly import Assembly, AssemblyStatus
+from julee.contrib.ceap.use_cases import (
+    ExecuteQueryGroupRequest,
+    ExecuteQueryGroupResponse,
+    ExtractAssembleDataUseCase,
+)
+from julee.contrib.ceap.use_cases.extract_assemble_data import (
+    BATCH_POLL_INTERVAL_SECONDS,
+)
 from julee.core.infrastructure.temporal.clock import TemporalClockService
 from julee.core.infrastructure.temporal.execution import TemporalExecutionService
 from julee.repositories.temporal.proxies import (
@@ -30,6 +50,64 @@ from julee.services.temporal.proxies import (
 
 logger = logging.getLogger(__name__)
 
+# Queries per child workflow. Each query costs a handful of history events
+# (local activity markers plus the execute_query activity), so this keeps
+# every run's history well below Temporal's limits.
+EXTRACT_ASSEMBLE_QUERY_GROUP_SIZE = 25
+
+# Documents per run of BatchExtractAssembleWorkflow. Each document costs a
+# handful of activities (its assembly, document, registrations and
+# assembled document), so larger corpora continue as new runs.
+BATCH_EXTRACT_ASSEMBLE_DOCUMENTS_PER_RUN = 100
+
+
+def _create_use_case(**kwargs: Any) -> ExtractAssembleDataUseCase:
+    """Create the use case wired to workflow-safe proxies."""
+    # Create workflow-safe repository proxies
+    # These proxy all calls through Temporal activities for durability
+    return ExtractAssembleDataUseCase(
+        document_repo=WorkflowDocumentRepositoryProxy(),  # type: ignore[abstract]
+        assembly_repo=WorkflowAssemblyRepositoryProxy(),  # type: ignore[abstract]
+        assembly_specification_repo=(
+            WorkflowAssemblySpecificationRepositoryProxy()  # type: ignore[abstract]
+        ),
+        knowledge_service_query_repo=(
+            WorkflowKnowledgeServiceQueryRepositoryProxy()  # type: ignore[abstract]
+        ),
+        knowledge_service_config_repo=(
+            WorkflowKnowledgeServiceConfigRepositoryProxy()  # type: ignore[abstract]
+        ),
+        knowledge_service=WorkflowKnowledgeServiceProxy(),  # type: ignore[abstract]
+        remote_schema_repo=WorkflowRemoteSchemaRepositoryProxy(),  # type: ignore[abstract]
+        clock_service=TemporalClockService(),
+        execution_service=TemporalExecutionService(),
+        coalesce_queries=True,
+        **kwargs,
+    )
+
+
+@workflow.defn
+class ExtractQueryGroupWorkflow:
+    """
+    Child workflow that executes one group of an assembly's queries.
+
+    Started by ExtractAssembleWorkflow for large specifications; returns
+    the query results keyed by schema pointer for the parent to merge.
+    """
+
+    @workflow.run
+    async def run(self, request: ExecuteQueryGroupRequest) -> ExecuteQueryGroupResponse:
+        """Execute the queries in the group and return their results."""
+        parent = workflow.info().parent
+        workflow.logger.info(
+            "Starting extract query group workflow",
+            extra={
+                "parent_workflow_id": parent.workflow_id if parent else None,
+                "query_count": len(request.knowledge_service_queries),
+            },
+        )
+        return await _create_use_case().execute_query_group(request)
+
 
 @workflow.defn
 class ExtractAssembleWorkflow:
@@ -50,6 +128,7 @@ class ExtractAssembleWorkflow:
     def __init__(self) -> None:
         self.current_step = "initialized"
         self.assembly_id: str | None = None
+        self._query_group_count = 0
 
     @workflow.query
     def get_current_step(self) -> str:
@@ -61,14 +140,33 @@ class ExtractAssembleWorkflow:
         """Query method to get the assembly ID once created"""
         return self.assembly_id
 
+    async def _run_query_group(
+        self, request: ExecuteQueryGroupRequest
+    ) -> ExecuteQueryGroupResponse:
+        """Run one group of queries as a child workflow."""
+        self._query_group_count += 1
+        # The result type is taken from the run method's annotation
+        return await workflow.execute_child_workflow(
+            ExtractQueryGroupWorkflow.run,
+            request,
+            id=f"{workflow.info().workflow_id}-queries-{self._query_group_count}",
+        )
+
     @workflow.run
-    async def run(self, document_id: str, assembly_specification_id: str) -> Assembly:
+    async def run(
+        self,
+        document_id: str,
+        assembly_specification_id: str,
+        query_group_size: int = EXTRACT_ASSEMBLE_QUERY_GROUP_SIZE,
+    ) -> Assembly:
         """
         Execute the extract and assemble workflow.
 
         Args:
             document_id: ID of the document to assemble
             assembly_specification_id: ID of the specification to use
+            query_group_size: Specifications with more queries than this are
+                split into child workflows of at most this many queries
 
         Returns:
             Completed Assembly object with assembled document
@@ -78,7 +176,6 @@ class ExtractAssembleWorkflow:
             RuntimeError: If assembly processing fails after retries
         """
         execution_service = TemporalExecutionService()
-        clock_service = TemporalClockService()
 
         workflow.logger.info(
             "Starting extract assemble workflow",
@@ -89,48 +186,14 @@ class ExtractAssembleWorkflow:
             },
         )
 
-        self.current_step = "initializing_repositories"
+        self.current_step = "creating_use_case"
 
         try:
-            # Create workflow-safe repository proxies
-            # These proxy all calls through Temporal activities for durability
-            document_repo = WorkflowDocumentRepositoryProxy()  # type: ignore[abstract]
-            assembly_repo = WorkflowAssemblyRepositoryProxy()  # type: ignore[abstract]
-            assembly_specification_repo = (
-                WorkflowAssemblySpecificationRepositoryProxy()  # type: ignore[abstract]
-            )
-            knowledge_service_query_repo = (
-                WorkflowKnowledgeServiceQueryRepositoryProxy()  # type: ignore[abstract]
-            )
-            knowledge_service_config_repo = (
-                WorkflowKnowledgeServiceConfigRepositoryProxy()  # type: ignore[abstract]
-            )
-
-            workflow.logger.debug(
-                "Repository proxies created",
-                extra={
-                    "document_id": document_id,
-                    "assembly_specification_id": assembly_specification_id,
-                },
-            )
-
-            self.current_step = "creating_use_case"
-
-            # Create workflow-safe knowledge service proxy
-            knowledge_service = WorkflowKnowledgeServiceProxy()  # type: ignore[abstract]
-
             # Create the use case with workflow-safe repositories and services.
             # The use case remains completely unaware it's running in a workflow.
-            use_case = ExtractAssembleDataUseCase(
-                document_repo=document_repo,
-                assembly_repo=assembly_repo,
-                assembly_specification_repo=assembly_specification_repo,
-                knowledge_service_query_repo=knowledge_service_query_repo,
-                knowledge_service_config_repo=knowledge_service_config_repo,
-                knowledge_service=knowledge_service,
-                remote_schema_repo=WorkflowRemoteSchemaRepositoryProxy(),  # type: ignore[abstract]
-                clock_service=clock_service,
-                execution_service=execution_service,
+            use_case = _create_use_case(
+                query_group_runner=self._run_query_group,
+                query_group_size=query_group_size,
             )
 
             workflow.logger.debug(
@@ -212,6 +275,121 @@ class ExtractAssembleWorkflow:
         # For now, let the workflow be cancelled naturally by Temporal
 
 
+class BatchExtractAssembleProgress(BaseModel):
+    """Assemblies a batch extract assemble workflow has finished so far.
+
+    Carried from run to run when the workflow continues as new; the
+    assemblies themselves are in the assembly repository.
+    """
+
+    completed_count: int = 0
+    failed_assembly_ids: list[str] = []
+
+
+@workflow.defn
+class BatchExtractAssembleWorkflow:
+    """
+    Temporal workflow that assembles many documents in bulk.
+
+    All queries for a slice of documents are submitted as knowledge service
+    query batches, which are processed offline at lower cost than
+    interactive queries. The workflow waits on durable timers between
+    batch status checks, so it holds no worker resources while the batches
+    run, then completes (or fails) one assembly per document, and continues
+    as new with the next slice.
+    """
+
+    def __init__(self) -> None:
+        self.current_step = "initialized"
+        self.progress = BatchExtractAssembleProgress()
+
+    @workflow.query
+    def get_current_step(self) -> str:
+        """Query method to get the current workflow step"""
+        return self.current_step
+
+    @workflow.query
+    def get_progress(self) -> BatchExtractAssembleProgress:
+        """Query method to get the assemblies finished so far"""
+        return self.progress
+
+    @workflow.run
+    async def run(
+        self,
+        document_ids: list[str],
+        assembly_specification_id: str,
+        poll_interval_seconds: float = BATCH_POLL_INTERVAL_SECONDS,
+        documents_per_run: int = BATCH_EXTRACT_ASSEMBLE_DOCUMENTS_PER_RUN,
+        progress: BatchExtractAssembleProgress | None = None,
+    ) -> BatchExtractAssembleProgress:
+        """
+        Execute the batch extract and assemble workflow.
+
+        Args:
+            document_ids: IDs of the documents still to assemble
+            assembly_specification_id: ID of the specification to use
+            poll_interval_seconds: Delay between batch status checks
+            documents_per_run: Documents assembled before continuing as new
+            progress: Progress of earlier runs, when continued as new
+
+        Returns:
+            How many assemblies completed, and the IDs of those that could
+            not be completed (status FAILED)
+        """
+        if progress is not None:
+            self.progress = progress
+        run_document_ids = document_ids[:documents_per_run]
+        remaining_document_ids = document_ids[documents_per_run:]
+
+        workflow.logger.info(
+            "Starting batch extract assemble workflow run",
+            extra={
+                "document_count": len(run_document_ids),
+                "remaining_count": len(remaining_document_ids),
+                "assembly_specification_id": assembly_specification_id,
+            },
+        )
+
+        self.current_step = "executing_batch_assembly"
+        try:
+            assemblies = await _create_use_case().assemble_data_batch(
+                run_document_ids,
+                assembly_specification_id,
+                poll_interval_seconds,
+            )
+        except Exception:
+            self.current_step = "failed"
+            raise
+
+        self.progress = BatchExtractAssembleProgress(
+            completed_count=self.progress.completed_count
+            + sum(1 for a in assemblies if a.status == AssemblyStatus.COMPLETED),
+            failed_assembly_ids=[
+                *self.progress.failed_assembly_ids,
+                *(
+                    a.assembly_id
+                    for a in assemblies
+                    if a.status != AssemblyStatus.COMPLETED
+                ),
+            ],
+        )
+
+        if remaining_document_ids:
+            self.current_step = "continuing_as_new"
+            workflow.continue_as_new(
+                args=[
+                    remaining_document_ids,
+                    assembly_specification_id,
+                    poll_interval_seconds,
+                    documents_per_run,
+                    self.progress,
+                ]
+            )
+
+        self.current_step = "completed"
+        return self.progress
+
+
 # Workflow configuration with retry policies optimized for document processing
 EXTRACT_ASSEMBLE_RETRY_POLICY = RetryPolicy(
     initial_interval=timedelta(seconds=1),
@@ -138,6 +138,7 @@ class ValidateDocumentWorkflow:
                 document_policy_validation_repo=document_policy_validation_repo,
                 knowledge_service=knowledge_service,
                 now_fn=workflow.now,
+                coalesce_queries=True,
             )
 
             workflow.logger.debug(
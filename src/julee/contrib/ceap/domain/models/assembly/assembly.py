@@ -12,8 +12,10 @@ All domain models use Pydantic BaseModel for validation, serialization,
 and type safety, following the patterns established in the sample project.
 """
 
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 from pydantic import Field, field_validator
 
@@ -56,6 +58,22 @@ class Assembly(Entity):
         default=None,
         description="ID of the assembled document produced by this assembly",
     )
+    query_results: Mapping[str, Any] = Field(
+        default_factory=dict,
+        description=(
+            "Query results that passed validation against their schema "
+            "pointer's schema, keyed by schema pointer. Saved as they arrive "
+            "so that a retried assembly only re-runs the queries that failed"
+        ),
+    )
+    query_fingerprints: Mapping[str, str] = Field(
+        default_factory=dict,
+        description=(
+            "Digest of the query (its ID, prompt and settings) each saved "
+            "query result answered, keyed by schema pointer, so that a "
+            "retried assembly re-runs queries edited since"
+        ),
+    )
 
     # Assembly metadata — provided by use case via ClockService (ADR 004)
     created_at: datetime | None = None
@@ -15,10 +15,11 @@ from .assembly_specification import (
     AssemblySpecification,
     AssemblySpecificationStatus,
 )
-from .knowledge_service_query import KnowledgeServiceQuery
+from .knowledge_service_query import KnowledgeServiceQuery, ModelCascade
 
 __all__ = [
     "AssemblySpecification",
     "AssemblySpecificationStatus",
     "KnowledgeServiceQuery",
+    "ModelCascade",
 ]
@@ -24,6 +24,29 @@ from pydantic import Field, field_validator
 from julee.core.entities.entity import Entity
 
 
+class ModelCascade(Entity):
+    """Opt-in policy for answering a query with cheaper models first.
+
+    The query is first asked of each cascade model in turn, and the first
+    answer that conforms to the query's output schema is used. Answers
+    that fail validation, are truncated, or (with min_confidence) report
+    too little confidence escalate to the next model; the query's own
+    model answers last.
+    """
+
+    models: tuple[str, ...] = Field(
+        min_length=1,
+        description="Models to try before the query's own model, cheapest first",
+    )
+    min_confidence: float | None = Field(
+        default=None,
+        gt=0,
+        le=1,
+        description="Self-reported confidence (0-1) below which cascade "
+        "answers escalate; None accepts any valid answer",
+    )
+
+
 class KnowledgeServiceQuery(Entity):
     """Knowledge service query configuration for extracting specific data.
 
@@ -94,6 +117,16 @@ class KnowledgeServiceQuery(Entity):
         "assistant message before the model generates its response, "
         "allowing control over response format and structure.",
     )
+    model_cascade: ModelCascade | None = Field(
+        default=None,
+        description="Cheaper models to try before the query's own model; "
+        "None always uses the query's model",
+    )
+    full_context: bool = Field(
+        default=False,
+        description="Always send the whole document, even to services that "
+        "retrieve relevant passages",
+    )
 
     created_at: datetime | None = Field(
         default_factory=lambda: datetime.now(timezone.utc)
@@ -0,0 +1,122 @@
+"""
+Lexical passage retrieval over text documents.
+
+Long documents are split into passages and indexed for BM25 ranking, so
+that a query can be sent the few passages relevant to it instead of the
+whole document. The index is a plain JSON-serializable mapping, stored as
+a document of its own under an ID derived from the source's content
+multihash, and built once for any given content. Like segments, indexes
+are left out of document listings.
+"""
+
+import math
+import re
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any
+
+from .document import Document
+from .segmentation import segment_bounds
+
+# Metadata key of a passage index naming the document it indexes
+PASSAGE_INDEX_OF_KEY = "passage_index_of"
+
+# BM25 term frequency saturation and length normalization
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Words that carry no information about where an answer is: common English
+# words, and the instructions that extraction prompts are phrased in
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or that
+    the this to was were which with what who whom whose when where how all
+    any each if into no not only other such than then there these they
+    those their them you your our we do does please provide return give
+    list extract identify find describe document documents text based
+    given following answer json
+    """.split())
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased words of a text, without stopwords."""
+    return [
+        word
+        for word in _WORD.findall(text.lower())
+        if len(word) > 1 and word not in STOPWORDS
+    ]
+
+
+def is_passage_index(document: Document) -> bool:
+    """Whether a document is the passage index of another document."""
+    return PASSAGE_INDEX_OF_KEY in document.additional_metadata
+
+
+def passage_index_document_id(content_multihash: str, passage_chars: int) -> str:
+    """ID of the passage index of the content with the given multihash."""
+    return f"passage-index-{content_multihash}-{passage_chars}"
+
+
+def build_passage_index(text: str, passage_chars: int) -> dict[str, Any]:
+    """Split a text into passages and index them for BM25 ranking.
+
+    Passages do not overlap, and end after a line break where possible.
+
+    Args:
+        text: Text to index
+        passage_chars: Largest passage length
+
+    Returns:
+        The passages, their lengths in terms, and the postings of each
+        term as [passage, term frequency] pairs
+    """
+    passages = [
+        text[start:end] for start, end in segment_bounds(text, passage_chars, 0)
+    ]
+    lengths = []
+    postings: dict[str, list[list[int]]] = {}
+    for index, passage in enumerate(passages):
+        terms = tokenize(passage)
+        lengths.append(len(terms))
+        for term, frequency in Counter(terms).items():
+            postings.setdefault(term, []).append([index, frequency])
+    return {"passages": passages, "lengths": lengths, "postings": postings}
+
+
+def rank_passages(index: Mapping[str, Any], query_text: str, top_k: int) -> list[int]:
+    """Select the passages of an index that best match a query.
+
+    Args:
+        index: Index built by build_passage_index
+        query_text: Text of the query
+        top_k: Most passages to select
+
+    Returns:
+        Indexes of the selected passages in document order; empty if no
+        passage shares a term with the query
+    """
+    lengths = index["lengths"]
+    postings = index["postings"]
+    count = len(lengths)
+    average_length = (sum(lengths) / count) if count else 0
+    if not average_length:
+        return []
+
+    scores: dict[int, float] = {}
+    for term in set(tokenize(query_text)):
+        term_postings = postings.get(term)
+        if not term_postings:
+            continue
+        frequency = len(term_postings)
+        idf = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+        for passage, term_frequency in term_postings:
+            normalization = BM25_K1 * (
+                1 - BM25_B + BM25_B * lengths[passage] / average_length
+            )
+            scores[passage] = scores.get(passage, 0.0) + idf * (
+                term_frequency * (BM25_K1 + 1) / (term_frequency + normalization)
+            )
+
+    best = sorted(scores, key=lambda passage: (-scores[passage], passage))
+    return sorted(best[:top_k])
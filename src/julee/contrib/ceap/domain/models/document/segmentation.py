@@ -0,0 +1,85 @@
+"""
+Segmentation of large text documents.
+
+Documents too large for a knowledge service's context window are split
+into overlapping segments, each stored as a document of its own. Segment
+document IDs are derived from the source's content multihash and the
+segmentation parameters, so the segments of any given content are created
+once and found again by every later assembly of the same content.
+
+Segments are working copies rather than documents anyone captured, so they
+are left out of document listings.
+"""
+
+from .document import Document
+
+# Metadata key of a segment document naming the document it was split from
+SEGMENT_OF_KEY = "segment_of"
+
+# Non-text/* media types whose content is text and can be split
+TEXT_MEDIA_TYPES = frozenset(
+    {
+        "application/json",
+        "application/xml",
+        "application/yaml",
+        "application/x-yaml",
+        "application/x-ndjson",
+    }
+)
+
+
+def is_segmentable(content_type: str) -> bool:
+    """Whether documents of a content type are text that can be split."""
+    media_type = content_type.split(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in TEXT_MEDIA_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+def is_segment(document: Document) -> bool:
+    """Whether a document is a segment split from another document."""
+    return SEGMENT_OF_KEY in document.additional_metadata
+
+
+def segment_document_id(
+    content_multihash: str, max_segment_chars: int, overlap_chars: int, index: int
+) -> str:
+    """ID of one segment of the content with the given multihash."""
+    return f"segment-{content_multihash}-{max_segment_chars}-{overlap_chars}-{index}"
+
+
+def segment_bounds(
+    text: str, max_segment_chars: int, overlap_chars: int
+) -> list[tuple[int, int]]:
+    """Character ranges of the overlapping segments of a text.
+
+    Segments end after a line break when one falls in their second half,
+    so that segments rarely split a line. Each segment starts overlap_chars
+    before the end of the previous one.
+
+    Args:
+        text: Text to split
+        max_segment_chars: Largest segment length
+        overlap_chars: Characters shared by consecutive segments; at most
+            half of max_segment_chars
+
+    Returns:
+        (start, end) ranges covering the text, a single range if it fits
+    """
+    if overlap_chars * 2 > max_segment_chars:
+        raise ValueError("overlap_chars must be at most half of max_segment_chars")
+
+    bounds = []
+    start = 0
+    while True:
+        end = min(len(text), start + max_segment_chars)
+        if end < len(text):
+            line_break = text.rfind("\n", start + max_segment_chars // 2, end)
+            if line_break != -1:
+                end = line_break + 1
+        bounds.append((start, end))
+        if end >= len(text):
+            return bounds
+        start = end - overlap_chars
@@ -0,0 +1,65 @@
+"""
+Tests for lexical passage retrieval.
+"""
+
+import json
+
+import pytest
+
+from julee.contrib.ceap.domain.models.document.retrieval import (
+    build_passage_index,
+    rank_passages,
+    tokenize,
+)
+
+pytestmark = pytest.mark.unit
+
+TEXT = "".join(
+    [
+        "Minutes of the quarterly board meeting.\n" * 10,
+        "Attendees: Ana Lopez, Ben Okafor and Chen Wei.\n",
+        "The budget for next year was discussed at length.\n" * 10,
+        "Action items: Ben to circulate the revised budget.\n",
+    ]
+)
+
+
+class TestTokenize:
+    def test_stopwords_and_case_removed(self) -> None:
+        assert tokenize("Extract the Attendees from this document") == ["attendees"]
+
+
+class TestRankPassages:
+    """Test BM25 ranking of indexed passages."""
+
+    def test_best_matching_passages_selected(self) -> None:
+        index = build_passage_index(TEXT, 400)
+        passages = index["passages"]
+
+        selected = rank_passages(index, "Who were the attendees?", 1)
+
+        assert len(selected) == 1
+        assert "Attendees:" in passages[selected[0]]
+
+    def test_selection_is_in_document_order(self) -> None:
+        index = build_passage_index(TEXT, 400)
+
+        selected = rank_passages(index, "board meeting budget", 3)
+
+        assert len(selected) == 3
+        assert selected == sorted(selected)
+
+    def test_no_matching_terms(self) -> None:
+        index = build_passage_index(TEXT, 400)
+
+        assert rank_passages(index, "What is the invoice total?", 3) == []
+
+    def test_index_is_json_serializable(self) -> None:
+        index = build_passage_index(TEXT, 400)
+
+        restored = json.loads(json.dumps(index))
+
+        assert rank_passages(restored, "attendees", 2) == rank_passages(
+            index, "attendees", 2
+        )
+        assert "".join(index["passages"]) == TEXT
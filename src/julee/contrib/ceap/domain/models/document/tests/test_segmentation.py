@@ -0,0 +1,52 @@
+"""
+Tests for the segmentation of large text documents.
+"""
+
+import pytest
+
+from julee.contrib.ceap.domain.models.document.segmentation import (
+    is_segmentable,
+    segment_bounds,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class TestSegmentBounds:
+    """Test splitting text into overlapping segments."""
+
+    def test_short_text_is_one_segment(self) -> None:
+        assert segment_bounds("short", 1000, 100) == [(0, 5)]
+
+    def test_segments_cover_text_with_overlap(self) -> None:
+        text = "x" * 2500
+        bounds = segment_bounds(text, 1000, 100)
+
+        assert bounds == [(0, 1000), (900, 1900), (1800, 2500)]
+
+    def test_segments_end_at_line_breaks(self) -> None:
+        """A line break in a segment's second half ends the segment."""
+        text = "a" * 700 + "\n" + "b" * 700
+        bounds = segment_bounds(text, 1000, 100)
+
+        assert bounds[0] == (0, 701)
+        assert bounds[1][0] == 601
+
+    def test_overlap_larger_than_half_rejected(self) -> None:
+        with pytest.raises(ValueError, match="overlap_chars"):
+            segment_bounds("text", 1000, 600)
+
+
+@pytest.mark.parametrize(
+    "content_type,expected",
+    [
+        ("text/plain", True),
+        ("text/markdown; charset=utf-8", True),
+        ("application/json", True),
+        ("application/ld+json", True),
+        ("application/pdf", False),
+        ("image/png", False),
+    ],
+)
+def test_is_segmentable(content_type: str, expected: bool) -> None:
+    assert is_segmentable(content_type) is expected
@@ -7,11 +7,17 @@ AI/ML services that can store documents and execute queries against them.
 """
 
 from .knowledge_service_config import (
+    HedgingPolicy,
     KnowledgeServiceConfig,
+    RetrievalPolicy,
+    SegmentationPolicy,
     ServiceApi,
 )
 
 __all__ = [
+    "HedgingPolicy",
     "KnowledgeServiceConfig",
+    "RetrievalPolicy",
+    "SegmentationPolicy",
     "ServiceApi",
 ]
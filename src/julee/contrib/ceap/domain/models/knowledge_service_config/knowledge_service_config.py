@@ -16,7 +16,7 @@ and type safety, following the patterns established in the sample project.
 from datetime import datetime, timezone
 from enum import Enum
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 
 from julee.core.entities.entity import Entity
 
@@ -25,6 +25,103 @@ class ServiceApi(str, Enum):
     """Supported knowledge service APIs."""
 
     ANTHROPIC = "anthropic"
+    # Chat completions servers such as local llama.cpp or vLLM
+    OPENAI_COMPATIBLE = "openai_compatible"
+
+
+class HedgingPolicy(Entity):
+    """Opt-in policy for hedging slow queries to a knowledge service.
+
+    A query that has not returned once it has taken longer than the
+    service's recent latency percentile is sent a second time, and
+    whichever copy returns a valid result first is used.
+    """
+
+    latency_percentile: float = Field(
+        default=95.0,
+        gt=0,
+        lt=100,
+        description="Recent latency percentile after which a query is hedged",
+    )
+    max_hedge_fraction: float = Field(
+        default=0.05,
+        gt=0,
+        le=1,
+        description="Upper bound on hedged queries as a fraction of all queries",
+    )
+    min_samples: int = Field(
+        default=20,
+        ge=1,
+        description="Latency observations needed before hedging starts",
+    )
+    min_delay_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        description="Never hedge a query sooner than this",
+    )
+
+
+class SegmentationPolicy(Entity):
+    """Opt-in policy for extracting from large documents segment by segment.
+
+    Text documents larger than max_segment_chars are split into overlapping
+    segments, each registered with the service on its own. Assembly queries
+    run over every segment and their partial answers are merged, so each
+    call stays within the model's context window however large the
+    document is. Other documents are registered whole.
+    """
+
+    max_segment_chars: int = Field(
+        default=200_000,
+        ge=1_000,
+        description="Largest segment, in characters of text",
+    )
+    overlap_chars: int = Field(
+        default=2_000,
+        ge=0,
+        description="Characters repeated at the start of each next segment, "
+        "so facts spanning a segment boundary are seen whole",
+    )
+    max_parallel_segments: int = Field(
+        default=8,
+        ge=1,
+        description="Segments queried concurrently for one assembly",
+    )
+
+    @model_validator(mode="after")
+    def overlap_must_leave_progress(self) -> "SegmentationPolicy":
+        if self.overlap_chars * 2 > self.max_segment_chars:
+            raise ValueError("overlap_chars must be at most half of max_segment_chars")
+        return self
+
+
+class RetrievalPolicy(Entity):
+    """Opt-in policy for sending only relevant passages of long documents.
+
+    Text documents of at least min_document_chars are split into passages
+    and indexed for BM25 ranking, once per document content. Each assembly
+    query is then sent the top_k passages that best match it, as text in
+    the prompt, instead of the whole registered document. Queries marked
+    full_context, and queries that match no passage, get the whole
+    document as before.
+    """
+
+    top_k: int = Field(
+        default=8,
+        ge=1,
+        description="Passages sent with each query",
+    )
+    passage_chars: int = Field(
+        default=1_500,
+        ge=200,
+        description="Largest passage, in characters of text",
+    )
+    min_document_chars: int = Field(
+        default=20_000,
+        ge=0,
+        description="Smallest document worth retrieving from; shorter "
+        "documents are always sent whole",
+    )
 
 
 class KnowledgeServiceConfig(Entity):
@@ -48,6 +145,20 @@ class KnowledgeServiceConfig(Entity):
     service_api: ServiceApi = Field(
         description="The external API/service this knowledge service uses"
     )
+    hedging: HedgingPolicy | None = Field(
+        default=None,
+        description="Hedging policy for slow queries; None disables hedging",
+    )
+    segmentation: SegmentationPolicy | None = Field(
+        default=None,
+        description="Segmentation of large documents; None always registers "
+        "documents whole",
+    )
+    retrieval: RetrievalPolicy | None = Field(
+        default=None,
+        description="Passage retrieval for long documents; None always "
+        "sends queries the whole document",
+    )
 
     # Timestamps
     created_at: datetime | None = Field(
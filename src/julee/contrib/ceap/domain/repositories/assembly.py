@@ -44,3 +44,35 @@ class AssemblyRepository(BaseRepository[Assembly], Protocol):
     Inherits common CRUD operations (get, save, generate_id) from
     BaseRepository.
     """
+
+    async def find_by_execution(
+        self,
+        execution_id: str,
+        input_document_id: str,
+        assembly_specification_id: str,
+    ) -> Assembly | None:
+        """Find the assembly an execution last started for a document.
+
+        Executions keep their ID across retries (in Temporal, the workflow
+        ID with its first execution run ID), so this finds the assembly that
+        an earlier attempt of the same execution left behind, to resume from
+        its query results. A new execution reusing a workflow ID has a new
+        execution ID, and does not find it.
+
+        Args:
+            execution_id: ID of the execution that created the assembly
+            input_document_id: ID of the document being assembled
+            assembly_specification_id: ID of the specification used
+
+        Returns:
+            The most recently created matching assembly, or None if the
+            execution has not assembled this document with this
+            specification
+
+        .. rubric:: Implementation Notes
+
+        - Must be idempotent: multiple calls return same result
+        - Must find assemblies as soon as they are saved
+
+        """
+        ...
@@ -47,4 +47,70 @@ class DocumentRepository(BaseRepository[Document], Protocol):
     storage atomically.
     """
 
-    pass
+    async def get_segments(
+        self, document_id: str, max_segment_chars: int, overlap_chars: int
+    ) -> list[str]:
+        """Split a large text document into overlapping segment documents.
+
+        Args:
+            document_id: ID of the document to split
+            max_segment_chars: Largest segment, in characters
+            overlap_chars: Characters shared by consecutive segments
+
+        Returns:
+            IDs of the document's segment documents, in document order;
+            just document_id if the document is not split
+
+        Raises:
+            ValueError: If the document does not exist
+
+        .. rubric:: Implementation Notes
+
+        - Must be idempotent: segments are stored under IDs derived from
+          the content multihash and the parameters, and stored segments
+          are reused rather than created again
+        - Documents that fit in one segment, and documents that are not
+          text, are returned as their own single segment
+        - Segment documents are marked with SEGMENT_OF_KEY metadata and
+          must be left out of list_all
+        - split_into_segments (julee.contrib.ceap.domain.services)
+          implements this on get, get_many and save
+
+        """
+        ...
+
+    async def get_passages(
+        self,
+        document_id: str,
+        query_texts: list[str],
+        top_k: int,
+        passage_chars: int,
+    ) -> list[list[str]]:
+        """Retrieve the passages of a text document relevant to queries.
+
+        Args:
+            document_id: ID of the document to retrieve from
+            query_texts: Texts of the queries to retrieve passages for
+            top_k: Most passages per query
+            passage_chars: Largest passage, in characters
+
+        Returns:
+            For each query text, the passages ranked most relevant by
+            BM25, in document order; empty for queries matching no passage
+            and for documents that are not text
+
+        Raises:
+            ValueError: If the document does not exist
+
+        .. rubric:: Implementation Notes
+
+        - Must be idempotent: the passage index is stored under an ID
+          derived from the content multihash and passage_chars, and a
+          stored index is reused rather than built again
+        - Passage index documents are marked with PASSAGE_INDEX_OF_KEY
+          metadata and must be left out of list_all
+        - retrieve_passages (julee.contrib.ceap.domain.services)
+          implements this on get and save
+
+        """
+        ...
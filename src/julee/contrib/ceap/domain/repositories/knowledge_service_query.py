@@ -41,4 +41,23 @@ class KnowledgeServiceQueryRepository(BaseRepository[KnowledgeServiceQuery], Pro
     BaseRepository.
     """
 
-    pass
+    async def find_knowledge_service_ids(self, query_ids: list[str]) -> list[str]:
+        """Find the knowledge services that queries are asked of.
+
+        Lets callers that only route queries, such as an assembly that
+        fans its queries out to query groups, find the services to
+        register a document with without retrieving every query.
+
+        Args:
+            query_ids: IDs of the queries
+
+        Returns:
+            The distinct knowledge_service_ids of the queries found,
+            sorted; queries that are not found are skipped
+
+        .. rubric:: Implementation Notes
+
+        - Must be idempotent: multiple calls return same result
+        - Must return each service once, however many queries use it
+        """
+        ...
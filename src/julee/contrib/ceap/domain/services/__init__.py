@@ -0,0 +1,10 @@
+"""
+CEAP domain services.
+"""
+
+from .document_derivation import retrieve_passages, split_into_segments
+
+__all__ = [
+    "retrieve_passages",
+    "split_into_segments",
+]
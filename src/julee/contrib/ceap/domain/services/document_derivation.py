@@ -0,0 +1,211 @@
+"""
+Documents derived from captured documents: segments and passage indexes.
+
+Large text documents are split into overlapping segments for knowledge
+services with a small context window, and indexed for BM25 passage
+retrieval. Both are stored as documents of their own, under IDs derived
+from the source's content multihash and the parameters, so that they are
+created once for any given content and found again by every later
+assembly of it. Document repositories implement get_segments and
+get_passages with these functions.
+"""
+
+import hashlib
+import json
+import logging
+
+import multihash  # type: ignore[import-untyped]
+
+from julee.contrib.ceap.domain.models import Document
+from julee.contrib.ceap.domain.models.document.retrieval import (
+    PASSAGE_INDEX_OF_KEY,
+    build_passage_index,
+    passage_index_document_id,
+    rank_passages,
+)
+from julee.contrib.ceap.domain.models.document.segmentation import (
+    SEGMENT_OF_KEY,
+    is_segmentable,
+    segment_bounds,
+    segment_document_id,
+)
+from julee.repositories.base import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _read_text(document: Document) -> str:
+    """Read a document's whole content as text."""
+    if document.content is not None:
+        if document.content.stream.seekable():
+            document.content.seek(0)
+        raw_bytes = document.content.read()
+    elif document.content_bytes is not None:
+        raw_bytes = document.content_bytes
+    else:
+        raise ValueError(f"Document has no content: {document.document_id}")
+    return raw_bytes.decode("utf-8", errors="replace")
+
+
+def _content_multihash(content: bytes) -> str:
+    digest = hashlib.sha256(content).digest()
+    return str(multihash.encode(digest, multihash.SHA2_256).hex())
+
+
+async def split_into_segments(
+    repo: BaseRepository[Document],
+    document_id: str,
+    max_segment_chars: int,
+    overlap_chars: int,
+) -> list[str]:
+    """Split a large text document into overlapping segment documents.
+
+    Reads the whole document into memory to split it, and stores the
+    segments with repo.save; see DocumentRepository.get_segments.
+
+    Args:
+        repo: Repository holding the document and its segments
+        document_id: ID of the document to split
+        max_segment_chars: Largest segment, in characters
+        overlap_chars: Characters shared by consecutive segments
+
+    Returns:
+        IDs of the document's segment documents, in document order;
+        just document_id if the document is not split
+
+    Raises:
+        ValueError: If the document does not exist
+    """
+    document = await repo.get(document_id)
+    if document is None:
+        raise ValueError(f"Document not found: {document_id}")
+    # UTF-8 text has at least as many bytes as characters
+    if document.size_bytes <= max_segment_chars or not is_segmentable(
+        document.content_type
+    ):
+        return [document_id]
+
+    def segment_id(index: int) -> str:
+        return segment_document_id(
+            document.content_multihash, max_segment_chars, overlap_chars, index
+        )
+
+    first = await repo.get(segment_id(0))
+    if first is not None:
+        count = int(first.additional_metadata.get("segment_count", 0))
+        segment_ids = [segment_id(index) for index in range(count)]
+        stored = await repo.get_many(segment_ids)
+        if segment_ids and all(stored.values()):
+            return segment_ids
+
+    text = _read_text(document)
+    bounds = segment_bounds(text, max_segment_chars, overlap_chars)
+    if len(bounds) == 1:
+        return [document_id]
+
+    for index, (start, end) in enumerate(bounds):
+        segment_bytes = text[start:end].encode("utf-8")
+        await repo.save(
+            Document(
+                document_id=segment_id(index),
+                original_filename=(
+                    f"segment-{index + 1}-of-{len(bounds)}-"
+                    f"{document.original_filename}"
+                ),
+                content_type="text/plain",
+                size_bytes=len(segment_bytes),
+                content_multihash=_content_multihash(segment_bytes),
+                status=document.status,
+                additional_metadata={
+                    SEGMENT_OF_KEY: document_id,
+                    "source_content_multihash": document.content_multihash,
+                    "segment_index": index,
+                    "segment_count": len(bounds),
+                    "segment_start": start,
+                    "segment_end": end,
+                },
+                content_bytes=segment_bytes,
+            )
+        )
+
+    logger.info(
+        "Document split into segments",
+        extra={
+            "document_id": document_id,
+            "segment_count": len(bounds),
+            "max_segment_chars": max_segment_chars,
+        },
+    )
+    return [segment_id(index) for index in range(len(bounds))]
+
+
+async def retrieve_passages(
+    repo: BaseRepository[Document],
+    document_id: str,
+    query_texts: list[str],
+    top_k: int,
+    passage_chars: int,
+) -> list[list[str]]:
+    """Retrieve the passages of a text document relevant to queries.
+
+    Keeps the passage index as a JSON document, stored with repo.save and
+    loaded whole; see DocumentRepository.get_passages.
+
+    Args:
+        repo: Repository holding the document and its passage index
+        document_id: ID of the document to retrieve from
+        query_texts: Texts of the queries to retrieve passages for
+        top_k: Most passages per query
+        passage_chars: Largest passage, in characters
+
+    Returns:
+        For each query text, the passages ranked most relevant by BM25,
+        in document order; empty for queries matching no passage and for
+        documents that are not text
+
+    Raises:
+        ValueError: If the document does not exist
+    """
+    document = await repo.get(document_id)
+    if document is None:
+        raise ValueError(f"Document not found: {document_id}")
+    if not is_segmentable(document.content_type):
+        return [[] for _ in query_texts]
+
+    index_id = passage_index_document_id(document.content_multihash, passage_chars)
+    stored = await repo.get(index_id)
+    if stored is not None:
+        index = json.loads(_read_text(stored))
+    else:
+        index = build_passage_index(_read_text(document), passage_chars)
+        index_bytes = json.dumps(index).encode("utf-8")
+        await repo.save(
+            Document(
+                document_id=index_id,
+                original_filename=(f"passage-index-{document.original_filename}.json"),
+                content_type="application/json",
+                size_bytes=len(index_bytes),
+                content_multihash=_content_multihash(index_bytes),
+                status=document.status,
+                additional_metadata={
+                    PASSAGE_INDEX_OF_KEY: document_id,
+                    "source_content_multihash": document.content_multihash,
+                    "passage_count": len(index["passages"]),
+                    "passage_chars": passage_chars,
+                },
+                content_bytes=index_bytes,
+            )
+        )
+        logger.info(
+            "Document passage index built",
+            extra={
+                "document_id": document_id,
+                "passage_count": len(index["passages"]),
+            },
+        )
+
+    passages = index["passages"]
+    return [
+        [passages[passage] for passage in rank_passages(index, query_text, top_k)]
+        for query_text in query_texts
+    ]
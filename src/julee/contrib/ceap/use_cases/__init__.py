@@ -6,11 +6,21 @@ for the CEAP workflow while remaining framework-agnostic, following
 Clean Architecture principles.
 """
 
-from .extract_assemble_data import ExtractAssembleDataUseCase
+from .extract_assemble_data import (
+    ExecuteQueryGroupRequest,
+    ExecuteQueryGroupResponse,
+    ExtractAssembleDataBatchRequest,
+    ExtractAssembleDataBatchResponse,
+    ExtractAssembleDataUseCase,
+)
 from .initialize_system_data import InitializeSystemDataUseCase
 from .validate_document import ValidateDocumentUseCase
 
 __all__ = [
+    "ExecuteQueryGroupRequest",
+    "ExecuteQueryGroupResponse",
+    "ExtractAssembleDataBatchRequest",
+    "ExtractAssembleDataBatchResponse",
     "ExtractAssembleDataUseCase",
     "InitializeSystemDataUseCase",
     "ValidateDocumentUseCase",
@@ -0,0 +1,191 @@
+"""
+Checkpointing of an assembly's query results.
+
+An assembly asks one knowledge service query per schema pointer, and used
+to keep their results only in memory until the assembled document was
+stored - so a query failing late in a large specification, or a final
+validation failure, cost every query again when the assembly was retried.
+
+Instead, results are validated against their pointers' schemas as soon as
+they arrive, and the valid ones are saved in the assembly's query_results -
+once per batch of results, such as a group of queries, so that saving does
+not grow with the square of the number of queries.
+Each result is saved with the fingerprint of the query it answered
+(query_fingerprint), as its query may be edited before the assembly is
+retried.
+A retry of the same execution finds the assembly its earlier attempt left
+behind (AssemblyRepository.find_by_execution), reuses the saved results
+that are still valid and answer the queries as they now are, and re-runs
+only the other queries.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import jsonschema
+
+from julee.contrib.ceap.domain.models import (
+    Assembly,
+    AssemblyStatus,
+    KnowledgeServiceQuery,
+)
+from julee.contrib.ceap.domain.repositories import AssemblyRepository
+
+from .pointable_json_schema import PointableJSONSchema
+from .query_coalescing import ResponseCallback
+
+logger = logging.getLogger(__name__)
+
+# Statuses of assemblies that a retry of their execution picks up again
+RESUMABLE_STATUSES = frozenset({AssemblyStatus.IN_PROGRESS, AssemblyStatus.FAILED})
+
+
+def is_valid_result(result: Any, schema: Mapping[str, Any]) -> bool:
+    """Whether a query result conforms to its pointer's schema."""
+    if result is None:
+        return False
+    try:
+        jsonschema.validate(result, schema)
+    except Exception:
+        # Including schemas that cannot be checked: such results are not
+        # trusted enough to skip their query on a retry
+        return False
+    return True
+
+
+def query_fingerprint(query: KnowledgeServiceQuery) -> str:
+    """A digest of a query's ID and of everything sent when it is asked.
+
+    Its name and timestamps are left out, as they do not change the answer.
+    """
+    asked = query.model_dump(mode="json", exclude={"name", "created_at", "updated_at"})
+    content = json.dumps(asked, sort_keys=True)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class AssemblyCheckpoint:
+    """Saves an assembly's valid query results as they arrive."""
+
+    def __init__(self, assembly_repo: AssemblyRepository, assembly: Assembly) -> None:
+        self._assembly_repo = assembly_repo
+        self._assembly = assembly
+        # Serializes saves, so a slower save never overwrites a later one
+        self._lock = asyncio.Lock()
+
+    @property
+    def assembly(self) -> Assembly:
+        """The assembly, with every result recorded so far."""
+        return self._assembly
+
+    def saved_fingerprints(
+        self, pointable_schema: PointableJSONSchema, schema_pointers: Iterable[str]
+    ) -> dict[str, str]:
+        """Query fingerprints of the saved results still valid against their
+        pointer's schema.
+
+        Args:
+            pointable_schema: The specification's resolved schema
+            schema_pointers: Pointers the assembly needs results for
+
+        Returns:
+            The fingerprints of the queries the results answered, keyed by
+            schema pointer
+        """
+        saved = self._assembly.query_results
+        fingerprints = self._assembly.query_fingerprints
+        return {
+            schema_pointer: fingerprints[schema_pointer]
+            for schema_pointer in schema_pointers
+            if schema_pointer in saved
+            and schema_pointer in fingerprints
+            and is_valid_result(
+                saved[schema_pointer],
+                pointable_schema.target_schema_for_pointer(schema_pointer),
+            )
+        }
+
+    def reusable_results(
+        self, pointable_schema: PointableJSONSchema, fingerprints: Mapping[str, str]
+    ) -> dict[str, Any]:
+        """Saved results that are still valid and answer the queries now asked.
+
+        Args:
+            pointable_schema: The specification's resolved schema
+            fingerprints: Fingerprints of the queries the assembly needs
+                results for, keyed by schema pointer
+
+        Returns:
+            The reusable results keyed by schema pointer
+        """
+        saved = self.saved_fingerprints(pointable_schema, fingerprints)
+        return {
+            schema_pointer: self._assembly.query_results[schema_pointer]
+            for schema_pointer, fingerprint in saved.items()
+            if fingerprint == fingerprints[schema_pointer]
+        }
+
+    def recorder(
+        self, pointable_schema: PointableJSONSchema, fingerprints: Mapping[str, str]
+    ) -> ResponseCallback:
+        """A callback recording each batch of results it is given."""
+
+        async def record(results: Mapping[str, Any]) -> None:
+            await self.record_many(results, pointable_schema, fingerprints)
+
+        return record
+
+    async def record_many(
+        self,
+        results: Mapping[str, Any],
+        pointable_schema: PointableJSONSchema,
+        fingerprints: Mapping[str, str],
+    ) -> None:
+        """Save the query results that are valid against their pointers' schemas.
+
+        The valid results are saved together, in one save of the assembly,
+        with the fingerprints of the queries they answered. Invalid results
+        are not saved, so a retry asks their query again; they are still
+        returned to the assembly, whose final validation decides whether it
+        fails. Neither are results of queries without a fingerprint, as a
+        retry could not tell whether they still answer their query.
+
+        Args:
+            results: Query results keyed by schema pointer
+            pointable_schema: The specification's resolved schema
+            fingerprints: Fingerprints of the queries answered, keyed by
+                schema pointer
+        """
+        valid = {}
+        for schema_pointer, result in results.items():
+            if schema_pointer in fingerprints and is_valid_result(
+                result, pointable_schema.target_schema_for_pointer(schema_pointer)
+            ):
+                valid[schema_pointer] = result
+            else:
+                logger.info(
+                    "Query result failed validation, not checkpointed",
+                    extra={
+                        "assembly_id": self._assembly.assembly_id,
+                        "schema_pointer": schema_pointer,
+                    },
+                )
+        if not valid:
+            return
+        async with self._lock:
+            self._assembly = self._assembly.model_copy(
+                update={
+                    "query_results": {**self._assembly.query_results, **valid},
+                    "query_fingerprints": {
+                        **self._assembly.query_fingerprints,
+                        **{
+                            schema_pointer: fingerprints[schema_pointer]
+                            for schema_pointer in valid
+                        },
+                    },
+                }
+            )
+            await self._assembly_repo.save(self._assembly)
@@ -7,15 +7,16 @@ remaining framework-agnostic. Dependencies are injected via repository
 instances following the Clean Architecture principles.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
-from collections.abc import Mapping
+from collections.abc import Awaitable, Callable, Mapping
 from typing import Any
 
 import jsonschema
 import multihash
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from julee.contrib.ceap._schema_ref import extract_schema_from_fetched
 from julee.contrib.ceap.domain.models import (
@@ -24,6 +25,7 @@ from julee.contrib.ceap.domain.models import (
     AssemblyStatus,
     Document,
     DocumentStatus,
+    KnowledgeServiceConfig,
     KnowledgeServiceQuery,
 )
 from julee.contrib.ceap.domain.repositories import (
@@ -36,14 +38,83 @@ from julee.contrib.ceap.domain.repositories import (
 )
 from julee.core.services import ClockService, ExecutionService, SystemClockService
 from julee.core.services.execution import DefaultExecutionService
-from julee.services import KnowledgeService
+from julee.services import BatchKnowledgeService, KnowledgeService
+from julee.services.knowledge_service import (
+    BatchQueryOutcome,
+    BatchQueryRequest,
+    BatchQueryResults,
+)
 from julee.util.validation import ensure_repository_protocol, validate_parameter_types
 
+from .assembly_checkpoint import (
+    RESUMABLE_STATUSES,
+    AssemblyCheckpoint,
+    query_fingerprint,
+)
 from .decorators import try_use_case_step
+from .model_cascade import execute_cascaded_query
+from .passage_retrieval import passage_query, retrieval_query_text
 from .pointable_json_schema import PointableJSONSchema
+from .query_coalescing import (
+    MAX_COALESCED_QUERIES,
+    CoalescibleQuery,
+    QueryCoalescer,
+    ResponseCallback,
+)
+from .segmented_extraction import SegmentedQuery, extract_from_segments
 
 logger = logging.getLogger(__name__)
 
+# How often a bulk assembly checks whether its query batches have ended.
+# Batches typically take minutes to hours, so polling is deliberately slow.
+BATCH_POLL_INTERVAL_SECONDS = 60.0
+
+# Queries per submitted batch, bounding the size of each submission and of
+# its results (which cross activity boundaries in workflows).
+MAX_BATCH_REQUESTS = 500
+
+# Estimated bytes per submitted batch, counting each request twice (it is
+# passed again to collect the results) and its largest possible answer.
+# Temporal rejects payloads over 2 MB by default.
+MAX_BATCH_PAYLOAD_BYTES = 1_000_000
+
+# Answer allowance for requests that do not set max_tokens, matching the
+# services' default, and a generous size of a token of JSON answer
+DEFAULT_BATCH_ANSWER_TOKENS = 4000
+BYTES_PER_ANSWER_TOKEN = 4
+
+
+def _estimated_batch_payload_bytes(request: BatchQueryRequest) -> int:
+    """Bytes a request adds to its batch's submission and results."""
+    max_tokens = (request.query_metadata or {}).get(
+        "max_tokens", DEFAULT_BATCH_ANSWER_TOKENS
+    )
+    return 2 * len(request.model_dump_json()) + BYTES_PER_ANSWER_TOKEN * int(max_tokens)
+
+
+def _chunk_batch_requests(
+    requests: list[BatchQueryRequest], max_requests: int, max_bytes: int
+) -> list[list[BatchQueryRequest]]:
+    """Split requests into batches within both a count and a size limit.
+
+    A request larger than max_bytes on its own gets a batch to itself.
+    """
+    chunks: list[list[BatchQueryRequest]] = []
+    chunk: list[BatchQueryRequest] = []
+    chunk_bytes = 0
+    for request in requests:
+        request_bytes = _estimated_batch_payload_bytes(request)
+        if chunk and (
+            len(chunk) >= max_requests or chunk_bytes + request_bytes > max_bytes
+        ):
+            chunks.append(chunk)
+            chunk, chunk_bytes = [], 0
+        chunk.append(request)
+        chunk_bytes += request_bytes
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
 
 class ExtractAssembleDataRequest(BaseModel):
     document_id: str
@@ -54,6 +125,49 @@ class ExtractAssembleDataResponse(BaseModel):
     assembly: Assembly
 
 
+class ExtractAssembleDataBatchRequest(BaseModel):
+    """Assemble many documents against one specification in bulk."""
+
+    document_ids: list[str]
+    assembly_specification_id: str
+
+
+class ExtractAssembleDataBatchResponse(BaseModel):
+    assemblies: list[Assembly]  # in document_ids order
+
+
+class ExecuteQueryGroupRequest(BaseModel):
+    """A slice of an assembly specification's queries to run together.
+
+    The group retrieves its own queries, and the passages relevant to them
+    for services that retrieve (see passage_retrieval), so that only
+    identifiers cross the runner boundary.
+    """
+
+    resolved_jsonschema: dict[str, Any]
+    knowledge_service_queries: dict[str, str]  # schema pointer -> query id
+    document_id: str
+    document_size_bytes: int
+    document_registrations: dict[str, str]  # service id -> service file id
+    # service id -> segment file ids, for services given the document in
+    # segments (see segmented_extraction)
+    segment_registrations: dict[str, list[str]] = Field(default_factory=dict)
+    # schema pointer -> query fingerprint, for the results an earlier
+    # attempt saved; the queries they still answer are not run again
+    saved_fingerprints: dict[str, str] = Field(default_factory=dict)
+
+
+class ExecuteQueryGroupResponse(BaseModel):
+    results: dict[str, Any]  # schema pointer -> query result data
+    # schema pointer -> fingerprint of the query each result answered
+    query_fingerprints: dict[str, str] = Field(default_factory=dict)
+
+
+QueryGroupRunner = Callable[
+    [ExecuteQueryGroupRequest], Awaitable[ExecuteQueryGroupResponse]
+]
+
+
 class ExtractAssembleDataUseCase:
     """
     Use case for extracting and assembling documents according to
@@ -93,6 +207,9 @@ class ExtractAssembleDataUseCase:
         remote_schema_repo: RemoteSchemaRepository,
         clock_service: ClockService | None = None,
         execution_service: ExecutionService | None = None,
+        query_group_runner: QueryGroupRunner | None = None,
+        query_group_size: int | None = None,
+        coalesce_queries: bool = False,
     ) -> None:
         """Initialize extract and assemble data use case.
 
@@ -113,6 +230,16 @@ class ExtractAssembleDataUseCase:
             execution_service: Service for obtaining the execution ID.
                 Defaults to DefaultExecutionService. Inject
                 TemporalExecutionService inside Temporal workflows.
+            query_group_runner: Optional runner for groups of queries. When
+                set together with query_group_size, specifications with more
+                queries than query_group_size are partitioned into groups and
+                each group is handed to the runner (e.g. a child workflow)
+                instead of being executed inline.
+            query_group_size: Maximum number of queries per group.
+            coalesce_queries: Ask compatible queries (same service, file
+                and model settings) together in one knowledge service
+                query, falling back to individual queries for answers that
+                fail validation. See query_coalescing.
 
         .. note::
 
@@ -155,6 +282,14 @@ class ExtractAssembleDataUseCase:
             knowledge_service_config_repo,
             KnowledgeServiceConfigRepository,  # type: ignore[type-abstract]
         )
+        if query_group_size is not None and query_group_size < 1:
+            raise ValueError("query_group_size must be at least 1")
+        self._query_group_runner = query_group_runner
+        self._query_group_size = query_group_size
+        self._query_coalescer = QueryCoalescer(
+            knowledge_service,
+            max_group_size=MAX_COALESCED_QUERIES if coalesce_queries else 1,
+        )
 
     async def execute(
         self, request: ExtractAssembleDataRequest
@@ -176,22 +311,30 @@ class ExtractAssembleDataUseCase:
 
         This method orchestrates the core assembly workflow:
 
-        1. Generates a unique assembly ID
+        1. Finds the assembly an earlier attempt of this execution left
+           behind, or generates a unique assembly ID
         2. Retrieves the assembly specification
-        3. Stores the initial assembly in the repository
-        4. Retrieves all knowledge service queries needed for the assembly
-        5. Retrieves all knowledge service instances needed for the assembly
+        3. Stores the initial (or resumed) assembly in the repository
+        4. Retrieves all knowledge service queries needed for the assembly,
+           or only the services they are asked of when the queries are
+           fanned out to query groups
+        5. Retrieves relevant passages for queries to services that
+           retrieve
         6. Retrieves the input document and registers it with knowledge
            services
-        7. Performs the assembly iteration to create the assembled document
+        7. Performs the assembly iteration to create the assembled document,
+           saving each valid query result in the assembly as it arrives
         8. Adds the iteration to the assembly and returns it
 
+        A retried execution resumes its earlier assembly, and only asks the
+        queries whose results were not saved (see assembly_checkpoint).
+
         Args:
             document_id: ID of the document to assemble
             assembly_specification_id: ID of the specification to use
 
         Returns:
-            New Assembly with the assembled document iteration
+            New or resumed Assembly with the assembled document iteration
 
         Raises:
             ValueError: If required entities are not found or invalid
@@ -208,10 +351,17 @@ class ExtractAssembleDataUseCase:
             },
         )
 
-        # Step 1: Generate unique assembly ID
-        assembly_id = await self._generate_assembly_id(
-            document_id, assembly_specification_id
+        # Step 1: Resume an earlier attempt's assembly, or generate a
+        # unique assembly ID
+        previous = await self._find_resumable_assembly(
+            execution_id, document_id, assembly_specification_id
         )
+        if previous is None:
+            assembly_id = await self._generate_assembly_id(
+                document_id, assembly_specification_id
+            )
+        else:
+            assembly_id = previous.assembly_id
 
         # Step 2: Retrieve the assembly specification
         assembly_specification = await self._retrieve_assembly_specification(
@@ -220,16 +370,21 @@ class ExtractAssembleDataUseCase:
 
         # Step 3: Store the initial assembly
         now = self._clock_service.now()
-        assembly = Assembly(
-            assembly_id=assembly_id,
-            assembly_specification_id=assembly_specification_id,
-            input_document_id=document_id,
-            execution_id=execution_id,
-            status=AssemblyStatus.IN_PROGRESS,
-            assembled_document_id=None,
-            created_at=now,
-            updated_at=now,
-        )
+        if previous is None:
+            assembly = Assembly(
+                assembly_id=assembly_id,
+                assembly_specification_id=assembly_specification_id,
+                input_document_id=document_id,
+                execution_id=execution_id,
+                status=AssemblyStatus.IN_PROGRESS,
+                assembled_document_id=None,
+                created_at=now,
+                updated_at=now,
+            )
+        else:
+            assembly = previous.model_copy(
+                update={"status": AssemblyStatus.IN_PROGRESS, "updated_at": now}
+            )
         await self.assembly_repo.save(assembly)
 
         logger.debug(
@@ -237,29 +392,73 @@ class ExtractAssembleDataUseCase:
             extra={
                 "assembly_id": assembly_id,
                 "status": assembly.status.value,
+                "saved_result_count": len(assembly.query_results),
             },
         )
 
-        # Step 4: Retrieve all knowledge service queries once
-        queries = await self._retrieve_all_queries(assembly_specification)
-
-        # Step 5: Register the document with knowledge services
         document = await self._retrieve_document(document_id)
+        queries: dict[str, KnowledgeServiceQuery] | None
+        retrieved_passages: dict[str, list[str]] = {}
+        if self._fans_out(len(assembly_specification.knowledge_service_queries)):
+            # Step 4: Query groups retrieve their own queries and passages,
+            # so that this history does not grow with the number of
+            # queries; the document is registered with every service the
+            # queries are asked of, for those no passage matches
+            queries = None
+            knowledge_service_ids = await self._retrieve_knowledge_service_ids(
+                assembly_specification
+            )
+        else:
+            # Step 4: Retrieve all knowledge service queries once
+            queries = await self._retrieve_all_queries(assembly_specification)
+
+            # Step 5: Retrieve relevant passages for queries to services
+            # that retrieve; the document is registered for the rest
+            retrieved_passages = await self._retrieve_passages(
+                document.document_id,
+                document.size_bytes,
+                assembly_specification.knowledge_service_queries,
+                queries,
+            )
+            knowledge_service_ids = sorted(
+                {
+                    queries[query_id].knowledge_service_id
+                    for schema_pointer, query_id in (
+                        assembly_specification.knowledge_service_queries.items()
+                    )
+                    if schema_pointer not in retrieved_passages
+                }
+            )
+
+        # Step 6: Register the document with knowledge services, in
+        # segments for services that cannot take it whole
+        segment_registrations = await self._register_document_segments(
+            document, knowledge_service_ids
+        )
         document_registrations = await self._register_document_with_services(
-            document, queries
+            document,
+            [
+                knowledge_service_id
+                for knowledge_service_id in knowledge_service_ids
+                if knowledge_service_id not in segment_registrations
+            ],
         )
 
         # Step 7: Perform the assembly iteration
+        checkpoint = AssemblyCheckpoint(self.assembly_repo, assembly)
         try:
             assembled_document_id = await self._assemble_iteration(
                 document,
                 assembly_specification,
                 document_registrations,
                 queries,
+                segment_registrations,
+                retrieved_passages,
+                checkpoint,
             )
 
             # Step 8: Set the assembled document and return
-            assembly = assembly.model_copy(
+            assembly = checkpoint.assembly.model_copy(
                 update={
                     "assembled_document_id": assembled_document_id,
                     "status": AssemblyStatus.COMPLETED,
@@ -278,8 +477,10 @@ class ExtractAssembleDataUseCase:
             return assembly
 
         except Exception as e:
-            # Mark assembly as failed
-            assembly = assembly.model_copy(update={"status": AssemblyStatus.FAILED})
+            # Mark assembly as failed, keeping the results saved so far
+            assembly = checkpoint.assembly.model_copy(
+                update={"status": AssemblyStatus.FAILED}
+            )
             await self.assembly_repo.save(assembly)
 
             logger.error(
@@ -292,12 +493,427 @@ class ExtractAssembleDataUseCase:
             )
             raise
 
+    async def execute_batch(
+        self, request: ExtractAssembleDataBatchRequest
+    ) -> ExtractAssembleDataBatchResponse:
+        assemblies = await self.assemble_data_batch(
+            request.document_ids,
+            request.assembly_specification_id,
+        )
+        return ExtractAssembleDataBatchResponse(assemblies=assemblies)
+
+    async def assemble_data_batch(
+        self,
+        document_ids: list[str],
+        assembly_specification_id: str,
+        poll_interval_seconds: float = BATCH_POLL_INTERVAL_SECONDS,
+        max_batch_requests: int = MAX_BATCH_REQUESTS,
+        max_batch_bytes: int = MAX_BATCH_PAYLOAD_BYTES,
+    ) -> list[Assembly]:
+        """
+        Assemble many documents using knowledge service query batches.
+
+        Instead of executing each query interactively, the queries of every
+        document are submitted together as query batches, which services
+        process offline at lower cost and outside interactive rate limits.
+        Once the batches have ended, the results are scattered back to each
+        document's assembly, which is then validated and completed exactly
+        as in assemble_data.
+
+        Failures are isolated per document: an assembly whose document
+        cannot be registered, or any of whose queries fails or was in a
+        batch that could not be submitted, is marked FAILED while the
+        others complete. Submissions are not retried, since a retry after
+        the service accepted a batch would submit it twice.
+
+        Args:
+            document_ids: IDs of the documents to assemble
+            assembly_specification_id: ID of the specification to use
+            poll_interval_seconds: Delay between batch status checks. In
+                workflows the wait is a durable timer.
+            max_batch_requests: Maximum number of queries per batch
+            max_batch_bytes: Maximum estimated size of a batch's submission
+                and results (see _estimated_batch_payload_bytes)
+
+        Returns:
+            One Assembly per document, in document_ids order
+
+        Raises:
+            ValueError: If the knowledge service does not support query
+                batches or the specification is not found
+
+        """
+        if not isinstance(self.knowledge_service, BatchKnowledgeService):
+            raise ValueError("Knowledge service does not support query batches")
+        if max_batch_requests < 1:
+            raise ValueError("max_batch_requests must be at least 1")
+        batch_service = self.knowledge_service
+
+        logger.debug(
+            "Starting batch data assembly use case",
+            extra={
+                "document_count": len(document_ids),
+                "assembly_specification_id": assembly_specification_id,
+            },
+        )
+
+        assembly_specification = await self._retrieve_assembly_specification(
+            assembly_specification_id
+        )
+        queries = await self._retrieve_all_queries(assembly_specification)
+        resolved_jsonschema = await self._resolve_jsonschema(
+            assembly_specification.jsonschema
+        )
+        pointable_schema = PointableJSONSchema(resolved_jsonschema)
+        pointers = list(assembly_specification.knowledge_service_queries)
+
+        # Prepare an assembly per document and the batch requests for its
+        # queries, grouped by knowledge service. custom_ids encode the
+        # document and pointer positions so outcomes can be scattered back.
+        assemblies: list[Assembly] = []
+        requests_by_service: dict[str, list[BatchQueryRequest]] = {}
+        for document_index, document_id in enumerate(document_ids):
+            assembly = await self._start_assembly(
+                document_id, assembly_specification_id
+            )
+            assemblies.append(assembly)
+            try:
+                document = await self._retrieve_document(document_id)
+                registrations = await self._register_document_with_services(
+                    document,
+                    sorted({query.knowledge_service_id for query in queries.values()}),
+                )
+            except Exception as e:
+                assemblies[-1] = await self._fail_assembly(assembly, e)
+                continue
+
+            for pointer_index, schema_pointer in enumerate(pointers):
+                query = queries[
+                    assembly_specification.knowledge_service_queries[schema_pointer]
+                ]
+                requests_by_service.setdefault(query.knowledge_service_id, []).append(
+                    BatchQueryRequest(
+                        custom_id=f"d{document_index}-q{pointer_index}",
+                        query_text=query.prompt,
+                        output_schema=pointable_schema.schema_for_pointer(
+                            schema_pointer
+                        ),
+                        service_file_ids=[registrations[query.knowledge_service_id]],
+                        query_metadata=dict(query.query_metadata or {}),
+                        assistant_prompt=query.assistant_prompt,
+                    )
+                )
+
+        # Submit every batch first so the services work on them in
+        # parallel, then wait for each in turn
+        submitted = []
+        outcomes = {}
+        for knowledge_service_id, requests in requests_by_service.items():
+            config = await self.knowledge_service_config_repo.get(knowledge_service_id)
+            if not config:
+                raise ValueError(
+                    f"Knowledge service config not found: {knowledge_service_id}"
+                )
+            for chunk in _chunk_batch_requests(
+                requests, max_batch_requests, max_batch_bytes
+            ):
+                try:
+                    submission = await batch_service.submit_query_batch(config, chunk)
+                except Exception as e:
+                    logger.error(
+                        "Query batch submission failed",
+                        extra={
+                            "knowledge_service_id": knowledge_service_id,
+                            "request_count": len(chunk),
+                            "error": str(e),
+                        },
+                    )
+                    for request in chunk:
+                        outcomes[request.custom_id] = BatchQueryOutcome(
+                            custom_id=request.custom_id,
+                            error=f"Batch submission failed: {e}",
+                        )
+                    continue
+                submitted.append((config, submission, chunk))
+
+        for config, submission, chunk in submitted:
+            while not submission.is_ended:
+                await asyncio.sleep(poll_interval_seconds)
+                submission = await batch_service.get_query_batch(
+                    config, submission.batch_id
+                )
+            results: BatchQueryResults = await batch_service.get_query_batch_results(
+                config, submission.batch_id, chunk
+            )
+            outcomes.update(results.by_custom_id())
+
+        logger.debug(
+            "Query batches ended",
+            extra={"batch_count": len(submitted), "outcome_count": len(outcomes)},
+        )
+
+        # Scatter the outcomes back to their assemblies
+        for document_index, assembly in enumerate(assemblies):
+            if assembly.status != AssemblyStatus.IN_PROGRESS:
+                continue
+            try:
+                results_by_pointer = {}
+                for pointer_index, schema_pointer in enumerate(pointers):
+                    outcome = outcomes.get(f"d{document_index}-q{pointer_index}")
+                    if outcome is None or outcome.result is None:
+                        error = outcome.error if outcome else "no outcome"
+                        raise RuntimeError(
+                            f"Query for '{schema_pointer}' failed: {error}"
+                        )
+                    response = outcome.result.result_data.get("response")
+                    if response is None:
+                        raise ValueError("Knowledge service returned no response data")
+                    results_by_pointer[schema_pointer] = response
+
+                assembled_document_id = await self._complete_assembly_data(
+                    results_by_pointer,
+                    pointers,
+                    resolved_jsonschema,
+                    assembly_specification,
+                )
+            except Exception as e:
+                assemblies[document_index] = await self._fail_assembly(assembly, e)
+                continue
+
+            assembly = assembly.model_copy(
+                update={
+                    "assembled_document_id": assembled_document_id,
+                    "status": AssemblyStatus.COMPLETED,
+                }
+            )
+            await self.assembly_repo.save(assembly)
+            assemblies[document_index] = assembly
+
+        logger.info(
+            "Batch assembly completed",
+            extra={
+                "assembly_specification_id": assembly_specification_id,
+                "document_count": len(document_ids),
+                "completed_count": sum(
+                    1 for a in assemblies if a.status == AssemblyStatus.COMPLETED
+                ),
+            },
+        )
+
+        return assemblies
+
+    async def _start_assembly(
+        self, document_id: str, assembly_specification_id: str
+    ) -> Assembly:
+        """Create and store an in-progress assembly for a document."""
+        assembly_id = await self._generate_assembly_id(
+            document_id, assembly_specification_id
+        )
+        now = self._clock_service.now()
+        assembly = Assembly(
+            assembly_id=assembly_id,
+            assembly_specification_id=assembly_specification_id,
+            input_document_id=document_id,
+            execution_id=self._execution_service.get_execution_id(),
+            status=AssemblyStatus.IN_PROGRESS,
+            assembled_document_id=None,
+            created_at=now,
+            updated_at=now,
+        )
+        await self.assembly_repo.save(assembly)
+        return assembly
+
+    async def _fail_assembly(self, assembly: Assembly, error: Exception) -> Assembly:
+        """Mark an assembly as failed and store it."""
+        assembly = assembly.model_copy(update={"status": AssemblyStatus.FAILED})
+        await self.assembly_repo.save(assembly)
+        logger.error(
+            "Assembly failed",
+            extra={"assembly_id": assembly.assembly_id, "error": str(error)},
+        )
+        return assembly
+
+    async def _complete_assembly_data(
+        self,
+        results: dict[str, Any],
+        schema_pointers: list[str],
+        resolved_jsonschema: dict[str, Any],
+        assembly_specification: AssemblySpecification,
+    ) -> str:
+        """Stitch query results together, validate and store the document."""
+        assembled_data: dict[str, Any] = {}
+        for schema_pointer in schema_pointers:
+            self._store_result_in_assembled_data(
+                assembled_data, schema_pointer, results[schema_pointer]
+            )
+        self._validate_assembled_data(assembled_data, resolved_jsonschema)
+        return await self._create_assembled_document(
+            assembled_data, assembly_specification
+        )
+
+    @try_use_case_step("passage_retrieval")
+    async def _retrieve_passages(
+        self,
+        document_id: str,
+        document_size_bytes: int,
+        knowledge_service_queries: Mapping[str, str],
+        queries: dict[str, KnowledgeServiceQuery],
+    ) -> dict[str, list[str]]:
+        """
+        Retrieve the passages of a long document relevant to each query.
+
+        Queries to services with a retrieval policy that the document is
+        long enough for get the passages that best match them, unless
+        marked full_context. The document's passage index is built once per
+        document content and reused by later assemblies.
+
+        Args:
+            document_id: ID of the document to retrieve from
+            document_size_bytes: Size of the document's content
+            knowledge_service_queries: Mapping of schema pointer to query_id
+            queries: Dict of query_id to KnowledgeServiceQuery objects
+
+        Returns:
+            Dict mapping schema pointer to the passages retrieved for its
+            query, for queries that are sent passages instead of the
+            document; queries no passage matches are left out
+
+        """
+        pointers_by_service: dict[str, list[str]] = {}
+        for schema_pointer, query_id in knowledge_service_queries.items():
+            query = queries[query_id]
+            if not query.full_context:
+                pointers_by_service.setdefault(query.knowledge_service_id, []).append(
+                    schema_pointer
+                )
+
+        retrieved: dict[str, list[str]] = {}
+        for knowledge_service_id in sorted(pointers_by_service):
+            config = await self.knowledge_service_config_repo.get(knowledge_service_id)
+            if not config:
+                raise ValueError(
+                    f"Knowledge service config not found: {knowledge_service_id}"
+                )
+            policy = config.retrieval
+            # UTF-8 text has at least as many bytes as characters
+            if policy is None or document_size_bytes < policy.min_document_chars:
+                continue
+
+            pointers = pointers_by_service[knowledge_service_id]
+            passages = await self.document_repo.get_passages(
+                document_id,
+                [
+                    retrieval_query_text(
+                        schema_pointer,
+                        queries[knowledge_service_queries[schema_pointer]],
+                    )
+                    for schema_pointer in pointers
+                ],
+                policy.top_k,
+                policy.passage_chars,
+            )
+            for schema_pointer, query_passages in zip(pointers, passages, strict=True):
+                if query_passages:
+                    retrieved[schema_pointer] = query_passages
+
+            logger.debug(
+                "Passages retrieved for knowledge service queries",
+                extra={
+                    "document_id": document_id,
+                    "knowledge_service_id": knowledge_service_id,
+                    "query_count": len(pointers),
+                    "retrieved_count": sum(1 for p in passages if p),
+                },
+            )
+
+        return retrieved
+
+    @try_use_case_step("document_segmentation")
+    async def _register_document_segments(
+        self,
+        document: Document,
+        knowledge_service_ids: list[str],
+    ) -> dict[str, list[str]]:
+        """
+        Register the segments of a large document with knowledge services.
+
+        Services with a segmentation policy that the document is too large
+        for get its segments instead of the whole document. Segments are
+        created once per document content and reused by later assemblies.
+
+        Args:
+            document: The document to register
+            knowledge_service_ids: IDs of the services to register it with
+
+        Returns:
+            Dict mapping knowledge_service_id to the service file IDs of the
+            document's segments, for services given the document in segments
+
+        """
+        registrations: dict[str, list[str]] = {}
+
+        # Sorted so that activities are scheduled in a stable order
+        for knowledge_service_id in sorted(set(knowledge_service_ids)):
+            config = await self.knowledge_service_config_repo.get(knowledge_service_id)
+            if not config:
+                raise ValueError(
+                    f"Knowledge service config not found: {knowledge_service_id}"
+                )
+            policy = config.segmentation
+            if policy is None or document.size_bytes <= policy.max_segment_chars:
+                continue
+
+            segment_ids = await self.document_repo.get_segments(
+                document.document_id, policy.max_segment_chars, policy.overlap_chars
+            )
+            if segment_ids == [document.document_id]:
+                continue
+
+            # Fetched one by one rather than with get_many, whose return
+            # type the workflow proxy cannot validate (see
+            # _retrieve_all_queries), so it would hand back plain dicts
+            segments = await asyncio.gather(
+                *(self.document_repo.get(segment_id) for segment_id in segment_ids)
+            )
+            missing = [
+                segment_id
+                for segment_id, segment in zip(segment_ids, segments, strict=True)
+                if segment is None
+            ]
+            if missing:
+                raise ValueError(
+                    f"Document segments not found for {document.document_id}: "
+                    f"{missing}"
+                )
+
+            registration_results = await asyncio.gather(
+                *(
+                    self.knowledge_service.register_file(config, segment)
+                    for segment in segments
+                    if segment is not None
+                )
+            )
+            registrations[knowledge_service_id] = [
+                result.knowledge_service_file_id for result in registration_results
+            ]
+
+            logger.debug(
+                "Document registered in segments",
+                extra={
+                    "document_id": document.document_id,
+                    "knowledge_service_id": knowledge_service_id,
+                    "segment_count": len(segment_ids),
+                },
+            )
+
+        return registrations
+
     @try_use_case_step("document_registration")
     @validate_parameter_types()
     async def _register_document_with_services(
         self,
         document: Document,
-        queries: dict[str, KnowledgeServiceQuery],
+        knowledge_service_ids: list[str],
     ) -> dict[str, str]:
         """
         Register the document with all knowledge services needed for assembly.
@@ -307,7 +923,7 @@ class ExtractAssembleDataUseCase:
 
         Args:
             document: The document to register
-            queries: Dict of query_id to KnowledgeServiceQuery objects
+            knowledge_service_ids: IDs of the services to register it with
 
         Returns:
             Dict mapping knowledge_service_id to service_file_id
@@ -318,11 +934,7 @@ class ExtractAssembleDataUseCase:
         """
         registrations = {}
 
-        required_service_ids = {
-            query.knowledge_service_id for query in queries.values()
-        }
-
-        for knowledge_service_id in required_service_ids:
+        for knowledge_service_id in dict.fromkeys(knowledge_service_ids):
             # Get the config for this service
             config = await self.knowledge_service_config_repo.get(knowledge_service_id)
             if not config:
@@ -387,6 +999,17 @@ class ExtractAssembleDataUseCase:
             queries[query_id] = query
         return queries
 
+    @try_use_case_step("knowledge_services_retrieval")
+    async def _retrieve_knowledge_service_ids(
+        self, assembly_specification: AssemblySpecification
+    ) -> list[str]:
+        """Retrieve the knowledge services this assembly's queries use."""
+        return await self.knowledge_service_query_repo.find_knowledge_service_ids(
+            list(
+                dict.fromkeys(assembly_specification.knowledge_service_queries.values())
+            )
+        )
+
     async def _resolve_jsonschema(self, schema: Mapping[str, Any]) -> dict[str, Any]:
         """Fetch and resolve a bare $ref schema; return inline schemas unchanged.
 
@@ -407,14 +1030,18 @@ class ExtractAssembleDataUseCase:
         document: Document,
         assembly_specification: AssemblySpecification,
         document_registrations: dict[str, str],
-        queries: dict[str, KnowledgeServiceQuery],
+        queries: dict[str, KnowledgeServiceQuery] | None,
+        segment_registrations: dict[str, list[str]] | None = None,
+        retrieved_passages: dict[str, list[str]] | None = None,
+        checkpoint: AssemblyCheckpoint | None = None,
     ) -> str:
         """
         Perform a single assembly iteration using knowledge services.
 
         This method:
 
-        1. Executes all knowledge service queries defined in the specification
+        1. Executes the knowledge service queries defined in the
+           specification, except those whose results the checkpoint saved
         2. Stitches together the query results into a complete JSON document
         3. Creates and stores the assembled document
         4. Returns the ID of the assembled document
@@ -423,7 +1050,14 @@ class ExtractAssembleDataUseCase:
             document: The input document
             assembly_specification: The specification defining how to assemble
             document_registrations: Mapping of service_id to service_file_id
-            queries: Dict of query_id to KnowledgeServiceQuery objects
+            queries: Dict of query_id to KnowledgeServiceQuery objects, or
+                None to fan all queries out to the query group runner
+            segment_registrations: Mapping of service_id to the file IDs of
+                the document's segments, for services given it in segments
+            retrieved_passages: Mapping of schema pointer to the passages
+                retrieved for its query, for queries sent passages
+            checkpoint: Saves valid query results as they arrive, and
+                holds those saved by earlier attempts
 
         Returns:
             ID of the newly created assembled document
@@ -433,26 +1067,276 @@ class ExtractAssembleDataUseCase:
             RuntimeError: If knowledge service operations fail
 
         """
-        # Initialize the result data structure
-        assembled_data: dict[str, Any] = {}
-
         # Resolve $ref schemas afresh on every query so any published patch
         # to the external schema is picked up automatically.
         resolved_jsonschema = await self._resolve_jsonschema(
             assembly_specification.jsonschema
         )
 
-        # Process each knowledge service query
-        # TODO: This is where we may want to fan-out/fan-in to do these
-        # in parallel.
-        for (
-            schema_pointer,
-            query_id,
-        ) in assembly_specification.knowledge_service_queries.items():
-            # Use PointableJSONSchema to generate complete schema for pointer target
-            pointable_schema = PointableJSONSchema(resolved_jsonschema)
-            output_schema = pointable_schema.schema_for_pointer(schema_pointer)
+        # Reuse the results earlier attempts saved that are still valid and
+        # answer the queries as they now are; query groups retrieve their
+        # own queries, so check that themselves
+        pointable_schema = PointableJSONSchema(resolved_jsonschema)
+        knowledge_service_queries = assembly_specification.knowledge_service_queries
+        fingerprints = (
+            {
+                schema_pointer: query_fingerprint(queries[query_id])
+                for schema_pointer, query_id in knowledge_service_queries.items()
+            }
+            if queries is not None
+            else {}
+        )
+        results = (
+            checkpoint.reusable_results(pointable_schema, fingerprints)
+            if checkpoint
+            else {}
+        )
+        pending_queries = {
+            schema_pointer: query_id
+            for schema_pointer, query_id in knowledge_service_queries.items()
+            if schema_pointer not in results
+        }
+        if results:
+            logger.info(
+                "Resuming assembly from saved query results",
+                extra={
+                    "reused_count": len(results),
+                    "pending_count": len(pending_queries),
+                },
+            )
 
+        # Execute the remaining queries, fanning out to the group runner for
+        # large specifications, then merge the results in specification
+        # order
+        if pending_queries:
+            results.update(
+                await self._execute_queries(
+                    document,
+                    resolved_jsonschema,
+                    pending_queries,
+                    queries,
+                    document_registrations,
+                    segment_registrations or {},
+                    retrieved_passages or {},
+                    fingerprints,
+                    checkpoint,
+                )
+            )
+        return await self._complete_assembly_data(
+            results,
+            list(assembly_specification.knowledge_service_queries),
+            resolved_jsonschema,
+            assembly_specification,
+        )
+
+    async def execute_query_group(
+        self, request: ExecuteQueryGroupRequest
+    ) -> ExecuteQueryGroupResponse:
+        """Execute one group of knowledge service queries.
+
+        This is the unit of work handed to the query group runner when a
+        large specification is partitioned; it retrieves the group's queries
+        itself so that only identifiers cross the runner boundary.
+
+        Queries that results saved by an earlier attempt still answer, as
+        their fingerprints tell, are not run again.
+
+        Args:
+            request: The group's schema pointers, the resolved schema, the
+                document, its knowledge service registrations and the
+                fingerprints of the saved results
+
+        Returns:
+            Query result data and the fingerprints of the queries answered,
+            keyed by schema pointer, for the queries that were run
+        """
+        queries = {}
+        # Ordered de-duplication keeps activity order stable across replays
+        for query_id in dict.fromkeys(request.knowledge_service_queries.values()):
+            query = await self.knowledge_service_query_repo.get(query_id)
+            if not query:
+                raise ValueError(f"Knowledge service query not found: {query_id}")
+            queries[query_id] = query
+
+        fingerprints = {
+            schema_pointer: query_fingerprint(queries[query_id])
+            for schema_pointer, query_id in request.knowledge_service_queries.items()
+        }
+        pending_queries = {
+            schema_pointer: query_id
+            for schema_pointer, query_id in request.knowledge_service_queries.items()
+            if request.saved_fingerprints.get(schema_pointer)
+            != fingerprints[schema_pointer]
+        }
+        if not pending_queries:
+            return ExecuteQueryGroupResponse(results={})
+
+        retrieved_passages = await self._retrieve_passages(
+            request.document_id,
+            request.document_size_bytes,
+            pending_queries,
+            queries,
+        )
+        results = await self._run_queries(
+            request.resolved_jsonschema,
+            pending_queries,
+            queries,
+            request.document_registrations,
+            request.segment_registrations,
+            retrieved_passages,
+        )
+        return ExecuteQueryGroupResponse(
+            results=results,
+            query_fingerprints={
+                schema_pointer: fingerprints[schema_pointer]
+                for schema_pointer in results
+            },
+        )
+
+    def _fans_out(self, query_count: int) -> bool:
+        """Whether a specification's queries are run in query groups."""
+        return (
+            self._query_group_runner is not None
+            and self._query_group_size is not None
+            and query_count > self._query_group_size
+        )
+
+    async def _execute_queries(
+        self,
+        document: Document,
+        resolved_jsonschema: dict[str, Any],
+        knowledge_service_queries: Mapping[str, str],
+        queries: dict[str, KnowledgeServiceQuery] | None,
+        document_registrations: dict[str, str],
+        segment_registrations: dict[str, list[str]],
+        retrieved_passages: dict[str, list[str]],
+        fingerprints: Mapping[str, str],
+        checkpoint: AssemblyCheckpoint | None = None,
+    ) -> dict[str, Any]:
+        """Execute all queries inline, or in groups via the runner.
+
+        Queries are run inline when they were retrieved, with fingerprints
+        holding theirs, and fanned out to the query group runner, which
+        retrieves them, when queries is None. The checkpoint records each
+        batch of results as it arrives: per coalesced group when inline,
+        per query group when fanned out. Query groups reuse the results it
+        saved that still answer their queries, and those are returned too.
+        """
+        pointable_schema = PointableJSONSchema(resolved_jsonschema)
+        if queries is not None:
+            return await self._run_queries(
+                resolved_jsonschema,
+                knowledge_service_queries,
+                queries,
+                document_registrations,
+                segment_registrations,
+                retrieved_passages,
+                (
+                    checkpoint.recorder(pointable_schema, fingerprints)
+                    if checkpoint
+                    else None
+                ),
+            )
+
+        group_size = self._query_group_size
+        if self._query_group_runner is None or group_size is None:
+            raise ValueError("Queries must be retrieved without a query group runner")
+
+        items = list(knowledge_service_queries.items())
+        saved_fingerprints = (
+            checkpoint.saved_fingerprints(pointable_schema, knowledge_service_queries)
+            if checkpoint
+            else {}
+        )
+        groups = [
+            ExecuteQueryGroupRequest(
+                resolved_jsonschema=resolved_jsonschema,
+                knowledge_service_queries=dict(items[start : start + group_size]),
+                document_id=document.document_id,
+                document_size_bytes=document.size_bytes,
+                document_registrations=document_registrations,
+                segment_registrations=segment_registrations,
+                saved_fingerprints={
+                    schema_pointer: saved_fingerprints[schema_pointer]
+                    for schema_pointer, _ in items[start : start + group_size]
+                    if schema_pointer in saved_fingerprints
+                },
+            )
+            for start in range(0, len(items), group_size)
+        ]
+
+        logger.debug(
+            "Fanning out knowledge service queries",
+            extra={"query_count": len(items), "group_count": len(groups)},
+        )
+
+        query_group_runner = self._query_group_runner
+
+        async def run_group(
+            group: ExecuteQueryGroupRequest,
+        ) -> ExecuteQueryGroupResponse:
+            response = await query_group_runner(group)
+            if checkpoint is not None:
+                await checkpoint.record_many(
+                    response.results, pointable_schema, response.query_fingerprints
+                )
+            return response
+
+        # Every group runs to the end even if another fails, so that the
+        # results of all the groups that succeed are kept
+        responses = await asyncio.gather(
+            *(run_group(group) for group in groups), return_exceptions=True
+        )
+
+        results: dict[str, Any] = {}
+        for response in responses:
+            if isinstance(response, BaseException):
+                raise response
+            results.update(response.results)
+
+        # The groups did not run the queries whose saved results still
+        # answer them
+        if checkpoint is not None:
+            reused = {
+                schema_pointer: checkpoint.assembly.query_results[schema_pointer]
+                for schema_pointer in saved_fingerprints
+                if schema_pointer not in results
+            }
+            if reused:
+                logger.info(
+                    "Query groups resumed from saved query results",
+                    extra={"reused_count": len(reused)},
+                )
+            results.update(reused)
+        return {
+            schema_pointer: results[schema_pointer]
+            for schema_pointer in knowledge_service_queries
+        }
+
+    async def _run_queries(
+        self,
+        resolved_jsonschema: dict[str, Any],
+        knowledge_service_queries: Mapping[str, str],
+        queries: dict[str, KnowledgeServiceQuery],
+        document_registrations: dict[str, str],
+        segment_registrations: Mapping[str, list[str]] | None = None,
+        retrieved_passages: Mapping[str, list[str]] | None = None,
+        on_result: ResponseCallback | None = None,
+    ) -> dict[str, Any]:
+        """Run knowledge service queries and return results by pointer.
+
+        on_result, if given, is called with each batch of results as it
+        arrives: per coalesced group, once for the queries quoting retrieved
+        passages and once per segmented knowledge service.
+        """
+        pointable_schema = PointableJSONSchema(resolved_jsonschema)
+        planned: list[CoalescibleQuery] = []
+        segmented: dict[str, list[SegmentedQuery]] = {}
+        retrieval: list[Awaitable[Any]] = []
+        retrieval_pointers: list[str] = []
+        configs = {}
+
+        for schema_pointer, query_id in knowledge_service_queries.items():
             # Get the query configuration
             query = queries[query_id]
 
@@ -465,6 +1349,37 @@ class ExtractAssembleDataUseCase:
                 raise ValueError(
                     f"Knowledge service config not found: {query.knowledge_service_id}"
                 )
+            configs[query.knowledge_service_id] = config
+
+            # Use PointableJSONSchema to generate complete schema for pointer target
+            output_schema = pointable_schema.schema_for_pointer(schema_pointer)
+
+            # Queries with retrieved passages are sent those alone, each in
+            # its own prompt, so they are neither coalesced nor segmented
+            passages = (retrieved_passages or {}).get(schema_pointer)
+            if passages:
+                retrieval_pointers.append(schema_pointer)
+                retrieval.append(
+                    self._run_retrieval_query(
+                        config,
+                        passage_query(query, passages),
+                        output_schema,
+                    )
+                )
+                continue
+
+            # Documents given to the service in segments are queried per
+            # segment, and the answers merged
+            if (segment_registrations or {}).get(query.knowledge_service_id):
+                segmented.setdefault(query.knowledge_service_id, []).append(
+                    SegmentedQuery(
+                        key=schema_pointer,
+                        query=query,
+                        config=config,
+                        output_schema=output_schema,
+                    )
+                )
+                continue
 
             # Get the service file ID from our registrations
             service_file_id = document_registrations.get(query.knowledge_service_id)
@@ -473,33 +1388,79 @@ class ExtractAssembleDataUseCase:
                     f"Document not registered with service {query.knowledge_service_id}"
                 )
 
-            # Execute query with complete schema
-            query_result = await self.knowledge_service.execute_query(
-                config,
-                query.prompt,
-                output_schema,
-                [service_file_id],
-                query.query_metadata,
-                query.assistant_prompt,
+            planned.append(
+                CoalescibleQuery(
+                    key=schema_pointer,
+                    query=query,
+                    config=config,
+                    service_file_id=service_file_id,
+                    output_schema=output_schema,
+                )
             )
 
-            # Knowledge service now returns parsed JSON directly
-            result_data = query_result.result_data.get("response")
-            if result_data is None:
-                raise ValueError("Knowledge service returned no response data")
-            self._store_result_in_assembled_data(
-                assembled_data, schema_pointer, result_data
+        # Knowledge service now returns parsed JSON directly
+        results = await self._query_coalescer.execute(planned, on_result)
+        # Every retrieval query runs to the end even if another fails, so
+        # that the answers received are all recorded, in one batch
+        retrieved: dict[str, Any] = {}
+        retrieval_error: BaseException | None = None
+        for schema_pointer, response in zip(
+            retrieval_pointers,
+            await asyncio.gather(*retrieval, return_exceptions=True),
+            strict=True,
+        ):
+            if isinstance(response, BaseException):
+                retrieval_error = retrieval_error or response
+            else:
+                retrieved[schema_pointer] = response
+        if on_result is not None and retrieved:
+            await on_result(retrieved)
+        if retrieval_error is not None:
+            raise retrieval_error
+        results.update(retrieved)
+        for knowledge_service_id, segmented_queries in segmented.items():
+            policy = configs[knowledge_service_id].segmentation
+            merged = await extract_from_segments(
+                self._query_coalescer,
+                segmented_queries,
+                (segment_registrations or {})[knowledge_service_id],
+                policy.max_parallel_segments if policy else 1,
             )
+            if on_result is not None:
+                await on_result(merged)
+            results.update(merged)
 
-        # Validate the assembled data against the JSON schema
-        self._validate_assembled_data(assembled_data, resolved_jsonschema)
+        for result_data in results.values():
+            if result_data is None:
+                raise ValueError("Knowledge service returned no response data")
+        return {pointer: results[pointer] for pointer in knowledge_service_queries}
 
-        # Create the assembled document
-        assembled_document_id = await self._create_assembled_document(
-            assembled_data, assembly_specification
+    async def _run_retrieval_query(
+        self,
+        config: KnowledgeServiceConfig,
+        query: KnowledgeServiceQuery,
+        output_schema: dict[str, Any],
+    ) -> Any:
+        """Run a query quoting retrieved passages and return its response."""
+        query_result = await execute_cascaded_query(
+            self.knowledge_service, config, query, output_schema, []
         )
+        return query_result.result_data.get("response")
 
-        return assembled_document_id
+    @try_use_case_step("assembly_resumption")
+    async def _find_resumable_assembly(
+        self,
+        execution_id: str,
+        document_id: str,
+        assembly_specification_id: str,
+    ) -> Assembly | None:
+        """Find an unfinished assembly from an earlier attempt, if any."""
+        assembly = await self.assembly_repo.find_by_execution(
+            execution_id, document_id, assembly_specification_id
+        )
+        if assembly is None or assembly.status not in RESUMABLE_STATUSES:
+            return None
+        return assembly
 
     @try_use_case_step("assembly_id_generation")
     async def _generate_assembly_id(
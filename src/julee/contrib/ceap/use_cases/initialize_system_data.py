@@ -299,6 +299,9 @@ class InitializeSystemDataUseCase:
             name=config_data["name"],
             description=config_data["description"],
             service_api=service_api,
+            hedging=config_data.get("hedging"),
+            segmentation=config_data.get("segmentation"),
+            retrieval=config_data.get("retrieval"),
             created_at=self._clock_service.now(),
             updated_at=self._clock_service.now(),
         )
@@ -469,6 +472,8 @@ class InitializeSystemDataUseCase:
             prompt=query_data["prompt"],
             assistant_prompt=query_data["assistant_prompt"],
             query_metadata=query_metadata,
+            model_cascade=query_data.get("model_cascade"),
+            full_context=query_data.get("full_context", False),
             created_at=self._clock_service.now(),
             updated_at=self._clock_service.now(),
         )
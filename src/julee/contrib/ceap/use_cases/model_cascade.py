@@ -0,0 +1,212 @@
+"""
+Model cascades for knowledge service queries.
+
+Most extraction queries are easy, and a small, fast model answers them as
+well as a large one. A query with a ModelCascade is asked of the cascade's
+models first, cheapest first. The first answer that conforms to the
+query's output schema is used, and only queries the cheaper models fail
+on reach the query's own model. The tier that answered is recorded in the
+result data, so the effect of a cascade on cost and quality can be
+measured per query.
+"""
+
+import logging
+from typing import Any
+
+import jsonschema
+
+from julee.contrib.ceap._schema_ref import object_schema
+from julee.contrib.ceap.domain.models import (
+    KnowledgeServiceConfig,
+    KnowledgeServiceQuery,
+)
+from julee.services import KnowledgeService
+from julee.services.knowledge_service import QueryResult
+
+logger = logging.getLogger(__name__)
+
+# Result data key of the cascade tier that answered: the index into the
+# cascade's models, or len(models) for the query's own model
+MODEL_TIER_KEY = "model_tier"
+
+# Result data key of the confidence reported by a cascade model
+CONFIDENCE_KEY = "confidence"
+
+# Prefills under which a cascade answer can be wrapped with a confidence
+_OBJECT_PREFILLS = (None, "{")
+
+_CONFIDENCE_INSTRUCTION = """
+
+Put your answer in the "answer" property of the response, and in the
+"confidence" property, how confident you are that the answer is correct
+and complete, from 0 (a guess) to 1 (certain)."""
+
+
+def _asks_confidence(
+    query: KnowledgeServiceQuery, output_schema: dict[str, Any] | None
+) -> bool:
+    """Whether cascade answers to a query carry a self-reported confidence.
+
+    Only structured answers can be wrapped; plain text answers escalate on
+    errors and truncation alone.
+    """
+    cascade = query.model_cascade
+    return (
+        cascade is not None
+        and cascade.min_confidence is not None
+        and output_schema is not None
+        and query.assistant_prompt in _OBJECT_PREFILLS
+    )
+
+
+def _confidence_schema(output_schema: dict[str, Any]) -> dict[str, Any]:
+    return object_schema(
+        {
+            "answer": output_schema,
+            "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+        }
+    )
+
+
+def _rejection_reason(
+    result_data: dict[str, Any],
+    output_schema: dict[str, Any] | None,
+    min_confidence: float | None,
+) -> str | None:
+    """Why a cascade answer must escalate, or None to accept it."""
+    if result_data.get("stop_reason") == "max_tokens":
+        return "answer was truncated"
+    response = result_data.get("response")
+    if response is None or response == "":
+        return "no response"
+    if min_confidence is not None:
+        confidence = result_data.get(CONFIDENCE_KEY)
+        if not isinstance(confidence, int | float) or confidence < min_confidence:
+            return f"confidence {confidence} below {min_confidence}"
+    if output_schema is not None:
+        try:
+            jsonschema.validate(response, output_schema)
+        except jsonschema.ValidationError as e:
+            return f"answer does not conform to schema: {e.message}"
+    return None
+
+
+def _unwrap_confidence(result_data: dict[str, Any]) -> dict[str, Any]:
+    """Move a wrapped answer's confidence out of its response."""
+    response = result_data.get("response")
+    if not isinstance(response, dict) or "answer" not in response:
+        return {**result_data, "response": None}
+    return {
+        **result_data,
+        "response": response["answer"],
+        CONFIDENCE_KEY: response.get("confidence"),
+    }
+
+
+def _with_tier(
+    result: QueryResult, result_data: dict[str, Any], tier: int
+) -> QueryResult:
+    return result.model_copy(
+        update={"result_data": {**result_data, MODEL_TIER_KEY: tier}}
+    )
+
+
+async def execute_cascaded_query(
+    knowledge_service: KnowledgeService,
+    config: KnowledgeServiceConfig,
+    query: KnowledgeServiceQuery,
+    output_schema: dict[str, Any] | None,
+    service_file_ids: list[str],
+    first_tier: int = 0,
+) -> QueryResult:
+    """Execute a query through its model cascade.
+
+    Queries without a cascade are executed once, as configured.
+
+    Args:
+        knowledge_service: Service to execute the query with
+        config: The query's knowledge service configuration
+        query: The query, with its optional model cascade
+        output_schema: Schema the answer must conform to, if any
+        service_file_ids: Files to query
+        first_tier: Cascade tier to start from, e.g. 1 when the first
+            cascade model has already failed to answer
+
+    Returns:
+        The accepted result, with the answering tier under MODEL_TIER_KEY
+        when the query has a cascade
+
+    Raises:
+        Exception: Errors of the query's own model; errors of cascade
+            models escalate to the next tier
+    """
+    cascade = query.model_cascade
+    if cascade is None:
+        return await knowledge_service.execute_query(
+            config,
+            query.prompt,
+            output_schema,
+            service_file_ids,
+            dict(query.query_metadata or {}),
+            query.assistant_prompt,
+        )
+
+    asks_confidence = _asks_confidence(query, output_schema)
+    for tier in range(first_tier, len(cascade.models)):
+        model = cascade.models[tier]
+        try:
+            result = await knowledge_service.execute_query(
+                config,
+                (
+                    query.prompt + _CONFIDENCE_INSTRUCTION
+                    if asks_confidence
+                    else query.prompt
+                ),
+                (
+                    _confidence_schema(output_schema)
+                    if asks_confidence and output_schema is not None
+                    else output_schema
+                ),
+                service_file_ids,
+                {**(query.query_metadata or {}), "model": model},
+                query.assistant_prompt,
+            )
+        except Exception as e:
+            reason: str | None = f"query failed: {e}"
+        else:
+            result_data = (
+                _unwrap_confidence(result.result_data)
+                if asks_confidence
+                else result.result_data
+            )
+            reason = _rejection_reason(
+                result_data,
+                output_schema,
+                cascade.min_confidence if asks_confidence else None,
+            )
+            if reason is None:
+                logger.debug(
+                    "Cascade model answered knowledge service query",
+                    extra={"query_id": query.query_id, "model": model, "tier": tier},
+                )
+                return _with_tier(result, result_data, tier)
+
+        logger.info(
+            "Escalating knowledge service query to the next model",
+            extra={
+                "query_id": query.query_id,
+                "model": model,
+                "tier": tier,
+                "reason": reason,
+            },
+        )
+
+    result = await knowledge_service.execute_query(
+        config,
+        query.prompt,
+        output_schema,
+        service_file_ids,
+        dict(query.query_metadata or {}),
+        query.assistant_prompt,
+    )
+    return _with_tier(result, result.result_data, len(cascade.models))
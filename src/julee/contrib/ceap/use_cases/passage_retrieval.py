@@ -0,0 +1,53 @@
+"""
+Retrieval of relevant passages for knowledge service queries.
+
+A query usually concerns a few paragraphs of a long document, yet sending
+the registered document makes the service read all of it for every query.
+Knowledge services with a RetrievalPolicy instead get, for each query, the
+passages of the document that best match it (ranked by BM25 over an index
+built once per document content), quoted in the prompt in place of the
+attached document. Queries marked full_context, and queries for which no
+passage matches, are sent the whole document as before.
+"""
+
+import re
+
+from julee.contrib.ceap.domain.models import KnowledgeServiceQuery
+
+PASSAGE_PROMPT = """The following passages were selected from a longer \
+document as relevant to the question below. Answer from these passages.
+
+{passages}
+
+{prompt}"""
+
+# Schema pointer segments that name structure rather than content
+_STRUCTURAL_SEGMENTS = frozenset(
+    {"properties", "items", "definitions", "$defs", "additionalProperties"}
+)
+
+_WORD_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|[_\-\s]+")
+
+
+def retrieval_query_text(schema_pointer: str, query: KnowledgeServiceQuery) -> str:
+    """Text to rank passages by: the prompt and the names in the pointer."""
+    names = [
+        segment
+        for segment in schema_pointer.split("/")
+        if segment and segment not in _STRUCTURAL_SEGMENTS and not segment.isdigit()
+    ]
+    words = [word for name in names for word in _WORD_BOUNDARY.split(name) if word]
+    return " ".join([query.prompt, *words])
+
+
+def passage_query(
+    query: KnowledgeServiceQuery, passages: list[str]
+) -> KnowledgeServiceQuery:
+    """A copy of a query that quotes retrieved passages in its prompt."""
+    quoted = "\n\n".join(
+        f'<passage number="{number}">\n{passage.strip()}\n</passage>'
+        for number, passage in enumerate(passages, start=1)
+    )
+    return query.model_copy(
+        update={"prompt": PASSAGE_PROMPT.format(passages=quoted, prompt=query.prompt)}
+    )
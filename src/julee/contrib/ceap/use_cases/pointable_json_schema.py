@@ -10,6 +10,9 @@ from typing import Any
 
 from jsonpointer import JsonPointer
 
+# Root keywords that a standalone schema for a pointer target keeps
+_ROOT_KEYWORDS = ("$schema", "$id", "definitions", "$defs")
+
 
 class PointableJSONSchema:
     """Utility for generating standalone schemas from JSON pointer targets.
@@ -81,6 +84,41 @@ class PointableJSONSchema:
 
         return standalone_schema
 
+    def target_schema_for_pointer(self, json_pointer: str) -> dict[str, Any]:
+        """Generate a standalone schema for the value at a pointer target.
+
+        Unlike schema_for_pointer, the target is not wrapped in an object:
+        this is the schema that a value stored at the pointer's location in
+        a document must conform to. Root metadata and definitions are kept
+        so that references in the target still resolve.
+
+        Args:
+            json_pointer: JSON pointer string (e.g., "/properties/title")
+
+        Returns:
+            Standalone schema for the target value
+
+        Raises:
+            ValueError: If JSON pointer is invalid or cannot be resolved
+        """
+        if not json_pointer:
+            return self.root_schema.copy()
+
+        try:
+            target_schema = JsonPointer(json_pointer).resolve(self.root_schema)
+        except Exception as e:
+            raise ValueError(f"Invalid JSON pointer '{json_pointer}': {e}")
+        if not isinstance(target_schema, dict):
+            raise ValueError(f"JSON pointer '{json_pointer}' does not target a schema")
+
+        standalone_schema = {
+            keyword: self.root_schema[keyword]
+            for keyword in _ROOT_KEYWORDS
+            if keyword in self.root_schema
+        }
+        standalone_schema.update(target_schema)
+        return standalone_schema
+
     def _extract_property_name_from_pointer(self, json_pointer: str) -> str:
         """Extract the final property name from a JSON pointer.
 
@@ -0,0 +1,289 @@
+"""
+Coalescing of knowledge service queries against the same document.
+
+Assembly specifications and policies ask many questions of one registered
+document, and every query re-sends and re-reads the whole document.
+Compatible queries - same knowledge service, same file, same model
+settings - can instead be asked together: the coalesced query lists each
+question under its own key with a combined output schema, and the answer
+is split back per question. Each part is validated against its own
+schema. Parts that are missing or invalid, and all parts of a coalesced
+query that fails outright, fall back to individual queries.
+
+Queries with the same model cascade are coalesced on the cascade's first
+model, and parts that fall back resume the cascade from its second tier.
+"""
+
+import json
+import logging
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Any
+
+import jsonschema
+from pydantic import BaseModel
+
+from julee.contrib.ceap._schema_ref import object_schema
+from julee.contrib.ceap.domain.models import (
+    KnowledgeServiceConfig,
+    KnowledgeServiceQuery,
+)
+from julee.services import KnowledgeService
+
+from .model_cascade import execute_cascaded_query
+
+logger = logging.getLogger(__name__)
+
+# Most questions asked in one coalesced query. Larger groups save more
+# input tokens but produce long answers that are more likely to fail
+# validation (and then cost the individual queries as well).
+MAX_COALESCED_QUERIES = 8
+
+# Receives the responses of a group of queries, keyed by query key, as
+# soon as the group has been answered
+ResponseCallback = Callable[[Mapping[str, Any]], Awaitable[None]]
+
+# The only assistant prefill a coalesced query can keep: its answer is a
+# JSON object, so a prefill opening that object still applies
+_OBJECT_PREFILL = "{"
+
+
+class CoalescibleQuery(BaseModel):
+    """One knowledge service query of a use case, ready to execute."""
+
+    key: str  # identifies the answer to the caller, e.g. a schema pointer
+    query: KnowledgeServiceQuery
+    config: KnowledgeServiceConfig
+    service_file_id: str
+    output_schema: dict[str, Any] | None = None
+    # Schema of the answer when asked as part of a coalesced query;
+    # defaults to output_schema. Queries with neither are never coalesced.
+    answer_schema: dict[str, Any] | None = None
+
+    @property
+    def coalesced_schema(self) -> dict[str, Any] | None:
+        if self.answer_schema is not None:
+            return self.answer_schema
+        return self.output_schema
+
+
+def _group_key(item: CoalescibleQuery) -> str | None:
+    """Queries with equal keys can be coalesced; None means never."""
+    if item.coalesced_schema is None:
+        return None
+    prefill = item.query.assistant_prompt
+    if prefill is not None and prefill.strip() != _OBJECT_PREFILL:
+        return None
+    cascade = item.query.model_cascade
+    # Coalesced answers cannot carry a confidence per part
+    if cascade is not None and cascade.min_confidence is not None:
+        return None
+    metadata = dict(item.query.query_metadata or {})
+    # Token limits are summed across the group, everything else must match
+    has_max_tokens = metadata.pop("max_tokens", None) is not None
+    return json.dumps(
+        [
+            item.config.knowledge_service_id,
+            item.service_file_id,
+            metadata,
+            prefill is not None,
+            has_max_tokens,
+            list(cascade.models) if cascade is not None else None,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def plan_query_groups(
+    queries: Sequence[CoalescibleQuery],
+    max_group_size: int = MAX_COALESCED_QUERIES,
+) -> list[list[CoalescibleQuery]]:
+    """Partition queries into groups that can each be asked as one query.
+
+    Groups are ordered by their first query, and queries keep their order
+    within a group, so the plan is deterministic for a given input.
+
+    Args:
+        queries: Queries to plan
+        max_group_size: Most queries per group; 1 disables coalescing
+
+    Returns:
+        Groups of queries; single-query groups are asked individually
+    """
+    groups: list[list[CoalescibleQuery]] = []
+    open_groups: dict[str, list[CoalescibleQuery]] = {}
+    for item in queries:
+        key = _group_key(item) if max_group_size > 1 else None
+        group = open_groups.get(key) if key is not None else None
+        if group is None or len(group) >= max_group_size:
+            group = []
+            groups.append(group)
+            if key is not None:
+                open_groups[key] = group
+        group.append(item)
+    return groups
+
+
+def _answer_key(index: int) -> str:
+    return f"answer_{index + 1}"
+
+
+def _coalesced_prompt(group: Sequence[CoalescibleQuery]) -> str:
+    questions = "\n\n".join(
+        f"Question {_answer_key(index)}:\n{item.query.prompt}"
+        for index, item in enumerate(group)
+    )
+    return (
+        f"Answer each of the following {len(group)} questions about the "
+        f"attached document.\n\n{questions}\n\n"
+        "Respond with a single JSON object with one property per question, "
+        "named as above, holding the answer to that question."
+    )
+
+
+def _coalesced_schema(group: Sequence[CoalescibleQuery]) -> dict[str, Any]:
+    """Combine the answer schemas of a group under one object schema.
+
+    Raises:
+        ValueError: If the parts define the same name differently
+    """
+    return object_schema(
+        {
+            _answer_key(index): item.coalesced_schema or {}
+            for index, item in enumerate(group)
+        }
+    )
+
+
+def _coalesced_metadata(group: Sequence[CoalescibleQuery]) -> dict[str, Any]:
+    metadata = dict(group[0].query.query_metadata or {})
+    cascade = group[0].query.model_cascade
+    if cascade is not None:
+        metadata["model"] = cascade.models[0]
+    if metadata.get("max_tokens") is not None:
+        metadata["max_tokens"] = sum(
+            (item.query.query_metadata or {})["max_tokens"] for item in group
+        )
+    return metadata
+
+
+def _is_valid_answer(answer: Any, schema: dict[str, Any]) -> bool:
+    try:
+        jsonschema.validate(answer, schema)
+    except (jsonschema.ValidationError, jsonschema.SchemaError):
+        return False
+    return True
+
+
+class QueryCoalescer:
+    """Executes a use case's queries, coalescing compatible ones."""
+
+    def __init__(
+        self,
+        knowledge_service: KnowledgeService,
+        max_group_size: int = MAX_COALESCED_QUERIES,
+    ) -> None:
+        if max_group_size < 1:
+            raise ValueError("max_group_size must be at least 1")
+        self.knowledge_service = knowledge_service
+        self.max_group_size = max_group_size
+
+    async def execute(
+        self,
+        queries: Sequence[CoalescibleQuery],
+        on_response: ResponseCallback | None = None,
+    ) -> dict[str, Any]:
+        """Execute queries, one at a time or coalesced.
+
+        Args:
+            queries: Queries to execute, with unique keys
+            on_response: Called once per group with the responses of its
+                queries, as soon as the group has been answered, so callers
+                can keep responses that arrive before a later query fails
+
+        Returns:
+            The response of each query (as its individual query would
+            return it, so possibly None) keyed by query key, in query order
+
+        Raises:
+            Exception: Errors of individual queries; errors of coalesced
+                queries are handled by falling back to individual queries
+        """
+        responses: dict[str, Any] = {}
+        for group in plan_query_groups(queries, self.max_group_size):
+            if len(group) == 1:
+                responses[group[0].key] = await self._execute_one(group[0])
+            else:
+                responses.update(await self._execute_group(group))
+            if on_response is not None:
+                await on_response({item.key: responses[item.key] for item in group})
+        return {item.key: responses[item.key] for item in queries}
+
+    async def _execute_one(self, item: CoalescibleQuery, first_tier: int = 0) -> Any:
+        query_result = await execute_cascaded_query(
+            self.knowledge_service,
+            item.config,
+            item.query,
+            item.output_schema,
+            [item.service_file_id],
+            first_tier=first_tier,
+        )
+        return query_result.result_data.get("response")
+
+    async def _execute_group(self, group: list[CoalescibleQuery]) -> dict[str, Any]:
+        response: Any = None
+        try:
+            query_result = await self.knowledge_service.execute_query(
+                group[0].config,
+                _coalesced_prompt(group),
+                _coalesced_schema(group),
+                [group[0].service_file_id],
+                _coalesced_metadata(group),
+                group[0].query.assistant_prompt,
+            )
+            response = query_result.result_data.get("response")
+        except Exception as e:
+            logger.warning(
+                "Coalesced query failed, falling back to individual queries",
+                extra={
+                    "knowledge_service_id": group[0].config.knowledge_service_id,
+                    "query_count": len(group),
+                    "error": str(e),
+                },
+            )
+
+        responses: dict[str, Any] = {}
+        fallbacks = []
+        for index, item in enumerate(group):
+            answer = (
+                response.get(_answer_key(index)) if isinstance(response, dict) else None
+            )
+            schema = item.coalesced_schema
+            if answer is not None and schema and _is_valid_answer(answer, schema):
+                responses[item.key] = answer
+            else:
+                fallbacks.append(item)
+
+        if fallbacks and response is not None:
+            logger.info(
+                "Coalesced answers failed validation, asking individually",
+                extra={
+                    "knowledge_service_id": group[0].config.knowledge_service_id,
+                    "query_count": len(group),
+                    "fallback_count": len(fallbacks),
+                },
+            )
+        # The coalesced query was the first tier of any cascade
+        first_tier = 1 if group[0].query.model_cascade is not None else 0
+        for item in fallbacks:
+            responses[item.key] = await self._execute_one(item, first_tier)
+
+        logger.debug(
+            "Coalesced query executed",
+            extra={
+                "knowledge_service_id": group[0].config.knowledge_service_id,
+                "query_count": len(group),
+                "fallback_count": len(fallbacks),
+            },
+        )
+        return responses
@@ -0,0 +1,214 @@
+"""
+Map-reduce extraction over the segments of a large document.
+
+Documents larger than a knowledge service's SegmentationPolicy allows are
+registered as overlapping segments rather than whole. Every query is then
+asked of each segment (the map step, segments running in parallel waves)
+under a relaxed schema that lets a segment leave out what it does not
+contain. The partial answers are merged guided by the query's schema
+(the reduce step): objects property by property, arrays concatenated
+without the repeats that segment overlaps produce, and other values taken
+from the first segment that gives a valid one.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import jsonschema
+from jsonpointer import JsonPointer  # type: ignore[import-untyped]
+from pydantic import BaseModel
+
+from julee.contrib.ceap.domain.models import (
+    KnowledgeServiceConfig,
+    KnowledgeServiceQuery,
+)
+
+from .query_coalescing import CoalescibleQuery, QueryCoalescer
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_INSTRUCTION = """
+
+The attached document is part {number} of {count} of a longer document,
+and consecutive parts overlap slightly. Answer from this part only, and
+leave out anything this part does not contain."""
+
+# Schema keywords that would force a segment to answer what it lacks
+_COMPLETENESS_KEYWORDS = ("required", "minItems", "minProperties")
+
+# Bound on $ref chains followed while merging
+_MAX_REF_DEPTH = 16
+
+
+class SegmentedQuery(BaseModel):
+    """A query to ask of every segment of a document."""
+
+    key: str  # identifies the answer to the caller, e.g. a schema pointer
+    query: KnowledgeServiceQuery
+    config: KnowledgeServiceConfig
+    output_schema: dict[str, Any]
+
+
+def relax_schema(schema: Any) -> Any:
+    """Copy a schema without the constraints that demand completeness."""
+    if isinstance(schema, dict):
+        return {
+            key: relax_schema(value)
+            for key, value in schema.items()
+            if key not in _COMPLETENESS_KEYWORDS
+        }
+    if isinstance(schema, list):
+        return [relax_schema(value) for value in schema]
+    return schema
+
+
+def _resolve(schema: Any, root: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Follow local $refs to the schema they point at."""
+    for _ in range(_MAX_REF_DEPTH):
+        if not isinstance(schema, Mapping):
+            return {}
+        ref = schema.get("$ref")
+        if not isinstance(ref, str) or not ref.startswith("#"):
+            return schema
+        try:
+            schema = JsonPointer(ref[1:]).resolve(root)
+        except Exception:
+            return {}
+    return {}
+
+
+def _is_valid(value: Any, schema: Mapping[str, Any]) -> bool:
+    try:
+        jsonschema.validate(value, schema)
+    except jsonschema.ValidationError:
+        return False
+    except Exception:
+        # Schemas whose references cannot be resolved here accept anything
+        return True
+    return True
+
+
+def merge_partial_results(
+    schema: Mapping[str, Any] | None,
+    partials: Sequence[Any],
+    root: Mapping[str, Any] | None = None,
+) -> Any:
+    """Merge partial answers from consecutive segments into one answer.
+
+    Args:
+        schema: Schema of the answer
+        partials: Answers of the segments that gave one, in segment order
+        root: Schema that local references resolve against; defaults to
+            schema
+
+    Returns:
+        The merged answer, or None if no segment gave one
+    """
+    root = root if root is not None else (schema or {})
+    resolved = _resolve(schema or {}, root)
+    values = [value for value in partials if value is not None and value != ""]
+    if not values:
+        return None
+
+    if all(isinstance(value, dict) for value in values):
+        properties = resolved.get("properties", {})
+        closed = resolved.get("additionalProperties") is False
+        merged: dict[str, Any] = {}
+        for key in dict.fromkeys(key for value in values for key in value):
+            if closed and key not in properties:
+                continue
+            merged[key] = merge_partial_results(
+                properties.get(key),
+                [value[key] for value in values if key in value],
+                root,
+            )
+        return merged
+
+    if all(isinstance(value, list) for value in values):
+        items_schema = resolved.get("items")
+        items: list[Any] = []
+        seen: set[str] = set()
+        for value in values:
+            for item in value:
+                marker = json.dumps(item, sort_keys=True, default=str)
+                if marker not in seen:
+                    seen.add(marker)
+                    items.append(item)
+        if isinstance(items_schema, Mapping):
+            item_schema = _resolve(items_schema, root)
+            items = [item for item in items if _is_valid(item, item_schema)]
+        return items
+
+    # Scalars, or answers of mixed shapes: the first valid one wins
+    for value in values:
+        if _is_valid(value, resolved):
+            return value
+    return values[0]
+
+
+def _segment_query(
+    query: SegmentedQuery, file_id: str, index: int, count: int
+) -> CoalescibleQuery:
+    prompt = query.query.prompt + SEGMENT_INSTRUCTION.format(
+        number=index + 1, count=count
+    )
+    return CoalescibleQuery(
+        key=query.key,
+        query=query.query.model_copy(update={"prompt": prompt}),
+        config=query.config,
+        service_file_id=file_id,
+        output_schema=relax_schema(query.output_schema),
+    )
+
+
+async def extract_from_segments(
+    coalescer: QueryCoalescer,
+    queries: Sequence[SegmentedQuery],
+    segment_file_ids: Sequence[str],
+    max_parallel_segments: int,
+) -> dict[str, Any]:
+    """Ask queries of every segment of a document and merge the answers.
+
+    Args:
+        coalescer: Executes each segment's queries, coalescing them
+        queries: Queries to ask
+        segment_file_ids: Knowledge service file IDs of the segments, in
+            document order
+        max_parallel_segments: Segments queried at the same time
+
+    Returns:
+        The merged answer of each query (None if no segment answered it)
+        keyed by query key
+    """
+    count = len(segment_file_ids)
+    segment_responses: list[dict[str, Any]] = []
+    for start in range(0, count, max_parallel_segments):
+        wave = range(start, min(count, start + max_parallel_segments))
+        segment_responses.extend(
+            await asyncio.gather(
+                *(
+                    coalescer.execute(
+                        [
+                            _segment_query(query, segment_file_ids[index], index, count)
+                            for query in queries
+                        ]
+                    )
+                    for index in wave
+                )
+            )
+        )
+
+    logger.debug(
+        "Segmented extraction executed",
+        extra={"query_count": len(queries), "segment_count": count},
+    )
+    return {
+        query.key: merge_partial_results(
+            query.output_schema,
+            [responses.get(query.key) for responses in segment_responses],
+        )
+        for query in queries
+    }
@@ -0,0 +1,193 @@
+"""
+Tests for checkpointing an assembly's query results.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from julee.contrib.ceap.domain.models import (
+    Assembly,
+    AssemblyStatus,
+    KnowledgeServiceQuery,
+)
+from julee.contrib.ceap.use_cases.assembly_checkpoint import (
+    AssemblyCheckpoint,
+    is_valid_result,
+    query_fingerprint,
+)
+from julee.contrib.ceap.use_cases.pointable_json_schema import PointableJSONSchema
+from julee.repositories.memory import MemoryAssemblyRepository
+
+pytestmark = pytest.mark.unit
+
+SCHEMA = PointableJSONSchema(
+    {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string"},
+            "count": {"type": "integer", "minimum": 0},
+        },
+    }
+)
+
+FINGERPRINTS = {"/properties/title": "title-v1", "/properties/count": "count-v1"}
+
+
+def make_assembly(query_results: dict | None = None) -> Assembly:
+    query_results = query_results or {}
+    return Assembly(
+        assembly_id="assembly-1",
+        assembly_specification_id="spec-1",
+        input_document_id="doc-1",
+        execution_id="execution-1",
+        status=AssemblyStatus.IN_PROGRESS,
+        query_results=query_results,
+        query_fingerprints={
+            schema_pointer: FINGERPRINTS[schema_pointer]
+            for schema_pointer in query_results
+        },
+    )
+
+
+def make_query(**overrides) -> KnowledgeServiceQuery:
+    fields = {
+        "query_id": "query-1",
+        "name": "Title",
+        "knowledge_service_id": "service-1",
+        "prompt": "What is the title?",
+    }
+    return KnowledgeServiceQuery(**{**fields, **overrides})
+
+
+class TestIsValidResult:
+    """Test cases for is_valid_result."""
+
+    def test_conforming_result_is_valid(self) -> None:
+        assert is_valid_result(3, {"type": "integer"})
+
+    def test_missing_or_nonconforming_results_are_invalid(self) -> None:
+        assert not is_valid_result(None, {})
+        assert not is_valid_result("3", {"type": "integer"})
+
+    def test_uncheckable_schemas_are_not_trusted(self) -> None:
+        assert not is_valid_result(3, {"$ref": "#/definitions/missing"})
+
+
+class TestQueryFingerprint:
+    """Test cases for query_fingerprint."""
+
+    def test_changes_with_what_is_asked(self) -> None:
+        fingerprint = query_fingerprint(make_query())
+
+        assert query_fingerprint(make_query()) == fingerprint
+        assert query_fingerprint(make_query(query_id="query-2")) != fingerprint
+        assert query_fingerprint(make_query(prompt="What is it?")) != fingerprint
+        assert (
+            query_fingerprint(make_query(query_metadata={"temperature": 0.5}))
+            != fingerprint
+        )
+
+    def test_ignores_name_and_timestamps(self) -> None:
+        assert query_fingerprint(make_query(name="Heading")) == query_fingerprint(
+            make_query()
+        )
+
+
+class TestAssemblyCheckpoint:
+    """Test cases for AssemblyCheckpoint."""
+
+    def test_reusable_results_must_still_be_valid(self) -> None:
+        """Saved results the current schema rejects are asked again."""
+        checkpoint = AssemblyCheckpoint(
+            MemoryAssemblyRepository(),
+            make_assembly({"/properties/title": "Minutes", "/properties/count": -1}),
+        )
+
+        reusable = checkpoint.reusable_results(SCHEMA, FINGERPRINTS)
+
+        assert reusable == {"/properties/title": "Minutes"}
+
+    def test_results_of_changed_queries_are_not_reusable(self) -> None:
+        """Saved results answering an earlier version of a query are dropped."""
+        checkpoint = AssemblyCheckpoint(
+            MemoryAssemblyRepository(),
+            make_assembly({"/properties/title": "Minutes", "/properties/count": 2}),
+        )
+
+        reusable = checkpoint.reusable_results(
+            SCHEMA, {**FINGERPRINTS, "/properties/count": "count-v2"}
+        )
+
+        assert reusable == {"/properties/title": "Minutes"}
+
+    def test_saved_fingerprints_are_those_of_valid_results(self) -> None:
+        checkpoint = AssemblyCheckpoint(
+            MemoryAssemblyRepository(),
+            make_assembly({"/properties/title": "Minutes", "/properties/count": -1}),
+        )
+
+        saved = checkpoint.saved_fingerprints(SCHEMA, FINGERPRINTS)
+
+        assert saved == {"/properties/title": "title-v1"}
+
+    async def test_only_valid_results_are_saved(self) -> None:
+        repo = MemoryAssemblyRepository()
+        checkpoint = AssemblyCheckpoint(repo, make_assembly())
+
+        await checkpoint.record_many(
+            {"/properties/title": "Minutes", "/properties/count": "many"},
+            SCHEMA,
+            FINGERPRINTS,
+        )
+
+        saved = await repo.get("assembly-1")
+        assert dict(saved.query_results) == {"/properties/title": "Minutes"}
+        assert dict(saved.query_fingerprints) == {"/properties/title": "title-v1"}
+        assert checkpoint.assembly.query_results == saved.query_results
+
+    async def test_results_without_fingerprints_are_not_saved(self) -> None:
+        repo = MemoryAssemblyRepository()
+        checkpoint = AssemblyCheckpoint(repo, make_assembly())
+
+        await checkpoint.record_many(
+            {"/properties/title": "Minutes", "/properties/count": 2},
+            SCHEMA,
+            {"/properties/count": "count-v1"},
+        )
+
+        saved = await repo.get("assembly-1")
+        assert dict(saved.query_results) == {"/properties/count": 2}
+
+    async def test_batch_is_saved_once(self) -> None:
+        repo = MemoryAssemblyRepository()
+        checkpoint = AssemblyCheckpoint(repo, make_assembly())
+
+        with patch.object(repo, "save", wraps=repo.save) as save:
+            await checkpoint.record_many(
+                {"/properties/title": "Minutes", "/properties/count": 2},
+                SCHEMA,
+                FINGERPRINTS,
+            )
+            await checkpoint.record_many(
+                {"/properties/count": -1}, SCHEMA, FINGERPRINTS
+            )
+
+        save.assert_awaited_once()
+
+    async def test_concurrent_results_are_all_kept(self) -> None:
+        repo = MemoryAssemblyRepository()
+        checkpoint = AssemblyCheckpoint(repo, make_assembly())
+        record = checkpoint.recorder(SCHEMA, FINGERPRINTS)
+
+        await asyncio.gather(
+            record({"/properties/title": "Minutes"}), record({"/properties/count": 2})
+        )
+
+        saved = await repo.get("assembly-1")
+        assert dict(saved.query_results) == {
+            "/properties/title": "Minutes",
+            "/properties/count": 2,
+        }
+        assert dict(saved.query_fingerprints) == FINGERPRINTS
@@ -9,7 +9,7 @@ following the Clean Architecture principles.
 import io
 import json
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -24,8 +24,13 @@ from julee.contrib.ceap.domain.models import (
     KnowledgeServiceConfig,
     KnowledgeServiceQuery,
 )
-from julee.contrib.ceap.domain.models.knowledge_service_config import ServiceApi
+from julee.contrib.ceap.domain.models.knowledge_service_config import (
+    RetrievalPolicy,
+    SegmentationPolicy,
+    ServiceApi,
+)
 from julee.contrib.ceap.use_cases import ExtractAssembleDataUseCase
+from julee.core.services.execution import DefaultExecutionService
 from julee.repositories.http.schema import HttpRemoteSchemaRepository
 from julee.repositories.memory import (
     MemoryAssemblyRepository,
@@ -35,7 +40,14 @@ from julee.repositories.memory import (
     MemoryKnowledgeServiceQueryRepository,
     MemoryRemoteSchemaRepository,
 )
-from julee.services.knowledge_service import QueryResult
+from julee.services.knowledge_service import (
+    BatchQueryOutcome,
+    BatchQueryResults,
+    BatchStatus,
+    BatchSubmission,
+    FileRegistrationResult,
+    QueryResult,
+)
 from julee.services.knowledge_service.memory import (
     MemoryKnowledgeService,
 )
@@ -757,3 +769,715 @@ class TestResolveJsonSchema:
         assert "name" in result["properties"]
         # Parent $defs must be bundled so the internal #/$defs/Address ref works
         assert "Address" in result["$defs"]
+
+
+async def _make_wide_use_case(
+    fields: list[str],
+    knowledge_service,
+    document_ids: tuple[str, ...] = ("doc-1",),
+    **kwargs,
+) -> tuple[ExtractAssembleDataUseCase, MemoryDocumentRepository]:
+    """Create a use case with one string query per field."""
+    now = datetime.now(timezone.utc)
+    document_repo = MemoryDocumentRepository()
+    spec_repo = MemoryAssemblySpecificationRepository()
+    query_repo = MemoryKnowledgeServiceQueryRepository()
+    config_repo = MemoryKnowledgeServiceConfigRepository()
+
+    for document_id in document_ids:
+        await document_repo.save(
+            Document(
+                document_id=document_id,
+                original_filename="input.txt",
+                content_type="text/plain",
+                size_bytes=5,
+                content_multihash=f"hash-{document_id}",
+                status=DocumentStatus.CAPTURED,
+                content=ContentStream(io.BytesIO(b"input")),
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    await config_repo.save(
+        KnowledgeServiceConfig(
+            knowledge_service_id="ks-1",
+            name="Test Knowledge Service",
+            description="Test service",
+            service_api=ServiceApi.ANTHROPIC,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    for field in fields:
+        await query_repo.save(
+            KnowledgeServiceQuery(
+                query_id=f"query-{field}",
+                name=f"Extract {field}",
+                knowledge_service_id="ks-1",
+                prompt=field,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    await spec_repo.save(
+        AssemblySpecification(
+            assembly_specification_id="spec-1",
+            name="Wide Assembly",
+            applicability="Test documents",
+            jsonschema={
+                "type": "object",
+                "properties": {f: {"type": "string"} for f in fields},
+                "required": fields,
+            },
+            status=AssemblySpecificationStatus.ACTIVE,
+            knowledge_service_queries={
+                f"/properties/{f}": f"query-{f}" for f in fields
+            },
+            created_at=now,
+            updated_at=now,
+        )
+    )
+
+    use_case = ExtractAssembleDataUseCase(
+        document_repo=document_repo,
+        assembly_repo=MemoryAssemblyRepository(),
+        assembly_specification_repo=spec_repo,
+        knowledge_service_query_repo=query_repo,
+        knowledge_service_config_repo=config_repo,
+        knowledge_service=knowledge_service,
+        remote_schema_repo=MemoryRemoteSchemaRepository(),
+        **kwargs,
+    )
+    return use_case, document_repo
+
+
+class TestQueryGroupFanOut:
+    """Tests for partitioning large specifications into query groups."""
+
+    FIELDS = ["a", "b", "c", "d", "e"]
+
+    async def _make_use_case(self, runner=None, group_size=None):
+        """Create a use case with one query per field and a mocked service."""
+        now = datetime.now(timezone.utc)
+
+        async def execute_query(config, prompt, *args):
+            return QueryResult(
+                query_id=f"result-{prompt}",
+                query_text=prompt,
+                result_data={"response": prompt.upper()},
+                execution_time_ms=1,
+                created_at=now,
+            )
+
+        knowledge_service = AsyncMock()
+        knowledge_service.register_file.return_value.knowledge_service_file_id = (
+            "file-1"
+        )
+        knowledge_service.execute_query.side_effect = execute_query
+
+        return await _make_wide_use_case(
+            self.FIELDS,
+            knowledge_service,
+            query_group_runner=runner,
+            query_group_size=group_size,
+        )
+
+    async def _assembled_data(self, use_case, document_repo) -> dict:
+        assembly = await use_case.assemble_data("doc-1", "spec-1")
+        assert assembly.status == AssemblyStatus.COMPLETED
+        document = await document_repo.get(assembly.assembled_document_id)
+        return json.loads(document.content.read().decode("utf-8"))
+
+    @pytest.mark.asyncio
+    async def test_large_specification_is_partitioned(self) -> None:
+        """Queries are split into ordered groups and results merged back."""
+        groups: list[list[str]] = []
+        holder = {}
+
+        async def runner(request):
+            groups.append(list(request.knowledge_service_queries))
+            return await holder["use_case"].execute_query_group(request)
+
+        use_case, document_repo = await self._make_use_case(runner, group_size=2)
+        holder["use_case"] = use_case
+
+        data = await self._assembled_data(use_case, document_repo)
+
+        assert groups == [
+            ["/properties/a", "/properties/b"],
+            ["/properties/c", "/properties/d"],
+            ["/properties/e"],
+        ]
+        assert data == {f: f.upper() for f in self.FIELDS}
+
+    @pytest.mark.asyncio
+    async def test_parent_leaves_query_retrieval_to_groups(self) -> None:
+        """Only the groups retrieve queries, so the parent's history does
+        not grow with the number of queries."""
+        retrieved: list[str] = []
+        retrieved_before_groups: list[int] = []
+        holder = {}
+
+        async def runner(request):
+            retrieved_before_groups.append(len(retrieved))
+            return await holder["use_case"].execute_query_group(request)
+
+        use_case, document_repo = await self._make_use_case(runner, group_size=2)
+        holder["use_case"] = use_case
+        query_repo = use_case.knowledge_service_query_repo
+        get = query_repo.get
+
+        async def recording_get(query_id):
+            retrieved.append(query_id)
+            return await get(query_id)
+
+        query_repo.get = recording_get
+
+        data = await self._assembled_data(use_case, document_repo)
+
+        assert retrieved_before_groups[0] == 0
+        assert sorted(retrieved) == [f"query-{f}" for f in self.FIELDS]
+        assert data == {f: f.upper() for f in self.FIELDS}
+
+    @pytest.mark.asyncio
+    async def test_small_specification_runs_inline(self) -> None:
+        """Specifications within the group size never call the runner."""
+        runner = AsyncMock()
+        use_case, document_repo = await self._make_use_case(runner, group_size=10)
+
+        data = await self._assembled_data(use_case, document_repo)
+
+        runner.assert_not_called()
+        assert data == {f: f.upper() for f in self.FIELDS}
+
+    @pytest.mark.asyncio
+    async def test_invalid_group_size_rejected(self) -> None:
+        """A group size below one is a configuration error."""
+        with pytest.raises(ValueError, match="query_group_size"):
+            await self._make_use_case(AsyncMock(), group_size=0)
+
+
+class FakeBatchKnowledgeService:
+    """Batch knowledge service answering each query with its upper-cased prompt.
+
+    Batches report in progress on their first status check, and queries
+    whose file ID is in failing_file_ids error.
+    """
+
+    def __init__(self, failing_file_ids: tuple[str, ...] = ()) -> None:
+        self.failing_file_ids = set(failing_file_ids)
+        self.batches: dict[str, list] = {}
+        self.status_checks = 0
+
+    async def register_file(self, config, document) -> FileRegistrationResult:
+        return FileRegistrationResult(
+            document_id=document.document_id,
+            knowledge_service_file_id=f"file-{document.document_id}",
+        )
+
+    async def execute_query(self, config, query_text, *args) -> QueryResult:
+        raise AssertionError("batch assembly must not execute queries directly")
+
+    async def submit_query_batch(self, config, requests) -> BatchSubmission:
+        batch_id = f"batch-{len(self.batches) + 1}"
+        self.batches[batch_id] = requests
+        return BatchSubmission(
+            batch_id=batch_id,
+            status=BatchStatus.IN_PROGRESS,
+            request_count=len(requests),
+        )
+
+    async def get_query_batch(self, config, batch_id) -> BatchSubmission:
+        self.status_checks += 1
+        requests = self.batches[batch_id]
+        return BatchSubmission(
+            batch_id=batch_id,
+            status=BatchStatus.ENDED,
+            request_count=len(requests),
+            completed_count=len(requests),
+        )
+
+    async def get_query_batch_results(
+        self, config, batch_id, requests
+    ) -> BatchQueryResults:
+        outcomes = []
+        for request in requests:
+            if request.service_file_ids[0] in self.failing_file_ids:
+                outcomes.append(
+                    BatchQueryOutcome(custom_id=request.custom_id, error="errored")
+                )
+                continue
+            outcomes.append(
+                BatchQueryOutcome(
+                    custom_id=request.custom_id,
+                    result=QueryResult(
+                        query_id=f"result-{request.custom_id}",
+                        query_text=request.query_text,
+                        result_data={"response": request.query_text.upper()},
+                    ),
+                )
+            )
+        return BatchQueryResults(batch_id=batch_id, outcomes=outcomes)
+
+
+class TestBatchAssembly:
+    """Tests for assembling many documents through query batches."""
+
+    FIELDS = ["a", "b", "c"]
+    DOCUMENTS = ("doc-1", "doc-2", "doc-3")
+
+    async def _assemble(self, service, document_ids=DOCUMENTS, **kwargs):
+        use_case, document_repo = await _make_wide_use_case(
+            self.FIELDS, service, document_ids=self.DOCUMENTS
+        )
+        assemblies = await use_case.assemble_data_batch(
+            list(document_ids), "spec-1", poll_interval_seconds=0, **kwargs
+        )
+        return assemblies, document_repo
+
+    @pytest.mark.asyncio
+    async def test_results_are_scattered_to_assemblies(self) -> None:
+        """One batch carries every query; each document gets its results."""
+        service = FakeBatchKnowledgeService()
+
+        assemblies, document_repo = await self._assemble(service)
+
+        assert len(service.batches) == 1
+        assert len(service.batches["batch-1"]) == 9
+        assert service.status_checks == 1
+        assert [a.input_document_id for a in assemblies] == list(self.DOCUMENTS)
+        for assembly in assemblies:
+            assert assembly.status == AssemblyStatus.COMPLETED
+            document = await document_repo.get(assembly.assembled_document_id)
+            data = json.loads(document.content.read().decode("utf-8"))
+            assert data == {f: f.upper() for f in self.FIELDS}
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated_per_document(self) -> None:
+        """Failed queries or missing documents fail only their assembly."""
+        service = FakeBatchKnowledgeService(failing_file_ids=("file-doc-2",))
+
+        assemblies, _ = await self._assemble(
+            service, document_ids=("doc-1", "doc-2", "missing")
+        )
+
+        assert [a.status for a in assemblies] == [
+            AssemblyStatus.COMPLETED,
+            AssemblyStatus.FAILED,
+            AssemblyStatus.FAILED,
+        ]
+        assert len(service.batches["batch-1"]) == 6
+
+    @pytest.mark.asyncio
+    async def test_large_batches_are_split(self) -> None:
+        """No submitted batch exceeds max_batch_requests."""
+        service = FakeBatchKnowledgeService()
+
+        assemblies, _ = await self._assemble(service, max_batch_requests=4)
+
+        assert [len(r) for r in service.batches.values()] == [4, 4, 1]
+        assert all(a.status == AssemblyStatus.COMPLETED for a in assemblies)
+
+    @pytest.mark.asyncio
+    async def test_batches_are_sized_by_payload_bytes(self) -> None:
+        """Batches stay under max_batch_bytes, whatever their request count."""
+        service = FakeBatchKnowledgeService()
+
+        # Each request's answer allowance alone is 16000 bytes
+        assemblies, _ = await self._assemble(service, max_batch_bytes=40000)
+
+        assert [len(r) for r in service.batches.values()] == [2, 2, 2, 2, 1]
+        assert all(a.status == AssemblyStatus.COMPLETED for a in assemblies)
+
+    @pytest.mark.asyncio
+    async def test_failed_submission_fails_only_its_documents(self) -> None:
+        """A batch that cannot be submitted is not retried, and only the
+        documents with queries in it fail."""
+        service = FakeBatchKnowledgeService()
+        submit = service.submit_query_batch
+        attempts = []
+
+        async def submit_query_batch(config, requests):
+            attempts.append(len(requests))
+            if len(attempts) == 1:
+                raise RuntimeError("service unavailable")
+            return await submit(config, requests)
+
+        service.submit_query_batch = submit_query_batch
+
+        assemblies, _ = await self._assemble(service, max_batch_requests=3)
+
+        assert attempts == [3, 3, 3]
+        assert [a.status for a in assemblies] == [
+            AssemblyStatus.FAILED,
+            AssemblyStatus.COMPLETED,
+            AssemblyStatus.COMPLETED,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_requires_batch_capable_service(self) -> None:
+        """Services without batch support are rejected up front."""
+        service = AsyncMock(spec=["register_file", "execute_query"])
+        use_case, _ = await _make_wide_use_case(self.FIELDS, service)
+
+        with pytest.raises(ValueError, match="does not support query batches"):
+            await use_case.assemble_data_batch(["doc-1"], "spec-1")
+
+
+class TestSegmentedAssembly:
+    """Tests for assembling large documents segment by segment."""
+
+    FIELDS = ["title", "topic"]
+
+    async def _make_use_case(self):
+        """Create a use case whose knowledge service splits large documents."""
+        now = datetime.now(timezone.utc)
+
+        async def register_file(config, document):
+            return FileRegistrationResult(
+                document_id=document.document_id,
+                knowledge_service_file_id=f"file-{document.document_id}",
+            )
+
+        async def execute_query(config, prompt, schema, file_ids, *args):
+            # Each field is only found in one part of the document
+            found_in = {"title": "-0", "topic": "-2"}
+            return QueryResult(
+                query_id="result",
+                query_text=prompt,
+                result_data={
+                    "response": (
+                        prompt.split()[0].upper()
+                        if file_ids[0].endswith(found_in[prompt.split()[0]])
+                        else None
+                    )
+                },
+                created_at=now,
+            )
+
+        knowledge_service = AsyncMock()
+        knowledge_service.register_file.side_effect = register_file
+        knowledge_service.execute_query.side_effect = execute_query
+
+        use_case, document_repo = await _make_wide_use_case(
+            self.FIELDS, knowledge_service
+        )
+        config = await use_case.knowledge_service_config_repo.get("ks-1")
+        await use_case.knowledge_service_config_repo.save(
+            config.model_copy(
+                update={
+                    "segmentation": SegmentationPolicy(
+                        max_segment_chars=1000, overlap_chars=100
+                    )
+                }
+            )
+        )
+        content_bytes = b"meeting notes\n" * 180
+        await document_repo.save(
+            Document(
+                document_id="doc-1",
+                original_filename="input.txt",
+                content_type="text/plain",
+                size_bytes=len(content_bytes),
+                content_multihash="hash-large",
+                status=DocumentStatus.CAPTURED,
+                content=ContentStream(io.BytesIO(content_bytes)),
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        return use_case, document_repo, knowledge_service
+
+    @pytest.mark.asyncio
+    async def test_answers_are_merged_across_segments(self) -> None:
+        """Every query is asked of every segment and the answers merged."""
+        use_case, document_repo, knowledge_service = await self._make_use_case()
+
+        assembly = await use_case.assemble_data("doc-1", "spec-1")
+
+        assert assembly.status == AssemblyStatus.COMPLETED
+        document = await document_repo.get(assembly.assembled_document_id)
+        data = json.loads(document.content.read().decode("utf-8"))
+        assert data == {"title": "TITLE", "topic": "TOPIC"}
+
+        registered = [
+            call.args[1].document_id
+            for call in knowledge_service.register_file.await_args_list
+        ]
+        assert len(registered) == 3
+        assert "doc-1" not in registered
+        assert knowledge_service.execute_query.await_count == 6
+
+
+class TestPassageRetrievalAssembly:
+    """Tests for sending queries only the passages relevant to them."""
+
+    FIELDS = ["attendees", "budget"]
+
+    async def _assemble(self, full_context_fields=()):
+        """Assemble a long document with a service that retrieves passages."""
+        now = datetime.now(timezone.utc)
+
+        async def execute_query(config, prompt, schema, file_ids, *args):
+            field = prompt.splitlines()[-1]
+            return QueryResult(
+                query_id="result",
+                query_text=prompt,
+                result_data={"response": f"{field}-{len(file_ids)}"},
+                created_at=now,
+            )
+
+        knowledge_service = AsyncMock()
+        knowledge_service.register_file.return_value = FileRegistrationResult(
+            document_id="doc-1", knowledge_service_file_id="file-1"
+        )
+        knowledge_service.execute_query.side_effect = execute_query
+
+        use_case, document_repo = await _make_wide_use_case(
+            self.FIELDS, knowledge_service
+        )
+        config = await use_case.knowledge_service_config_repo.get("ks-1")
+        await use_case.knowledge_service_config_repo.save(
+            config.model_copy(
+                update={
+                    "retrieval": RetrievalPolicy(
+                        top_k=1, passage_chars=300, min_document_chars=0
+                    )
+                }
+            )
+        )
+        for field in full_context_fields:
+            query = await use_case.knowledge_service_query_repo.get(f"query-{field}")
+            await use_case.knowledge_service_query_repo.save(
+                query.model_copy(update={"full_context": True})
+            )
+        content_bytes = (
+            "Opening remarks.\n" * 30
+            + "Attendees were Ana and Ben.\n"
+            + "Closing remarks.\n" * 30
+            + "The budget was approved.\n"
+        ).encode("utf-8")
+        await document_repo.save(
+            Document(
+                document_id="doc-1",
+                original_filename="minutes.txt",
+                content_type="text/plain",
+                size_bytes=len(content_bytes),
+                content_multihash="hash-minutes",
+                status=DocumentStatus.CAPTURED,
+                content=ContentStream(io.BytesIO(content_bytes)),
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+        assembly = await use_case.assemble_data("doc-1", "spec-1")
+        assert assembly.status == AssemblyStatus.COMPLETED
+        document = await document_repo.get(assembly.assembled_document_id)
+        data = json.loads(document.content.read().decode("utf-8"))
+        return data, knowledge_service
+
+    @pytest.mark.asyncio
+    async def test_queries_are_sent_relevant_passages(self) -> None:
+        """Passages replace the registered document in each query."""
+        data, knowledge_service = await self._assemble()
+
+        assert data == {"attendees": "attendees-0", "budget": "budget-0"}
+        knowledge_service.register_file.assert_not_called()
+        prompts = {
+            call.args[1].splitlines()[-1]: call.args[1]
+            for call in knowledge_service.execute_query.await_args_list
+        }
+        assert "Attendees were Ana and Ben." in prompts["attendees"]
+        assert "budget was approved" not in prompts["attendees"]
+        assert "The budget was approved." in prompts["budget"]
+
+    @pytest.mark.asyncio
+    async def test_full_context_queries_get_the_document(self) -> None:
+        data, knowledge_service = await self._assemble(full_context_fields=["budget"])
+
+        assert data == {"attendees": "attendees-0", "budget": "budget-1"}
+        knowledge_service.register_file.assert_awaited_once()
+
+
+class TestResumedAssembly:
+    """Tests for retries resuming from the query results already saved."""
+
+    FIELDS = ["a", "b", "c", "d", "e"]
+
+    async def _make_use_case(self, answers, group_size=None):
+        """Create a use case whose service answers each prompt via answers.
+
+        answers maps a prompt to an exception to raise or a response to
+        return; other prompts are answered upper-cased.
+        """
+        now = datetime.now(timezone.utc)
+        asked: list[str] = []
+
+        async def execute_query(config, prompt, *args):
+            asked.append(prompt)
+            answer = answers.get(prompt, prompt.upper())
+            if isinstance(answer, Exception):
+                raise answer
+            return QueryResult(
+                query_id=f"result-{prompt}",
+                query_text=prompt,
+                result_data={"response": answer},
+                execution_time_ms=1,
+                created_at=now,
+            )
+
+        knowledge_service = AsyncMock()
+        knowledge_service.register_file.return_value.knowledge_service_file_id = (
+            "file-1"
+        )
+        knowledge_service.execute_query.side_effect = execute_query
+
+        holder = {}
+
+        async def runner(request):
+            return await holder["use_case"].execute_query_group(request)
+
+        use_case, _ = await _make_wide_use_case(
+            self.FIELDS,
+            knowledge_service,
+            execution_service=DefaultExecutionService("execution-1"),
+            query_group_runner=runner if group_size else None,
+            query_group_size=group_size,
+        )
+        holder["use_case"] = use_case
+        return use_case, asked
+
+    @pytest.mark.asyncio
+    async def test_retry_only_asks_failed_queries(self) -> None:
+        answers: dict = {"c": RuntimeError("service unavailable")}
+        use_case, asked = await self._make_use_case(answers)
+
+        with pytest.raises(RuntimeError, match="service unavailable"):
+            await use_case.assemble_data("doc-1", "spec-1")
+        failed = await use_case.assembly_repo.find_by_execution(
+            "execution-1", "doc-1", "spec-1"
+        )
+        assert failed.status == AssemblyStatus.FAILED
+        assert dict(failed.query_results) == {
+            "/properties/a": "A",
+            "/properties/b": "B",
+        }
+
+        answers.clear()
+        asked.clear()
+        assembly = await use_case.assemble_data("doc-1", "spec-1")
+
+        assert assembly.status == AssemblyStatus.COMPLETED
+        assert assembly.assembly_id == failed.assembly_id
+        assert asked == ["c", "d", "e"]
+
+    @pytest.mark.asyncio
+    async def test_new_executions_do_not_resume_earlier_ones(self) -> None:
+        """A workflow ID reused for a new execution starts afresh."""
+        answers: dict = {"c": RuntimeError("service unavailable")}
+        use_case, asked = await self._make_use_case(answers)
+
+        with pytest.raises(RuntimeError, match="service unavailable"):
+            await use_case.assemble_data("doc-1", "spec-1")
+        failed = await use_case.assembly_repo.find_by_execution(
+            "execution-1", "doc-1", "spec-1"
+        )
+
+        answers.clear()
+        asked.clear()
+        use_case._execution_service = DefaultExecutionService("execution-2")
+        assembly = await use_case.assemble_data("doc-1", "spec-1")
+
+        assert assembly.assembly_id != failed.assembly_id
+        assert asked == self.FIELDS
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("group_size", "expected"),
+        [(None, ["a, again", "c", "d", "e"]), (2, ["a, again", "c", "d"])],
+    )
+    async def test_retry_asks_queries_edited_since_again(
+        self, group_size, expected
+    ) -> None:
+        """Saved results of a query whose prompt changed are not reused."""
+        answers: dict = {"c": RuntimeError("service unavailable")}
+        use_case, asked = await self._make_use_case(answers, group_size=group_size)
+
+        with pytest.raises(RuntimeError, match="service unavailable"):
+            await use_case.assemble_data("doc-1", "spec-1")
+        query_repo = use_case.knowledge_service_query_repo
+        query = await query_repo.get("query-a")
+        await query_repo.save(query.model_copy(update={"prompt": "a, again"}))
+
+        answers.clear()
+        asked.clear()
+        assembly = await use_case.assemble_data("doc-1", "spec-1")
+
+        assert assembly.status == AssemblyStatus.COMPLETED
+        assert sorted(asked) == expected
+
+    @pytest.mark.asyncio
+    async def test_invalid_results_are_not_saved(self) -> None:
+        """A result failing its pointer's schema is asked again on retry."""
+        answers: dict = {"b": 42}
+        use_case, asked = await self._make_use_case(answers)
+
+        with pytest.raises(ValueError, match="does not conform"):
+            await use_case.assemble_data("doc-1", "spec-1")
+        failed = await use_case.assembly_repo.find_by_execution(
+            "execution-1", "doc-1", "spec-1"
+        )
+        assert "/properties/b" not in failed.query_results
+        assert len(failed.query_results) == 4
+
+        answers.clear()
+        asked.clear()
+        assembly = await use_case.assemble_data("doc-1", "spec-1")
+
+        assert assembly.status == AssemblyStatus.COMPLETED
+        assert asked == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_results_of_other_groups_survive_a_failed_group(self) -> None:
+        answers: dict = {"c": RuntimeError("service unavailable")}
+        use_case, asked = await self._make_use_case(answers, group_size=2)
+
+        with pytest.raises(RuntimeError, match="service unavailable"):
+            await use_case.assemble_data("doc-1", "spec-1")
+
+        answers.clear()
+        asked.clear()
+        assembly = await use_case.assemble_data("doc-1", "spec-1")
+
+        assert assembly.status == AssemblyStatus.COMPLETED
+        assert asked == ["c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_results_are_saved_once_per_group(self) -> None:
+        use_case, _ = await self._make_use_case({}, group_size=2)
+        repo = use_case.assembly_repo
+        saved_counts = []
+        save = repo.save
+
+        async def counting_save(assembly):
+            saved_counts.append(len(assembly.query_results))
+            await save(assembly)
+
+        with patch.object(repo, "save", side_effect=counting_save):
+            await use_case.assemble_data("doc-1", "spec-1")
+
+        # Creation, one save per group of two, one for the last query, and
+        # completion
+        assert sorted(saved_counts) == [0, 2, 4, 5, 5]
+
+    @pytest.mark.asyncio
+    async def test_completed_assemblies_are_not_resumed(self) -> None:
+        use_case, asked = await self._make_use_case({})
+
+        first = await use_case.assemble_data("doc-1", "spec-1")
+        asked.clear()
+        second = await use_case.assemble_data("doc-1", "spec-1")
+
+        assert second.assembly_id != first.assembly_id
+        assert asked == self.FIELDS
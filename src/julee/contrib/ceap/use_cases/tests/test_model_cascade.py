@@ -0,0 +1,193 @@
+"""
+Tests for model cascades.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import jsonschema
+import pytest
+
+from julee.contrib.ceap.domain.models import (
+    KnowledgeServiceConfig,
+    KnowledgeServiceQuery,
+)
+from julee.contrib.ceap.domain.models.assembly_specification import ModelCascade
+from julee.contrib.ceap.domain.models.knowledge_service_config import ServiceApi
+from julee.contrib.ceap.use_cases.model_cascade import execute_cascaded_query
+from julee.contrib.ceap.use_cases.query_coalescing import (
+    CoalescibleQuery,
+    QueryCoalescer,
+)
+from julee.services.knowledge_service import QueryResult
+
+pytestmark = pytest.mark.unit
+
+CONFIG = KnowledgeServiceConfig(
+    knowledge_service_id="ks-1",
+    name="Test Knowledge Service",
+    description="Test service",
+    service_api=ServiceApi.ANTHROPIC,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"title": {"type": "string"}},
+    "required": ["title"],
+}
+
+
+def make_query(key: str = "title", **cascade) -> KnowledgeServiceQuery:
+    return KnowledgeServiceQuery(
+        query_id=f"query-{key}",
+        name=f"Extract {key}",
+        knowledge_service_id="ks-1",
+        prompt=f"What is the {key}?",
+        query_metadata={"model": "large", "max_tokens": 100},
+        assistant_prompt="{",
+        model_cascade=ModelCascade(models=("small", "medium"), **cascade),
+    )
+
+
+def result(response, stop_reason: str = "end_turn") -> QueryResult:
+    return QueryResult(
+        query_id="result",
+        query_text="query",
+        result_data={"response": response, "stop_reason": stop_reason},
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def models_asked(service: AsyncMock) -> list[str]:
+    return [call.args[4]["model"] for call in service.execute_query.await_args_list]
+
+
+class TestExecuteCascadedQuery:
+    """Test cases for execute_cascaded_query."""
+
+    async def test_first_valid_answer_is_used(self) -> None:
+        """A conforming answer from the cheapest model ends the cascade."""
+        service = AsyncMock()
+        service.execute_query.return_value = result({"title": "Report"})
+
+        query_result = await execute_cascaded_query(
+            service, CONFIG, make_query(), SCHEMA, ["file-1"]
+        )
+
+        assert models_asked(service) == ["small"]
+        assert service.execute_query.await_args.args[4]["max_tokens"] == 100
+        assert query_result.result_data["response"] == {"title": "Report"}
+        assert query_result.result_data["model_tier"] == 0
+
+    async def test_escalates_until_an_answer_conforms(self) -> None:
+        """Invalid, truncated and failed answers escalate to the next tier."""
+        service = AsyncMock()
+        service.execute_query.side_effect = [
+            result({"title": 1}),
+            result({"title": "Rep"}, stop_reason="max_tokens"),
+            result({"title": "Report"}),
+        ]
+
+        query_result = await execute_cascaded_query(
+            service, CONFIG, make_query(), SCHEMA, ["file-1"]
+        )
+
+        assert models_asked(service) == ["small", "medium", "large"]
+        assert query_result.result_data["model_tier"] == 2
+
+    async def test_errors_escalate(self) -> None:
+        service = AsyncMock()
+        service.execute_query.side_effect = [
+            ValueError("Failed to parse JSON response"),
+            result({"title": "Report"}),
+        ]
+
+        query_result = await execute_cascaded_query(
+            service, CONFIG, make_query(), SCHEMA, ["file-1"]
+        )
+
+        assert query_result.result_data["model_tier"] == 1
+
+    async def test_low_confidence_escalates(self) -> None:
+        """With min_confidence, cascade models report their confidence."""
+        service = AsyncMock()
+        service.execute_query.side_effect = [
+            result({"answer": {"title": "Report?"}, "confidence": 0.4}),
+            result({"answer": {"title": "Report"}, "confidence": 0.9}),
+        ]
+
+        query_result = await execute_cascaded_query(
+            service, CONFIG, make_query(min_confidence=0.8), SCHEMA, ["file-1"]
+        )
+
+        prompt, schema = service.execute_query.await_args.args[1:3]
+        assert "confidence" in prompt
+        assert schema["properties"]["answer"] == SCHEMA
+        assert query_result.result_data["response"] == {"title": "Report"}
+        assert query_result.result_data["confidence"] == 0.9
+        assert query_result.result_data["model_tier"] == 1
+
+    async def test_confidence_schema_keeps_definitions_resolvable(self) -> None:
+        """References in the answer schema resolve in the wrapped schema."""
+        service = AsyncMock()
+        service.execute_query.return_value = result(
+            {"answer": {"author": {"name": "Ada"}}, "confidence": 0.9}
+        )
+        output_schema = {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "type": "object",
+            "properties": {"author": {"$ref": "#/$defs/person"}},
+            "$defs": {"person": {"type": "object", "required": ["name"]}},
+        }
+
+        await execute_cascaded_query(
+            service, CONFIG, make_query(min_confidence=0.8), output_schema, ["f"]
+        )
+
+        schema = service.execute_query.await_args.args[2]
+        assert schema["$defs"] == output_schema["$defs"]
+        assert "$defs" not in schema["properties"]["answer"]
+        jsonschema.validate(
+            {"answer": {"author": {"name": "Ada"}}, "confidence": 0.9}, schema
+        )
+        with pytest.raises(jsonschema.ValidationError):
+            jsonschema.validate({"answer": {"author": {}}, "confidence": 0.9}, schema)
+
+    async def test_query_without_cascade_runs_once(self) -> None:
+        service = AsyncMock()
+        service.execute_query.return_value = result({"title": "Report"})
+        query = make_query().model_copy(update={"model_cascade": None})
+
+        query_result = await execute_cascaded_query(
+            service, CONFIG, query, SCHEMA, ["file-1"]
+        )
+
+        assert models_asked(service) == ["large"]
+        assert "model_tier" not in query_result.result_data
+
+
+class TestCascadedCoalescing:
+    """Test that coalesced queries start their cascade together."""
+
+    async def test_coalesced_query_uses_first_tier(self) -> None:
+        """Parts failing on the coalesced first tier resume at the second."""
+        service = AsyncMock()
+        service.execute_query.side_effect = [
+            result({"answer_1": {"title": "A"}, "answer_2": {}}),
+            result({"title": "B"}),
+        ]
+        queries = [
+            CoalescibleQuery(
+                key=key,
+                query=make_query(key),
+                config=CONFIG,
+                service_file_id="file-1",
+                output_schema=SCHEMA,
+            )
+            for key in ("a", "b")
+        ]
+
+        responses = await QueryCoalescer(service).execute(queries)
+
+        assert responses == {"a": {"title": "A"}, "b": {"title": "B"}}
+        assert models_asked(service) == ["small", "medium"]
@@ -0,0 +1,38 @@
+"""
+Tests for passage retrieval helpers.
+"""
+
+import pytest
+
+from julee.contrib.ceap.domain.models import KnowledgeServiceQuery
+from julee.contrib.ceap.use_cases.passage_retrieval import (
+    passage_query,
+    retrieval_query_text,
+)
+
+pytestmark = pytest.mark.unit
+
+QUERY = KnowledgeServiceQuery(
+    query_id="query-1",
+    name="Extract attendees",
+    knowledge_service_id="ks-1",
+    prompt="Who attended the meeting?",
+)
+
+
+class TestRetrievalQueryText:
+    def test_pointer_names_added_to_prompt(self) -> None:
+        text = retrieval_query_text(
+            "/properties/meetingDetails/properties/action_items/items/0", QUERY
+        )
+
+        assert text == "Who attended the meeting? meeting Details action items"
+
+
+class TestPassageQuery:
+    def test_passages_quoted_before_question(self) -> None:
+        query = passage_query(QUERY, ["First passage.\n", "Second passage."])
+
+        assert '<passage number="2">\nSecond passage.\n</passage>' in query.prompt
+        assert query.prompt.endswith("\n\nWho attended the meeting?")
+        assert query.query_id == QUERY.query_id
@@ -232,6 +232,25 @@ class TestPointableJSONSchema:
         }
         assert result == expected
 
+    def test_target_schema_is_not_wrapped(self) -> None:
+        """The target schema keeps definitions but is not an object wrapper."""
+        root_schema = {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "type": "object",
+            "$defs": {"timestamp": {"type": "string", "format": "date-time"}},
+            "properties": {"created_at": {"$ref": "#/$defs/timestamp"}},
+            "required": ["created_at"],
+        }
+
+        pointable = PointableJSONSchema(root_schema)
+        result = pointable.target_schema_for_pointer("/properties/created_at")
+
+        assert result == {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "$defs": {"timestamp": {"type": "string", "format": "date-time"}},
+            "$ref": "#/$defs/timestamp",
+        }
+
     def test_invalid_pointer_raises_error(self) -> None:
         """Test that invalid JSON pointers raise ValueError."""
         root_schema = {
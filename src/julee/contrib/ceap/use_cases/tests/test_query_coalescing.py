@@ -0,0 +1,217 @@
+"""
+Tests for coalescing knowledge service queries.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from julee.contrib.ceap.domain.models import (
+    KnowledgeServiceConfig,
+    KnowledgeServiceQuery,
+)
+from julee.contrib.ceap.domain.models.knowledge_service_config import ServiceApi
+from julee.contrib.ceap.use_cases.query_coalescing import (
+    CoalescibleQuery,
+    QueryCoalescer,
+    plan_query_groups,
+)
+from julee.services.knowledge_service import QueryResult
+
+pytestmark = pytest.mark.unit
+
+CONFIG = KnowledgeServiceConfig(
+    knowledge_service_id="ks-1",
+    name="Test Knowledge Service",
+    description="Test service",
+    service_api=ServiceApi.ANTHROPIC,
+)
+
+STRING_SCHEMA = {"type": "string"}
+
+
+def make_query(
+    key: str,
+    schema: dict | None = STRING_SCHEMA,
+    metadata: dict | None = None,
+    assistant_prompt: str | None = "{",
+    service_file_id: str = "file-1",
+) -> CoalescibleQuery:
+    return CoalescibleQuery(
+        key=key,
+        query=KnowledgeServiceQuery(
+            query_id=f"query-{key}",
+            name=f"Extract {key}",
+            knowledge_service_id="ks-1",
+            prompt=f"What is {key}?",
+            query_metadata=metadata or {},
+            assistant_prompt=assistant_prompt,
+        ),
+        config=CONFIG,
+        service_file_id=service_file_id,
+        output_schema=schema,
+    )
+
+
+def result(response) -> QueryResult:
+    return QueryResult(
+        query_id="result",
+        query_text="query",
+        result_data={"response": response},
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+class TestPlanQueryGroups:
+    """Test cases for plan_query_groups."""
+
+    def test_groups_compatible_queries(self) -> None:
+        """Queries differing only in max_tokens share a group, in order."""
+        queries = [
+            make_query("a", metadata={"model": "m1", "max_tokens": 10}),
+            make_query("b", metadata={"model": "m2", "max_tokens": 10}),
+            make_query("c", metadata={"model": "m1", "max_tokens": 20}),
+            make_query("d", service_file_id="file-2", metadata={"model": "m1"}),
+        ]
+
+        groups = plan_query_groups(queries)
+
+        assert [[q.key for q in group] for group in groups] == [
+            ["a", "c"],
+            ["b"],
+            ["d"],
+        ]
+
+    def test_incompatible_queries_run_alone(self) -> None:
+        """Queries without a schema or with another prefill are not grouped."""
+        queries = [
+            make_query("a", schema=None),
+            make_query("b", schema=None),
+            make_query("c", assistant_prompt='{"title":'),
+            make_query("d", assistant_prompt='{"title":'),
+        ]
+
+        assert [len(group) for group in plan_query_groups(queries)] == [1, 1, 1, 1]
+
+    def test_respects_group_size(self) -> None:
+        queries = [make_query(key) for key in "abcde"]
+
+        groups = plan_query_groups(queries, max_group_size=2)
+
+        assert [[q.key for q in group] for group in groups] == [
+            ["a", "b"],
+            ["c", "d"],
+            ["e"],
+        ]
+
+
+class TestQueryCoalescer:
+    """Test cases for QueryCoalescer."""
+
+    async def test_asks_compatible_queries_once(self) -> None:
+        """One query with a combined schema answers every part."""
+        service = AsyncMock()
+        service.execute_query.return_value = result({"answer_1": "A", "answer_2": "B"})
+        queries = [
+            make_query("a", metadata={"max_tokens": 100, "temperature": 0.1}),
+            make_query("b", metadata={"max_tokens": 50, "temperature": 0.1}),
+        ]
+
+        responses = await QueryCoalescer(service).execute(queries)
+
+        assert responses == {"a": "A", "b": "B"}
+        service.execute_query.assert_awaited_once()
+        config, prompt, schema, file_ids, metadata, prefill = (
+            service.execute_query.await_args.args
+        )
+        assert "What is a?" in prompt and "What is b?" in prompt
+        assert schema["properties"] == {
+            "answer_1": STRING_SCHEMA,
+            "answer_2": STRING_SCHEMA,
+        }
+        assert schema["required"] == ["answer_1", "answer_2"]
+        assert file_ids == ["file-1"]
+        assert metadata == {"max_tokens": 150, "temperature": 0.1}
+        assert prefill == "{"
+
+    async def test_responses_are_reported_as_groups_are_answered(self) -> None:
+        """Responses already received are reported before a later failure."""
+        service = AsyncMock()
+        service.execute_query.side_effect = [
+            result({"answer_1": "A", "answer_2": "B"}),
+            RuntimeError("service unavailable"),
+        ]
+        queries = [make_query("a"), make_query("b"), make_query("c", schema=None)]
+        reported = []
+
+        async def on_response(responses):
+            reported.append(responses)
+
+        with pytest.raises(RuntimeError):
+            await QueryCoalescer(service).execute(queries, on_response)
+
+        assert reported == [{"a": "A", "b": "B"}]
+
+    async def test_invalid_parts_are_asked_individually(self) -> None:
+        """Only the parts that fail validation fall back."""
+        service = AsyncMock()
+        service.execute_query.side_effect = [
+            result({"answer_1": "A", "answer_2": 2}),
+            result("B"),
+        ]
+
+        responses = await QueryCoalescer(service).execute(
+            [make_query("a"), make_query("b")]
+        )
+
+        assert responses == {"a": "A", "b": "B"}
+        fallback = service.execute_query.await_args_list[1].args
+        assert fallback[1] == "What is b?"
+        assert fallback[2] == STRING_SCHEMA
+
+    async def test_failed_coalesced_query_falls_back(self) -> None:
+        """A coalesced query that errors is replaced by individual queries."""
+        service = AsyncMock()
+        service.execute_query.side_effect = [
+            ValueError("Failed to parse JSON response"),
+            result("A"),
+            result("B"),
+        ]
+
+        responses = await QueryCoalescer(service).execute(
+            [make_query("a"), make_query("b")]
+        )
+
+        assert responses == {"a": "A", "b": "B"}
+        assert service.execute_query.await_count == 3
+
+    async def test_definitions_are_hoisted(self) -> None:
+        """Shared definitions move to the root of the combined schema."""
+        part = {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "$defs": {"name": {"type": "string"}},
+            "$ref": "#/$defs/name",
+        }
+        service = AsyncMock()
+        service.execute_query.return_value = result({"answer_1": "A", "answer_2": "B"})
+
+        await QueryCoalescer(service).execute(
+            [make_query("a", schema=part), make_query("b", schema=part)]
+        )
+
+        schema = service.execute_query.await_args.args[2]
+        assert schema["$defs"] == {"name": {"type": "string"}}
+        assert schema["$schema"] == part["$schema"]
+        assert schema["properties"]["answer_1"] == {"$ref": "#/$defs/name"}
+
+    async def test_group_size_one_disables_coalescing(self) -> None:
+        service = AsyncMock()
+        service.execute_query.side_effect = [result("A"), result("B")]
+
+        responses = await QueryCoalescer(service, max_group_size=1).execute(
+            [make_query("a"), make_query("b")]
+        )
+
+        assert responses == {"a": "A", "b": "B"}
+        assert service.execute_query.await_count == 2
@@ -0,0 +1,141 @@
+"""
+Tests for map-reduce extraction over document segments.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from julee.contrib.ceap.domain.models import (
+    KnowledgeServiceConfig,
+    KnowledgeServiceQuery,
+)
+from julee.contrib.ceap.domain.models.knowledge_service_config import ServiceApi
+from julee.contrib.ceap.use_cases.query_coalescing import QueryCoalescer
+from julee.contrib.ceap.use_cases.segmented_extraction import (
+    SegmentedQuery,
+    extract_from_segments,
+    merge_partial_results,
+    relax_schema,
+)
+from julee.services.knowledge_service import QueryResult
+
+pytestmark = pytest.mark.unit
+
+CONFIG = KnowledgeServiceConfig(
+    knowledge_service_id="ks-1",
+    name="Test Knowledge Service",
+    description="Test service",
+    service_api=ServiceApi.ANTHROPIC,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "attendees": {"type": "array", "items": {"$ref": "#/$defs/person"}},
+    },
+    "required": ["title", "attendees"],
+    "additionalProperties": False,
+    "$defs": {
+        "person": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "required": ["name"],
+        }
+    },
+}
+
+
+class TestRelaxSchema:
+    """Test relaxing schemas for partial answers."""
+
+    def test_completeness_constraints_removed(self) -> None:
+        relaxed = relax_schema(
+            {**SCHEMA, "properties": {"tags": {"type": "array", "minItems": 1}}}
+        )
+
+        assert "required" not in relaxed
+        assert "required" not in relaxed["$defs"]["person"]
+        assert relaxed["properties"]["tags"] == {"type": "array"}
+        assert relaxed["additionalProperties"] is False
+
+
+class TestMergePartialResults:
+    """Test merging the answers of consecutive segments."""
+
+    def test_objects_merge_by_property(self) -> None:
+        merged = merge_partial_results(
+            SCHEMA,
+            [
+                {"title": "Board meeting", "attendees": [{"name": "Ana"}]},
+                {"attendees": [{"name": "Ana"}, {"name": "Ben"}], "notes": "x"},
+            ],
+        )
+
+        assert merged == {
+            "title": "Board meeting",
+            "attendees": [{"name": "Ana"}, {"name": "Ben"}],
+        }
+
+    def test_invalid_array_items_dropped(self) -> None:
+        merged = merge_partial_results(
+            SCHEMA, [{"attendees": [{"name": "Ana"}, {"role": "chair"}]}]
+        )
+
+        assert merged == {"attendees": [{"name": "Ana"}]}
+
+    def test_first_valid_scalar_wins(self) -> None:
+        merged = merge_partial_results({"type": "integer"}, ["12", 12, 13])
+
+        assert merged == 12
+
+    def test_no_answers(self) -> None:
+        assert merge_partial_results(SCHEMA, [None, ""]) is None
+
+
+class TestExtractFromSegments:
+    """Test asking queries of every segment."""
+
+    async def test_segments_answered_and_merged(self) -> None:
+        async def execute_query(config, prompt, schema, file_ids, *args):
+            answers = {
+                "file-1": {"title": "Board meeting", "attendees": [{"name": "Ana"}]},
+                "file-2": {"attendees": [{"name": "Ben"}]},
+                "file-3": {},
+            }
+            return QueryResult(
+                query_id="result",
+                query_text=prompt,
+                result_data={"response": answers[file_ids[0]]},
+                created_at=datetime.now(timezone.utc),
+            )
+
+        service = AsyncMock()
+        service.execute_query.side_effect = execute_query
+        query = SegmentedQuery(
+            key="/properties/meeting",
+            query=KnowledgeServiceQuery(
+                query_id="query-meeting",
+                name="Extract meeting",
+                knowledge_service_id="ks-1",
+                prompt="Describe the meeting",
+            ),
+            config=CONFIG,
+            output_schema=SCHEMA,
+        )
+
+        results = await extract_from_segments(
+            QueryCoalescer(service), [query], ["file-1", "file-2", "file-3"], 2
+        )
+
+        assert results == {
+            "/properties/meeting": {
+                "title": "Board meeting",
+                "attendees": [{"name": "Ana"}, {"name": "Ben"}],
+            }
+        }
+        prompts = [call.args[1] for call in service.execute_query.await_args_list]
+        assert "part 2 of 3" in prompts[1]
+        assert "required" not in service.execute_query.await_args.args[2]
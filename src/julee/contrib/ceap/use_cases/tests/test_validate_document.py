@@ -1228,3 +1228,91 @@ class TestValidateDocumentUseCase:
             await configured_use_case.validate_document(
                 document_id="doc-789", policy_id="policy-789"
             )
+
+    @pytest.mark.asyncio
+    async def test_validation_queries_are_coalesced(
+        self,
+        document_repo: MemoryDocumentRepository,
+        policy_repo: MemoryPolicyRepository,
+        knowledge_service_query_repo: MemoryKnowledgeServiceQueryRepository,
+        knowledge_service_config_repo: MemoryKnowledgeServiceConfigRepository,
+        document_policy_validation_repo: MemoryDocumentPolicyValidationRepository,
+    ) -> None:
+        """Compatible validation queries are answered by one query."""
+        now = datetime.now(timezone.utc)
+        await document_repo.save(
+            Document(
+                document_id="doc-123",
+                original_filename="test_document.txt",
+                content_type="text/plain",
+                size_bytes=8,
+                content_multihash="test-hash-123",
+                status=DocumentStatus.CAPTURED,
+                content=ContentStream(io.BytesIO(b"document")),
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        await policy_repo.save(
+            Policy(
+                policy_id="policy-123",
+                title="Quality Policy",
+                description="Validates document quality",
+                status=PolicyStatus.ACTIVE,
+                validation_scores=[("quality-query", 80), ("clarity-query", 70)],
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        ks_config = KnowledgeServiceConfig(
+            knowledge_service_id="ks-123",
+            name="Test Knowledge Service",
+            description="Test service",
+            service_api=ServiceApi.ANTHROPIC,
+            created_at=now,
+            updated_at=now,
+        )
+        await knowledge_service_config_repo.save(ks_config)
+        for query_id in ("quality-query", "clarity-query"):
+            await knowledge_service_query_repo.save(
+                KnowledgeServiceQuery(
+                    query_id=query_id,
+                    name=query_id,
+                    knowledge_service_id="ks-123",
+                    prompt=f"Rate the {query_id} of this document from 0-100",
+                    query_metadata={"max_tokens": 10},
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+
+        # A single canned result: a second query would find none
+        memory_service = MemoryKnowledgeService(ks_config)
+        memory_service.add_canned_query_result(
+            QueryResult(
+                query_id="result-1",
+                query_text="coalesced",
+                result_data={"response": {"answer_1": 85, "answer_2": 75}},
+                created_at=now,
+            )
+        )
+        use_case = ValidateDocumentUseCase(
+            document_repo=document_repo,
+            knowledge_service_query_repo=knowledge_service_query_repo,
+            knowledge_service_config_repo=knowledge_service_config_repo,
+            policy_repo=policy_repo,
+            document_policy_validation_repo=document_policy_validation_repo,
+            knowledge_service=memory_service,
+            now_fn=lambda: datetime.now(timezone.utc),
+            coalesce_queries=True,
+        )
+
+        result = await use_case.validate_document(
+            document_id="doc-123", policy_id="policy-123"
+        )
+
+        assert result.status == DocumentPolicyValidationStatus.PASSED
+        assert result.validation_scores == (
+            ("quality-query", 85),
+            ("clarity-query", 75),
+        )
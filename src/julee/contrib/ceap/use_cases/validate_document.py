@@ -39,9 +39,14 @@ from julee.services import KnowledgeService
 from julee.util.validation import ensure_repository_protocol
 
 from .decorators import try_use_case_step
+from .query_coalescing import MAX_COALESCED_QUERIES, CoalescibleQuery, QueryCoalescer
 
 logger = logging.getLogger(__name__)
 
+# Answer schema of a validation query asked as part of a coalesced query;
+# asked individually, it answers with the score as plain text
+SCORE_ANSWER_SCHEMA = {"type": "integer"}
+
 
 class ValidateDocumentRequest(BaseModel):
     document_id: str
@@ -88,6 +93,7 @@ class ValidateDocumentUseCase:
         document_policy_validation_repo: DocumentPolicyValidationRepository,
         knowledge_service: KnowledgeService,
         now_fn: Callable[[], datetime],
+        coalesce_queries: bool = False,
     ) -> None:
         """Initialize validate document use case.
 
@@ -104,6 +110,10 @@ class ValidateDocumentUseCase:
                 operations
             now_fn: Function to get current time (e.g., workflow.now for
                 Temporal workflows)
+            coalesce_queries: Ask compatible validation queries together in
+                one knowledge service query, falling back to individual
+                queries for scores that fail validation. See
+                query_coalescing.
 
         .. note::
 
@@ -139,6 +149,10 @@ class ValidateDocumentUseCase:
             DocumentPolicyValidationRepository,  # type: ignore[type-abstract]
         )
         self.now_fn = now_fn
+        self._query_coalescer = QueryCoalescer(
+            knowledge_service,
+            max_group_size=MAX_COALESCED_QUERIES if coalesce_queries else 1,
+        )
 
     async def execute(
         self, request: ValidateDocumentRequest
@@ -520,10 +534,10 @@ class ValidateDocumentUseCase:
             List of (query_id, actual_score) tuples
 
         """
-        validation_scores = []
+        planned: list[CoalescibleQuery] = []
 
-        # Execute each validation query defined in the policy
-        for query_id, required_score in policy.validation_scores:
+        # Plan each distinct validation query defined in the policy
+        for query_id in dict.fromkeys(q for q, _ in policy.validation_scores):
             # Get the query configuration
             query = queries[query_id]
 
@@ -543,18 +557,25 @@ class ValidateDocumentUseCase:
                     f"Document not registered with service {query.knowledge_service_id}"
                 )
 
-            # Execute the validation query
-            query_result = await self.knowledge_service.execute_query(
-                config,
-                query.prompt,
-                None,  # output_schema
-                [service_file_id],
-                query.query_metadata,
-                query.assistant_prompt,
+            planned.append(
+                CoalescibleQuery(
+                    key=query_id,
+                    query=query,
+                    config=config,
+                    service_file_id=service_file_id,
+                    answer_schema=SCORE_ANSWER_SCHEMA,
+                )
             )
 
+        # Execute the validation queries
+        responses = await self._query_coalescer.execute(planned)
+
+        validation_scores = []
+        for query_id, required_score in policy.validation_scores:
             # Extract the score from the query result
-            actual_score = self._extract_score_from_result(query_result.result_data)
+            actual_score = self._extract_score_from_result(
+                {"response": responses[query_id]}
+            )
             validation_scores.append((query_id, actual_score))
 
             logger.debug(
@@ -578,6 +599,9 @@ class ValidateDocumentUseCase:
         integrity.
         """
         response_text = result_data.get("response", "")
+        # Coalesced queries answer with JSON integers
+        if isinstance(response_text, int) and not isinstance(response_text, bool):
+            return response_text
         if not response_text:
             raise ValueError("Empty response from knowledge service")
 
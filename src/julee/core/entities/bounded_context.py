@@ -10,6 +10,7 @@ meanings. In julee, bounded contexts follow Clean Architecture patterns
 and "scream" at the top level of the codebase.
 """
 
+from enum import Enum
 from pathlib import Path
 
 from pydantic import BaseModel, Field, field_validator
@@ -132,3 +133,26 @@ class BoundedContext(BaseModel):
         if layer == "use_cases":
             return self.markers.has_domain_use_cases
         return False
+
+
+class BoundedContextChangeKind(str, Enum):
+    """How a bounded context changed between two discovery scans."""
+
+    ADDED = "added"
+    MODIFIED = "modified"
+    REMOVED = "removed"
+
+
+class BoundedContextChange(BaseModel):
+    """A change to a single bounded context detected by an incremental scan.
+
+    Consumers such as documentation dev servers use these events to
+    re-render only the pages that depend on the affected context.
+    """
+
+    kind: BoundedContextChangeKind
+    slug: str = Field(description="Slug of the affected bounded context")
+    context: BoundedContext | None = Field(
+        default=None,
+        description="The context after the change; None if it was removed",
+    )
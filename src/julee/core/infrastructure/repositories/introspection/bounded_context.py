@@ -12,13 +12,19 @@ from pathlib import Path
 from julee.core.doctrine_constants import (
     CONTRIB_DIR,
     ENTITIES_PATH,
+    INFRASTRUCTURE_PATH,
     REPOSITORIES_PATH,
     RESERVED_WORDS,
     SERVICES_PATH,
     USE_CASES_PATH,
     VIEWPOINT_SLUGS,
 )
-from julee.core.entities.bounded_context import BoundedContext, StructuralMarkers
+from julee.core.entities.bounded_context import (
+    BoundedContext,
+    BoundedContextChange,
+    BoundedContextChangeKind,
+    StructuralMarkers,
+)
 
 __all__ = ["FilesystemBoundedContextRepository"]
 
@@ -61,30 +67,92 @@ def _get_first_docstring_line(path: Path) -> str | None:
 # =============================================================================
 
 
-def _is_gitignored(path: Path, project_root: Path) -> bool:
-    """Check if a path is ignored by git.
+# Per-project-root memo of path -> ignored. Ignore rules rarely change during
+# a process lifetime, and discovery is repeated by doctrine tests and the CLI.
+_gitignore_cache: dict[Path, dict[Path, bool]] = {}
 
-    Uses `git check-ignore` to respect .gitignore rules.
-    Falls back to False if git is not available or path is not in a repo.
+
+def _git_check_ignore(paths: list[Path], project_root: Path) -> set[Path]:
+    """Run a single `git check-ignore --stdin` for a batch of paths.
+
+    Returns the subset of paths that git reports as ignored. Falls back to
+    an empty set if git is not available or the root is not in a repo.
     """
+    payload = "".join(f"{path}\0" for path in paths)
     try:
         result = subprocess.run(
-            ["git", "check-ignore", "-q", str(path)],
+            ["git", "check-ignore", "-z", "--stdin"],
             cwd=project_root,
+            input=payload.encode(),
             capture_output=True,
             timeout=5,
         )
-        # Exit code 0 means the path IS ignored
-        return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         # git not available or other error - don't ignore
-        return False
+        return set()
+
+    # Exit code 0 means at least one path IS ignored, 1 means none are;
+    # anything else is a git error (e.g. not a repository).
+    if result.returncode != 0:
+        return set()
+
+    ignored = result.stdout.decode().split("\0")
+    return {Path(p) for p in ignored if p}
+
+
+def _filter_gitignored(paths: list[Path], project_root: Path) -> set[Path]:
+    """Return the subset of paths that are ignored by git.
+
+    Results are memoized per project root, so only paths not seen before
+    are sent to git, and all of them in one batched call.
+    """
+    cache = _gitignore_cache.setdefault(project_root.resolve(), {})
+    unknown = [path for path in paths if path not in cache]
+    if unknown:
+        ignored = _git_check_ignore(unknown, project_root)
+        for path in unknown:
+            cache[path] = path in ignored
+    return {path for path in paths if cache[path]}
+
+
+def _is_gitignored(path: Path, project_root: Path) -> bool:
+    """Check if a path is ignored by git.
+
+    Uses `git check-ignore` to respect .gitignore rules.
+    Falls back to False if git is not available or path is not in a repo.
+    """
+    return path in _filter_gitignored([path], project_root)
+
+
+def _clear_gitignore_cache(project_root: Path | None = None) -> None:
+    """Forget memoized gitignore results.
+
+    Args:
+        project_root: Only clear results for this root. Clears all if None.
+    """
+    if project_root is None:
+        _gitignore_cache.clear()
+    else:
+        _gitignore_cache.pop(project_root.resolve(), None)
 
 
 # =============================================================================
 # Repository Implementation
 # =============================================================================
 
+# Layer directories whose source files are introspected downstream (e.g. by
+# sphinx_hcd's BoundedContextInfo), including the legacy domain/ layout.
+_SOURCE_LAYERS: tuple[tuple[str, ...], ...] = (
+    ENTITIES_PATH,
+    REPOSITORIES_PATH,
+    SERVICES_PATH,
+    USE_CASES_PATH,
+    INFRASTRUCTURE_PATH,
+    ("domain", "models"),
+    ("domain", "repositories"),
+    ("domain", "services"),
+)
+
 
 class FilesystemBoundedContextRepository:
     """Repository that discovers bounded contexts by scanning filesystem.
@@ -109,6 +177,9 @@ class FilesystemBoundedContextRepository:
         self.project_root = project_root
         self.search_root = search_root
         self._cache: list[BoundedContext] | None = None
+        self._by_candidate: dict[Path, list[BoundedContext]] = {}
+        self._fingerprints: dict[Path, tuple] = {}
+        self._context_fingerprints: dict[str, tuple] = {}
 
     def _is_python_package(self, path: Path) -> bool:
         """Check if directory is a Python package."""
@@ -118,6 +189,14 @@ class FilesystemBoundedContextRepository:
         """Check if path contains a subdirectory."""
         return path.joinpath(*parts).is_dir()
 
+    def _candidate_directories(self, search_path: Path) -> list[Path]:
+        """List non-hidden subdirectories of a search path."""
+        return [
+            candidate
+            for candidate in search_path.iterdir()
+            if candidate.is_dir() and not candidate.name.startswith(".")
+        ]
+
     def _detect_markers(self, path: Path) -> StructuralMarkers:
         """Detect structural markers in a directory."""
         return StructuralMarkers(
@@ -148,16 +227,12 @@ class FilesystemBoundedContextRepository:
         if not search_path.exists():
             return contexts
 
-        for candidate in search_path.iterdir():
-            if not candidate.is_dir():
-                continue
-
-            # Skip dot-prefixed directories
-            if candidate.name.startswith("."):
-                continue
+        candidates = self._candidate_directories(search_path)
+        ignored = _filter_gitignored(candidates, self.project_root)
 
+        for candidate in candidates:
             # Skip gitignored directories
-            if _is_gitignored(candidate, self.project_root):
+            if candidate in ignored:
                 continue
 
             # Skip reserved words
@@ -174,15 +249,7 @@ class FilesystemBoundedContextRepository:
             if not self._is_bounded_context(markers):
                 continue
 
-            context = BoundedContext(
-                slug=candidate.name,
-                path=str(candidate),
-                description=_get_first_docstring_line(candidate),
-                is_contrib=is_contrib,
-                is_viewpoint=candidate.name in VIEWPOINT_SLUGS,
-                markers=markers,
-            )
-            contexts.append(context)
+            contexts.append(self._build_context(candidate, is_contrib, markers))
 
         return sorted(contexts, key=lambda c: c.slug)
 
@@ -215,6 +282,54 @@ class FilesystemBoundedContextRepository:
 
         return False
 
+    def _build_context(
+        self, candidate: Path, is_contrib: bool, markers: StructuralMarkers
+    ) -> BoundedContext:
+        """Build the BoundedContext entity for a discovered directory."""
+        return BoundedContext(
+            slug=candidate.name,
+            path=str(candidate),
+            description=_get_first_docstring_line(candidate),
+            is_contrib=is_contrib,
+            is_viewpoint=candidate.name in VIEWPOINT_SLUGS,
+            markers=markers,
+        )
+
+    def _discover_candidate(self, candidate: Path) -> list[BoundedContext]:
+        """Discover bounded contexts contributed by a top-level directory.
+
+        A top-level directory contributes either itself (if it is a bounded
+        context) or the bounded contexts nested within it (if it is a nested
+        solution), or nothing at all.
+        """
+        if not self._is_python_package(candidate):
+            return []
+
+        # Reserved words cannot be bounded contexts themselves, but may
+        # still be nested solution containers (e.g. contrib/, apps/).
+        is_reserved = candidate.name in RESERVED_WORDS
+        is_contrib = candidate.name == CONTRIB_DIR
+
+        markers = self._detect_markers(candidate)
+
+        if not is_reserved and self._is_bounded_context(markers):
+            # It's a bounded context
+            return [self._build_context(candidate, is_contrib, markers)]
+        if self._is_nested_solution(candidate):
+            # It's a nested solution - discover BCs within it
+            return self._discover_in_directory(candidate, is_contrib=is_contrib)
+        return []
+
+    def _top_level_candidates(self) -> list[Path]:
+        """List top-level directories eligible for discovery."""
+        search_path = self.project_root / self.search_root
+        if not search_path.exists():
+            return []
+
+        candidates = self._candidate_directories(search_path)
+        ignored = _filter_gitignored(candidates, self.project_root)
+        return [candidate for candidate in candidates if candidate not in ignored]
+
     def _discover_all(self) -> list[BoundedContext]:
         """Discover all bounded contexts.
 
@@ -222,49 +337,132 @@ class FilesystemBoundedContextRepository:
         nested solutions. A nested solution is a Python package that
         contains BCs but isn't a BC itself (e.g., contrib/, experimental/).
         """
-        search_path = self.project_root / self.search_root
-        all_contexts: list[BoundedContext] = []
+        self._by_candidate = {}
+        self._fingerprints = {}
+        for candidate in self._top_level_candidates():
+            self._by_candidate[candidate] = self._discover_candidate(candidate)
+            self._fingerprints[candidate] = self._fingerprint(candidate)
+
+        contexts = self._flatten()
+        self._context_fingerprints = {
+            c.slug: self._context_fingerprint(c.absolute_path) for c in contexts
+        }
+        return contexts
+
+    def _flatten(self) -> list[BoundedContext]:
+        """Merge per-directory results into the sorted context list."""
+        all_contexts = [
+            context for contexts in self._by_candidate.values() for context in contexts
+        ]
+        return sorted(all_contexts, key=lambda c: c.slug)
 
-        if not search_path.exists():
-            return all_contexts
+    # -------------------------------------------------------------------------
+    # Incremental refresh
+    # -------------------------------------------------------------------------
 
-        for candidate in search_path.iterdir():
-            if not candidate.is_dir():
-                continue
-            if candidate.name.startswith("."):
-                continue
-            if _is_gitignored(candidate, self.project_root):
-                continue
-            if not self._is_python_package(candidate):
+    def _context_fingerprint(self, path: Path) -> tuple:
+        """Stat-based signature of everything introspection reads for a BC.
+
+        Covers the __init__.py (docstring), the structural markers, and the
+        modification times of source files in each layer directory, so that
+        edits to entity or use case modules are detected as well.
+        """
+        try:
+            init_mtime: int | None = (path / "__init__.py").stat().st_mtime_ns
+        except OSError:
+            init_mtime = None
+
+        layers = []
+        for parts in _SOURCE_LAYERS:
+            layer_dir = path.joinpath(*parts)
+            if not layer_dir.is_dir():
                 continue
+            files = tuple(
+                sorted((f.name, f.stat().st_mtime_ns) for f in layer_dir.glob("*.py"))
+            )
+            layers.append((parts, files))
 
-            # Reserved words cannot be bounded contexts themselves, but may
-            # still be nested solution containers (e.g. contrib/, apps/).
-            is_reserved = candidate.name in RESERVED_WORDS
+        markers = tuple(self._detect_markers(path).model_dump().values())
+        return (init_mtime, markers, tuple(layers))
 
-            markers = self._detect_markers(candidate)
+    def _fingerprint(self, candidate: Path) -> tuple:
+        """Stat-based signature of a top-level candidate and its children.
 
-            if not is_reserved and self._is_bounded_context(markers):
-                # It's a bounded context
-                is_contrib = candidate.name == CONTRIB_DIR
-                context = BoundedContext(
-                    slug=candidate.name,
-                    path=str(candidate),
-                    description=_get_first_docstring_line(candidate),
-                    is_contrib=is_contrib,
-                    is_viewpoint=candidate.name in VIEWPOINT_SLUGS,
-                    markers=markers,
-                )
-                all_contexts.append(context)
-            elif self._is_nested_solution(candidate):
-                # It's a nested solution - discover BCs within it
-                is_contrib = candidate.name == CONTRIB_DIR
-                nested_contexts = self._discover_in_directory(
-                    candidate, is_contrib=is_contrib
+        Children are included so that BCs appearing, disappearing or
+        changing inside a nested solution are seen.
+        """
+        children = tuple(
+            (child.name, self._context_fingerprint(child))
+            for child in sorted(self._candidate_directories(candidate))
+            if self._is_python_package(child)
+        )
+        return (self._context_fingerprint(candidate), children)
+
+    def refresh(self) -> list[BoundedContextChange]:
+        """Incrementally bring the discovery cache up to date.
+
+        Only top-level directories whose fingerprint changed since the last
+        scan are rediscovered; all other cached entries are kept as-is.
+        If nothing has been discovered yet, a full discovery is run and
+        every context is reported as added.
+
+        Returns:
+            Changes to individual bounded contexts, ordered by slug
+        """
+        if self._cache is None:
+            self._cache = self._discover_all()
+            return [
+                BoundedContextChange(
+                    kind=BoundedContextChangeKind.ADDED, slug=c.slug, context=c
                 )
-                all_contexts.extend(nested_contexts)
+                for c in self._cache
+            ]
 
-        return sorted(all_contexts, key=lambda c: c.slug)
+        previous = {c.slug: c for c in self._cache}
+        rediscovered: set[str] = set()
+        candidates = self._top_level_candidates()
+
+        for candidate in set(self._by_candidate) - set(candidates):
+            del self._by_candidate[candidate]
+            del self._fingerprints[candidate]
+
+        for candidate in candidates:
+            fingerprint = self._fingerprint(candidate)
+            if self._fingerprints.get(candidate) == fingerprint:
+                continue
+            self._by_candidate[candidate] = self._discover_candidate(candidate)
+            self._fingerprints[candidate] = fingerprint
+            rediscovered.update(c.slug for c in self._by_candidate[candidate])
+
+        self._cache = self._flatten()
+        current = {c.slug: c for c in self._cache}
+
+        changes = []
+        for slug in sorted(previous.keys() | current.keys()):
+            before, after = previous.get(slug), current.get(slug)
+            if before is None:
+                kind = BoundedContextChangeKind.ADDED
+            elif after is None:
+                kind = BoundedContextChangeKind.REMOVED
+            elif before != after or self._source_changed(after):
+                kind = BoundedContextChangeKind.MODIFIED
+            else:
+                continue
+            changes.append(BoundedContextChange(kind=kind, slug=slug, context=after))
+
+        for slug in previous.keys() - current.keys():
+            self._context_fingerprints.pop(slug, None)
+        for slug in rediscovered:
+            self._context_fingerprints[slug] = self._context_fingerprint(
+                current[slug].absolute_path
+            )
+        return changes
+
+    def _source_changed(self, context: BoundedContext) -> bool:
+        """Check whether a context's source files changed since last scan."""
+        return self._context_fingerprints.get(
+            context.slug
+        ) != self._context_fingerprint(context.absolute_path)
 
     async def list_all(self) -> list[BoundedContext]:
         """List all discovered bounded contexts."""
@@ -281,5 +479,6 @@ class FilesystemBoundedContextRepository:
         return None
 
     def invalidate_cache(self) -> None:
-        """Clear the discovery cache."""
+        """Clear the discovery cache, including memoized gitignore results."""
         self._cache = None
+        _clear_gitignore_cache(self.project_root)
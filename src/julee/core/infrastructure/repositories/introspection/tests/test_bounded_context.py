@@ -0,0 +1,212 @@
+"""Tests for FilesystemBoundedContextRepository."""
+
+import asyncio
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from julee.core.entities.bounded_context import BoundedContextChangeKind
+from julee.core.infrastructure.repositories.introspection import bounded_context
+from julee.core.infrastructure.repositories.introspection.bounded_context import (
+    FilesystemBoundedContextRepository,
+)
+from julee.core.infrastructure.repositories.introspection.watcher import (
+    BoundedContextWatcher,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _make_bc(path: Path) -> None:
+    """Create a minimal bounded context package at path."""
+    (path / "entities").mkdir(parents=True)
+    (path / "__init__.py").write_text('"""A bounded context."""\n')
+
+
+@pytest.fixture
+def project_root(tmp_path: Path) -> Path:
+    """A git repository with a few bounded contexts, one of them ignored."""
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    (tmp_path / ".gitignore").write_text("src/pkg/generated/\n")
+    pkg = tmp_path / "src" / "pkg"
+    for name in ("billing", "shipping", "generated"):
+        _make_bc(pkg / name)
+    contrib = pkg / "contrib"
+    contrib.mkdir()
+    (contrib / "__init__.py").write_text("")
+    _make_bc(contrib / "polling")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate the module-level gitignore memo between tests."""
+    bounded_context._clear_gitignore_cache()
+    yield
+    bounded_context._clear_gitignore_cache()
+
+
+class TestGitignoreBatching:
+    """Test that gitignore checks are batched and memoized."""
+
+    async def test_discovery_skips_ignored_directories(
+        self, project_root: Path
+    ) -> None:
+        repo = FilesystemBoundedContextRepository(project_root, "src/pkg")
+
+        slugs = [c.slug for c in await repo.list_all()]
+
+        assert slugs == ["billing", "polling", "shipping"]
+
+    async def test_one_git_call_per_scanned_directory(self, project_root: Path) -> None:
+        repo = FilesystemBoundedContextRepository(project_root, "src/pkg")
+
+        with patch.object(
+            bounded_context,
+            "_git_check_ignore",
+            wraps=bounded_context._git_check_ignore,
+        ) as check:
+            await repo.list_all()
+
+        # One batch for src/pkg, one for the nested contrib solution
+        assert check.call_count == 2
+
+    async def test_results_memoized_across_instances(self, project_root: Path) -> None:
+        await FilesystemBoundedContextRepository(project_root, "src/pkg").list_all()
+
+        with patch.object(bounded_context, "_git_check_ignore") as check:
+            contexts = await FilesystemBoundedContextRepository(
+                project_root, "src/pkg"
+            ).list_all()
+
+        check.assert_not_called()
+        assert len(contexts) == 3
+
+    async def test_invalidate_cache_forgets_ignore_results(
+        self, project_root: Path
+    ) -> None:
+        repo = FilesystemBoundedContextRepository(project_root, "src/pkg")
+        await repo.list_all()
+
+        (project_root / ".gitignore").write_text("src/pkg/billing/\n")
+        repo.invalidate_cache()
+
+        slugs = [c.slug for c in await repo.list_all()]
+        assert slugs == ["generated", "polling", "shipping"]
+
+    def test_outside_git_repository_ignores_nothing(self, tmp_path: Path) -> None:
+        candidate = tmp_path / "a"
+        candidate.mkdir()
+
+        assert bounded_context._filter_gitignored([candidate], tmp_path) == set()
+
+
+class TestIncrementalRefresh:
+    """Test incremental refresh and change events."""
+
+    async def test_refresh_before_discovery_reports_everything_added(
+        self, project_root: Path
+    ) -> None:
+        repo = FilesystemBoundedContextRepository(project_root, "src/pkg")
+
+        changes = repo.refresh()
+
+        assert [c.slug for c in changes] == ["billing", "polling", "shipping"]
+        assert {c.kind for c in changes} == {BoundedContextChangeKind.ADDED}
+
+    async def test_refresh_without_edits_reports_nothing(
+        self, project_root: Path
+    ) -> None:
+        repo = FilesystemBoundedContextRepository(project_root, "src/pkg")
+        await repo.list_all()
+
+        assert repo.refresh() == []
+
+    async def test_refresh_detects_added_nested_context(
+        self, project_root: Path
+    ) -> None:
+        repo = FilesystemBoundedContextRepository(project_root, "src/pkg")
+        await repo.list_all()
+
+        _make_bc(project_root / "src" / "pkg" / "contrib" / "audit")
+        changes = repo.refresh()
+
+        assert [(c.slug, c.kind) for c in changes] == [
+            ("audit", BoundedContextChangeKind.ADDED)
+        ]
+        assert changes[0].context.is_contrib
+        assert "audit" in [c.slug for c in await repo.list_all()]
+
+    async def test_refresh_detects_modified_and_removed(
+        self, project_root: Path
+    ) -> None:
+        repo = FilesystemBoundedContextRepository(project_root, "src/pkg")
+        await repo.list_all()
+
+        pkg = project_root / "src" / "pkg"
+        (pkg / "billing" / "use_cases").mkdir()
+        shutil.rmtree(pkg / "shipping")
+        changes = repo.refresh()
+
+        assert [(c.slug, c.kind) for c in changes] == [
+            ("billing", BoundedContextChangeKind.MODIFIED),
+            ("shipping", BoundedContextChangeKind.REMOVED),
+        ]
+        assert changes[0].context.markers.has_domain_use_cases
+        assert changes[1].context is None
+
+    async def test_refresh_detects_source_file_edits(self, project_root: Path) -> None:
+        repo = FilesystemBoundedContextRepository(project_root, "src/pkg")
+        await repo.list_all()
+
+        (
+            project_root / "src" / "pkg" / "billing" / "entities" / "invoice.py"
+        ).write_text("class Invoice: ...\n")
+        changes = repo.refresh()
+
+        assert [(c.slug, c.kind) for c in changes] == [
+            ("billing", BoundedContextChangeKind.MODIFIED)
+        ]
+        assert repo.refresh() == []
+
+    async def test_refresh_only_rediscovers_changed_directories(
+        self, project_root: Path
+    ) -> None:
+        repo = FilesystemBoundedContextRepository(project_root, "src/pkg")
+        await repo.list_all()
+
+        (project_root / "src" / "pkg" / "billing" / "use_cases").mkdir()
+        with patch.object(
+            repo, "_discover_candidate", wraps=repo._discover_candidate
+        ) as discover:
+            repo.refresh()
+
+        assert [call.args[0].name for call in discover.call_args_list] == ["billing"]
+
+
+class TestBoundedContextWatcher:
+    """Test the polling change stream."""
+
+    async def test_changes_streams_edits_until_stopped(
+        self, project_root: Path
+    ) -> None:
+        repo = FilesystemBoundedContextRepository(project_root, "src/pkg")
+        watcher = BoundedContextWatcher(repo, poll_interval=0.01)
+        received = []
+
+        async def consume() -> None:
+            async for changes in watcher.changes():
+                received.extend(changes)
+                watcher.stop()
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        _make_bc(project_root / "src" / "pkg" / "orders")
+        await asyncio.wait_for(task, timeout=5)
+
+        assert [(c.slug, c.kind) for c in received] == [
+            ("orders", BoundedContextChangeKind.ADDED)
+        ]
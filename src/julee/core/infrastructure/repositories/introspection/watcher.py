@@ -0,0 +1,74 @@
+"""Polling watcher for filesystem bounded context discovery.
+
+Long-running tools (documentation dev servers, IDE helpers) keep a
+FilesystemBoundedContextRepository alive across edits. Rather than
+invalidating and rescanning the whole tree, the watcher periodically asks
+the repository to refresh incrementally and streams the resulting change
+events to consumers.
+
+Polling uses only stat calls, so it works on every platform without an
+inotify dependency.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from julee.core.entities.bounded_context import BoundedContextChange
+from julee.core.infrastructure.repositories.introspection.bounded_context import (
+    FilesystemBoundedContextRepository,
+)
+
+__all__ = ["BoundedContextWatcher"]
+
+
+class BoundedContextWatcher:
+    """Watch a search root and stream bounded context changes.
+
+    Example:
+        watcher = BoundedContextWatcher(repo, poll_interval=0.5)
+        async for changes in watcher.changes():
+            for change in changes:
+                rerender(change.slug)
+    """
+
+    def __init__(
+        self,
+        repository: FilesystemBoundedContextRepository,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """Initialize watcher.
+
+        Args:
+            repository: Repository whose cache is kept up to date
+            poll_interval: Seconds between filesystem scans
+        """
+        self.repository = repository
+        self.poll_interval = poll_interval
+        self._stopped = asyncio.Event()
+
+    def poll(self) -> list[BoundedContextChange]:
+        """Scan once and return changes since the previous scan."""
+        return self.repository.refresh()
+
+    async def changes(self) -> AsyncIterator[list[BoundedContextChange]]:
+        """Yield batches of changes as they are detected.
+
+        The repository is primed before watching starts, so the first
+        batch only contains edits made after this call. Iteration ends
+        when stop() is called.
+        """
+        self._stopped.clear()
+        await self.repository.list_all()
+
+        while not self._stopped.is_set():
+            changes = self.poll()
+            if changes:
+                yield changes
+            try:
+                await asyncio.wait_for(self._stopped.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        """Stop an active changes() iteration after the current scan."""
+        self._stopped.set()
@@ -1,7 +1,8 @@
 """Temporal implementation of ExecutionService.
 
-Returns the Temporal workflow ID as the execution identifier. Import this
-only in workflow code — it must not be used outside a Temporal workflow context.
+Returns the Temporal workflow ID, qualified by the first run ID of its
+execution chain, as the execution identifier. Import this only in workflow
+code — it must not be used outside a Temporal workflow context.
 """
 
 from temporalio import workflow
@@ -10,11 +11,14 @@ from temporalio import workflow
 class TemporalExecutionService:
     """ExecutionService implementation for Temporal workflows.
 
-    Returns workflow.info().workflow_id so execution identity is stable
-    across retries and replay. This must only be instantiated and used
-    within a Temporal workflow.
+    A workflow ID alone does not identify an execution: a workflow that has
+    closed can be started again under the same ID. The first execution run
+    ID tells them apart while staying the same across retries, continues
+    as new and replay of one execution, so the identity combines both.
+    This must only be instantiated and used within a Temporal workflow.
     """
 
     def get_execution_id(self) -> str:
-        """Return the Temporal workflow ID for this execution."""
-        return workflow.info().workflow_id
+        """Return the workflow ID and first run ID of this execution."""
+        info = workflow.info()
+        return f"{info.workflow_id}:{info.first_execution_run_id}"
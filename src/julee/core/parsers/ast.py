@@ -13,6 +13,7 @@ import from this module.
 import ast
 import functools
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -197,6 +198,24 @@ def parse_module_docstring(module_path: Path) -> tuple[str | None, str | None]:
     return None, None
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_module_cached(path_str: str, mtime_ns: int, size: int) -> ast.Module:
+    # mtime and size are part of the key so edited files are re-parsed
+    path = Path(path_str)
+    return ast.parse(path.read_text(encoding="utf-8"), filename=path_str)
+
+
+def _parse_module(py_file: Path) -> ast.Module:
+    """Parse a Python file with stdlib ast, sharing trees between checks.
+
+    Import scanning and pipeline analysis both need module trees; parsing
+    each file once per content version keeps doctrine runs over large
+    solutions from re-parsing the same sources for every check.
+    """
+    stat = py_file.stat()
+    return _parse_module_cached(str(py_file), stat.st_mtime_ns, stat.st_size)
+
+
 def _imported_class_names(directory: Path) -> set[str]:
     """Return names imported into any non-private file in directory.
 
@@ -211,7 +230,7 @@ def _imported_class_names(directory: Path) -> set[str]:
         if py_file.name.startswith("_"):
             continue
         try:
-            tree = ast.parse(py_file.read_text(encoding="utf-8"))
+            tree = _parse_module(py_file)
         except Exception:
             continue
         for node in ast.walk(tree):
@@ -372,59 +391,74 @@ def _find_method(
     return None
 
 
-def _method_delegates_to_use_case(
-    method_node: ast.FunctionDef | ast.AsyncFunctionDef,
-) -> tuple[bool, str | None]:
-    from julee.core.doctrine_constants import USE_CASE_SUFFIX
+@dataclass(frozen=True)
+class _MethodFacts:
+    """Everything pipeline doctrine checks need to know about a method body.
 
-    use_case_instantiated: str | None = None
-    use_case_called = False
+    Collected in a single walk of the method, so each check is a lookup
+    instead of another traversal.
+    """
 
-    for node in ast.walk(method_node):
-        if isinstance(node, ast.Assign):
-            if isinstance(node.value, ast.Call) and isinstance(
-                node.value.func, ast.Name
-            ):
-                if node.value.func.id.endswith(USE_CASE_SUFFIX):
-                    use_case_instantiated = node.value.func.id
-        if isinstance(node, ast.Await):
-            if isinstance(node.value, ast.Call):
-                call = node.value
-                if isinstance(call.func, ast.Attribute) and call.func.attr == "execute":
-                    use_case_called = True
+    instantiated_use_case: str | None = None
+    awaits_execute: bool = False
+    self_calls: frozenset[str] = frozenset()
+    sets_dispatches: bool = False
 
-    return use_case_instantiated is not None and use_case_called, use_case_instantiated
+    @property
+    def delegates_to_use_case(self) -> bool:
+        return self.instantiated_use_case is not None and self.awaits_execute
 
+    def calls_method(self, method_name: str) -> bool:
+        return method_name in self.self_calls
 
-def _method_calls_method(
+
+def _collect_method_facts(
     method_node: ast.FunctionDef | ast.AsyncFunctionDef,
-    target_method: str,
-) -> bool:
-    for node in ast.walk(method_node):
-        call_node = None
-        if isinstance(node, ast.Await) and isinstance(node.value, ast.Call):
-            call_node = node.value
-        elif isinstance(node, ast.Call):
-            call_node = node
-        if call_node and isinstance(call_node.func, ast.Attribute):
-            if call_node.func.attr == target_method:
-                if (
-                    isinstance(call_node.func.value, ast.Name)
-                    and call_node.func.value.id == "self"
-                ):
-                    return True
-    return False
+) -> _MethodFacts:
+    from julee.core.doctrine_constants import USE_CASE_SUFFIX
 
+    instantiated_use_case: str | None = None
+    awaits_execute = False
+    self_calls: set[str] = set()
+    sets_dispatches = False
 
-def _method_sets_dispatches(
-    method_node: ast.FunctionDef | ast.AsyncFunctionDef,
-) -> bool:
     for node in ast.walk(method_node):
         if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Attribute) and target.attr == "dispatches":
-                    return True
-    return False
+            value = node.value
+            if (
+                isinstance(value, ast.Call)
+                and isinstance(value.func, ast.Name)
+                and value.func.id.endswith(USE_CASE_SUFFIX)
+            ):
+                instantiated_use_case = value.func.id
+            if any(
+                isinstance(target, ast.Attribute) and target.attr == "dispatches"
+                for target in node.targets
+            ):
+                sets_dispatches = True
+        elif isinstance(node, ast.Await):
+            call = node.value
+            if (
+                isinstance(call, ast.Call)
+                and isinstance(call.func, ast.Attribute)
+                and call.func.attr == "execute"
+            ):
+                awaits_execute = True
+        elif isinstance(node, ast.Call):
+            func = node.func
+            if (
+                isinstance(func, ast.Attribute)
+                and isinstance(func.value, ast.Name)
+                and func.value.id == "self"
+            ):
+                self_calls.add(func.attr)
+
+    return _MethodFacts(
+        instantiated_use_case=instantiated_use_case,
+        awaits_execute=awaits_execute,
+        self_calls=frozenset(self_calls),
+        sets_dispatches=sets_dispatches,
+    )
 
 
 def _parse_pipeline_class(
@@ -450,25 +484,23 @@ def _parse_pipeline_class(
     delegates_to_use_case = False
     wrapped_use_case: str | None = None
 
+    run_facts = _collect_method_facts(run_method) if run_method else _MethodFacts()
+
     if run_method:
         has_run_decorator = _has_decorator(run_method, "workflow.run")
-        delegates_to_use_case, wrapped_use_case = _method_delegates_to_use_case(
-            run_method
-        )
+        delegates_to_use_case = run_facts.delegates_to_use_case
+        wrapped_use_case = run_facts.instantiated_use_case
 
     run_next_method = _find_method(class_node, "run_next")
     has_run_next_method = run_next_method is not None
     run_next_has_workflow_decorator = False
-    run_calls_run_next = False
-    sets_dispatches_on_response = False
 
     if run_next_method:
         run_next_has_workflow_decorator = _has_decorator(
             run_next_method, "workflow.run"
         )
-    if run_method:
-        run_calls_run_next = _method_calls_method(run_method, "run_next")
-        sets_dispatches_on_response = _method_sets_dispatches(run_method)
+    run_calls_run_next = run_facts.calls_method("run_next")
+    sets_dispatches_on_response = run_facts.sets_dispatches
 
     methods = []
     for node in class_node.body:
@@ -522,8 +554,7 @@ def parse_pipelines_from_file(
 
     pipelines = []
     try:
-        source = file_path.read_text()
-        tree = ast.parse(source, filename=str(file_path))
+        tree = _parse_module(file_path)
         for node in ast.walk(tree):
             if isinstance(node, ast.ClassDef):
                 pipeline = _parse_pipeline_class(node, file_path.name, bounded_context)
@@ -0,0 +1,162 @@
+"""Tests for pipeline parsing in julee.core.parsers.ast."""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from julee.core.parsers import ast as parsers_ast
+from julee.core.parsers.ast import (
+    _collect_method_facts,
+    parse_pipelines_from_bounded_context,
+    parse_pipelines_from_file,
+)
+
+COMPLIANT_PIPELINE = '''
+@workflow.defn
+class {name}Pipeline:
+    """Run {name} durably."""
+
+    @workflow.run
+    async def run(self, request):
+        use_case = {name}UseCase(repo=self.repo)
+        response = await use_case.execute(request)
+        response.dispatches = await self.run_next(response)
+        return response
+
+    @workflow.run
+    async def run_next(self, response):
+        return []
+'''
+
+NON_COMPLIANT_PIPELINE = '''
+class {name}Pipeline:
+    """Does its own thing."""
+
+    async def run(self, request):
+        helper = {name}Helper()
+        return helper.go(request)
+'''
+
+
+def _method(source: str) -> ast.AsyncFunctionDef:
+    return ast.parse(source).body[0]
+
+
+def _write_solution(root: Path, count: int) -> Path:
+    """Write a synthetic bounded context with count pipelines."""
+    context_dir = root / "synthetic"
+    worker_dir = context_dir / "apps" / "worker"
+    worker_dir.mkdir(parents=True)
+    parts = ["from temporalio import workflow\n"]
+    for i in range(count):
+        template = NON_COMPLIANT_PIPELINE if i % 5 == 0 else COMPLIANT_PIPELINE
+        parts.append(template.format(name=f"Step{i:04d}"))
+    (worker_dir / "pipelines.py").write_text("\n".join(parts))
+    return context_dir
+
+
+class TestCollectMethodFacts:
+    """Test the single-pass method summary."""
+
+    def test_delegating_method(self) -> None:
+        facts = _collect_method_facts(
+            _method(
+                "async def run(self, request):\n"
+                "    uc = DoThingUseCase()\n"
+                "    response = await uc.execute(request)\n"
+                "    response.dispatches = await self.run_next(response)\n"
+            )
+        )
+
+        assert facts.delegates_to_use_case
+        assert facts.instantiated_use_case == "DoThingUseCase"
+        assert facts.calls_method("run_next")
+        assert facts.sets_dispatches
+
+    def test_instantiated_but_not_executed(self) -> None:
+        facts = _collect_method_facts(
+            _method("async def run(self):\n    uc = DoThingUseCase()\n")
+        )
+
+        assert facts.instantiated_use_case == "DoThingUseCase"
+        assert not facts.delegates_to_use_case
+
+    def test_only_self_calls_count(self) -> None:
+        facts = _collect_method_facts(
+            _method("async def run(self):\n    await other.run_next()\n")
+        )
+
+        assert not facts.calls_method("run_next")
+        assert not facts.sets_dispatches
+
+
+class TestParsePipelines:
+    """Test pipeline extraction from files and bounded contexts."""
+
+    def test_compliance_flags(self, tmp_path: Path) -> None:
+        context_dir = _write_solution(tmp_path, 5)
+
+        pipelines = {
+            p.name: p for p in parse_pipelines_from_bounded_context(context_dir)
+        }
+
+        good = pipelines["Step0001Pipeline"]
+        assert good.has_workflow_decorator and good.has_run_decorator
+        assert good.delegates_to_use_case
+        assert good.wrapped_use_case == "Step0001UseCase"
+        assert good.run_calls_run_next and good.sets_dispatches_on_response
+        assert good.bounded_context == "synthetic"
+
+        bad = pipelines["Step0000Pipeline"]
+        assert not bad.delegates_to_use_case
+        assert not bad.run_calls_run_next
+
+    def test_module_tree_is_parsed_once(self, tmp_path: Path) -> None:
+        context_dir = _write_solution(tmp_path, 3)
+        pipelines_file = context_dir / "apps" / "worker" / "pipelines.py"
+        parsers_ast._parse_module_cached.cache_clear()
+
+        parse_pipelines_from_file(pipelines_file)
+        parse_pipelines_from_file(pipelines_file)
+
+        info = parsers_ast._parse_module_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_edited_file_is_reparsed(self, tmp_path: Path) -> None:
+        context_dir = _write_solution(tmp_path, 3)
+        pipelines_file = context_dir / "apps" / "worker" / "pipelines.py"
+        parse_pipelines_from_file(pipelines_file)
+
+        pipelines_file.write_text(
+            pipelines_file.read_text() + COMPLIANT_PIPELINE.format(name="Extra")
+        )
+
+        names = [p.name for p in parse_pipelines_from_file(pipelines_file)]
+        assert "ExtraPipeline" in names
+
+
+@pytest.mark.slow
+class TestPipelineParsingBenchmark:
+    """Pipeline analysis over a large synthetic solution."""
+
+    PIPELINE_COUNT = 500
+
+    def test_hundreds_of_pipelines(self, tmp_path: Path) -> None:
+        context_dir = _write_solution(tmp_path, self.PIPELINE_COUNT)
+        parsers_ast._parse_module_cached.cache_clear()
+
+        cold = parse_pipelines_from_bounded_context(context_dir)
+        cold_parses = parsers_ast._parse_module_cached.cache_info().misses
+        warm = parse_pipelines_from_bounded_context(context_dir)
+        cache = parsers_ast._parse_module_cached.cache_info()
+
+        assert len(cold) == len(warm) == self.PIPELINE_COUNT
+        assert (
+            sum(p.delegates_to_use_case for p in cold) == self.PIPELINE_COUNT * 4 // 5
+        )
+        # Every pipeline is analysed from one parse of its module, and the
+        # second pass parses nothing again
+        assert cold_parses == 1
+        assert cache.misses == cold_parses
+        assert cache.hits >= 1
@@ -16,7 +16,7 @@ class ExecutionService(Protocol):
     Provides a unique identifier for the current execution without coupling
     use cases to Temporal's workflow_id or any other framework concept.
 
-    In Temporal: backed by workflow.info().workflow_id
+    In Temporal: backed by the workflow ID and its first execution run ID
     In tests: backed by a deterministic or randomly generated UUID
     In simple async: backed by a generated UUID
     """
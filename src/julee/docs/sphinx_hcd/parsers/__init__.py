@@ -4,6 +4,7 @@ Contains parsing logic for:
 - gherkin.py: Feature file parsing (.feature files)
 - yaml.py: App and integration manifest parsing
 - ast.py: Python code introspection for accelerators
+- cache.py: Content-hash keyed parse cache for incremental builds
 """
 
 from .ast import (
@@ -12,6 +13,7 @@ from .ast import (
     parse_python_classes,
     scan_bounded_contexts,
 )
+from .cache import ParseCache, parse_with_cache
 from .gherkin import (
     ParsedFeature,
     parse_feature_content,
@@ -32,6 +34,9 @@ __all__ = [
     "parse_module_docstring",
     "parse_python_classes",
     "scan_bounded_contexts",
+    # Cache
+    "ParseCache",
+    "parse_with_cache",
     # Gherkin
     "ParsedFeature",
     "parse_feature_content",
@@ -9,15 +9,45 @@ import logging
 from pathlib import Path
 
 from ..domain.models.code_info import BoundedContextInfo, ClassInfo
+from .cache import ParseCache, parse_with_cache
 
 logger = logging.getLogger(__name__)
 
 
-def parse_python_classes(directory: Path) -> list[ClassInfo]:
+def _parse_classes_in_file(py_file: Path) -> list[ClassInfo]:
+    """Extract class information from a single Python file."""
+    classes = []
+    try:
+        source = py_file.read_text()
+        tree = ast.parse(source, filename=str(py_file))
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                docstring = ast.get_docstring(node) or ""
+                first_line = docstring.split("\n")[0].strip() if docstring else ""
+                classes.append(
+                    ClassInfo(
+                        name=node.name,
+                        docstring=first_line,
+                        file=py_file.name,
+                    )
+                )
+    except SyntaxError as e:
+        logger.warning(f"Syntax error in {py_file}: {e}")
+    except Exception as e:
+        logger.warning(f"Could not parse {py_file}: {e}")
+
+    return classes
+
+
+def parse_python_classes(
+    directory: Path, cache: ParseCache | None = None
+) -> list[ClassInfo]:
     """Extract class information from Python files in a directory using AST.
 
     Args:
         directory: Directory to scan for .py files
+        cache: Optional parse cache to skip unchanged files
 
     Returns:
         List of ClassInfo objects sorted by class name
@@ -29,26 +59,7 @@ def parse_python_classes(directory: Path) -> list[ClassInfo]:
     for py_file in directory.glob("*.py"):
         if py_file.name.startswith("_"):
             continue
-
-        try:
-            source = py_file.read_text()
-            tree = ast.parse(source, filename=str(py_file))
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    docstring = ast.get_docstring(node) or ""
-                    first_line = docstring.split("\n")[0].strip() if docstring else ""
-                    classes.append(
-                        ClassInfo(
-                            name=node.name,
-                            docstring=first_line,
-                            file=py_file.name,
-                        )
-                    )
-        except SyntaxError as e:
-            logger.warning(f"Syntax error in {py_file}: {e}")
-        except Exception as e:
-            logger.warning(f"Could not parse {py_file}: {e}")
+        classes.extend(parse_with_cache(cache, py_file, _parse_classes_in_file))
 
     return sorted(classes, key=lambda c: c.name)
 
@@ -80,7 +91,9 @@ def parse_module_docstring(module_path: Path) -> tuple[str | None, str | None]:
     return None, None
 
 
-def parse_bounded_context(context_dir: Path) -> BoundedContextInfo | None:
+def parse_bounded_context(
+    context_dir: Path, cache: ParseCache | None = None
+) -> BoundedContextInfo | None:
     """Introspect a bounded context directory for ADR 001-compliant code structure.
 
     Expected directory structure:
@@ -95,6 +108,7 @@ def parse_bounded_context(context_dir: Path) -> BoundedContextInfo | None:
 
     Args:
         context_dir: Path to the bounded context directory
+        cache: Optional parse cache to skip unchanged files
 
     Returns:
         BoundedContextInfo if directory exists, None otherwise
@@ -103,16 +117,20 @@ def parse_bounded_context(context_dir: Path) -> BoundedContextInfo | None:
         return None
 
     init_file = context_dir / "__init__.py"
-    objective, full_docstring = parse_module_docstring(init_file)
+    objective, full_docstring = parse_with_cache(
+        cache, init_file, parse_module_docstring
+    )
 
     return BoundedContextInfo(
         slug=context_dir.name,
-        entities=parse_python_classes(context_dir / "domain" / "models"),
-        use_cases=parse_python_classes(context_dir / "use_cases"),
+        entities=parse_python_classes(context_dir / "domain" / "models", cache),
+        use_cases=parse_python_classes(context_dir / "use_cases", cache),
         repository_protocols=parse_python_classes(
-            context_dir / "domain" / "repositories"
+            context_dir / "domain" / "repositories", cache
+        ),
+        service_protocols=parse_python_classes(
+            context_dir / "domain" / "services", cache
         ),
-        service_protocols=parse_python_classes(context_dir / "domain" / "services"),
         has_infrastructure=(context_dir / "infrastructure").exists(),
         code_dir=context_dir.name,
         objective=objective,
@@ -120,11 +138,14 @@ def parse_bounded_context(context_dir: Path) -> BoundedContextInfo | None:
     )
 
 
-def scan_bounded_contexts(src_dir: Path) -> list[BoundedContextInfo]:
+def scan_bounded_contexts(
+    src_dir: Path, cache: ParseCache | None = None
+) -> list[BoundedContextInfo]:
     """Scan a source directory for all bounded contexts.
 
     Args:
         src_dir: Root source directory (e.g., project/src/)
+        cache: Optional parse cache to skip unchanged files
 
     Returns:
         List of BoundedContextInfo objects for all discovered contexts
@@ -140,7 +161,7 @@ def scan_bounded_contexts(src_dir: Path) -> list[BoundedContextInfo]:
         if context_dir.name.startswith((".", "_")):
             continue
 
-        context_info = parse_bounded_context(context_dir)
+        context_info = parse_bounded_context(context_dir, cache)
         if context_info:
             contexts.append(context_info)
             logger.info(
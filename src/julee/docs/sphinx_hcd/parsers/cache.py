@@ -0,0 +1,114 @@
+"""Content-hash keyed parse cache.
+
+Lets scanners skip re-parsing files whose content has not changed since
+the previous build. The cache is a plain picklable object, so the Sphinx
+layer can keep it on the build environment and have it persisted together
+with the environment pickle between incremental builds.
+"""
+
+import hashlib
+import logging
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ParseCache:
+    """Memoize per-file parse results keyed by the file's content hash.
+
+    Entries are keyed by parser, file path and any extra parser arguments,
+    and are only reused while the SHA-256 of the file content is unchanged.
+
+    Attributes:
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that required parsing
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: dict[tuple, tuple[str, Any]] = {}
+        self._touched: set[tuple] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Persist entries only; counters and touch tracking are per build."""
+        return {"_entries": self._entries}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore entries and reset per-build bookkeeping."""
+        self._entries = state["_entries"]
+        self._touched = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_parse(
+        self,
+        path: Path,
+        parse: Callable[..., T],
+        *args: Hashable,
+    ) -> T:
+        """Return the cached result for path, parsing it if content changed.
+
+        Args:
+            path: File to parse
+            parse: Parser called as parse(path, *args) on a cache miss
+            *args: Extra parser arguments; part of the cache key
+
+        Returns:
+            The parser's result (possibly from cache)
+        """
+        key = (parse.__module__, parse.__qualname__, str(path), args)
+        self._touched.add(key)
+
+        try:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            # Let the parser report unreadable files in its usual way
+            self.misses += 1
+            self._entries.pop(key, None)
+            return parse(path, *args)
+
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == digest:
+            self.hits += 1
+            return cast(T, cached[1])
+
+        self.misses += 1
+        result = parse(path, *args)
+        self._entries[key] = (digest, result)
+        return result
+
+    def prune(self) -> int:
+        """Drop entries not looked up since the cache was loaded.
+
+        Call once all scanning for a build is done, so entries for deleted
+        files do not accumulate across builds.
+
+        Returns:
+            Number of entries removed
+        """
+        stale = self._entries.keys() - self._touched
+        for key in stale:
+            del self._entries[key]
+        self._touched = set()
+        return len(stale)
+
+
+def parse_with_cache(
+    cache: ParseCache | None,
+    path: Path,
+    parse: Callable[..., T],
+    *args: Hashable,
+) -> T:
+    """Parse path through cache if one is given, directly otherwise."""
+    if cache is None:
+        return parse(path, *args)
+    return cache.get_or_parse(path, parse, *args)
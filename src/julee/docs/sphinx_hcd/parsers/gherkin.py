@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from ..domain.models.story import Story
+from .cache import ParseCache, parse_with_cache
 
 logger = logging.getLogger(__name__)
 
@@ -128,12 +129,14 @@ def parse_feature_file(
 def scan_feature_directory(
     feature_dir: Path,
     project_root: Path,
+    cache: ParseCache | None = None,
 ) -> list[Story]:
     """Scan a directory tree for .feature files and parse them.
 
     Args:
         feature_dir: Root directory to scan (e.g., tests/e2e/)
         project_root: Project root for computing relative paths
+        cache: Optional parse cache to skip unchanged files
 
     Returns:
         List of parsed Story entities
@@ -147,7 +150,7 @@ def scan_feature_directory(
         return stories
 
     for feature_file in feature_dir.rglob("*.feature"):
-        story = parse_feature_file(feature_file, project_root)
+        story = parse_with_cache(cache, feature_file, parse_feature_file, project_root)
         if story:
             stories.append(story)
 
@@ -10,6 +10,7 @@ import yaml
 
 from ..domain.models.app import App
 from ..domain.models.integration import Integration
+from .cache import ParseCache, parse_with_cache
 
 logger = logging.getLogger(__name__)
 
@@ -51,13 +52,14 @@ def parse_app_manifest(manifest_path: Path, app_slug: str | None = None) -> App
     )
 
 
-def scan_app_manifests(apps_dir: Path) -> list[App]:
+def scan_app_manifests(apps_dir: Path, cache: ParseCache | None = None) -> list[App]:
     """Scan a directory for app.yaml manifest files.
 
     Expects structure: apps_dir/{app-slug}/app.yaml
 
     Args:
         apps_dir: Directory containing app subdirectories
+        cache: Optional parse cache to skip unchanged manifests
 
     Returns:
         List of parsed App entities
@@ -78,7 +80,7 @@ def scan_app_manifests(apps_dir: Path) -> list[App]:
         if not manifest_path.exists():
             continue
 
-        app = parse_app_manifest(manifest_path)
+        app = parse_with_cache(cache, manifest_path, parse_app_manifest)
         if app:
             apps.append(app)
 
@@ -146,7 +148,9 @@ def parse_integration_manifest(
     )
 
 
-def scan_integration_manifests(integrations_dir: Path) -> list[Integration]:
+def scan_integration_manifests(
+    integrations_dir: Path, cache: ParseCache | None = None
+) -> list[Integration]:
     """Scan a directory for integration.yaml manifest files.
 
     Expects structure: integrations_dir/{module_name}/integration.yaml
@@ -154,6 +158,7 @@ def scan_integration_manifests(integrations_dir: Path) -> list[Integration]:
 
     Args:
         integrations_dir: Directory containing integration subdirectories
+        cache: Optional parse cache to skip unchanged manifests
 
     Returns:
         List of parsed Integration entities
@@ -176,7 +181,7 @@ def scan_integration_manifests(integrations_dir: Path) -> list[Integration]:
         if not manifest_path.exists():
             continue
 
-        integration = parse_integration_manifest(manifest_path)
+        integration = parse_with_cache(cache, manifest_path, parse_integration_manifest)
         if integration:
             integrations.append(integration)
 
@@ -3,6 +3,7 @@
 Contains Sphinx-specific code:
 - adapters.py: SyncRepositoryAdapter for sync access to async repos
 - context.py: HCDContext for unified repository access
+- diagrams.py: Memoized, content-hashed diagram generation
 - initialization.py: Builder-inited handlers
 - directives/: Sphinx directive implementations
 - event_handlers/: Sphinx lifecycle event handlers
@@ -15,11 +16,16 @@ from .context import (
     get_hcd_context,
     set_hcd_context,
 )
-from .initialization import initialize_hcd_context, purge_doc_from_context
+from .initialization import (
+    apply_bounded_context_changes,
+    initialize_hcd_context,
+    purge_doc_from_context,
+)
 
 __all__ = [
     "HCDContext",
     "SyncRepositoryAdapter",
+    "apply_bounded_context_changes",
     "ensure_hcd_context",
     "get_hcd_context",
     "initialize_hcd_context",
@@ -18,6 +18,7 @@ from ..repositories.memory import (
     MemoryStoryRepository,
 )
 from .adapters import SyncRepositoryAdapter
+from .diagrams import DiagramCache
 
 if TYPE_CHECKING:
     from ..domain.models import (
@@ -50,6 +51,7 @@ class HCDContext:
         accelerator_repo: Repository for Accelerator entities
         integration_repo: Repository for Integration entities
         code_info_repo: Repository for BoundedContextInfo entities
+        diagram_cache: Memo of generated diagram sources
     """
 
     story_repo: SyncRepositoryAdapter["Story"] = field(
@@ -73,6 +75,7 @@ class HCDContext:
     code_info_repo: SyncRepositoryAdapter["BoundedContextInfo"] = field(
         default_factory=lambda: SyncRepositoryAdapter(MemoryCodeInfoRepository())
     )
+    diagram_cache: DiagramCache = field(default_factory=DiagramCache)
 
     def clear_all(self) -> None:
         """Clear all repositories.
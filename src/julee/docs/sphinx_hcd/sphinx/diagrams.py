@@ -0,0 +1,127 @@
+"""Memoized diagram generation for sphinx_hcd.
+
+Diagram directives (persona, accelerator dependency, journey dependency,
+integration architecture) derive their PlantUML source from whole
+repositories on every doctree-resolved pass. DiagramCache keys each
+generated source by a hash of the diagram kind, its arguments and the
+entities it was derived from, so unchanged diagrams are not regenerated.
+
+The cache is kept on the Sphinx environment (alongside the parse cache),
+so it survives incremental builds. Generated nodes are named after the
+hash of their source and carry no per-page include directory, which lets
+sphinxcontrib.plantuml reuse one rendered image for every page embedding
+the same graph.
+"""
+
+import hashlib
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+def digest_entities(*groups: Iterable[BaseModel]) -> str:
+    """Compute a stable hash over one or more groups of entities.
+
+    Each group is hashed order-independently, so repositories returning
+    entities in a different order still produce the same digest.
+
+    Args:
+        *groups: Iterables of pydantic entities
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    h = hashlib.sha256()
+    for group in groups:
+        for dumped in sorted(entity.model_dump_json() for entity in group):
+            h.update(dumped.encode())
+            h.update(b"\0")
+        h.update(b"\1")
+    return h.hexdigest()
+
+
+class DiagramCache:
+    """Memoize generated diagram results by the hash of their inputs.
+
+    Attributes:
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that required generation
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._results: dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Persist results only; counters are per build."""
+        return {"_results": self._results}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore results and reset counters."""
+        self._results = state["_results"]
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get_or_build(
+        self,
+        kind: str,
+        args: tuple[str, ...],
+        inputs_digest: str,
+        build: Callable[[], Any],
+    ) -> Any:
+        """Return the cached result for a diagram, generating it on a miss.
+
+        Only the latest result per (kind, args) is kept, so the cache does
+        not grow as entities change across builds.
+
+        Args:
+            kind: Diagram kind, e.g. "persona"
+            args: Directive arguments distinguishing diagrams of one kind
+            inputs_digest: Hash of the entities the diagram derives from
+            build: Generates the result when the inputs changed
+
+        Returns:
+            The (possibly cached) result of build()
+        """
+        slot = "\0".join((kind, *args))
+        cached = self._results.get(slot)
+        if cached is not None and cached[0] == inputs_digest:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        result = build()
+        self._results[slot] = (inputs_digest, result)
+        return result
+
+
+def make_plantuml_node(plantuml: type, kind: str, source: str):
+    """Create a plantuml node whose rendered image is shared across pages.
+
+    Generated diagrams have no !include directives, so the include
+    directory is left empty; sphinxcontrib.plantuml then derives the image
+    name purely from the source and renders each distinct graph once.
+
+    Args:
+        plantuml: The sphinxcontrib.plantuml node class
+        kind: Diagram kind, used as the filename prefix
+        source: PlantUML source
+
+    Returns:
+        A plantuml node
+    """
+    source_hash = hashlib.sha256(source.encode()).hexdigest()[:12]
+    node = plantuml(source)
+    node["uml"] = source
+    node["incdir"] = ""
+    node["filename"] = f"{kind}-{source_hash}"
+    return node
@@ -9,8 +9,6 @@ Provides directives for accelerators with code introspection:
 - accelerator-status: Show status, milestone, and acceptance info
 """
 
-import os
-
 from docutils import nodes
 from docutils.parsers.rst import directives
 
@@ -27,6 +25,7 @@ from ...utils import (
     parse_list_option,
     path_to_root,
 )
+from ..diagrams import digest_entities, make_plantuml_node
 from .base import HCDDirective
 
 
@@ -469,22 +468,8 @@ def build_accelerators_for_app(app_slug: str, docname: str, hcd_context):
     return [bullet_list]
 
 
-def build_dependency_diagram(docname: str, hcd_context):
-    """Build PlantUML diagram of accelerator dependencies."""
-    try:
-        from sphinxcontrib.plantuml import plantuml
-    except ImportError:
-        para = nodes.paragraph()
-        para += nodes.emphasis(text="PlantUML extension not available")
-        return [para]
-
-    all_accelerators = hcd_context.accelerator_repo.list_all()
-
-    if not all_accelerators:
-        para = nodes.paragraph()
-        para += nodes.emphasis(text="No accelerators defined")
-        return [para]
-
+def generate_accelerator_dependency_plantuml(all_accelerators) -> str:
+    """Generate PlantUML for the accelerator dependency diagram."""
     lines = [
         "@startuml",
         "skinparam componentStyle rectangle",
@@ -520,13 +505,33 @@ def build_dependency_diagram(docname: str, hcd_context):
     lines.append("")
     lines.append("@enduml")
 
-    puml_source = "\n".join(lines)
-    node = plantuml(puml_source)
-    node["uml"] = puml_source
-    node["incdir"] = os.path.dirname(docname)
-    node["filename"] = os.path.basename(docname)
+    return "\n".join(lines)
+
+
+def build_dependency_diagram(docname: str, hcd_context):
+    """Build PlantUML diagram of accelerator dependencies."""
+    try:
+        from sphinxcontrib.plantuml import plantuml
+    except ImportError:
+        para = nodes.paragraph()
+        para += nodes.emphasis(text="PlantUML extension not available")
+        return [para]
+
+    all_accelerators = hcd_context.accelerator_repo.list_all()
+
+    if not all_accelerators:
+        para = nodes.paragraph()
+        para += nodes.emphasis(text="No accelerators defined")
+        return [para]
+
+    puml_source = hcd_context.diagram_cache.get_or_build(
+        "accelerator-dependencies",
+        (),
+        digest_entities(all_accelerators),
+        lambda: generate_accelerator_dependency_plantuml(all_accelerators),
+    )
 
-    return [node]
+    return [make_plantuml_node(plantuml, "accelerator-dependencies", puml_source)]
 
 
 def clear_accelerator_state(app, env, docname):
@@ -7,11 +7,10 @@ Provides directives:
 - integration-index: Generate index with architecture diagram
 """
 
-import os
-
 from docutils import nodes
 
 from ...domain.models.integration import Direction
+from ..diagrams import digest_entities, make_plantuml_node
 from .base import HCDDirective
 
 
@@ -122,23 +121,8 @@ def build_integration_content(slug: str, docname: str, hcd_context):
     return result_nodes
 
 
-def build_integration_index(docname: str, hcd_context):
-    """Build integration index with architecture diagram."""
-    try:
-        from sphinxcontrib.plantuml import plantuml
-    except ImportError:
-        para = nodes.paragraph()
-        para += nodes.emphasis(text="PlantUML extension not available")
-        return [para]
-
-    all_integrations = hcd_context.integration_repo.list_all()
-
-    if not all_integrations:
-        para = nodes.paragraph()
-        para += nodes.emphasis(text="No integrations defined")
-        return [para]
-
-    # Build PlantUML diagram
+def generate_integration_plantuml(all_integrations) -> str:
+    """Generate PlantUML for the integration architecture diagram."""
     lines = [
         "@startuml",
         "skinparam componentStyle rectangle",
@@ -195,13 +179,33 @@ def build_integration_index(docname: str, hcd_context):
     lines.append("")
     lines.append("@enduml")
 
-    puml_source = "\n".join(lines)
-    node = plantuml(puml_source)
-    node["uml"] = puml_source
-    node["incdir"] = os.path.dirname(docname)
-    node["filename"] = os.path.basename(docname) + ".rst"
+    return "\n".join(lines)
+
+
+def build_integration_index(docname: str, hcd_context):
+    """Build integration index with architecture diagram."""
+    try:
+        from sphinxcontrib.plantuml import plantuml
+    except ImportError:
+        para = nodes.paragraph()
+        para += nodes.emphasis(text="PlantUML extension not available")
+        return [para]
+
+    all_integrations = hcd_context.integration_repo.list_all()
+
+    if not all_integrations:
+        para = nodes.paragraph()
+        para += nodes.emphasis(text="No integrations defined")
+        return [para]
+
+    puml_source = hcd_context.diagram_cache.get_or_build(
+        "integrations",
+        (),
+        digest_entities(all_integrations),
+        lambda: generate_integration_plantuml(all_integrations),
+    )
 
-    return [node]
+    return [make_plantuml_node(plantuml, "integrations", puml_source)]
 
 
 def process_integration_placeholders(app, doctree, docname):
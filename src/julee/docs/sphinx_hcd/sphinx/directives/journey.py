@@ -24,6 +24,7 @@ from ...utils import (
     parse_list_option,
     path_to_root,
 )
+from ..diagrams import digest_entities, make_plantuml_node
 from .base import HCDDirective
 
 
@@ -579,23 +580,8 @@ def process_journey_steps(app, doctree):
         )
 
 
-def build_dependency_graph_node(env, hcd_context):
-    """Build the PlantUML node for the journey dependency graph."""
-    try:
-        from sphinxcontrib.plantuml import plantuml
-    except ImportError:
-        para = nodes.paragraph()
-        para += nodes.emphasis(text="PlantUML extension not available")
-        return para
-
-    all_journeys = hcd_context.journey_repo.list_all()
-
-    if not all_journeys:
-        para = nodes.paragraph()
-        para += nodes.emphasis(text="No journeys defined")
-        return para
-
-    # Build PlantUML content
+def generate_journey_dependency_plantuml(all_journeys) -> str:
+    """Generate PlantUML for the journey dependency graph."""
     lines = [
         "@startuml",
         "skinparam componentStyle rectangle",
@@ -621,14 +607,33 @@ def build_dependency_graph_node(env, hcd_context):
     lines.append("")
     lines.append("@enduml")
 
-    puml_content = "\n".join(lines)
+    return "\n".join(lines)
+
 
-    puml_node = plantuml(puml_content)
-    puml_node["uml"] = puml_content
-    puml_node["incdir"] = ""
-    puml_node["filename"] = "journey-dependency-graph"
+def build_dependency_graph_node(env, hcd_context):
+    """Build the PlantUML node for the journey dependency graph."""
+    try:
+        from sphinxcontrib.plantuml import plantuml
+    except ImportError:
+        para = nodes.paragraph()
+        para += nodes.emphasis(text="PlantUML extension not available")
+        return para
+
+    all_journeys = hcd_context.journey_repo.list_all()
+
+    if not all_journeys:
+        para = nodes.paragraph()
+        para += nodes.emphasis(text="No journeys defined")
+        return para
+
+    puml_content = hcd_context.diagram_cache.get_or_build(
+        "journey-dependency-graph",
+        (),
+        digest_entities(all_journeys),
+        lambda: generate_journey_dependency_plantuml(all_journeys),
+    )
 
-    return puml_node
+    return make_plantuml_node(plantuml, "journey-dependency-graph", puml_content)
 
 
 def process_dependency_graph_placeholder(app, doctree, docname):
@@ -7,8 +7,6 @@ Provides directives:
 - persona-index-diagram: Generate UML diagram for staff or external persona groups
 """
 
-import os
-
 from docutils import nodes
 
 from ...domain.use_cases import (
@@ -17,6 +15,7 @@ from ...domain.use_cases import (
     get_epics_for_persona,
 )
 from ...utils import normalize_name, slugify
+from ..diagrams import digest_entities, make_plantuml_node
 from .base import HCDDirective
 
 
@@ -242,19 +241,10 @@ def generate_persona_index_plantuml(
     return "\n".join(lines)
 
 
-def build_persona_diagram(persona_name: str, docname: str, hcd_context):
-    """Build the PlantUML diagram for a single persona."""
-    try:
-        from sphinxcontrib.plantuml import plantuml
-    except ImportError:
-        para = nodes.paragraph()
-        para += nodes.emphasis(text="PlantUML extension not available")
-        return [para]
-
-    all_stories = hcd_context.story_repo.list_all()
-    all_epics = hcd_context.epic_repo.list_all()
-    all_apps = hcd_context.app_repo.list_all()
-
+def _persona_diagram_source(
+    persona_name: str, all_stories, all_epics, all_apps
+) -> tuple[str | None, str]:
+    """Derive the persona diagram source, or a message if there is none."""
     # Derive personas
     personas = derive_personas(all_stories, all_epics)
     persona_normalized = normalize_name(persona_name)
@@ -267,27 +257,59 @@ def build_persona_diagram(persona_name: str, docname: str, hcd_context):
             break
 
     if not persona:
-        para = nodes.paragraph()
-        para += nodes.emphasis(text=f"No persona found: '{persona_name}'")
-        return [para]
+        return None, f"No persona found: '{persona_name}'"
 
     # Check if persona has epics
     epics = get_epics_for_persona(persona, all_epics, all_stories)
     if not epics:
+        return None, f"No epics found for persona '{persona_name}'"
+
+    return generate_persona_plantuml(persona, all_epics, all_stories, all_apps), ""
+
+
+def _persona_index_diagram_source(
+    group_type: str, all_stories, all_epics, all_apps
+) -> tuple[str | None, str]:
+    """Derive the persona group diagram source, or a message if there is none."""
+    # Get personas grouped by app type
+    personas_by_type = derive_personas_by_app_type(all_stories, all_epics, all_apps)
+    personas = sorted(personas_by_type.get(group_type, []), key=lambda p: p.name)
+
+    if not personas:
+        return None, f"No {group_type} personas found"
+
+    source = generate_persona_index_plantuml(
+        group_type, personas, all_epics, all_stories, all_apps
+    )
+    return source, ""
+
+
+def build_persona_diagram(persona_name: str, docname: str, hcd_context):
+    """Build the PlantUML diagram for a single persona."""
+    try:
+        from sphinxcontrib.plantuml import plantuml
+    except ImportError:
         para = nodes.paragraph()
-        para += nodes.emphasis(text=f"No epics found for persona '{persona_name}'")
+        para += nodes.emphasis(text="PlantUML extension not available")
         return [para]
 
-    # Generate PlantUML
-    puml_source = generate_persona_plantuml(persona, all_epics, all_stories, all_apps)
+    all_stories = hcd_context.story_repo.list_all()
+    all_epics = hcd_context.epic_repo.list_all()
+    all_apps = hcd_context.app_repo.list_all()
 
-    # Create plantuml node
-    node = plantuml(puml_source)
-    node["uml"] = puml_source
-    node["incdir"] = os.path.dirname(docname)
-    node["filename"] = os.path.basename(docname)
+    puml_source, message = hcd_context.diagram_cache.get_or_build(
+        "persona",
+        (persona_name,),
+        digest_entities(all_stories, all_epics, all_apps),
+        lambda: _persona_diagram_source(persona_name, all_stories, all_epics, all_apps),
+    )
 
-    return [node]
+    if puml_source is None:
+        para = nodes.paragraph()
+        para += nodes.emphasis(text=message)
+        return [para]
+
+    return [make_plantuml_node(plantuml, "persona", puml_source)]
 
 
 def build_persona_index_diagram(group_type: str, docname: str, hcd_context):
@@ -303,27 +325,21 @@ def build_persona_index_diagram(group_type: str, docname: str, hcd_context):
     all_epics = hcd_context.epic_repo.list_all()
     all_apps = hcd_context.app_repo.list_all()
 
-    # Get personas grouped by app type
-    personas_by_type = derive_personas_by_app_type(all_stories, all_epics, all_apps)
-    personas = sorted(personas_by_type.get(group_type, []), key=lambda p: p.name)
+    puml_source, message = hcd_context.diagram_cache.get_or_build(
+        "persona-index",
+        (group_type,),
+        digest_entities(all_stories, all_epics, all_apps),
+        lambda: _persona_index_diagram_source(
+            group_type, all_stories, all_epics, all_apps
+        ),
+    )
 
-    if not personas:
+    if puml_source is None:
         para = nodes.paragraph()
-        para += nodes.emphasis(text=f"No {group_type} personas found")
+        para += nodes.emphasis(text=message)
         return [para]
 
-    # Generate PlantUML
-    puml_source = generate_persona_index_plantuml(
-        group_type, personas, all_epics, all_stories, all_apps
-    )
-
-    # Create plantuml node
-    node = plantuml(puml_source)
-    node["uml"] = puml_source
-    node["incdir"] = os.path.dirname(docname)
-    node["filename"] = os.path.basename(docname)
-
-    return [node]
+    return [make_plantuml_node(plantuml, "persona-index", puml_source)]
 
 
 def process_persona_placeholders(app, doctree, docname):
@@ -5,15 +5,25 @@ repositories with data that doesn't change during the build.
 """
 
 import logging
+from collections.abc import Iterable
+from typing import cast
+
+from julee.core.entities.bounded_context import (
+    BoundedContextChange,
+    BoundedContextChangeKind,
+)
 
 from ..config import get_config
 from ..parsers import (
+    ParseCache,
+    parse_bounded_context,
     scan_app_manifests,
     scan_bounded_contexts,
     scan_feature_directory,
     scan_integration_manifests,
 )
 from .context import HCDContext, set_hcd_context
+from .diagrams import DiagramCache
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +41,9 @@ def initialize_hcd_context(app) -> None:
     Journeys, epics, and accelerators are populated during doctree
     processing as they're defined in RST files.
 
+    Parse results are cached on the Sphinx environment keyed by file
+    content hash, so incremental builds only re-parse changed files.
+
     Args:
         app: Sphinx application object
     """
@@ -38,78 +51,173 @@ def initialize_hcd_context(app) -> None:
     set_hcd_context(app, context)
 
     config = get_config()
+    cache = get_parse_cache(app)
+    diagram_cache = get_diagram_cache(app)
+    if diagram_cache is not None:
+        context.diagram_cache = diagram_cache
 
     # Load stories from feature files
-    _load_stories(context, config)
+    _load_stories(context, config, cache)
 
     # Load apps from manifests
-    _load_apps(context, config)
+    _load_apps(context, config, cache)
 
     # Load integrations from manifests
-    _load_integrations(context, config)
+    _load_integrations(context, config, cache)
 
     # Load code info from src/ introspection
-    _load_code_info(context, config)
+    _load_code_info(context, config, cache)
+
+    if cache is not None:
+        pruned = cache.prune()
+        logger.info(
+            f"Parse cache: {cache.hits} reused, {cache.misses} parsed, "
+            f"{pruned} pruned"
+        )
 
     logger.info("HCDContext initialized")
 
 
-def _load_stories(context: HCDContext, config) -> None:
+def get_parse_cache(app) -> ParseCache | None:
+    """Get the parse cache stored on the Sphinx build environment.
+
+    The environment is pickled between builds, so storing the cache on it
+    persists parse results alongside the environment pickle. A fresh
+    environment (e.g. after a config change) starts with an empty cache.
+
+    Args:
+        app: Sphinx application object
+
+    Returns:
+        ParseCache attached to app.env, or None if there is no environment
+    """
+    return cast(ParseCache | None, _get_env_cache(app, "hcd_parse_cache", ParseCache))
+
+
+def get_diagram_cache(app) -> DiagramCache | None:
+    """Get the diagram cache stored on the Sphinx build environment.
+
+    Persisted with the environment pickle like the parse cache, so
+    diagrams whose inputs did not change are not regenerated.
+
+    Args:
+        app: Sphinx application object
+
+    Returns:
+        DiagramCache attached to app.env, or None if there is no environment
+    """
+    return cast(
+        DiagramCache | None, _get_env_cache(app, "hcd_diagram_cache", DiagramCache)
+    )
+
+
+def _get_env_cache(app, attr: str, cache_type: type):
+    """Get or create a cache object stored as an attribute of app.env."""
+    env = getattr(app, "env", None)
+    if env is None:
+        return None
+
+    cache = getattr(env, attr, None)
+    if not isinstance(cache, cache_type):
+        cache = cache_type()
+        setattr(env, attr, cache)
+    return cache
+
+
+def _load_stories(context: HCDContext, config, cache: ParseCache | None = None) -> None:
     """Load stories from feature files into the repository."""
     features_dir = config.get_path("feature_files")
     if not features_dir.exists():
         logger.info(f"Features directory not found: {features_dir}")
         return
 
-    stories = scan_feature_directory(features_dir, config.project_root)
+    stories = scan_feature_directory(features_dir, config.project_root, cache)
     for story in stories:
         context.story_repo.save(story)
 
     logger.info(f"Loaded {len(stories)} stories from feature files")
 
 
-def _load_apps(context: HCDContext, config) -> None:
+def _load_apps(context: HCDContext, config, cache: ParseCache | None = None) -> None:
     """Load apps from manifest files into the repository."""
     apps_dir = config.get_path("app_manifests")
     if not apps_dir.exists():
         logger.info(f"Applications directory not found: {apps_dir}")
         return
 
-    apps = scan_app_manifests(apps_dir)
+    apps = scan_app_manifests(apps_dir, cache)
     for app in apps:
         context.app_repo.save(app)
 
     logger.info(f"Loaded {len(apps)} apps from manifests")
 
 
-def _load_integrations(context: HCDContext, config) -> None:
+def _load_integrations(
+    context: HCDContext, config, cache: ParseCache | None = None
+) -> None:
     """Load integrations from manifest files into the repository."""
     integrations_dir = config.get_path("integration_manifests")
     if not integrations_dir.exists():
         logger.info(f"Integrations directory not found: {integrations_dir}")
         return
 
-    integrations = scan_integration_manifests(integrations_dir)
+    integrations = scan_integration_manifests(integrations_dir, cache)
     for integration in integrations:
         context.integration_repo.save(integration)
 
     logger.info(f"Loaded {len(integrations)} integrations from manifests")
 
 
-def _load_code_info(context: HCDContext, config) -> None:
+def _load_code_info(
+    context: HCDContext, config, cache: ParseCache | None = None
+) -> None:
     """Load code info from src/ introspection into the repository."""
     src_dir = config.get_path("bounded_contexts")
     if not src_dir.exists():
         logger.info(f"Source directory not found: {src_dir}")
         return
 
-    contexts = scan_bounded_contexts(src_dir)
+    contexts = scan_bounded_contexts(src_dir, cache)
     for code_info in contexts:
         context.code_info_repo.save(code_info)
 
     logger.info(f"Loaded {len(contexts)} bounded contexts from source")
 
 
+def apply_bounded_context_changes(
+    context: HCDContext, changes: Iterable[BoundedContextChange]
+) -> list[str]:
+    """Update code info for bounded contexts reported as changed.
+
+    Used by long-running tools that watch the source tree (see
+    BoundedContextWatcher) to re-introspect only the affected contexts
+    instead of rescanning src/.
+
+    Args:
+        context: HCDContext whose code_info_repo is updated
+        changes: Change events from an incremental bounded context scan
+
+    Returns:
+        Slugs of the code info entries that were updated or removed
+    """
+    updated = []
+    for change in changes:
+        code_info = None
+        if change.kind != BoundedContextChangeKind.REMOVED and change.context:
+            code_info = parse_bounded_context(change.context.absolute_path)
+        # A context that can no longer be introspected (e.g. its directory
+        # went away after the change was detected) loses its stale code
+        # info; its next change re-introspects it
+        if code_info is None:
+            context.code_info_repo.delete(change.slug)
+        else:
+            context.code_info_repo.save(code_info)
+        updated.append(change.slug)
+
+    logger.info(f"Updated code info for {len(updated)} bounded contexts")
+    return updated
+
+
 def purge_doc_from_context(app, env, docname: str) -> None:
     """Purge entities from a document when it's being re-read.
 
@@ -0,0 +1,101 @@
+"""Tests for the content-hash parse cache."""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from julee.docs.sphinx_hcd.parsers import (
+    ParseCache,
+    scan_app_manifests,
+    scan_bounded_contexts,
+    scan_feature_directory,
+)
+
+
+@pytest.fixture
+def feature_dir(tmp_path: Path) -> Path:
+    """Create a feature directory with two feature files."""
+    features = tmp_path / "tests" / "e2e" / "portal" / "features"
+    features.mkdir(parents=True)
+    (features / "login.feature").write_text(
+        "Feature: Login\n\n  As a User\n  I want to log in\n"
+    )
+    (features / "logout.feature").write_text(
+        "Feature: Logout\n\n  As a User\n  I want to log out\n"
+    )
+    return tmp_path / "tests" / "e2e"
+
+
+class TestParseCache:
+    """Test ParseCache behaviour."""
+
+    def test_unchanged_files_are_not_reparsed(
+        self, feature_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that a second scan is served entirely from the cache."""
+        cache = ParseCache()
+        first = scan_feature_directory(feature_dir, tmp_path, cache)
+        second = scan_feature_directory(feature_dir, tmp_path, cache)
+
+        assert cache.misses == 2
+        assert cache.hits == 2
+        assert {s.feature_title for s in second} == {s.feature_title for s in first}
+
+    def test_changed_file_is_reparsed(self, feature_dir: Path, tmp_path: Path) -> None:
+        """Test that editing a file invalidates only its entry."""
+        cache = ParseCache()
+        scan_feature_directory(feature_dir, tmp_path, cache)
+
+        login = feature_dir / "portal" / "features" / "login.feature"
+        login.write_text("Feature: Sign in\n\n  As a User\n  I want to sign in\n")
+        stories = scan_feature_directory(feature_dir, tmp_path, cache)
+
+        assert cache.misses == 3
+        assert cache.hits == 1
+        assert "Sign in" in {s.feature_title for s in stories}
+
+    def test_survives_pickling(self, feature_dir: Path, tmp_path: Path) -> None:
+        """Test that entries persist through a pickle round-trip."""
+        cache = ParseCache()
+        scan_feature_directory(feature_dir, tmp_path, cache)
+
+        restored = pickle.loads(pickle.dumps(cache))
+        scan_feature_directory(feature_dir, tmp_path, restored)
+
+        assert restored.hits == 2
+        assert restored.misses == 0
+
+    def test_prune_drops_deleted_files(self, feature_dir: Path, tmp_path: Path) -> None:
+        """Test that entries for files no longer scanned are pruned."""
+        cache = ParseCache()
+        scan_feature_directory(feature_dir, tmp_path, cache)
+        cache.prune()
+
+        (feature_dir / "portal" / "features" / "logout.feature").unlink()
+        scan_feature_directory(feature_dir, tmp_path, cache)
+
+        assert cache.prune() == 1
+        assert len(cache) == 1
+
+    def test_manifests_and_code_are_cached(self, tmp_path: Path) -> None:
+        """Test that YAML manifests and Python sources use the cache."""
+        app_dir = tmp_path / "apps" / "portal"
+        app_dir.mkdir(parents=True)
+        (app_dir / "app.yaml").write_text("name: Portal\ntype: staff\n")
+        models_dir = tmp_path / "src" / "vocabulary" / "domain" / "models"
+        models_dir.mkdir(parents=True)
+        (models_dir / "term.py").write_text("class Term:\n    pass\n")
+        (tmp_path / "src" / "vocabulary" / "__init__.py").write_text('"""Terms."""\n')
+
+        cache = ParseCache()
+        scan_app_manifests(tmp_path / "apps", cache)
+        scan_bounded_contexts(tmp_path / "src", cache)
+        misses = cache.misses
+
+        apps = scan_app_manifests(tmp_path / "apps", cache)
+        contexts = scan_bounded_contexts(tmp_path / "src", cache)
+
+        assert cache.misses == misses
+        assert apps[0].name == "Portal"
+        assert contexts[0].get_entity_names() == ["Term"]
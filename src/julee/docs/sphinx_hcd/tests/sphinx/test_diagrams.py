@@ -0,0 +1,124 @@
+"""Tests for memoized diagram generation."""
+
+import pickle
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+
+from julee.docs.sphinx_hcd.domain.models.journey import Journey
+from julee.docs.sphinx_hcd.sphinx.context import HCDContext
+from julee.docs.sphinx_hcd.sphinx.diagrams import (
+    DiagramCache,
+    digest_entities,
+)
+from julee.docs.sphinx_hcd.sphinx.directives import journey as journey_directives
+
+
+class FakePlantumlNode(dict):
+    """Stand-in for the sphinxcontrib.plantuml node class."""
+
+    def __init__(self, source: str) -> None:
+        super().__init__()
+        self.source = source
+
+
+@pytest.fixture
+def fake_plantuml(monkeypatch):
+    """Install a fake sphinxcontrib.plantuml module."""
+    module = types.ModuleType("sphinxcontrib.plantuml")
+    module.plantuml = FakePlantumlNode
+    monkeypatch.setitem(sys.modules, "sphinxcontrib.plantuml", module)
+    return module
+
+
+class TestDigestEntities:
+    """Test entity digests."""
+
+    def test_order_independent(self) -> None:
+        """Test that entity order does not change the digest."""
+        a, b = Journey(slug="a"), Journey(slug="b")
+
+        assert digest_entities([a, b]) == digest_entities([b, a])
+
+    def test_content_sensitive(self) -> None:
+        """Test that changing an entity changes the digest."""
+        before = digest_entities([Journey(slug="a")])
+        after = digest_entities([Journey(slug="a", depends_on=["b"])])
+
+        assert before != after
+
+
+class TestDiagramCache:
+    """Test DiagramCache behaviour."""
+
+    def test_unchanged_inputs_are_not_rebuilt(self) -> None:
+        """Test that a matching digest returns the cached result."""
+        cache = DiagramCache()
+        builds = []
+
+        def build() -> str:
+            builds.append(1)
+            return "@startuml\n@enduml"
+
+        cache.get_or_build("graph", (), "digest-1", build)
+        result = cache.get_or_build("graph", (), "digest-1", build)
+
+        assert result == "@startuml\n@enduml"
+        assert len(builds) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_inputs_replace_entry(self) -> None:
+        """Test that a new digest rebuilds and replaces the old result."""
+        cache = DiagramCache()
+        cache.get_or_build("graph", ("x",), "digest-1", lambda: "old")
+        result = cache.get_or_build("graph", ("x",), "digest-2", lambda: "new")
+
+        assert result == "new"
+        assert len(cache) == 1
+
+    def test_survives_pickling(self) -> None:
+        """Test that results persist through a pickle round-trip."""
+        cache = DiagramCache()
+        cache.get_or_build("graph", (), "digest-1", lambda: "source")
+
+        restored = pickle.loads(pickle.dumps(cache))
+
+        assert restored.get_or_build("graph", (), "digest-1", lambda: "x") == "source"
+        assert restored.hits == 1
+
+
+class TestJourneyDependencyGraph:
+    """Test the memoized journey dependency graph builder."""
+
+    def test_graph_generated_once_and_shared(self, fake_plantuml) -> None:
+        """Test that repeated pages reuse one source and image name."""
+        context = HCDContext()
+        context.journey_repo.save(Journey(slug="onboard"))
+        context.journey_repo.save(Journey(slug="review", depends_on=["onboard"]))
+
+        with patch.object(
+            journey_directives,
+            "generate_journey_dependency_plantuml",
+            wraps=journey_directives.generate_journey_dependency_plantuml,
+        ) as generate:
+            first = journey_directives.build_dependency_graph_node(None, context)
+            second = journey_directives.build_dependency_graph_node(None, context)
+
+        assert generate.call_count == 1
+        assert "review --> onboard" in first["uml"]
+        assert first["filename"] == second["filename"]
+        assert first["incdir"] == ""
+
+    def test_graph_regenerated_when_journeys_change(self, fake_plantuml) -> None:
+        """Test that editing a journey invalidates the cached graph."""
+        context = HCDContext()
+        context.journey_repo.save(Journey(slug="onboard"))
+        first = journey_directives.build_dependency_graph_node(None, context)
+
+        context.journey_repo.save(Journey(slug="review", depends_on=["onboard"]))
+        second = journey_directives.build_dependency_graph_node(None, context)
+
+        assert first["filename"] != second["filename"]
+        assert "review --> onboard" in second["uml"]
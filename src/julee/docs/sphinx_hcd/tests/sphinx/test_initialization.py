@@ -0,0 +1,71 @@
+"""Tests for sphinx_hcd initialization helpers."""
+
+from pathlib import Path
+
+from julee.core.entities.bounded_context import (
+    BoundedContext,
+    BoundedContextChange,
+    BoundedContextChangeKind,
+)
+from julee.docs.sphinx_hcd.domain.models import BoundedContextInfo
+from julee.docs.sphinx_hcd.sphinx.context import HCDContext
+from julee.docs.sphinx_hcd.sphinx.initialization import (
+    apply_bounded_context_changes,
+)
+
+
+class TestApplyBoundedContextChanges:
+    """Test incremental code info updates from change events."""
+
+    def test_added_context_is_introspected(self, tmp_path: Path) -> None:
+        """Test that added and modified contexts are re-parsed."""
+        bc_dir = tmp_path / "vocabulary"
+        (bc_dir / "use_cases").mkdir(parents=True)
+        (bc_dir / "__init__.py").write_text('"""Manage vocabularies."""\n')
+        (bc_dir / "use_cases" / "create.py").write_text(
+            'class CreateVocabulary:\n    """Create a vocabulary."""\n'
+        )
+        context = HCDContext()
+        change = BoundedContextChange(
+            kind=BoundedContextChangeKind.ADDED,
+            slug="vocabulary",
+            context=BoundedContext(slug="vocabulary", path=str(bc_dir)),
+        )
+
+        updated = apply_bounded_context_changes(context, [change])
+
+        assert updated == ["vocabulary"]
+        info = context.code_info_repo.get("vocabulary")
+        assert info.objective == "Manage vocabularies."
+        assert info.get_use_case_names() == ["CreateVocabulary"]
+
+    def test_removed_context_is_deleted(self) -> None:
+        """Test that removed contexts are dropped from the repository."""
+        context = HCDContext()
+        context.code_info_repo.save(BoundedContextInfo(slug="vocabulary"))
+        change = BoundedContextChange(
+            kind=BoundedContextChangeKind.REMOVED, slug="vocabulary"
+        )
+
+        apply_bounded_context_changes(context, [change])
+
+        assert context.code_info_repo.get("vocabulary") is None
+
+    def test_unparseable_modified_context_is_dropped(self, tmp_path: Path) -> None:
+        """Test that stale code info is not kept when re-parsing fails."""
+        context = HCDContext()
+        context.code_info_repo.save(
+            BoundedContextInfo(slug="vocabulary", objective="Old objective.")
+        )
+        change = BoundedContextChange(
+            kind=BoundedContextChangeKind.MODIFIED,
+            slug="vocabulary",
+            context=BoundedContext(
+                slug="vocabulary", path=str(tmp_path / "vocabulary")
+            ),
+        )
+
+        updated = apply_bounded_context_changes(context, [change])
+
+        assert updated == ["vocabulary"]
+        assert context.code_info_repo.get("vocabulary") is None
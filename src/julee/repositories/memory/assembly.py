@@ -77,6 +77,32 @@ class MemoryAssemblyRepository(AssemblyRepository, MemoryRepositoryMixin[Assembl
         """
         return self.get_many_entities(assembly_ids)
 
+    async def find_by_execution(
+        self,
+        execution_id: str,
+        input_document_id: str,
+        assembly_specification_id: str,
+    ) -> Assembly | None:
+        """Find the assembly an execution last started for a document.
+
+        Args:
+            execution_id: ID of the execution that created the assembly
+            input_document_id: ID of the document being assembled
+            assembly_specification_id: ID of the specification used
+
+        Returns:
+            The most recently saved matching assembly, or None
+        """
+        # Dictionaries keep insertion order, so the last match is the newest
+        matches = [
+            assembly
+            for assembly in self.storage_dict.values()
+            if assembly.execution_id == execution_id
+            and assembly.input_document_id == input_document_id
+            and assembly.assembly_specification_id == assembly_specification_id
+        ]
+        return matches[-1] if matches else None
+
     def _add_entity_specific_log_data(
         self, entity: Assembly, log_data: dict[str, Any]
     ) -> None:
@@ -20,7 +20,10 @@ from julee.contrib.ceap.domain.models.custom_fields.content_stream import (
     ContentStream,
 )
 from julee.contrib.ceap.domain.models.document import Document
+from julee.contrib.ceap.domain.models.document.retrieval import is_passage_index
+from julee.contrib.ceap.domain.models.document.segmentation import is_segment
 from julee.contrib.ceap.domain.repositories.document import DocumentRepository
+from julee.contrib.ceap.domain.services import retrieve_passages, split_into_segments
 
 from .base import MemoryRepositoryMixin
 
@@ -127,8 +130,28 @@ class MemoryDocumentRepository(DocumentRepository, MemoryRepositoryMixin[Documen
         """
         return self.get_many_entities(document_ids)
 
+    async def get_segments(
+        self, document_id: str, max_segment_chars: int, overlap_chars: int
+    ) -> list[str]:
+        """Split a large text document into overlapping segment documents."""
+        return await split_into_segments(
+            self, document_id, max_segment_chars, overlap_chars
+        )
+
+    async def get_passages(
+        self,
+        document_id: str,
+        query_texts: list[str],
+        top_k: int,
+        passage_chars: int,
+    ) -> list[list[str]]:
+        """Retrieve the passages of a text document relevant to queries."""
+        return await retrieve_passages(
+            self, document_id, query_texts, top_k, passage_chars
+        )
+
     async def list_all(self) -> list[Document]:
-        """List all documents.
+        """List all documents, leaving out their segments and passage indexes.
 
         Returns:
             List of all Document entities in the repository
@@ -138,7 +161,11 @@ class MemoryDocumentRepository(DocumentRepository, MemoryRepositoryMixin[Documen
             f"{self.entity_name.lower()}s"
         )
 
-        documents = list(self.storage_dict.values())
+        documents = [
+            document
+            for document in self.storage_dict.values()
+            if not is_segment(document) and not is_passage_index(document)
+        ]
 
         self.logger.info(
             f"Memory{self.entity_name}Repository: Listed all "
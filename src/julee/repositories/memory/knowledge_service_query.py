@@ -85,6 +85,23 @@ class MemoryKnowledgeServiceQueryRepository(
         """
         return self.get_many_entities(query_ids)
 
+    async def find_knowledge_service_ids(self, query_ids: list[str]) -> list[str]:
+        """Find the knowledge services that queries are asked of.
+
+        Args:
+            query_ids: IDs of the queries
+
+        Returns:
+            The distinct knowledge_service_ids of the queries found, sorted
+        """
+        return sorted(
+            {
+                query.knowledge_service_id
+                for query in self.get_many_entities(query_ids).values()
+                if query is not None
+            }
+        )
+
     async def generate_id(self) -> str:
         """Generate a unique query identifier.
 
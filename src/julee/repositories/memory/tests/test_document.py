@@ -7,6 +7,7 @@ idempotency, error handling, and content operations including content_bytes.
 """
 
 import io
+from unittest.mock import patch
 
 import pytest
 
@@ -214,3 +215,177 @@ class TestMemoryDocumentRepositoryErrorHandling:
                 status=DocumentStatus.CAPTURED,
                 content_bytes="test content",
             )
+
+
+class TestMemoryDocumentRepositorySegments:
+    """Test splitting large documents into segments."""
+
+    @staticmethod
+    def _text_document(text: str, content_type: str = "text/plain") -> Document:
+        content_bytes = text.encode("utf-8")
+        return Document(
+            document_id="large-doc",
+            original_filename="large.txt",
+            content_type=content_type,
+            size_bytes=len(content_bytes),
+            content_multihash="large_hash",
+            status=DocumentStatus.CAPTURED,
+            content=ContentStream(io.BytesIO(content_bytes)),
+        )
+
+    async def test_small_document_is_not_split(
+        self, repository: MemoryDocumentRepository, sample_document: Document
+    ) -> None:
+        await repository.save(sample_document)
+
+        segment_ids = await repository.get_segments("test-doc-123", 1000, 100)
+
+        assert segment_ids == ["test-doc-123"]
+
+    async def test_large_document_is_split_into_overlapping_segments(
+        self, repository: MemoryDocumentRepository
+    ) -> None:
+        text = "".join(f"line {i:04d}\n" for i in range(300))
+        await repository.save(self._text_document(text))
+
+        segment_ids = await repository.get_segments("large-doc", 1000, 100)
+
+        assert len(segment_ids) == 4
+        segments = await repository.get_many(segment_ids)
+        texts = []
+        for segment_id in segment_ids:
+            segment = segments[segment_id]
+            assert segment is not None
+            assert segment.content is not None
+            assert segment.additional_metadata["segment_of"] == "large-doc"
+            texts.append(segment.content.read().decode("utf-8"))
+        assert texts[0].startswith("line 0000\n")
+        assert texts[-1].endswith("line 0299\n")
+        # Consecutive segments share their boundary lines
+        assert texts[1].startswith(texts[0][-100:])
+
+    async def test_segments_are_reused(
+        self, repository: MemoryDocumentRepository
+    ) -> None:
+        """Splitting the same content again finds the stored segments."""
+        await repository.save(self._text_document("x" * 2500))
+        first = await repository.get_segments("large-doc", 1000, 100)
+
+        with patch.object(repository, "save") as save:
+            second = await repository.get_segments("large-doc", 1000, 100)
+
+        assert second == first
+        save.assert_not_called()
+
+    async def test_segments_are_not_listed(
+        self, repository: MemoryDocumentRepository
+    ) -> None:
+        await repository.save(self._text_document("x" * 2500))
+        await repository.get_segments("large-doc", 1000, 100)
+
+        documents = await repository.list_all()
+
+        assert [document.document_id for document in documents] == ["large-doc"]
+
+    async def test_non_text_document_is_not_split(
+        self, repository: MemoryDocumentRepository
+    ) -> None:
+        await repository.save(self._text_document("x" * 2500, "application/pdf"))
+
+        segment_ids = await repository.get_segments("large-doc", 1000, 100)
+
+        assert segment_ids == ["large-doc"]
+
+    async def test_missing_document_rejected(
+        self, repository: MemoryDocumentRepository
+    ) -> None:
+        with pytest.raises(ValueError, match="Document not found"):
+            await repository.get_segments("nonexistent-123", 1000, 100)
+
+
+class TestMemoryDocumentRepositoryPassages:
+    """Test retrieving relevant passages of documents."""
+
+    TEXT = "".join(
+        ["Agenda and apologies.\n" * 40, "Attendees: Ana and Ben.\n"]
+        + ["Budget discussion.\n" * 40]
+    )
+
+    async def test_relevant_passages_retrieved(
+        self, repository: MemoryDocumentRepository
+    ) -> None:
+        content_bytes = self.TEXT.encode("utf-8")
+        await repository.save(
+            Document(
+                document_id="minutes",
+                original_filename="minutes.txt",
+                content_type="text/plain",
+                size_bytes=len(content_bytes),
+                content_multihash="minutes_hash",
+                status=DocumentStatus.CAPTURED,
+                content=ContentStream(io.BytesIO(content_bytes)),
+            )
+        )
+
+        passages = await repository.get_passages(
+            "minutes", ["Who attended?", "attendees", "invoice total"], 1, 300
+        )
+
+        assert passages[0] == []
+        assert len(passages[1]) == 1
+        assert "Attendees: Ana and Ben." in passages[1][0]
+        assert passages[2] == []
+
+    async def test_index_is_reused(self, repository: MemoryDocumentRepository) -> None:
+        """Retrieving from the same content again loads the stored index."""
+        content_bytes = self.TEXT.encode("utf-8")
+        await repository.save(
+            Document(
+                document_id="minutes",
+                original_filename="minutes.txt",
+                content_type="text/plain",
+                size_bytes=len(content_bytes),
+                content_multihash="minutes_hash",
+                status=DocumentStatus.CAPTURED,
+                content_bytes=content_bytes,
+            )
+        )
+        first = await repository.get_passages("minutes", ["budget"], 2, 300)
+
+        with patch.object(repository, "save") as save:
+            second = await repository.get_passages("minutes", ["budget"], 2, 300)
+
+        assert second == first
+        save.assert_not_called()
+
+    async def test_index_is_not_listed(
+        self, repository: MemoryDocumentRepository
+    ) -> None:
+        content_bytes = self.TEXT.encode("utf-8")
+        await repository.save(
+            Document(
+                document_id="minutes",
+                original_filename="minutes.txt",
+                content_type="text/plain",
+                size_bytes=len(content_bytes),
+                content_multihash="minutes_hash",
+                status=DocumentStatus.CAPTURED,
+                content_bytes=content_bytes,
+            )
+        )
+        await repository.get_passages("minutes", ["budget"], 2, 300)
+
+        documents = await repository.list_all()
+
+        assert [document.document_id for document in documents] == ["minutes"]
+
+    async def test_non_text_document_has_no_passages(
+        self, repository: MemoryDocumentRepository, sample_document: Document
+    ) -> None:
+        await repository.save(
+            sample_document.model_copy(update={"content_type": "application/pdf"})
+        )
+
+        passages = await repository.get_passages("test-doc-123", ["test"], 2, 300)
+
+        assert passages == [[]]
@@ -10,8 +10,13 @@ The implementation stores assembly data as JSON objects in Minio, following
 the large payload handling pattern from the architectural guidelines.
 """
 
+import hashlib
+import io
+import json
 import logging
 
+from minio.error import S3Error
+
 from julee.contrib.ceap.domain.models.assembly import Assembly
 from julee.contrib.ceap.domain.repositories.assembly import AssemblyRepository
 
@@ -35,7 +40,9 @@ class MinioAssemblyRepository(AssemblyRepository, MinioRepositoryMixin):
         self.client = client
         self.logger = logging.getLogger("MinioAssemblyRepository")
         self.assembly_bucket = "assemblies"
-        self.ensure_buckets_exist([self.assembly_bucket])
+        # Maps (execution, document, specification) to the latest assembly
+        self.execution_index_bucket = "assembly-executions"
+        self.ensure_buckets_exist([self.assembly_bucket, self.execution_index_bucket])
 
     async def get(self, assembly_id: str) -> Assembly | None:
         """Retrieve an assembly by ID."""
@@ -69,6 +76,19 @@ class MinioAssemblyRepository(AssemblyRepository, MinioRepositoryMixin):
             },
         )
 
+        assembly_id_bytes = assembly.assembly_id.encode("utf-8")
+        self.client.put_object(
+            bucket_name=self.execution_index_bucket,
+            object_name=self._execution_index_key(
+                assembly.execution_id,
+                assembly.input_document_id,
+                assembly.assembly_specification_id,
+            ),
+            data=io.BytesIO(assembly_id_bytes),
+            length=len(assembly_id_bytes),
+            content_type="text/plain",
+        )
+
     async def get_many(self, assembly_ids: list[str]) -> dict[str, Assembly | None]:
         """Retrieve multiple assemblies by ID.
 
@@ -98,6 +118,45 @@ class MinioAssemblyRepository(AssemblyRepository, MinioRepositoryMixin):
 
         return result
 
+    async def find_by_execution(
+        self,
+        execution_id: str,
+        input_document_id: str,
+        assembly_specification_id: str,
+    ) -> Assembly | None:
+        """Find the assembly an execution last started for a document.
+
+        Looked up through the execution index written by save.
+        """
+        try:
+            response = self.client.get_object(
+                bucket_name=self.execution_index_bucket,
+                object_name=self._execution_index_key(
+                    execution_id, input_document_id, assembly_specification_id
+                ),
+            )
+        except S3Error as e:
+            if getattr(e, "code", None) == "NoSuchKey":
+                return None
+            self.logger.error(
+                "Error retrieving assembly execution index",
+                extra={"execution_id": execution_id, "error": str(e)},
+            )
+            raise
+        try:
+            assembly_id = response.read().decode("utf-8")
+        finally:
+            response.close()
+            response.release_conn()
+        return await self.get(assembly_id)
+
+    @staticmethod
+    def _execution_index_key(
+        execution_id: str, input_document_id: str, assembly_specification_id: str
+    ) -> str:
+        key = json.dumps([execution_id, input_document_id, assembly_specification_id])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
     async def generate_id(self) -> str:
         """Generate a unique assembly identifier."""
         return self.generate_id_with_prefix("assembly")
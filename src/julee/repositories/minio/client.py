@@ -23,6 +23,7 @@ from typing import (
 )
 
 from minio.api import ObjectWriteResult
+from minio.commonconfig import ComposeSource
 from minio.datatypes import Object
 from minio.error import S3Error  # type: ignore[import-untyped]
 from pydantic import BaseModel
@@ -76,6 +77,7 @@ class MinioClient(Protocol):
         length: int,
         content_type: str = "application/octet-stream",
         metadata: dict[str, str | list[str] | tuple[str]] | None = None,
+        part_size: int = 0,
     ) -> ObjectWriteResult:
         """Store an object in the bucket.
 
@@ -83,9 +85,10 @@ class MinioClient(Protocol):
             bucket_name: Name of the bucket
             object_name: Name of the object to store
             data: Object data (stream or bytes)
-            length: Size of the object in bytes
+            length: Size of the object in bytes, or -1 if unknown
             content_type: MIME type of the object
             metadata: Optional metadata dict
+            part_size: Multipart upload part size; required when length is -1
 
         Returns:
             Object upload result
@@ -125,6 +128,41 @@ class MinioClient(Protocol):
         """
         ...
 
+    def compose_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        sources: list[ComposeSource],
+        metadata: dict[str, str | list[str] | tuple[str]] | None = None,
+    ) -> ObjectWriteResult:
+        """Create an object server-side from one or more existing objects.
+
+        Args:
+            bucket_name: Name of the destination bucket
+            object_name: Name of the object to create
+            sources: Source objects, concatenated in order
+            metadata: Optional metadata dict for the new object
+
+        Returns:
+            Object upload result
+
+        Raises:
+            S3Error: If a source is missing or the copy fails
+        """
+        ...
+
+    def remove_object(self, bucket_name: str, object_name: str) -> None:
+        """Remove an object from the bucket.
+
+        Args:
+            bucket_name: Name of the bucket
+            object_name: Name of the object to remove
+
+        Raises:
+            S3Error: If removal fails
+        """
+        ...
+
     def list_objects(self, bucket_name: str, prefix: str = "") -> Any:
         """List objects in a bucket with optional prefix filter.
 
@@ -11,13 +11,18 @@ The implementation separates document metadata (stored as JSON) from content
 payload handling pattern from the architectural guidelines.
 """
 
+import asyncio
 import hashlib
 import io
 import json
 import logging
+import uuid
+from collections.abc import AsyncIterable, Mapping
 from datetime import datetime, timezone
+from typing import Any
 
 import multihash  # type: ignore[import-untyped]
+from minio.commonconfig import ComposeSource
 from minio.error import S3Error  # type: ignore[import-untyped]
 from pydantic import BaseModel, ConfigDict
 
@@ -25,10 +30,77 @@ from julee.contrib.ceap.domain.models.custom_fields.content_stream import (
     ContentStream,
 )
 from julee.contrib.ceap.domain.models.document import Document
+from julee.contrib.ceap.domain.models.document.retrieval import is_passage_index
+from julee.contrib.ceap.domain.models.document.segmentation import is_segment
 from julee.contrib.ceap.domain.repositories.document import DocumentRepository
+from julee.contrib.ceap.domain.services import retrieve_passages, split_into_segments
 
 from .client import MinioClient, MinioRepositoryMixin
 
+# Multipart part size for uploads of unknown length. Bounds the memory a
+# streamed upload holds at once (per in-flight part).
+STREAM_PART_SIZE = 16 * 1024 * 1024
+
+# Prefix, within the content bucket, for streamed uploads whose multihash is
+# not known yet.
+STAGING_PREFIX = "staging/"
+
+
+class _HashingChunkReader(io.RawIOBase):
+    """Blocking reader over async chunks, hashing the bytes read through it.
+
+    Lets a blocking upload running in a worker thread consume chunks that
+    are produced on the event loop, without buffering more than one chunk.
+    """
+
+    def __init__(
+        self, chunks: AsyncIterable[bytes], loop: asyncio.AbstractEventLoop
+    ) -> None:
+        super().__init__()
+        self._chunks = aiter(chunks)
+        self._loop = loop
+        self._chunk = b""
+        self._offset = 0
+        self._eof = False
+        self._sha256 = hashlib.sha256()
+        self.size = 0
+
+    @property
+    def multihash(self) -> str:
+        """Multihash (SHA-256) of the bytes read so far."""
+        mhash = multihash.encode(self._sha256.digest(), multihash.SHA2_256)
+        return str(mhash.hex())
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while self._offset >= len(self._chunk):
+            if self._eof:
+                return 0
+            self._chunk = self._next_chunk()
+            self._offset = 0
+        count = min(len(buffer), len(self._chunk) - self._offset)
+        buffer[:count] = self._chunk[self._offset : self._offset + count]
+        self._offset += count
+        return count
+
+    def _next_chunk(self) -> bytes:
+        future = asyncio.run_coroutine_threadsafe(self._anext(), self._loop)
+        chunk = future.result()
+        if chunk is None:
+            self._eof = True
+            return b""
+        self._sha256.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    async def _anext(self) -> bytes | None:
+        try:
+            return await anext(self._chunks)
+        except StopAsyncIteration:
+            return None
+
 
 class RawMetadata(BaseModel):
     """Simple wrapper for raw document metadata JSON."""
@@ -216,6 +288,121 @@ class MinioDocumentRepository(DocumentRepository, MinioRepositoryMixin):
             )
             raise
 
+    async def save_stream(
+        self,
+        document_id: str,
+        chunks: AsyncIterable[bytes],
+        original_filename: str,
+        content_type: str,
+        additional_metadata: Mapping[str, Any] | None = None,
+    ) -> Document:
+        """Save a document whose content arrives as a stream of chunks.
+
+        Unlike save(), the content is never held in memory as a whole. It is
+        uploaded to a staging object while its multihash is calculated, then
+        copied server-side to its content-addressed name (or dropped if that
+        content is already stored), and the metadata is stored last.
+
+        Returns:
+            The saved document, as returned by get()
+
+        Raises:
+            ValueError: If the stream is empty
+        """
+        staging_name = f"{STAGING_PREFIX}{document_id}-{uuid.uuid4().hex}"
+        reader = _HashingChunkReader(chunks, asyncio.get_running_loop())
+
+        try:
+            await asyncio.to_thread(
+                self.client.put_object,
+                bucket_name=self.content_bucket,
+                object_name=staging_name,
+                data=reader,  # type: ignore[arg-type]
+                length=-1,
+                content_type=content_type,
+                part_size=STREAM_PART_SIZE,
+            )
+            if reader.size == 0:
+                raise ValueError(f"Document {document_id} has no content")
+
+            content_multihash = reader.multihash
+            await asyncio.to_thread(
+                self._promote_staged_content,
+                staging_name,
+                content_multihash,
+                content_type,
+                {"document_id": document_id, "original_filename": original_filename},
+            )
+        finally:
+            await asyncio.to_thread(self._remove_staged_content, staging_name)
+
+        document = Document(
+            document_id=document_id,
+            original_filename=original_filename,
+            content_type=content_type,
+            size_bytes=reader.size,
+            content_multihash=content_multihash,
+            additional_metadata=additional_metadata or {},
+            # The content is already stored; this placeholder only satisfies
+            # validation and is excluded from the stored metadata.
+            content=ContentStream(io.BytesIO()),
+        )
+        await self._store_metadata(self.update_timestamps(document))
+
+        self.logger.info(
+            "Streamed document saved successfully",
+            extra={
+                "document_id": document_id,
+                "content_multihash": content_multihash,
+                "size_bytes": reader.size,
+            },
+        )
+
+        saved = await self.get(document_id)
+        if saved is None:
+            raise ValueError(f"Document {document_id} could not be read back")
+        return saved
+
+    def _promote_staged_content(
+        self,
+        staging_name: str,
+        content_multihash: str,
+        content_type: str,
+        metadata: dict[str, str],
+    ) -> None:
+        """Copy a staged upload to its content-addressed object name."""
+        try:
+            self.client.stat_object(
+                bucket_name=self.content_bucket, object_name=content_multihash
+            )
+            self.logger.debug(
+                "Content already exists, discarding staged upload",
+                extra={"content_multihash": content_multihash},
+            )
+            return
+        except S3Error as e:
+            if getattr(e, "code", None) != "NoSuchKey":
+                raise
+
+        self.client.compose_object(
+            bucket_name=self.content_bucket,
+            object_name=content_multihash,
+            sources=[ComposeSource(self.content_bucket, staging_name)],
+            metadata={"Content-Type": content_type, **metadata},
+        )
+
+    def _remove_staged_content(self, staging_name: str) -> None:
+        try:
+            self.client.remove_object(
+                bucket_name=self.content_bucket, object_name=staging_name
+            )
+        except S3Error as e:
+            if getattr(e, "code", None) != "NoSuchKey":
+                self.logger.warning(
+                    "Failed to remove staged upload",
+                    extra={"object_name": staging_name, "error": str(e)},
+                )
+
     async def get_many(self, document_ids: list[str]) -> dict[str, Document | None]:
         """Retrieve multiple documents by ID using batch operations.
 
@@ -317,8 +504,28 @@ class MinioDocumentRepository(DocumentRepository, MinioRepositoryMixin):
 
         return result
 
+    async def get_segments(
+        self, document_id: str, max_segment_chars: int, overlap_chars: int
+    ) -> list[str]:
+        """Split a large text document into overlapping segment documents."""
+        return await split_into_segments(
+            self, document_id, max_segment_chars, overlap_chars
+        )
+
+    async def get_passages(
+        self,
+        document_id: str,
+        query_texts: list[str],
+        top_k: int,
+        passage_chars: int,
+    ) -> list[list[str]]:
+        """Retrieve the passages of a text document relevant to queries."""
+        return await retrieve_passages(
+            self, document_id, query_texts, top_k, passage_chars
+        )
+
     async def list_all(self) -> list[Document]:
-        """List all documents.
+        """List all documents, leaving out their segments and passage indexes.
 
         Returns:
             List of all documents, sorted by document_id
@@ -337,8 +544,13 @@ class MinioDocumentRepository(DocumentRepository, MinioRepositoryMixin):
             # Get all documents using the existing get_many method
             document_results = await self.get_many(document_ids)
 
-            # Filter out None results and sort by document_id
-            documents = [doc for doc in document_results.values() if doc is not None]
+            # Filter out None results and derived documents, sort by
+            # document_id
+            documents = [
+                doc
+                for doc in document_results.values()
+                if doc is not None and not is_segment(doc) and not is_passage_index(doc)
+            ]
             documents.sort(key=lambda x: x.document_id)
 
             self.logger.debug(
@@ -369,8 +581,11 @@ class MinioDocumentRepository(DocumentRepository, MinioRepositoryMixin):
         if not document.content:
             raise ValueError(f"Document {document.document_id} has no content")
 
-        # Calculate multihash from the content stream
-        calculated_multihash = self._calculate_multihash_from_stream(document.content)
+        # Calculate multihash from the content stream. Hashing is CPU-bound,
+        # so run it on the executor rather than the activity event loop.
+        calculated_multihash = await asyncio.to_thread(
+            self._calculate_multihash_from_stream, document.content
+        )
         object_name = calculated_multihash
 
         try:
@@ -163,6 +163,24 @@ class MinioKnowledgeServiceQueryRepository(
 
         return result
 
+    async def find_knowledge_service_ids(self, query_ids: list[str]) -> list[str]:
+        """Find the knowledge services that queries are asked of.
+
+        Args:
+            query_ids: IDs of the queries
+
+        Returns:
+            The distinct knowledge_service_ids of the queries found, sorted
+        """
+        query_results = await self.get_many(query_ids)
+        return sorted(
+            {
+                query.knowledge_service_id
+                for query in query_results.values()
+                if query is not None
+            }
+        )
+
     async def list_all(self) -> list[KnowledgeServiceQuery]:
         """List all knowledge service queries.
 
@@ -14,6 +14,7 @@ from typing import Any, BinaryIO
 from unittest.mock import Mock
 
 from minio.api import ObjectWriteResult
+from minio.commonconfig import ComposeSource
 from minio.datatypes import Object
 from minio.error import S3Error
 from urllib3 import HTTPHeaderDict
@@ -115,15 +116,19 @@ class FakeMinioClient(MinioClient):
         length: int,
         content_type: str = "application/octet-stream",
         metadata: dict[str, str | list[str] | tuple[str]] | None = None,
+        part_size: int = 0,
     ) -> ObjectWriteResult:
         """Store an object in the bucket."""
 
         # Read the data from stream
         if hasattr(data, "read"):
-            if hasattr(data, "seek"):
+            seekable = hasattr(data, "seek") and (
+                not hasattr(data, "seekable") or data.seekable()
+            )
+            if seekable:
                 data.seek(0)  # Ensure we're at the beginning
-            content = data.read()
-            if hasattr(data, "seek"):
+            content = data.read() if length < 0 else data.read(length)
+            if seekable:
                 data.seek(0)  # Reset for potential re-use
         else:
             content = data if isinstance(data, bytes) else str(data).encode("utf-8")
@@ -146,6 +151,37 @@ class FakeMinioClient(MinioClient):
             location=f"/{bucket_name}/{object_name}",
         )
 
+    @requires_bucket
+    def compose_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        sources: list[ComposeSource],
+        metadata: dict[str, str | list[str] | tuple[str]] | None = None,
+    ) -> ObjectWriteResult:
+        """Create an object from existing objects."""
+        parts = []
+        for source in sources:
+            self.stat_object(source.bucket_name, source.object_name)  # NoSuchKey
+            parts.append(self._objects[source.bucket_name][source.object_name])
+        content = b"".join(part["data"] for part in parts)
+
+        self._objects[bucket_name][object_name] = {
+            "data": content,
+            "metadata": metadata or parts[0]["metadata"],
+            "content_type": parts[0]["content_type"],
+            "size": len(content),
+        }
+        return ObjectWriteResult(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            version_id=None,
+            etag="fake-etag",
+            http_headers=HTTPHeaderDict(),
+            last_modified=datetime.now(timezone.utc),
+            location=f"/{bucket_name}/{object_name}",
+        )
+
     @requires_object
     def get_object(self, bucket_name: str, object_name: str) -> BaseHTTPResponse:
         """Retrieve an object from the bucket."""
@@ -412,3 +412,63 @@ class TestMinioAssemblyRepositoryRoundtrip:
         assert retrieved is not None
         assert retrieved.status == AssemblyStatus.FAILED
         assert retrieved.assembled_document_id is None
+
+
+class TestMinioAssemblyRepositoryFindByExecution:
+    """Test finding the assembly an execution started for a document."""
+
+    @pytest.mark.asyncio
+    async def test_finds_latest_assembly_of_execution(
+        self,
+        assembly_repo: MinioAssemblyRepository,
+        sample_assembly: Assembly,
+    ) -> None:
+        """The most recently saved matching assembly is found."""
+        await assembly_repo.save(sample_assembly)
+        newer = sample_assembly.model_copy(update={"assembly_id": "assembly-2"})
+        await assembly_repo.save(newer)
+
+        found = await assembly_repo.find_by_execution(
+            "test-execution-123", "input-doc-789", "spec-456"
+        )
+
+        assert found is not None
+        assert found.assembly_id == "assembly-2"
+
+    @pytest.mark.asyncio
+    async def test_other_executions_and_documents_are_not_found(
+        self,
+        assembly_repo: MinioAssemblyRepository,
+        sample_assembly: Assembly,
+    ) -> None:
+        await assembly_repo.save(sample_assembly)
+
+        assert (
+            await assembly_repo.find_by_execution(
+                "other-execution", "input-doc-789", "spec-456"
+            )
+            is None
+        )
+        assert (
+            await assembly_repo.find_by_execution(
+                "test-execution-123", "other-doc", "spec-456"
+            )
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_results_roundtrip(
+        self,
+        assembly_repo: MinioAssemblyRepository,
+        sample_assembly: Assembly,
+    ) -> None:
+        """Saved query results are kept with the assembly."""
+        results = {"/properties/title": "Minutes", "/properties/tags": ["a", "b"]}
+        await assembly_repo.save(
+            sample_assembly.model_copy(update={"query_results": results})
+        )
+
+        retrieved = await assembly_repo.get(sample_assembly.assembly_id)
+
+        assert retrieved is not None
+        assert dict(retrieved.query_results) == results
@@ -8,6 +8,7 @@ testing patterns and verify idempotency, error handling, and content.
 
 import hashlib
 import io
+from collections.abc import AsyncIterator
 from typing import Any
 from unittest.mock import Mock
 
@@ -537,6 +538,73 @@ class TestMinioDocumentRepositoryContentBytes:
         assert "status" in metadata_dict
 
 
+class TestMinioDocumentRepositorySaveStream:
+    """Test saving documents from a stream of chunks."""
+
+    @staticmethod
+    async def chunks(*parts: bytes) -> AsyncIterator[bytes]:
+        for part in parts:
+            yield part
+
+    async def test_save_stream_stores_content_addressed_content(
+        self,
+        repository: MinioDocumentRepository,
+        fake_minio_client: FakeMinioClient,
+    ) -> None:
+        """Test content is hashed in flight and stored under its multihash."""
+        content = b"streamed " * 1000
+        expected = multihash.encode(
+            hashlib.sha256(content).digest(), multihash.SHA2_256
+        )
+
+        document = await repository.save_stream(
+            "doc-stream-1",
+            self.chunks(content[:100], content[100:4000], content[4000:]),
+            original_filename="streamed.txt",
+            content_type="text/plain",
+            additional_metadata={"source": "upload"},
+        )
+
+        assert document.content_multihash == str(expected.hex())
+        assert document.size_bytes == len(content)
+        assert document.additional_metadata == {"source": "upload"}
+        assert document.content is not None
+        assert document.content.read() == content
+
+        stored = fake_minio_client.get_stored_objects("documents-content")
+        assert list(stored) == [document.content_multihash]
+
+    async def test_save_stream_deduplicates_existing_content(
+        self,
+        repository: MinioDocumentRepository,
+        fake_minio_client: FakeMinioClient,
+    ) -> None:
+        """Test identical content is stored once and staging is cleaned up."""
+        first = await repository.save_stream(
+            "doc-a", self.chunks(b"same bytes"), "a.txt", "text/plain"
+        )
+        second = await repository.save_stream(
+            "doc-b", self.chunks(b"same ", b"bytes"), "b.txt", "text/plain"
+        )
+
+        assert first.content_multihash == second.content_multihash
+        assert fake_minio_client.get_object_count("documents-content") == 1
+        assert fake_minio_client.get_object_count("documents") == 2
+
+    async def test_save_stream_rejects_empty_content(
+        self,
+        repository: MinioDocumentRepository,
+        fake_minio_client: FakeMinioClient,
+    ) -> None:
+        """Test an empty stream is rejected without leaving objects behind."""
+        with pytest.raises(ValueError, match="has no content"):
+            await repository.save_stream(
+                "doc-empty", self.chunks(), "empty.txt", "text/plain"
+            )
+
+        assert fake_minio_client.get_total_object_count() == 0
+
+
 class TestMinioDocumentRepositoryErrorHandling:
     """Test error handling scenarios."""
 
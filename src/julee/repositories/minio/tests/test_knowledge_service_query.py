@@ -283,6 +283,31 @@ class TestMinioKnowledgeServiceQueryRepositoryGetMany:
         assert result["nonexistent-1"] is None
         assert result["nonexistent-2"] is None
 
+    @pytest.mark.asyncio
+    async def test_find_knowledge_service_ids(
+        self,
+        query_repo: MinioKnowledgeServiceQueryRepository,
+        sample_queries: list[KnowledgeServiceQuery],
+    ) -> None:
+        """Test finding the distinct services of queries, skipping missing ones."""
+        for query in sample_queries:
+            await query_repo.save(query)
+
+        result = await query_repo.find_knowledge_service_ids(
+            [query.query_id for query in sample_queries] + ["nonexistent-1"]
+        )
+
+        assert result == sorted(
+            {query.knowledge_service_id for query in sample_queries}
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_knowledge_service_ids_empty_list(
+        self, query_repo: MinioKnowledgeServiceQueryRepository
+    ) -> None:
+        """Test finding services for no queries."""
+        assert await query_repo.find_knowledge_service_ids([]) == []
+
 
 class TestMinioKnowledgeServiceQueryRepositoryEdgeCases:
     """Test edge cases and error conditions."""
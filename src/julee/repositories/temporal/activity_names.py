@@ -22,6 +22,10 @@ POLICY_ACTIVITY_BASE = "julee.policy_repo.minio"
 DOCUMENT_POLICY_VALIDATION_ACTIVITY_BASE = "julee.document_policy_validation_repo.minio"
 REMOTE_SCHEMA_ACTIVITY_BASE = "julee.remote_schema_repo.http"
 
+# Task queue for storage-bound repository activities, served by a worker pool
+# separate from slow LLM calls
+STORAGE_TASK_QUEUE = "julee-storage-queue"
+
 
 # Export all constants
 __all__ = [
@@ -33,4 +37,5 @@ __all__ = [
     "POLICY_ACTIVITY_BASE",
     "DOCUMENT_POLICY_VALIDATION_ACTIVITY_BASE",
     "REMOTE_SCHEMA_ACTIVITY_BASE",
+    "STORAGE_TASK_QUEUE",
 ]
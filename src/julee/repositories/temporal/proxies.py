@@ -8,7 +8,13 @@ restrictions.
 
 The proxy classes automatically generate methods that call
 workflow.execute_activity() with the appropriate activity names, timeouts,
-and retry policies.
+and retry policies. generate_id() is the exception: it only mints a uuid, so
+each proxy declares it workflow-local and the id is produced
+deterministically with workflow.uuid4() instead of costing an activity
+round-trip. Small metadata reads (specifications, knowledge service configs
+and queries, policies) run as local activities to skip task-queue dispatch.
+Everything else is dispatched to STORAGE_TASK_QUEUE so it is not queued
+behind slow knowledge service calls.
 """
 
 from julee.contrib.ceap.domain.repositories.assembly import AssemblyRepository
@@ -38,14 +44,20 @@ from julee.repositories.temporal.activity_names import (
     KNOWLEDGE_SERVICE_QUERY_ACTIVITY_BASE,
     POLICY_ACTIVITY_BASE,
     REMOTE_SCHEMA_ACTIVITY_BASE,
+    STORAGE_TASK_QUEUE,
+)
+from julee.util.temporal.decorators import (
+    temporal_workflow_proxy,
+    workflow_prefixed_id,
 )
-from julee.util.temporal.decorators import temporal_workflow_proxy
 
 
 @temporal_workflow_proxy(
     activity_base=ASSEMBLY_ACTIVITY_BASE,
     default_timeout_seconds=30,
-    retry_methods=["save", "generate_id"],
+    task_queue=STORAGE_TASK_QUEUE,
+    retry_methods=["save"],
+    workflow_local_methods={"generate_id": workflow_prefixed_id("assembly")},
 )
 class WorkflowAssemblyRepositoryProxy(AssemblyRepository):
     """
@@ -60,7 +72,10 @@ class WorkflowAssemblyRepositoryProxy(AssemblyRepository):
 @temporal_workflow_proxy(
     activity_base=ASSEMBLY_SPECIFICATION_ACTIVITY_BASE,
     default_timeout_seconds=30,
-    retry_methods=["save", "generate_id"],
+    task_queue=STORAGE_TASK_QUEUE,
+    retry_methods=["save"],
+    workflow_local_methods={"generate_id": workflow_prefixed_id("spec")},
+    local_activity_methods=["get"],
 )
 class WorkflowAssemblySpecificationRepositoryProxy(AssemblySpecificationRepository):
     """
@@ -76,7 +91,9 @@ class WorkflowAssemblySpecificationRepositoryProxy(AssemblySpecificationReposito
 @temporal_workflow_proxy(
     activity_base=DOCUMENT_ACTIVITY_BASE,
     default_timeout_seconds=30,
-    retry_methods=["save", "generate_id"],
+    task_queue=STORAGE_TASK_QUEUE,
+    retry_methods=["save", "get_segments", "get_passages"],
+    workflow_local_methods={"generate_id": workflow_prefixed_id("doc")},
 )
 class WorkflowDocumentRepositoryProxy(DocumentRepository):
     """
@@ -91,7 +108,10 @@ class WorkflowDocumentRepositoryProxy(DocumentRepository):
 @temporal_workflow_proxy(
     activity_base=KNOWLEDGE_SERVICE_CONFIG_ACTIVITY_BASE,
     default_timeout_seconds=30,
-    retry_methods=["save", "generate_id"],
+    task_queue=STORAGE_TASK_QUEUE,
+    retry_methods=["save"],
+    workflow_local_methods={"generate_id": workflow_prefixed_id("ks")},
+    local_activity_methods=["get", "get_many"],
 )
 class WorkflowKnowledgeServiceConfigRepositoryProxy(KnowledgeServiceConfigRepository):
     """
@@ -107,7 +127,10 @@ class WorkflowKnowledgeServiceConfigRepositoryProxy(KnowledgeServiceConfigReposi
 @temporal_workflow_proxy(
     activity_base=KNOWLEDGE_SERVICE_QUERY_ACTIVITY_BASE,
     default_timeout_seconds=30,
-    retry_methods=["save", "generate_id"],
+    task_queue=STORAGE_TASK_QUEUE,
+    retry_methods=["save"],
+    workflow_local_methods={"generate_id": workflow_prefixed_id("query")},
+    local_activity_methods=["get", "find_knowledge_service_ids"],
 )
 class WorkflowKnowledgeServiceQueryRepositoryProxy(KnowledgeServiceQueryRepository):
     """
@@ -122,7 +145,10 @@ class WorkflowKnowledgeServiceQueryRepositoryProxy(KnowledgeServiceQueryReposito
 @temporal_workflow_proxy(
     activity_base=POLICY_ACTIVITY_BASE,
     default_timeout_seconds=30,
-    retry_methods=["save", "generate_id"],
+    task_queue=STORAGE_TASK_QUEUE,
+    retry_methods=["save"],
+    workflow_local_methods={"generate_id": workflow_prefixed_id("policy")},
+    local_activity_methods=["get"],
 )
 class WorkflowPolicyRepositoryProxy(PolicyRepository):
     """
@@ -137,7 +163,9 @@ class WorkflowPolicyRepositoryProxy(PolicyRepository):
 @temporal_workflow_proxy(
     activity_base=DOCUMENT_POLICY_VALIDATION_ACTIVITY_BASE,
     default_timeout_seconds=30,
-    retry_methods=["save", "generate_id"],
+    task_queue=STORAGE_TASK_QUEUE,
+    retry_methods=["save"],
+    workflow_local_methods={"generate_id": workflow_prefixed_id("validation")},
 )
 class WorkflowDocumentPolicyValidationRepositoryProxy(
     DocumentPolicyValidationRepository
@@ -154,6 +182,7 @@ class WorkflowDocumentPolicyValidationRepositoryProxy(
 @temporal_workflow_proxy(
     activity_base=REMOTE_SCHEMA_ACTIVITY_BASE,
     default_timeout_seconds=30,
+    task_queue=STORAGE_TASK_QUEUE,
     retry_methods=["fetch"],
 )
 class WorkflowRemoteSchemaRepositoryProxy(RemoteSchemaRepository):
@@ -10,9 +10,10 @@ into submodules, each with their own protocols and implementations.
 """
 
 # Re-export knowledge service components
-from .knowledge_service import KnowledgeService
+from .knowledge_service import BatchKnowledgeService, KnowledgeService
 
 __all__ = [
     # Knowledge Service
     "KnowledgeService",
+    "BatchKnowledgeService",
 ]
@@ -8,11 +8,23 @@ appropriate implementation based on the service_api configuration.
 
 import logging
 
+from .hedging import QueryHedger, QueryHedgerRegistry
 from .knowledge_service import (
+    BatchKnowledgeService,
+    BatchQueryOutcome,
+    BatchQueryRequest,
+    BatchQueryResults,
+    BatchStatus,
+    BatchSubmission,
     FileRegistrationResult,
     KnowledgeService,
     QueryResult,
 )
+from .rate_limiter import (
+    KnowledgeServiceRateLimiter,
+    RateLimiterRegistry,
+    RateLimits,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,4 +56,15 @@ __all__ = [
     "ensure_knowledge_service",
     "QueryResult",
     "FileRegistrationResult",
+    "BatchKnowledgeService",
+    "BatchQueryRequest",
+    "BatchQueryOutcome",
+    "BatchQueryResults",
+    "BatchStatus",
+    "BatchSubmission",
+    "KnowledgeServiceRateLimiter",
+    "QueryHedger",
+    "QueryHedgerRegistry",
+    "RateLimiterRegistry",
+    "RateLimits",
 ]
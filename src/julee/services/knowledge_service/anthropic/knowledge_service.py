@@ -4,7 +4,8 @@ Assemble, Publish workflow.
 
 This module provides the Anthropic-specific implementation of the
 KnowledgeService protocol. It handles interactions with Anthropic's API
-for document registration and query execution.
+for document registration and query execution, including streamed
+execution and bulk execution through the Message Batches API.
 
 Requirements:
     - ANTHROPIC_API_KEY environment variable must be set
@@ -26,10 +27,21 @@ from julee.contrib.ceap.domain.models.knowledge_service_config import (
 )
 
 from ..knowledge_service import (
+    BatchKnowledgeService,
+    BatchQueryOutcome,
+    BatchQueryRequest,
+    BatchQueryResults,
+    BatchStatus,
+    BatchSubmission,
     FileRegistrationResult,
-    KnowledgeService,
     QueryResult,
 )
+from ..streaming import (
+    IncrementalJSONValidator,
+    QueryProgress,
+    StreamAbortedError,
+    report_query_progress,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,13 +50,14 @@ DEFAULT_MODEL = "claude-sonnet-4-5"
 DEFAULT_MAX_TOKENS = 4000
 
 
-class AnthropicKnowledgeService(KnowledgeService):
+class AnthropicKnowledgeService(BatchKnowledgeService):
     """
     Anthropic implementation of the KnowledgeService protocol.
 
     This class handles interactions with Anthropic's API for document
     registration and query execution. It implements the KnowledgeService
-    protocol with Anthropic-specific logic.
+    protocol with Anthropic-specific logic, and the BatchKnowledgeService
+    extension on top of the Message Batches API.
     """
 
     def __init__(self) -> None:
@@ -75,9 +88,14 @@ class AnthropicKnowledgeService(KnowledgeService):
                 "AnthropicKnowledgeService"
             )
 
+        # Retries are left to the callers: the knowledge service rate limiter
+        # backs off on throttling and Temporal retries other failures, and
+        # SDK retries on top of those would multiply the load on an
+        # already throttled service.
         return AsyncAnthropic(
             api_key=api_key,
             default_headers={"anthropic-beta": "files-api-2025-04-14"},
+            max_retries=0,
         )
 
     async def register_file(
@@ -187,12 +205,18 @@ class AnthropicKnowledgeService(KnowledgeService):
             service_file_ids: Optional list of Anthropic file IDs to provide
                              as context for the query
             query_metadata: Optional Anthropic-specific configuration such as
-                           model, temperature, max_tokens, etc.
+                           model, temperature, max_tokens, etc. With
+                           stream set, the response is streamed (see
+                           _stream_message).
             assistant_prompt: Optional assistant message content to constrain
                              or prime the model's response.
 
         Returns:
             QueryResult with Anthropic query results
+
+        Raises:
+            StreamAbortedError: If a streamed response was abandoned
+                because it could not conform to output_schema
         """
         logger.debug(
             "Executing query with Anthropic",
@@ -207,146 +231,47 @@ class AnthropicKnowledgeService(KnowledgeService):
         start_time = time.time()
         query_id = f"anthropic_{uuid.uuid4().hex[:12]}"
 
-        # Extract configuration from query_metadata
-        metadata = query_metadata or {}
-        model = metadata.get("model", DEFAULT_MODEL)
-        max_tokens = metadata.get("max_tokens", DEFAULT_MAX_TOKENS)
-        temperature = metadata.get("temperature")
-
         try:
             # Get Anthropic client for this operation
             client = self._get_client(config)
 
-            # Prepare the message content with file attachments if provided
-            content_parts = []
-
-            # Add file attachments if service_file_ids are provided
-            if service_file_ids:
-                for file_id in service_file_ids:
-                    content_parts.append(
-                        {
-                            "type": "document",
-                            "source": {"type": "file", "file_id": file_id},
-                        }
-                    )
-
-            # Handle schema embedding if provided
-            if output_schema:
-                # Build query with embedded schema
-                schema_json = json.dumps(output_schema, indent=2)
-                enhanced_query_text = f"""{query_text}
-
-Please structure your response according to this JSON schema:
-{schema_json}
+            create_params = self._build_message_params(
+                query_text,
+                output_schema,
+                service_file_ids,
+                query_metadata,
+                assistant_prompt,
+            )
 
-Return only valid JSON that conforms to this schema, without any surrounding
-text or markdown formatting."""
+            time_to_first_token_ms = None
+            if (query_metadata or {}).get("stream"):
+                response, time_to_first_token_ms = await self._stream_message(
+                    client,
+                    create_params,
+                    query_id,
+                    output_schema,
+                    assistant_prompt,
+                    start_time,
+                )
             else:
-                enhanced_query_text = query_text
-
-            # Add the text query
-            content_parts.append({"type": "text", "text": enhanced_query_text})
-
-            # Prepare messages for the API
-            messages = [{"role": "user", "content": content_parts}]
-
-            # Add assistant message if provided to constrain response
-            if assistant_prompt:
-                messages.append({"role": "assistant", "content": assistant_prompt})
-
-            create_params = {
-                "model": model,
-                "max_tokens": max_tokens,
-                "messages": messages,
-            }
-
-            # Add temperature if specified
-            if temperature is not None:
-                create_params["temperature"] = temperature
-
-            response = await client.messages.create(**create_params)
+                response = await client.messages.create(**create_params)
 
             # Calculate execution time
             execution_time_ms = int((time.time() - start_time) * 1000)
 
-            # Validate response has exactly one content block of type 'text'
-            if len(response.content) != 1:
-                raise ValueError(
-                    f"Expected exactly 1 content block, got {len(response.content)}"
-                )
-
-            content_block = response.content[0]
-
-            if not hasattr(content_block, "type") or content_block.type != "text":
-                block_type = getattr(content_block, "type", "unknown")
-                raise ValueError(
-                    f"Expected content block type 'text', got '{block_type}'"
-                )
-
-            if not hasattr(content_block, "text"):
-                raise ValueError("Text content block missing 'text' attribute")
-
-            response_text = str(content_block.text)
-
-            logger.debug(
-                "Single text content block validated and extracted",
-                extra={
-                    "knowledge_service_id": config.knowledge_service_id,
-                    "query_id": query_id,
-                    "response_length": len(response_text),
-                },
-            )
-
-            # Handle JSON parsing if schema was provided
-            if output_schema:
-                # Determine the text to parse
-                if assistant_prompt and assistant_prompt.strip().startswith("{"):
-                    # Concatenate assistant prompt with response for JSON parsing
-                    json_text_to_parse = assistant_prompt + response_text
-                else:
-                    json_text_to_parse = response_text
-
-                try:
-                    response_value = json.loads(json_text_to_parse.strip())
-                except json.JSONDecodeError as e:
-                    logger.error(
-                        f"Failed to parse JSON response when output schema was provided. "
-                        f"JSON text to parse: {json_text_to_parse[:500]}... "
-                        f"Parse error: {str(e)}",
-                        extra={
-                            "knowledge_service_id": config.knowledge_service_id,
-                            "query_id": query_id,
-                            "assistant_prompt": assistant_prompt,
-                            "response_text_preview": response_text[:100],
-                        },
-                    )
-                    raise ValueError(
-                        f"Expected valid JSON response when output schema provided, "
-                        f"but failed to parse: {str(e)}"
-                    )
-            else:
-                response_value = response_text
-
-            # Structure the result with parsed or text content
-            result_data = {
-                "response": response_value,
-                "model": model,
-                "service": "anthropic",
-                "sources": service_file_ids or [],
-                "usage": {
-                    "input_tokens": response.usage.input_tokens,
-                    "output_tokens": response.usage.output_tokens,
-                },
-                "stop_reason": response.stop_reason,
-            }
-
-            result = QueryResult(
-                query_id=query_id,
-                query_text=query_text,
-                result_data=result_data,
-                execution_time_ms=execution_time_ms,
-                created_at=datetime.now(timezone.utc),
+            result = self._build_query_result(
+                config,
+                query_id,
+                query_text,
+                response,
+                create_params["model"],
+                output_schema,
+                service_file_ids,
+                assistant_prompt,
+                execution_time_ms,
             )
+            if time_to_first_token_ms is not None:
+                result.result_data["time_to_first_token_ms"] = time_to_first_token_ms
 
             logger.info(
                 "Query executed with Anthropic successfully",
@@ -377,3 +302,357 @@ text or markdown formatting."""
                 exc_info=True,
             )
             raise
+
+    async def _stream_message(
+        self,
+        client: AsyncAnthropic,
+        create_params: dict[str, Any],
+        query_id: str,
+        output_schema: dict[str, Any] | None,
+        assistant_prompt: str | None,
+        start_time: float,
+    ) -> tuple[Any, int | None]:
+        """Stream a message, abandoning it once it cannot be valid.
+
+        Structured responses are checked against output_schema as they
+        arrive, and the stream is closed (ending generation, and billing)
+        as soon as they provably cannot conform. Progress is reported
+        through report_query_progress after every chunk.
+
+        Returns:
+            The final message, and the milliseconds until its first text
+        """
+        validator = None
+        if output_schema:
+            validator = IncrementalJSONValidator(output_schema)
+            # The prefill is part of the JSON, as in _build_query_result
+            if assistant_prompt and assistant_prompt.strip().startswith("{"):
+                validator.feed(assistant_prompt)
+
+        time_to_first_token_ms = None
+        output_chars = 0
+        async with client.messages.stream(**create_params) as stream:
+            async for text in stream.text_stream:
+                if time_to_first_token_ms is None:
+                    time_to_first_token_ms = int((time.time() - start_time) * 1000)
+                output_chars += len(text)
+                if validator is not None:
+                    try:
+                        validator.feed(text)
+                    except StreamAbortedError as e:
+                        logger.warning(
+                            "Abandoned streamed Anthropic response",
+                            extra={
+                                "query_id": query_id,
+                                "output_chars": output_chars,
+                                "reason": str(e),
+                            },
+                        )
+                        raise
+                report_query_progress(
+                    QueryProgress(query_id, output_chars, time_to_first_token_ms)
+                )
+            message = await stream.get_final_message()
+        return message, time_to_first_token_ms
+
+    def _build_message_params(
+        self,
+        query_text: str,
+        output_schema: dict[str, Any] | None,
+        service_file_ids: list[str] | None,
+        query_metadata: dict[str, Any] | None,
+        assistant_prompt: str | None,
+    ) -> dict[str, Any]:
+        """Build the Messages API parameters for a query."""
+        # Extract configuration from query_metadata
+        metadata = query_metadata or {}
+        model = metadata.get("model", DEFAULT_MODEL)
+        max_tokens = metadata.get("max_tokens", DEFAULT_MAX_TOKENS)
+        temperature = metadata.get("temperature")
+
+        # Prepare the message content with file attachments if provided
+        content_parts: list[dict[str, Any]] = []
+
+        # Add file attachments if service_file_ids are provided
+        if service_file_ids:
+            for file_id in service_file_ids:
+                content_parts.append(
+                    {
+                        "type": "document",
+                        "source": {"type": "file", "file_id": file_id},
+                    }
+                )
+
+        # Handle schema embedding if provided
+        if output_schema:
+            # Build query with embedded schema
+            schema_json = json.dumps(output_schema, indent=2)
+            enhanced_query_text = f"""{query_text}
+
+Please structure your response according to this JSON schema:
+{schema_json}
+
+Return only valid JSON that conforms to this schema, without any surrounding
+text or markdown formatting."""
+        else:
+            enhanced_query_text = query_text
+
+        # Add the text query
+        content_parts.append({"type": "text", "text": enhanced_query_text})
+
+        # Prepare messages for the API
+        messages: list[dict[str, Any]] = [{"role": "user", "content": content_parts}]
+
+        # Add assistant message if provided to constrain response
+        if assistant_prompt:
+            messages.append({"role": "assistant", "content": assistant_prompt})
+
+        create_params: dict[str, Any] = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "messages": messages,
+        }
+
+        # Add temperature if specified
+        if temperature is not None:
+            create_params["temperature"] = temperature
+
+        return create_params
+
+    def _build_query_result(
+        self,
+        config: KnowledgeServiceConfig,
+        query_id: str,
+        query_text: str,
+        response: Any,
+        model: str,
+        output_schema: dict[str, Any] | None,
+        service_file_ids: list[str] | None,
+        assistant_prompt: str | None,
+        execution_time_ms: int | None,
+    ) -> QueryResult:
+        """Validate and parse a Messages API response into a QueryResult."""
+        # Validate response has exactly one content block of type 'text'
+        if len(response.content) != 1:
+            raise ValueError(
+                f"Expected exactly 1 content block, got {len(response.content)}"
+            )
+
+        content_block = response.content[0]
+
+        if not hasattr(content_block, "type") or content_block.type != "text":
+            block_type = getattr(content_block, "type", "unknown")
+            raise ValueError(f"Expected content block type 'text', got '{block_type}'")
+
+        if not hasattr(content_block, "text"):
+            raise ValueError("Text content block missing 'text' attribute")
+
+        response_text = str(content_block.text)
+
+        logger.debug(
+            "Single text content block validated and extracted",
+            extra={
+                "knowledge_service_id": config.knowledge_service_id,
+                "query_id": query_id,
+                "response_length": len(response_text),
+            },
+        )
+
+        # Handle JSON parsing if schema was provided
+        if output_schema:
+            # Determine the text to parse
+            if assistant_prompt and assistant_prompt.strip().startswith("{"):
+                # Concatenate assistant prompt with response for JSON parsing
+                json_text_to_parse = assistant_prompt + response_text
+            else:
+                json_text_to_parse = response_text
+
+            try:
+                response_value = json.loads(json_text_to_parse.strip())
+            except json.JSONDecodeError as e:
+                logger.error(
+                    f"Failed to parse JSON response when output schema was provided. "
+                    f"JSON text to parse: {json_text_to_parse[:500]}... "
+                    f"Parse error: {str(e)}",
+                    extra={
+                        "knowledge_service_id": config.knowledge_service_id,
+                        "query_id": query_id,
+                        "assistant_prompt": assistant_prompt,
+                        "response_text_preview": response_text[:100],
+                    },
+                )
+                raise ValueError(
+                    f"Expected valid JSON response when output schema provided, "
+                    f"but failed to parse: {str(e)}"
+                )
+        else:
+            response_value = response_text
+
+        # Structure the result with parsed or text content
+        result_data = {
+            "response": response_value,
+            "model": model,
+            "service": "anthropic",
+            "sources": service_file_ids or [],
+            "usage": {
+                "input_tokens": response.usage.input_tokens,
+                "output_tokens": response.usage.output_tokens,
+            },
+            "stop_reason": response.stop_reason,
+        }
+
+        return QueryResult(
+            query_id=query_id,
+            query_text=query_text,
+            result_data=result_data,
+            execution_time_ms=execution_time_ms,
+            created_at=datetime.now(timezone.utc),
+        )
+
+    def _build_batch_submission(self, batch: Any) -> BatchSubmission:
+        """Convert an Anthropic MessageBatch into a BatchSubmission."""
+        counts = batch.request_counts
+        completed = counts.succeeded + counts.errored + counts.canceled + counts.expired
+        return BatchSubmission(
+            batch_id=batch.id,
+            status=BatchStatus(batch.processing_status),
+            request_count=counts.processing + completed,
+            completed_count=completed,
+            created_at=batch.created_at,
+            ended_at=batch.ended_at,
+        )
+
+    def _build_batch_outcome(
+        self,
+        config: KnowledgeServiceConfig,
+        request: BatchQueryRequest,
+        entry: Any,
+    ) -> BatchQueryOutcome:
+        """Convert one Message Batch result entry into a BatchQueryOutcome."""
+        result = entry.result
+        if result.type != "succeeded":
+            error = getattr(getattr(result, "error", None), "error", None)
+            message = getattr(error, "message", None)
+            return BatchQueryOutcome(
+                custom_id=request.custom_id,
+                error=f"{result.type}: {message}" if message else result.type,
+            )
+
+        try:
+            query_result = self._build_query_result(
+                config,
+                f"anthropic_{uuid.uuid4().hex[:12]}",
+                request.query_text,
+                result.message,
+                (request.query_metadata or {}).get("model", DEFAULT_MODEL),
+                request.output_schema,
+                request.service_file_ids,
+                request.assistant_prompt,
+                None,
+            )
+        except ValueError as e:
+            return BatchQueryOutcome(custom_id=request.custom_id, error=str(e))
+        return BatchQueryOutcome(custom_id=request.custom_id, result=query_result)
+
+    async def submit_query_batch(
+        self,
+        config: KnowledgeServiceConfig,
+        requests: list[BatchQueryRequest],
+    ) -> BatchSubmission:
+        """Submit queries as one Anthropic Message Batch.
+
+        Each query becomes one batch request with exactly the message
+        parameters execute_query would send.
+
+        Args:
+            config: KnowledgeServiceConfig for this operation
+            requests: Queries to execute, identified by custom_id
+
+        Returns:
+            BatchSubmission for the created Message Batch
+        """
+        if not requests:
+            raise ValueError("A query batch needs at least one request")
+        custom_ids = [request.custom_id for request in requests]
+        if len(set(custom_ids)) != len(custom_ids):
+            raise ValueError("Batch request custom_ids must be unique")
+
+        client = self._get_client(config)
+        batch = await client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": request.custom_id,
+                    "params": self._build_message_params(  # type: ignore[typeddict-item]
+                        request.query_text,
+                        request.output_schema,
+                        request.service_file_ids,
+                        request.query_metadata,
+                        request.assistant_prompt,
+                    ),
+                }
+                for request in requests
+            ]
+        )
+
+        logger.info(
+            "Query batch submitted to Anthropic",
+            extra={
+                "knowledge_service_id": config.knowledge_service_id,
+                "batch_id": batch.id,
+                "request_count": len(requests),
+            },
+        )
+
+        return self._build_batch_submission(batch)
+
+    async def get_query_batch(
+        self, config: KnowledgeServiceConfig, batch_id: str
+    ) -> BatchSubmission:
+        """Get the status of an Anthropic Message Batch."""
+        client = self._get_client(config)
+        batch = await client.messages.batches.retrieve(batch_id)
+        return self._build_batch_submission(batch)
+
+    async def get_query_batch_results(
+        self,
+        config: KnowledgeServiceConfig,
+        batch_id: str,
+        requests: list[BatchQueryRequest],
+    ) -> BatchQueryResults:
+        """Collect the results of an ended Anthropic Message Batch.
+
+        Succeeded requests are validated and parsed as in execute_query; a
+        response that fails parsing becomes an error outcome rather than
+        failing the whole batch.
+        """
+        client = self._get_client(config)
+        batch = await client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != BatchStatus.ENDED.value:
+            raise ValueError(
+                f"Batch {batch_id} has not ended "
+                f"(status: {batch.processing_status})"
+            )
+
+        requests_by_id = {request.custom_id: request for request in requests}
+        outcomes = []
+        async for entry in await client.messages.batches.results(batch_id):
+            request = requests_by_id.get(entry.custom_id)
+            if request is None:
+                logger.warning(
+                    "Ignoring batch result for unknown request",
+                    extra={"batch_id": batch_id, "custom_id": entry.custom_id},
+                )
+                continue
+            outcomes.append(self._build_batch_outcome(config, request, entry))
+
+        logger.info(
+            "Query batch results collected from Anthropic",
+            extra={
+                "knowledge_service_id": config.knowledge_service_id,
+                "batch_id": batch_id,
+                "outcome_count": len(outcomes),
+                "error_count": sum(1 for o in outcomes if o.error is not None),
+            },
+        )
+
+        return BatchQueryResults(batch_id=batch_id, outcomes=outcomes)
@@ -26,6 +26,14 @@ from julee.services.knowledge_service.anthropic import (
 from julee.services.knowledge_service.anthropic import (
     knowledge_service as anthropic_ks_module,
 )
+from julee.services.knowledge_service.knowledge_service import (
+    BatchQueryRequest,
+    BatchStatus,
+)
+from julee.services.knowledge_service.streaming import (
+    StreamAbortedError,
+    listen_to_query_progress,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -462,3 +470,227 @@ class TestAnthropicKnowledgeService:
                     output_schema=output_schema,
                     assistant_prompt=assistant_prompt,
                 )
+
+
+def _streaming_client(*chunks: str) -> MagicMock:
+    """Create a mock Anthropic client whose messages stream the chunks."""
+    sent: list[str] = []
+
+    async def text_stream():
+        for chunk in chunks:
+            sent.append(chunk)
+            yield chunk
+
+    async def final_message() -> MagicMock:
+        message = MagicMock()
+        message.content = [MagicMock(type="text", text="".join(sent))]
+        message.usage.input_tokens = 100
+        message.usage.output_tokens = len(sent)
+        message.stop_reason = "end_turn"
+        return message
+
+    stream = MagicMock()
+    stream.text_stream = text_stream()
+    stream.get_final_message = final_message
+    manager = MagicMock()
+    manager.__aenter__ = AsyncMock(return_value=stream)
+    manager.__aexit__ = AsyncMock(return_value=False)
+
+    client = MagicMock()
+    client.messages.stream = MagicMock(return_value=manager)
+    client.sent = sent
+    return client
+
+
+class TestAnthropicKnowledgeServiceStreaming:
+    """Test cases for streamed query execution."""
+
+    OUTPUT_SCHEMA = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "age": {"type": "number"}},
+        "additionalProperties": False,
+    }
+
+    async def _execute(self, config, client, **kwargs):
+        with (
+            patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}),
+            patch.object(anthropic_ks_module, "AsyncAnthropic", return_value=client),
+        ):
+            return await anthropic_ks.AnthropicKnowledgeService().execute_query(
+                config,
+                "What is the person's data?",
+                output_schema=self.OUTPUT_SCHEMA,
+                query_metadata={"stream": True},
+                **kwargs,
+            )
+
+    async def test_streamed_response_is_parsed(
+        self, knowledge_service_config: KnowledgeServiceConfig
+    ) -> None:
+        client = _streaming_client('"name": "Jo', 'hn", "age"', ": 30}")
+        progress = []
+
+        with listen_to_query_progress(progress.append):
+            result = await self._execute(
+                knowledge_service_config, client, assistant_prompt="{"
+            )
+
+        assert result.result_data["response"] == {"name": "John", "age": 30}
+        assert result.result_data["time_to_first_token_ms"] >= 0
+        assert [p.output_chars for p in progress] == [11, 21, 26]
+        assert "stream" not in client.messages.stream.call_args.kwargs
+        client.messages.create.assert_not_called()
+
+    async def test_invalid_response_is_abandoned_early(
+        self, knowledge_service_config: KnowledgeServiceConfig
+    ) -> None:
+        """Streaming stops at the first chunk that cannot be valid."""
+        client = _streaming_client(
+            '{"name": "John", ', '"address": "', "1 Main St", '"}'
+        )
+
+        with pytest.raises(StreamAbortedError, match="Property not allowed"):
+            await self._execute(knowledge_service_config, client)
+
+        assert client.sent == ['{"name": "John", ', '"address": "']
+        client.messages.stream.return_value.__aexit__.assert_awaited_once()
+
+
+def _message_batch(status: str, processing: int, succeeded: int = 0) -> MagicMock:
+    """Create a mock Anthropic MessageBatch."""
+    batch = MagicMock()
+    batch.id = "msgbatch_123"
+    batch.processing_status = status
+    batch.request_counts = MagicMock(
+        processing=processing, succeeded=succeeded, errored=0, canceled=0, expired=0
+    )
+    batch.created_at = datetime.now(timezone.utc)
+    batch.ended_at = datetime.now(timezone.utc) if status == "ended" else None
+    return batch
+
+
+def _succeeded(custom_id: str, text: str) -> MagicMock:
+    """Create a mock succeeded batch result entry."""
+    entry = MagicMock()
+    entry.custom_id = custom_id
+    entry.result.type = "succeeded"
+    block = MagicMock(type="text", text=text)
+    entry.result.message.content = [block]
+    entry.result.message.usage.input_tokens = 10
+    entry.result.message.usage.output_tokens = 5
+    entry.result.message.stop_reason = "end_turn"
+    return entry
+
+
+async def _entries(*entries: MagicMock):
+    for entry in entries:
+        yield entry
+
+
+class TestAnthropicKnowledgeServiceBatches:
+    """Test cases for AnthropicKnowledgeService query batches."""
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
+    async def test_submit_query_batch_uses_query_message_params(
+        self, knowledge_service_config: KnowledgeServiceConfig
+    ) -> None:
+        """Batch requests carry the same parameters as execute_query."""
+        mock_client = MagicMock()
+        mock_client.messages.batches.create = AsyncMock(
+            return_value=_message_batch("in_progress", processing=2)
+        )
+        service = anthropic_ks.AnthropicKnowledgeService()
+        requests = [
+            BatchQueryRequest(
+                custom_id="q-1",
+                query_text="Title?",
+                output_schema={"type": "string"},
+                service_file_ids=["file_1"],
+                query_metadata={"temperature": 0.2},
+                assistant_prompt="{",
+            ),
+            BatchQueryRequest(custom_id="q-2", query_text="Summary?"),
+        ]
+
+        with patch.object(service, "_get_client", return_value=mock_client):
+            submission = await service.submit_query_batch(
+                knowledge_service_config, requests
+            )
+
+        assert submission.batch_id == "msgbatch_123"
+        assert submission.status == BatchStatus.IN_PROGRESS
+        assert (submission.request_count, submission.completed_count) == (2, 0)
+
+        sent = mock_client.messages.batches.create.call_args[1]["requests"]
+        assert [r["custom_id"] for r in sent] == ["q-1", "q-2"]
+        expected = service._build_message_params(
+            "Title?", {"type": "string"}, ["file_1"], {"temperature": 0.2}, "{"
+        )
+        assert sent[0]["params"] == expected
+        assert sent[0]["params"]["temperature"] == 0.2
+        assert sent[1]["params"]["model"] == anthropic_ks_module.DEFAULT_MODEL
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
+    async def test_get_query_batch_results_parses_each_outcome(
+        self, knowledge_service_config: KnowledgeServiceConfig
+    ) -> None:
+        """Results are parsed like execute_query; failures become errors."""
+        errored = MagicMock()
+        errored.custom_id = "q-3"
+        errored.result.type = "errored"
+        errored.result.error.error.message = "Overloaded"
+
+        mock_client = MagicMock()
+        mock_client.messages.batches.retrieve = AsyncMock(
+            return_value=_message_batch("ended", processing=0, succeeded=3)
+        )
+        mock_client.messages.batches.results = AsyncMock(
+            return_value=_entries(
+                _succeeded("q-1", '"title": "Report"}'),
+                _succeeded("q-2", "not json"),
+                errored,
+            )
+        )
+        schema = {"type": "object"}
+        requests = [
+            BatchQueryRequest(
+                custom_id="q-1",
+                query_text="Title?",
+                output_schema=schema,
+                assistant_prompt="{",
+            ),
+            BatchQueryRequest(
+                custom_id="q-2", query_text="Body?", output_schema=schema
+            ),
+            BatchQueryRequest(custom_id="q-3", query_text="Tags?"),
+        ]
+        service = anthropic_ks.AnthropicKnowledgeService()
+
+        with patch.object(service, "_get_client", return_value=mock_client):
+            results = await service.get_query_batch_results(
+                knowledge_service_config, "msgbatch_123", requests
+            )
+
+        outcomes = results.by_custom_id()
+        assert outcomes["q-1"].result is not None
+        assert outcomes["q-1"].result.result_data["response"] == {"title": "Report"}
+        assert outcomes["q-1"].result.query_text == "Title?"
+        assert "Expected valid JSON" in (outcomes["q-2"].error or "")
+        assert outcomes["q-3"].error == "errored: Overloaded"
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
+    async def test_get_query_batch_results_requires_ended_batch(
+        self, knowledge_service_config: KnowledgeServiceConfig
+    ) -> None:
+        """Results cannot be collected while the batch is processing."""
+        mock_client = MagicMock()
+        mock_client.messages.batches.retrieve = AsyncMock(
+            return_value=_message_batch("in_progress", processing=1)
+        )
+        service = anthropic_ks.AnthropicKnowledgeService()
+
+        with patch.object(service, "_get_client", return_value=mock_client):
+            with pytest.raises(ValueError, match="has not ended"):
+                await service.get_query_batch_results(
+                    knowledge_service_config, "msgbatch_123", []
+                )
@@ -5,7 +5,9 @@ This module provides the factory function for creating configured
 KnowledgeService instances based on the service API configuration.
 """
 
+import json
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from julee.contrib.ceap.domain.models.document import Document
@@ -14,17 +16,23 @@ from julee.contrib.ceap.domain.models.knowledge_service_config import (
     ServiceApi,
 )
 from julee.services.knowledge_service import (
+    BatchQueryRequest,
+    BatchQueryResults,
+    BatchSubmission,
     FileRegistrationResult,
     QueryResult,
 )
 
 from .anthropic import AnthropicKnowledgeService
-from .knowledge_service import KnowledgeService
+from .hedging import QueryHedgerRegistry
+from .knowledge_service import BatchKnowledgeService, KnowledgeService
+from .openai_compatible import OpenAICompatibleKnowledgeService
+from .rate_limiter import RateLimiterRegistry
 
 logger = logging.getLogger(__name__)
 
 
-class ConfigurableKnowledgeService(KnowledgeService):
+class ConfigurableKnowledgeService(BatchKnowledgeService):
     """
     KnowledgeService implementation that uses the factory pattern.
 
@@ -33,15 +41,33 @@ class ConfigurableKnowledgeService(KnowledgeService):
     decorators while maintaining proper protocol compliance.
 
     No constructor configuration is required - the factory is called
-    within each method using the provided config parameter.
+    within each method using the provided config parameter. Query batch
+    methods raise ValueError for services without batch support.
+
+    File registrations and queries go through a rate limiter per knowledge
+    service, shared by every call made through this instance, so one
+    instance per worker keeps the whole worker within each service's
+    budgets. Queries to services with a hedging policy are hedged based on
+    the latencies observed by this instance; hedges are rate limited like
+    any other query.
     """
 
+    def __init__(
+        self,
+        rate_limiters: RateLimiterRegistry | None = None,
+        hedgers: QueryHedgerRegistry | None = None,
+    ) -> None:
+        self.rate_limiters = rate_limiters or RateLimiterRegistry()
+        self.hedgers = hedgers or QueryHedgerRegistry()
+
     async def register_file(
         self, config: KnowledgeServiceConfig, document: Document
     ) -> FileRegistrationResult:
         """Register a document with the knowledge service."""
         service = knowledge_service_factory(config)
-        return await service.register_file(config, document)
+        return await self.rate_limiters.get(config).call(
+            lambda: service.register_file(config, document)
+        )
 
     async def execute_query(
         self,
@@ -54,14 +80,91 @@ class ConfigurableKnowledgeService(KnowledgeService):
     ) -> QueryResult:
         """Execute a query against the knowledge service."""
         service = knowledge_service_factory(config)
-        return await service.execute_query(
-            config=config,
-            query_text=query_text,
-            output_schema=output_schema,
-            service_file_ids=service_file_ids,
-            query_metadata=query_metadata,
-            assistant_prompt=assistant_prompt,
+        limiter = self.rate_limiters.get(config)
+        estimated_tokens = _estimate_prompt_tokens(query_text, output_schema)
+
+        def query() -> Awaitable[QueryResult]:
+            return service.execute_query(
+                config=config,
+                query_text=query_text,
+                output_schema=output_schema,
+                service_file_ids=service_file_ids,
+                query_metadata=query_metadata,
+                assistant_prompt=assistant_prompt,
+            )
+
+        def admit(
+            call: Callable[[], Awaitable[QueryResult]],
+        ) -> Awaitable[QueryResult]:
+            return limiter.call(
+                call, estimated_tokens=estimated_tokens, tokens_used=_reported_tokens
+            )
+
+        # The hedger times calls from their admission by the limiter, so
+        # queueing and throttle backoffs neither count as service latency
+        # nor trigger hedges
+        hedger = self.hedgers.get(config.knowledge_service_id)
+        return await hedger.run(config.hedging, query, admit)
+
+    async def submit_query_batch(
+        self,
+        config: KnowledgeServiceConfig,
+        requests: list[BatchQueryRequest],
+    ) -> BatchSubmission:
+        """Submit a batch of queries to the knowledge service."""
+        service = _batch_knowledge_service(config)
+        return await service.submit_query_batch(config, requests)
+
+    async def get_query_batch(
+        self, config: KnowledgeServiceConfig, batch_id: str
+    ) -> BatchSubmission:
+        """Get the status of a query batch."""
+        service = _batch_knowledge_service(config)
+        return await service.get_query_batch(config, batch_id)
+
+    async def get_query_batch_results(
+        self,
+        config: KnowledgeServiceConfig,
+        batch_id: str,
+        requests: list[BatchQueryRequest],
+    ) -> BatchQueryResults:
+        """Collect the outcomes of an ended query batch."""
+        service = _batch_knowledge_service(config)
+        return await service.get_query_batch_results(config, batch_id, requests)
+
+
+def _estimate_prompt_tokens(
+    query_text: str, output_schema: dict[str, Any] | None
+) -> int:
+    """Rough token count of a query prompt, reserved before it is sent.
+
+    Attached files and the response are not known in advance; they are
+    charged once the response reports its usage.
+    """
+    characters = len(query_text) + (
+        len(json.dumps(output_schema)) if output_schema else 0
+    )
+    return characters // 4
+
+
+def _reported_tokens(result: QueryResult) -> int | None:
+    """Input plus output tokens reported in a query result's usage."""
+    usage = result.result_data.get("usage")
+    if not isinstance(usage, dict):
+        return None
+    return int(usage.get("input_tokens", 0)) + int(usage.get("output_tokens", 0))
+
+
+def _batch_knowledge_service(
+    config: KnowledgeServiceConfig,
+) -> BatchKnowledgeService:
+    """Create the configured service, requiring query batch support."""
+    service = knowledge_service_factory(config)
+    if not isinstance(service, BatchKnowledgeService):
+        raise ValueError(
+            f"Service API {config.service_api.value} does not support " f"query batches"
         )
+    return service
 
 
 def knowledge_service_factory(
@@ -111,6 +214,8 @@ def knowledge_service_factory(
     service: KnowledgeService
     if knowledge_service_config.service_api == ServiceApi.ANTHROPIC:
         service = AnthropicKnowledgeService()
+    elif knowledge_service_config.service_api == ServiceApi.OPENAI_COMPATIBLE:
+        service = OpenAICompatibleKnowledgeService()
     else:
         raise ValueError(
             f"Unsupported service API: {knowledge_service_config.service_api}"
@@ -0,0 +1,206 @@
+"""
+Hedged execution of knowledge service queries.
+
+LLM latency has a long tail, and an assembly waits for its slowest query.
+For knowledge services configured with a HedgingPolicy, a query that has
+not returned by the service's recent latency percentile is sent again; the
+first copy to return a valid result wins and the other is cancelled.
+Latencies are tracked per service, and hedges are drawn from a budget that
+grows with the number of queries, bounding the extra spend to a fraction
+of the traffic.
+
+Calls admitted through a rate limiter are timed from admission, and hedged
+only once admitted: time spent queueing says nothing about the service's
+latency, and a query still waiting to be sent gains nothing from a copy.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from julee.contrib.ceap.domain.models.knowledge_service_config import (
+    HedgingPolicy,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Wraps a call to admit it, e.g. through a rate limiter
+Admission = Callable[[Callable[[], Awaitable[T]]], Awaitable[T]]
+
+# Latency observations kept per knowledge service
+LATENCY_WINDOW = 500
+
+# Most hedges that can be saved up during a run of fast queries
+MAX_HEDGE_CREDIT = 10.0
+
+
+class LatencyHistogram:
+    """Latencies of the most recent calls to one service."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> float | None:
+        """Nearest-rank percentile of the recorded latencies."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+        return ordered[index]
+
+
+class QueryHedger:
+    """Runs calls to one knowledge service, hedging the slow ones."""
+
+    def __init__(
+        self,
+        name: str,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.latencies = LatencyHistogram()
+        self.hedged_count = 0
+        self._clock = clock
+        self._credit = 0.0
+
+    async def run(
+        self,
+        policy: HedgingPolicy | None,
+        operation: Callable[[], Awaitable[T]],
+        admit: Admission[T] | None = None,
+    ) -> T:
+        """Run an operation, sending a duplicate if it is slow.
+
+        Args:
+            policy: Hedging policy; None runs the operation once
+            operation: Zero-argument coroutine function making one call
+            admit: Optional admission of each copy of the call, such as a
+                rate limiter's call; latency is measured, and the hedge
+                delay counted, from when the primary is admitted
+
+        Returns:
+            The result of the first copy of the operation to succeed
+
+        Raises:
+            Exception: The primary call's error if no copy succeeded
+        """
+        if policy is None:
+            return await self._attempt(operation, admit, asyncio.Event())
+
+        self._credit = min(MAX_HEDGE_CREDIT, self._credit + policy.max_hedge_fraction)
+        delay = self._hedge_delay(policy)
+        admitted = asyncio.Event()
+        primary = asyncio.create_task(self._attempt(operation, admit, admitted))
+        try:
+            if delay is not None:
+                await self._wait_for_admission(primary, admitted)
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done and self._credit >= 1.0:
+                    self._credit -= 1.0
+                    self.hedged_count += 1
+                    logger.info(
+                        "Hedging slow knowledge service query",
+                        extra={
+                            "knowledge_service_id": self.name,
+                            "delay_seconds": delay,
+                        },
+                    )
+                    hedge = asyncio.create_task(
+                        self._attempt(operation, admit, asyncio.Event())
+                    )
+                    return await self._first_success(primary, hedge)
+            return await primary
+        finally:
+            # Do not leave the call running if the caller was cancelled
+            if not primary.done():
+                primary.cancel()
+
+    def _hedge_delay(self, policy: HedgingPolicy) -> float | None:
+        """Seconds after which to hedge, or None to never hedge."""
+        if len(self.latencies) < policy.min_samples:
+            return None
+        latency = self.latencies.percentile(policy.latency_percentile)
+        if latency is None:
+            return None
+        return max(policy.min_delay_seconds, latency)
+
+    async def _attempt(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        admit: Admission[T] | None,
+        admitted: asyncio.Event,
+    ) -> T:
+        """One copy of the call, timed from its admission."""
+
+        async def timed() -> T:
+            admitted.set()
+            started = self._clock()
+            result = await operation()
+            self.latencies.record(self._clock() - started)
+            return result
+
+        if admit is None:
+            return await timed()
+        return await admit(timed)
+
+    @staticmethod
+    async def _wait_for_admission(
+        primary: "asyncio.Task[T]", admitted: asyncio.Event
+    ) -> None:
+        """Wait until the primary is admitted, or has finished without it."""
+        admission = asyncio.create_task(admitted.wait())
+        try:
+            await asyncio.wait(
+                {primary, admission}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            admission.cancel()
+
+    async def _first_success(
+        self, primary: "asyncio.Task[T]", hedge: "asyncio.Task[T]"
+    ) -> T:
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Prefer the primary when both finish together
+                for task in sorted(done, key=lambda t: t is not primary):
+                    if not task.cancelled() and task.exception() is None:
+                        return task.result()
+            # Neither copy succeeded: report the primary's failure
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+class QueryHedgerRegistry:
+    """Shared query hedgers, one per knowledge service."""
+
+    def __init__(self) -> None:
+        self._hedgers: dict[str, QueryHedger] = {}
+
+    def get(self, knowledge_service_id: str) -> QueryHedger:
+        """Return the hedger for a knowledge service, creating it if needed."""
+        hedger = self._hedgers.get(knowledge_service_id)
+        if hedger is None:
+            hedger = self._hedgers[knowledge_service_id] = QueryHedger(
+                knowledge_service_id
+            )
+        return hedger
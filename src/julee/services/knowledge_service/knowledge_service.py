@@ -12,6 +12,7 @@ services (Anthropic, OpenAI, etc.) and are created via factory functions.
 """
 
 from datetime import datetime, timezone
+from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -63,6 +64,70 @@ class FileRegistrationResult(BaseModel):
     )
 
 
+class BatchQueryRequest(BaseModel):
+    """One query in a batch, with the same parameters as execute_query."""
+
+    custom_id: str = Field(
+        pattern=r"^[a-zA-Z0-9_-]{1,64}$",
+        description="Caller-chosen identifier used to match the query's outcome",
+    )
+    query_text: str
+    output_schema: dict[str, Any] | None = None
+    service_file_ids: list[str] | None = None
+    query_metadata: dict[str, Any] | None = None
+    assistant_prompt: str | None = None
+
+
+class BatchStatus(str, Enum):
+    """Processing status of a query batch."""
+
+    IN_PROGRESS = "in_progress"
+    CANCELING = "canceling"
+    ENDED = "ended"
+
+
+class BatchSubmission(BaseModel):
+    """State of a query batch submitted to a knowledge service."""
+
+    batch_id: str = Field(description="Identifier assigned by the service")
+    status: BatchStatus
+    request_count: int = Field(default=0, description="Number of queries in the batch")
+    completed_count: int = Field(
+        default=0,
+        description="Number of queries that have finished, successfully or not",
+    )
+    created_at: datetime | None = Field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    ended_at: datetime | None = None
+
+    @property
+    def is_ended(self) -> bool:
+        """Whether every query in the batch has finished."""
+        return self.status == BatchStatus.ENDED
+
+
+class BatchQueryOutcome(BaseModel):
+    """Outcome of one query in a batch: a result or an error."""
+
+    custom_id: str
+    result: QueryResult | None = None
+    error: str | None = Field(
+        default=None, description="Why the query produced no result"
+    )
+
+
+class BatchQueryResults(BaseModel):
+    """Outcomes of every query in an ended batch."""
+
+    batch_id: str
+    outcomes: list[BatchQueryOutcome] = Field(default_factory=list)
+
+    def by_custom_id(self) -> dict[str, BatchQueryOutcome]:
+        """Outcomes keyed by the custom_id of their request."""
+        return {outcome.custom_id: outcome for outcome in self.outcomes}
+
+
 @runtime_checkable
 class KnowledgeService(Protocol):
     """
@@ -167,3 +232,82 @@ class KnowledgeService(Protocol):
 
         """
         ...
+
+
+@runtime_checkable
+class BatchKnowledgeService(KnowledgeService, Protocol):
+    """
+    KnowledgeService that can also execute queries asynchronously in bulk.
+
+    Batches trade latency for throughput and cost: queries are submitted
+    together, processed by the service in its own time (typically minutes,
+    up to a day) outside the interactive rate limits, and their results are
+    collected once the whole batch has ended. Use it for offline work such as
+    re-assembling a corpus, not for interactive requests.
+    """
+
+    async def submit_query_batch(
+        self,
+        config: "KnowledgeServiceConfig",
+        requests: list[BatchQueryRequest],
+    ) -> BatchSubmission:
+        """Submit queries for asynchronous execution as one batch.
+
+        Args:
+            config: KnowledgeServiceConfig for the service to use
+            requests: Queries to execute; custom_ids must be unique within
+                     the batch
+
+        Returns:
+            BatchSubmission identifying the batch and its initial status
+
+        .. rubric:: Workflow Context
+
+        In Temporal workflows this is an activity. It is not idempotent: a
+        retry after the service accepted the batch submits a second batch,
+        so the activity is attempted only once.
+
+        """
+        ...
+
+    async def get_query_batch(
+        self, config: "KnowledgeServiceConfig", batch_id: str
+    ) -> BatchSubmission:
+        """Get the current status of a submitted batch.
+
+        Args:
+            config: KnowledgeServiceConfig for the service to use
+            batch_id: Identifier returned by submit_query_batch
+
+        Returns:
+            BatchSubmission with the batch's current status and progress
+
+        """
+        ...
+
+    async def get_query_batch_results(
+        self,
+        config: "KnowledgeServiceConfig",
+        batch_id: str,
+        requests: list[BatchQueryRequest],
+    ) -> BatchQueryResults:
+        """Collect the outcomes of an ended batch.
+
+        Args:
+            config: KnowledgeServiceConfig for the service to use
+            batch_id: Identifier of a batch whose status is ENDED
+            requests: The requests the batch was submitted with; services
+                     do not return them with the results, and they are
+                     needed to parse each response as execute_query would
+
+        Returns:
+            BatchQueryResults with one outcome per submitted query. Queries
+            that failed, expired or were canceled have an error instead of a
+            result; results are parsed exactly as execute_query would parse
+            them.
+
+        Raises:
+            ValueError: If the batch has not ended yet
+
+        """
+        ...
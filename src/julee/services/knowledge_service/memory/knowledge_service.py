@@ -19,21 +19,28 @@ from julee.contrib.ceap.domain.models.knowledge_service_config import (
 )
 
 from ..knowledge_service import (
+    BatchKnowledgeService,
+    BatchQueryOutcome,
+    BatchQueryRequest,
+    BatchQueryResults,
+    BatchStatus,
+    BatchSubmission,
     FileRegistrationResult,
-    KnowledgeService,
     QueryResult,
 )
 
 logger = logging.getLogger(__name__)
 
 
-class MemoryKnowledgeService(KnowledgeService):
+class MemoryKnowledgeService(BatchKnowledgeService):
     """
     In-memory implementation of the KnowledgeService protocol.
 
     This class stores file registrations in memory using a dictionary
     keyed by knowledge_service_file_id. Query results are returned from
-    a configurable queue of canned responses.
+    a configurable queue of canned responses. Query batches are executed
+    against the same queue as soon as they are submitted, so they have
+    always ended by the time their status is checked.
 
     Useful for testing and development scenarios where you want to avoid
     external service dependencies while still exercising the full
@@ -66,6 +73,9 @@ class MemoryKnowledgeService(KnowledgeService):
         # Queue of canned query results to return
         self._canned_query_results: deque[QueryResult] = deque()
 
+        # Submitted query batches and their outcomes, keyed by batch_id
+        self._batches: dict[str, tuple[BatchSubmission, list[BatchQueryOutcome]]] = {}
+
     def add_canned_query_result(self, query_result: QueryResult) -> None:
         """Add a canned query result to be returned by execute_query.
 
@@ -301,3 +311,101 @@ text or markdown formatting."""
         )
 
         return updated_result
+
+    async def submit_query_batch(
+        self,
+        config: KnowledgeServiceConfig,
+        requests: list[BatchQueryRequest],
+    ) -> BatchSubmission:
+        """Execute a batch of queries immediately against the canned results.
+
+        Queries for which no canned result is available get an error
+        outcome, as an errored request would in a real batch.
+
+        Args:
+            config: KnowledgeServiceConfig for this operation
+            requests: Queries to execute, identified by custom_id
+
+        Returns:
+            BatchSubmission for a batch that has already ended
+        """
+        if not requests:
+            raise ValueError("A query batch needs at least one request")
+        custom_ids = [request.custom_id for request in requests]
+        if len(set(custom_ids)) != len(custom_ids):
+            raise ValueError("Batch request custom_ids must be unique")
+
+        outcomes = []
+        for request in requests:
+            try:
+                result = await self.execute_query(
+                    config,
+                    request.query_text,
+                    request.output_schema,
+                    request.service_file_ids,
+                    request.query_metadata,
+                    request.assistant_prompt,
+                )
+            except ValueError as e:
+                outcomes.append(
+                    BatchQueryOutcome(custom_id=request.custom_id, error=str(e))
+                )
+            else:
+                outcomes.append(
+                    BatchQueryOutcome(custom_id=request.custom_id, result=result)
+                )
+
+        now = datetime.now(timezone.utc)
+        batch_id = f"memory_batch_{len(self._batches) + 1}"
+        submission = BatchSubmission(
+            batch_id=batch_id,
+            status=BatchStatus.ENDED,
+            request_count=len(requests),
+            completed_count=len(requests),
+            created_at=now,
+            ended_at=now,
+        )
+        self._batches[batch_id] = (submission, outcomes)
+
+        logger.info(
+            "Query batch executed with MemoryKnowledgeService",
+            extra={
+                "knowledge_service_id": config.knowledge_service_id,
+                "batch_id": batch_id,
+                "request_count": len(requests),
+            },
+        )
+
+        return submission
+
+    async def get_query_batch(
+        self, config: KnowledgeServiceConfig, batch_id: str
+    ) -> BatchSubmission:
+        """Get a submitted batch.
+
+        Raises:
+            ValueError: If no batch with this ID was submitted
+        """
+        return self._get_batch(batch_id)[0]
+
+    async def get_query_batch_results(
+        self,
+        config: KnowledgeServiceConfig,
+        batch_id: str,
+        requests: list[BatchQueryRequest],
+    ) -> BatchQueryResults:
+        """Get the outcomes of a submitted batch.
+
+        Raises:
+            ValueError: If no batch with this ID was submitted
+        """
+        outcomes = self._get_batch(batch_id)[1]
+        return BatchQueryResults(batch_id=batch_id, outcomes=list(outcomes))
+
+    def _get_batch(
+        self, batch_id: str
+    ) -> tuple[BatchSubmission, list[BatchQueryOutcome]]:
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            raise ValueError(f"Unknown query batch: {batch_id}")
+        return batch
@@ -20,7 +20,7 @@ from julee.contrib.ceap.domain.models.knowledge_service_config import (
     ServiceApi,
 )
 
-from ..knowledge_service import QueryResult
+from ..knowledge_service import BatchQueryRequest, BatchStatus, QueryResult
 from .knowledge_service import MemoryKnowledgeService
 
 pytestmark = pytest.mark.unit
@@ -348,3 +348,62 @@ class TestMemoryKnowledgeService:
         assert service.config == knowledge_service_config
         assert service._registered_files == {}
         assert len(service._canned_query_results) == 0
+
+
+class TestMemoryKnowledgeServiceBatches:
+    """Test cases for MemoryKnowledgeService query batches."""
+
+    async def test_batch_ends_immediately_with_outcomes(
+        self,
+        memory_service: MemoryKnowledgeService,
+        sample_query_result: QueryResult,
+        knowledge_service_config: KnowledgeServiceConfig,
+    ) -> None:
+        """Batches consume canned results in order and end on submission."""
+        memory_service.add_canned_query_result(sample_query_result)
+        requests = [
+            BatchQueryRequest(custom_id="q-1", query_text="First?"),
+            BatchQueryRequest(custom_id="q-2", query_text="Second?"),
+        ]
+
+        submission = await memory_service.submit_query_batch(
+            knowledge_service_config, requests
+        )
+        status = await memory_service.get_query_batch(
+            knowledge_service_config, submission.batch_id
+        )
+        results = await memory_service.get_query_batch_results(
+            knowledge_service_config, submission.batch_id, requests
+        )
+
+        assert status.status == BatchStatus.ENDED
+        assert status.is_ended
+        assert (status.request_count, status.completed_count) == (2, 2)
+        outcomes = results.by_custom_id()
+        assert outcomes["q-1"].result is not None
+        assert outcomes["q-1"].result.query_text == "First?"
+        assert outcomes["q-2"].result is None
+        assert "No canned query results" in (outcomes["q-2"].error or "")
+
+    async def test_batch_rejects_duplicate_custom_ids(
+        self,
+        memory_service: MemoryKnowledgeService,
+        knowledge_service_config: KnowledgeServiceConfig,
+    ) -> None:
+        """custom_ids must identify requests uniquely within a batch."""
+        requests = [
+            BatchQueryRequest(custom_id="q-1", query_text="First?"),
+            BatchQueryRequest(custom_id="q-1", query_text="Again?"),
+        ]
+
+        with pytest.raises(ValueError, match="unique"):
+            await memory_service.submit_query_batch(knowledge_service_config, requests)
+
+    async def test_unknown_batch_raises_error(
+        self,
+        memory_service: MemoryKnowledgeService,
+        knowledge_service_config: KnowledgeServiceConfig,
+    ) -> None:
+        """Looking up a batch that was never submitted fails."""
+        with pytest.raises(ValueError, match="Unknown query batch"):
+            await memory_service.get_query_batch(knowledge_service_config, "nope")
@@ -0,0 +1,17 @@
+"""
+OpenAI-compatible service implementations for julee domain.
+
+This module exports the implementation of the KnowledgeService protocol
+for servers that speak the OpenAI-compatible chat completions protocol,
+such as local llama.cpp or vLLM inference servers.
+"""
+
+from .knowledge_service import (
+    OpenAICompatibleAPIError,
+    OpenAICompatibleKnowledgeService,
+)
+
+__all__ = [
+    "OpenAICompatibleAPIError",
+    "OpenAICompatibleKnowledgeService",
+]
@@ -0,0 +1,406 @@
+"""
+OpenAI-compatible implementation of KnowledgeService for the Capture,
+Extract, Assemble, Publish workflow.
+
+This module provides a KnowledgeService that speaks the OpenAI-compatible
+chat completions protocol, as served by local inference servers such as
+llama.cpp's server and vLLM, so that simple, high-volume extractions can
+run on local hardware instead of a remote API.
+
+Such servers have no files API, so file registration is emulated: the
+text of a registered document is kept in a local file store under an ID
+derived from its content multihash, and quoted into the prompt of every
+query that names that ID. Structured queries ask the server to constrain
+its output to the schema through response_format.
+
+Requests to one server share a pooled HTTP client per event loop, so
+consecutive queries reuse their connections.
+
+Configuration:
+    - OPENAI_COMPATIBLE_BASE_URL: API base URL, including the version path
+      (default http://localhost:8080/v1)
+    - OPENAI_COMPATIBLE_API_KEY: Optional bearer token
+    - OPENAI_COMPATIBLE_MODEL: Model to use when a query names none
+    - OPENAI_COMPATIBLE_FILE_DIR: Directory for registered document text;
+      workers that share registrations must share this directory
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+import weakref
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from julee.contrib.ceap.domain.models.document import Document
+from julee.contrib.ceap.domain.models.document.segmentation import is_segmentable
+from julee.contrib.ceap.domain.models.knowledge_service_config import (
+    KnowledgeServiceConfig,
+)
+
+from ..knowledge_service import (
+    FileRegistrationResult,
+    KnowledgeService,
+    QueryResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default configuration constants
+DEFAULT_BASE_URL = "http://localhost:8080/v1"
+DEFAULT_MODEL = "default"
+DEFAULT_MAX_TOKENS = 4000
+
+# Local inference on CPU can take minutes for one long answer; the
+# activity's own timeout bounds the query as a whole
+REQUEST_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+POOL_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+
+FILE_ID_PREFIX = "local-file-"
+
+# Finish reasons with an Anthropic stop reason of their own: truncated
+# answers must read as truncated wherever they are checked
+STOP_REASONS = {"stop": "end_turn", "length": "max_tokens"}
+
+# Pooled clients by event loop, then by (base URL, API key): httpx clients
+# cannot be shared across event loops
+_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str | None], httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
+
+class OpenAICompatibleAPIError(RuntimeError):
+    """An OpenAI-compatible server answered a request with an error.
+
+    Carries the status code and response, so that the knowledge service
+    rate limiter recognizes throttling and honours Retry-After.
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        self.response = response
+        self.status_code = response.status_code
+        super().__init__(
+            f"OpenAI-compatible server returned {response.status_code}: "
+            f"{response.text[:500]}"
+        )
+
+
+def _pooled_client(base_url: str, api_key: str | None) -> httpx.AsyncClient:
+    """The shared HTTP client for a server in the running event loop."""
+    clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get((base_url, api_key))
+    if client is None or client.is_closed:
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=REQUEST_TIMEOUT,
+            limits=POOL_LIMITS,
+        )
+        clients[(base_url, api_key)] = client
+    return client
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a markdown code fence wrapped around a whole response."""
+    stripped = text.strip()
+    if stripped.startswith("```") and stripped.endswith("```"):
+        first_line_end = stripped.find("\n")
+        if first_line_end != -1:
+            return stripped[first_line_end + 1 : -3].strip()
+    return stripped
+
+
+class OpenAICompatibleKnowledgeService(KnowledgeService):
+    """
+    OpenAI-compatible implementation of the KnowledgeService protocol.
+
+    Queries are sent to the chat completions endpoint of the configured
+    server, with the text of registered documents quoted in the prompt.
+    Query batches are not supported.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the service from the environment.
+
+        Configuration is read per instance, and instances are cheap: HTTP
+        connections are pooled across instances.
+        """
+        self.base_url = os.environ.get(
+            "OPENAI_COMPATIBLE_BASE_URL", DEFAULT_BASE_URL
+        ).rstrip("/")
+        self.api_key = os.environ.get("OPENAI_COMPATIBLE_API_KEY") or None
+        self.default_model = os.environ.get("OPENAI_COMPATIBLE_MODEL", DEFAULT_MODEL)
+        self.file_dir = Path(
+            os.environ.get("OPENAI_COMPATIBLE_FILE_DIR")
+            or Path(tempfile.gettempdir()) / "julee-knowledge-service-files"
+        )
+
+    def _file_path(self, file_id: str) -> Path:
+        if (
+            not file_id.startswith(FILE_ID_PREFIX)
+            or not file_id[len(FILE_ID_PREFIX) :].replace("-", "").isalnum()
+        ):
+            raise ValueError(f"Not a registered file ID: {file_id}")
+        return self.file_dir / f"{file_id}.json"
+
+    async def register_file(
+        self, config: KnowledgeServiceConfig, document: Document
+    ) -> FileRegistrationResult:
+        """Register a text document by storing its text locally.
+
+        Args:
+            config: KnowledgeServiceConfig for this operation
+            document: Document domain object to register
+
+        Returns:
+            FileRegistrationResult whose file ID names the stored text
+
+        Raises:
+            ValueError: If the document has no content or is not text
+        """
+        if not document.content:
+            raise ValueError("Document content stream is required for upload")
+        if not is_segmentable(document.content_type):
+            raise ValueError(
+                f"OpenAI-compatible services only accept text documents, "
+                f"got {document.content_type}"
+            )
+
+        document.content.seek(0)
+        try:
+            text = document.content.read().decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Document content is not UTF-8 text: {e}") from e
+
+        file_id = f"{FILE_ID_PREFIX}{document.content_multihash}"
+        path = self._file_path(file_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written under a temporary name, so readers never see a partial file
+        temporary = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        temporary.write_text(
+            json.dumps({"filename": document.original_filename, "text": text}),
+            encoding="utf-8",
+        )
+        temporary.replace(path)
+
+        logger.info(
+            "File registered with OpenAI-compatible service",
+            extra={
+                "knowledge_service_id": config.knowledge_service_id,
+                "document_id": document.document_id,
+                "file_id": file_id,
+                "size_bytes": document.size_bytes,
+            },
+        )
+
+        return FileRegistrationResult(
+            document_id=document.document_id,
+            knowledge_service_file_id=file_id,
+            registration_metadata={
+                "service": "openai_compatible",
+                "registered_via": "local_file_store",
+                "filename": document.original_filename,
+                "content_type": document.content_type,
+                "size_bytes": document.size_bytes,
+                "content_multihash": document.content_multihash,
+            },
+            created_at=datetime.now(timezone.utc),
+        )
+
+    async def execute_query(
+        self,
+        config: KnowledgeServiceConfig,
+        query_text: str,
+        output_schema: dict[str, Any] | None = None,
+        service_file_ids: list[str] | None = None,
+        query_metadata: dict[str, Any] | None = None,
+        assistant_prompt: str | None = None,
+    ) -> QueryResult:
+        """Execute a query against the chat completions endpoint.
+
+        Args:
+            config: KnowledgeServiceConfig for this operation
+            query_text: The query to execute
+            output_schema: Optional JSON schema the response must conform
+                to; the server is asked to constrain its output to it
+            service_file_ids: IDs of registered files whose text is quoted
+                in the prompt
+            query_metadata: Optional model, max_tokens and temperature
+            assistant_prompt: Optional assistant message to prime the
+                response. Not sent with an output_schema, which
+                constrains the response already.
+
+        Returns:
+            QueryResult with the parsed response and token usage
+
+        Raises:
+            OpenAICompatibleAPIError: If the server answers with an error
+            ValueError: If a file is not registered, or a structured
+                response is not valid JSON
+        """
+        start_time = time.time()
+        query_id = f"openai_compatible_{uuid.uuid4().hex[:12]}"
+        metadata = query_metadata or {}
+        model = metadata.get("model", self.default_model)
+
+        try:
+            body = self._build_request_body(
+                query_text,
+                output_schema,
+                service_file_ids,
+                metadata,
+                assistant_prompt,
+                model,
+            )
+            client = _pooled_client(self.base_url, self.api_key)
+            response = await client.post("/chat/completions", json=body)
+            if response.is_error:
+                raise OpenAICompatibleAPIError(response)
+            completion = response.json()
+            execution_time_ms = int((time.time() - start_time) * 1000)
+
+            result = self._build_query_result(
+                query_id,
+                query_text,
+                completion,
+                model,
+                output_schema,
+                service_file_ids,
+                execution_time_ms,
+            )
+
+            logger.info(
+                "Query executed with OpenAI-compatible service successfully",
+                extra={
+                    "knowledge_service_id": config.knowledge_service_id,
+                    "query_id": query_id,
+                    "execution_time_ms": execution_time_ms,
+                    **result.result_data["usage"],
+                    "file_count": len(service_file_ids or []),
+                },
+            )
+            return result
+
+        except Exception as e:
+            logger.error(
+                "Failed to execute query with OpenAI-compatible service",
+                extra={
+                    "knowledge_service_id": config.knowledge_service_id,
+                    "query_id": query_id,
+                    "execution_time_ms": int((time.time() - start_time) * 1000),
+                    "file_count": len(service_file_ids or []),
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            raise
+
+    def _build_request_body(
+        self,
+        query_text: str,
+        output_schema: dict[str, Any] | None,
+        service_file_ids: list[str] | None,
+        metadata: dict[str, Any],
+        assistant_prompt: str | None,
+        model: str,
+    ) -> dict[str, Any]:
+        """Build the chat completions request for a query."""
+        parts = []
+        for file_id in service_file_ids or []:
+            path = self._file_path(file_id)
+            try:
+                stored = json.loads(path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                raise ValueError(f"File not registered: {file_id}") from None
+            parts.append(
+                f'<document name="{stored["filename"]}">\n'
+                f'{stored["text"]}\n</document>'
+            )
+
+        if output_schema:
+            parts.append(f"""{query_text}
+
+Please structure your response according to this JSON schema:
+{json.dumps(output_schema, indent=2)}
+
+Return only valid JSON that conforms to this schema, without any surrounding
+text or markdown formatting.""")
+        else:
+            parts.append(query_text)
+
+        messages: list[dict[str, Any]] = [
+            {"role": "user", "content": "\n\n".join(parts)}
+        ]
+        if assistant_prompt and not output_schema:
+            messages.append({"role": "assistant", "content": assistant_prompt})
+
+        body: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": metadata.get("max_tokens", DEFAULT_MAX_TOKENS),
+        }
+        if metadata.get("temperature") is not None:
+            body["temperature"] = metadata["temperature"]
+        if output_schema:
+            body["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": "response", "schema": output_schema},
+            }
+        return body
+
+    def _build_query_result(
+        self,
+        query_id: str,
+        query_text: str,
+        completion: dict[str, Any],
+        model: str,
+        output_schema: dict[str, Any] | None,
+        service_file_ids: list[str] | None,
+        execution_time_ms: int,
+    ) -> QueryResult:
+        """Parse a chat completion into a QueryResult."""
+        choices = completion.get("choices") or []
+        if len(choices) != 1:
+            raise ValueError(f"Expected exactly 1 choice, got {len(choices)}")
+        response_text = choices[0].get("message", {}).get("content") or ""
+
+        if output_schema:
+            try:
+                response_value: Any = json.loads(_strip_code_fence(response_text))
+            except json.JSONDecodeError as e:
+                raise ValueError(
+                    f"Expected valid JSON response when output schema provided, "
+                    f"but failed to parse: {str(e)}"
+                )
+        else:
+            response_value = response_text
+
+        usage = completion.get("usage") or {}
+        finish_reason = choices[0].get("finish_reason")
+        return QueryResult(
+            query_id=query_id,
+            query_text=query_text,
+            result_data={
+                "response": response_value,
+                "model": completion.get("model", model),
+                "service": "openai_compatible",
+                "sources": service_file_ids or [],
+                # Named as Anthropic names them, for the rate limiter, for
+                # usage reporting across services and for model cascades
+                "usage": {
+                    "input_tokens": usage.get("prompt_tokens", 0),
+                    "output_tokens": usage.get("completion_tokens", 0),
+                },
+                "stop_reason": STOP_REASONS.get(finish_reason, finish_reason),
+            },
+            execution_time_ms=execution_time_ms,
+            created_at=datetime.now(timezone.utc),
+        )
@@ -0,0 +1,281 @@
+"""
+Tests for OpenAICompatibleKnowledgeService implementation.
+
+This module tests the OpenAI-compatible implementation of the
+KnowledgeService protocol against a local stub chat completions server,
+verifying file-context emulation, structured queries, usage reporting and
+connection pooling.
+"""
+
+import io
+import json
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from julee.contrib.ceap.domain.models.custom_fields.content_stream import (
+    ContentStream,
+)
+from julee.contrib.ceap.domain.models.document import Document, DocumentStatus
+from julee.contrib.ceap.domain.models.knowledge_service_config import (
+    KnowledgeServiceConfig,
+    ServiceApi,
+)
+from julee.services.knowledge_service.openai_compatible import (
+    OpenAICompatibleAPIError,
+    OpenAICompatibleKnowledgeService,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def completion(content: str, finish_reason: str = "stop") -> dict[str, Any]:
+    """A chat completion as OpenAI-compatible servers return it."""
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "model": "local-model",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason,
+            }
+        ],
+        "usage": {"prompt_tokens": 42, "completion_tokens": 7, "total_tokens": 49},
+    }
+
+
+@pytest.fixture
+def completions_server():
+    """Start a stub chat completions server on a random local port.
+
+    Responses are queued with ``server.respond(body, status, headers)``;
+    each request received is recorded in ``server.requests`` with its
+    headers, JSON body and client port.
+    """
+    responses: list[tuple[int, dict[str, Any], dict[str, str]]] = []
+    requests: list[dict[str, Any]] = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        # Keeps connections open between requests, as real servers do
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            requests.append(
+                {
+                    "path": self.path,
+                    "headers": dict(self.headers),
+                    "body": json.loads(self.rfile.read(length)),
+                    "client_port": self.client_address[1],
+                }
+            )
+            status, body, headers = (
+                responses.pop(0) if responses else (200, completion("ok"), {})
+            )
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass  # suppress test output
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    class _Server:
+        base_url = f"http://127.0.0.1:{server.server_port}/v1"
+
+        def __init__(self) -> None:
+            self.requests = requests
+
+        def respond(
+            self,
+            body: dict[str, Any],
+            status: int = 200,
+            headers: dict[str, str] | None = None,
+        ) -> None:
+            responses.append((status, body, headers or {}))
+
+    yield _Server()
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def service(
+    completions_server, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> OpenAICompatibleKnowledgeService:
+    """A service configured to use the stub server."""
+    monkeypatch.setenv("OPENAI_COMPATIBLE_BASE_URL", completions_server.base_url)
+    monkeypatch.setenv("OPENAI_COMPATIBLE_API_KEY", "local-key")
+    monkeypatch.setenv("OPENAI_COMPATIBLE_MODEL", "local-model")
+    monkeypatch.setenv("OPENAI_COMPATIBLE_FILE_DIR", str(tmp_path))
+    return OpenAICompatibleKnowledgeService()
+
+
+@pytest.fixture
+def knowledge_service_config() -> KnowledgeServiceConfig:
+    """Create a test KnowledgeServiceConfig for a local server."""
+    return KnowledgeServiceConfig(
+        knowledge_service_id="ks-local-test",
+        name="Test Local Service",
+        description="Local inference server for testing",
+        service_api=ServiceApi.OPENAI_COMPATIBLE,
+    )
+
+
+def make_document(
+    content: bytes = b"The meeting approved the budget.",
+    content_type: str = "text/plain",
+) -> Document:
+    return Document(
+        document_id="test-doc-123",
+        original_filename="minutes.txt",
+        content_type=content_type,
+        size_bytes=len(content),
+        content_multihash="test-hash-123",
+        status=DocumentStatus.CAPTURED,
+        content=ContentStream(io.BytesIO(content)),
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+class TestOpenAICompatibleKnowledgeService:
+    """Test cases for OpenAICompatibleKnowledgeService."""
+
+    async def test_registered_file_is_quoted_in_the_prompt(
+        self, service, completions_server, knowledge_service_config
+    ) -> None:
+        registration = await service.register_file(
+            knowledge_service_config, make_document()
+        )
+
+        result = await service.execute_query(
+            knowledge_service_config,
+            "What was approved?",
+            service_file_ids=[registration.knowledge_service_file_id],
+        )
+
+        assert registration.knowledge_service_file_id == "local-file-test-hash-123"
+        request = completions_server.requests[0]
+        assert request["path"] == "/v1/chat/completions"
+        assert request["headers"]["Authorization"] == "Bearer local-key"
+        assert request["body"]["model"] == "local-model"
+        prompt = request["body"]["messages"][0]["content"]
+        assert '<document name="minutes.txt">' in prompt
+        assert "The meeting approved the budget." in prompt
+        assert prompt.endswith("What was approved?")
+        assert result.result_data["response"] == "ok"
+        assert result.result_data["sources"] == ["local-file-test-hash-123"]
+
+    async def test_non_text_documents_are_rejected(
+        self, service, knowledge_service_config
+    ) -> None:
+        with pytest.raises(ValueError, match="only accept text documents"):
+            await service.register_file(
+                knowledge_service_config,
+                make_document(b"%PDF-1.7", content_type="application/pdf"),
+            )
+
+    async def test_unregistered_file_is_an_error(
+        self, service, completions_server, knowledge_service_config
+    ) -> None:
+        with pytest.raises(ValueError, match="File not registered"):
+            await service.execute_query(
+                knowledge_service_config,
+                "What was approved?",
+                service_file_ids=["local-file-unknown"],
+            )
+        assert completions_server.requests == []
+
+    async def test_structured_query_constrains_the_response(
+        self, service, completions_server, knowledge_service_config
+    ) -> None:
+        schema = {"type": "object", "properties": {"item": {"type": "string"}}}
+        completions_server.respond(completion('```json\n{"item": "budget"}\n```'))
+
+        result = await service.execute_query(
+            knowledge_service_config,
+            "What was approved?",
+            output_schema=schema,
+            assistant_prompt="{",
+            query_metadata={"model": "other-model", "temperature": 0},
+        )
+
+        body = completions_server.requests[0]["body"]
+        assert body["model"] == "other-model"
+        assert body["temperature"] == 0
+        assert body["response_format"]["json_schema"]["schema"] == schema
+        # The schema constrains the answer, so no prefill is sent
+        assert [message["role"] for message in body["messages"]] == ["user"]
+        assert result.result_data["response"] == {"item": "budget"}
+
+    async def test_invalid_structured_response_is_an_error(
+        self, service, completions_server, knowledge_service_config
+    ) -> None:
+        completions_server.respond(completion("The budget."))
+
+        with pytest.raises(ValueError, match="Expected valid JSON response"):
+            await service.execute_query(
+                knowledge_service_config,
+                "What was approved?",
+                output_schema={"type": "object"},
+            )
+
+    async def test_usage_is_reported_as_for_other_services(
+        self, service, completions_server, knowledge_service_config
+    ) -> None:
+        completions_server.respond(completion("The budget.", finish_reason="length"))
+
+        result = await service.execute_query(
+            knowledge_service_config, "What was approved?"
+        )
+
+        assert result.query_id.startswith("openai_compatible_")
+        assert result.result_data["usage"] == {
+            "input_tokens": 42,
+            "output_tokens": 7,
+        }
+        assert result.result_data["model"] == "local-model"
+        assert result.result_data["service"] == "openai_compatible"
+        assert result.result_data["stop_reason"] == "max_tokens"
+
+    async def test_throttling_is_recognizable_by_the_rate_limiter(
+        self, service, completions_server, knowledge_service_config
+    ) -> None:
+        completions_server.respond(
+            {"error": {"message": "busy"}}, status=429, headers={"Retry-After": "3"}
+        )
+
+        with pytest.raises(OpenAICompatibleAPIError) as exc_info:
+            await service.execute_query(knowledge_service_config, "Anything?")
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.response.headers["Retry-After"] == "3"
+
+    async def test_queries_share_pooled_connections(
+        self, service, completions_server, knowledge_service_config
+    ) -> None:
+        other_service = OpenAICompatibleKnowledgeService()
+
+        await service.execute_query(knowledge_service_config, "First?")
+        await other_service.execute_query(knowledge_service_config, "Second?")
+
+        ports = {request["client_port"] for request in completions_server.requests}
+        assert len(ports) == 1
@@ -0,0 +1,359 @@
+"""
+Adaptive rate limiting for knowledge service calls.
+
+Providers enforce request and token budgets per minute, and reject excess
+traffic with 429 (rate limited) or 529 (overloaded) responses. When many
+workflows call a service in parallel, and every layer retries on its own,
+those rejections turn into error storms. The limiter in this module is
+shared by all calls to one knowledge service within a worker process. It
+admits calls only within the configured requests/min and tokens/min
+budgets, charging each call for the tokens its response reports as used.
+It adapts the number of concurrent calls AIMD-style: the limit grows by
+one per round of successful calls and halves when the service pushes back,
+with a jittered backoff before the next attempt. Throughput therefore
+settles just below the provider's limit.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from temporalio.common import MetricMeter
+
+    from julee.contrib.ceap.domain.models.knowledge_service_config import (
+        KnowledgeServiceConfig,
+    )
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP status codes with which providers signal "slow down"
+THROTTLED_STATUS_CODES = frozenset({429, 529})
+
+
+class RateLimits(BaseModel):
+    """Budgets and tuning for one knowledge service's rate limiter."""
+
+    requests_per_minute: int | None = Field(
+        default=None, ge=1, description="Request budget; None means unlimited"
+    )
+    tokens_per_minute: int | None = Field(
+        default=None,
+        ge=1,
+        description="Input plus output token budget; None means unlimited",
+    )
+    max_concurrency: int = Field(default=16, ge=1)
+    min_concurrency: int = Field(default=1, ge=1)
+    max_throttle_retries: int = Field(
+        default=3,
+        ge=0,
+        description="Retries of a throttled call before the error is raised",
+    )
+    base_backoff_seconds: float = Field(default=1.0, gt=0)
+    max_backoff_seconds: float = Field(default=60.0, gt=0)
+
+    @classmethod
+    def from_env(cls) -> "RateLimits":
+        """Read limits from JULEE_KNOWLEDGE_SERVICE_* environment variables."""
+        values: dict[str, Any] = {}
+        for field, variable in (
+            ("requests_per_minute", "JULEE_KNOWLEDGE_SERVICE_REQUESTS_PER_MINUTE"),
+            ("tokens_per_minute", "JULEE_KNOWLEDGE_SERVICE_TOKENS_PER_MINUTE"),
+            ("max_concurrency", "JULEE_KNOWLEDGE_SERVICE_MAX_CONCURRENCY"),
+        ):
+            value = os.environ.get(variable)
+            if value:
+                values[field] = int(value)
+        return cls(**values)
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Whether an error is the service asking callers to slow down."""
+    status_code = getattr(error, "status_code", None)
+    return status_code in THROTTLED_STATUS_CODES
+
+
+def _retry_after_seconds(error: BaseException) -> float | None:
+    """The Retry-After delay carried by an error's response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+class _TokenBucket:
+    """Continuously refilling budget of units per minute."""
+
+    def __init__(self, per_minute: int, now: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self._updated = now
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self.available = min(self.capacity, self.available + elapsed * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount units are available (0 if they are now)."""
+        self._refill(now)
+        # A single call larger than the whole budget waits for a full bucket
+        shortfall = min(amount, self.capacity) - self.available
+        return max(0.0, shortfall / self.rate)
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.available -= amount
+
+    def adjust(self, delta: float, now: float) -> None:
+        """Charge (positive) or refund (negative) units after the fact.
+
+        Charges may leave the bucket in debt, delaying later calls.
+        """
+        self._refill(now)
+        self.available = min(self.capacity, self.available - delta)
+
+
+class KnowledgeServiceRateLimiter:
+    """
+    Rate limiter and adaptive concurrency controller for one service.
+
+    Calls go through call(), which waits for a concurrency slot and for
+    the request and token budgets, runs the call, and retries it after a
+    jittered backoff if the service throttles it. Waiting callers are
+    admitted in arrival order.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limits: RateLimits,
+        metric_meter: "MetricMeter | None" = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self.name = name
+        self.limits = limits
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+
+        now = clock()
+        self._requests = (
+            _TokenBucket(limits.requests_per_minute, now)
+            if limits.requests_per_minute
+            else None
+        )
+        self._tokens = (
+            _TokenBucket(limits.tokens_per_minute, now)
+            if limits.tokens_per_minute
+            else None
+        )
+        self._limit = float(limits.max_concurrency)
+        self._in_flight = 0
+        self._waiting = 0
+        self._backoff_until = 0.0
+        self._last_decrease = float("-inf")
+        self._consecutive_throttles = 0
+        self._admission = asyncio.Lock()
+        self._released = asyncio.Event()
+
+        self._gauges = {}
+        if metric_meter is not None:
+            meter = metric_meter.with_additional_attributes(
+                {"knowledge_service_id": name}
+            )
+            self._gauges = {
+                "queue_depth": meter.create_gauge(
+                    "julee_knowledge_service_queue_depth",
+                    "Calls waiting for the knowledge service rate limiter",
+                ),
+                "in_flight": meter.create_gauge(
+                    "julee_knowledge_service_in_flight",
+                    "Knowledge service calls currently in flight",
+                ),
+                "concurrency_limit": meter.create_gauge(
+                    "julee_knowledge_service_concurrency_limit",
+                    "Current adaptive concurrency limit",
+                ),
+            }
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting to be admitted."""
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        return self._in_flight
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current adaptive limit on concurrent calls."""
+        return int(self._limit)
+
+    async def call(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        estimated_tokens: int = 0,
+        tokens_used: Callable[[T], int | None] | None = None,
+    ) -> T:
+        """Run an operation within the service's budgets.
+
+        Args:
+            operation: Zero-argument coroutine function making one call
+            estimated_tokens: Tokens reserved before the call is made
+            tokens_used: Extracts the tokens actually used from the result;
+                the difference from the estimate is charged or refunded
+
+        Returns:
+            The operation's result
+
+        Raises:
+            Exception: Whatever the operation raises; throttling errors only
+                once max_throttle_retries retries have been exhausted
+        """
+        attempt = 0
+        while True:
+            await self._acquire(estimated_tokens)
+            try:
+                result = await operation()
+            except Exception as e:
+                if not is_throttling_error(e):
+                    raise
+                self._on_throttled(_retry_after_seconds(e))
+                if attempt >= self.limits.max_throttle_retries:
+                    raise
+                attempt += 1
+                logger.info(
+                    "Knowledge service call throttled, retrying",
+                    extra={
+                        "knowledge_service_id": self.name,
+                        "attempt": attempt,
+                        "concurrency_limit": self.concurrency_limit,
+                    },
+                )
+                continue
+            finally:
+                self._release()
+
+            self._on_success()
+            if tokens_used is not None and self._tokens is not None:
+                used = tokens_used(result)
+                if used is not None:
+                    self._tokens.adjust(used - estimated_tokens, self._clock())
+            return result
+
+    async def _acquire(self, tokens: int) -> None:
+        self._waiting += 1
+        self._record_metrics()
+        try:
+            async with self._admission:
+                while True:
+                    now = self._clock()
+                    wait = self._backoff_until - now
+                    if wait <= 0 and self._in_flight >= self.concurrency_limit:
+                        self._released.clear()
+                        await self._released.wait()
+                        continue
+                    if self._requests is not None:
+                        wait = max(wait, self._requests.wait_time(1, now))
+                    if self._tokens is not None:
+                        wait = max(wait, self._tokens.wait_time(tokens, now))
+                    if wait > 0:
+                        await self._sleep(wait)
+                        continue
+
+                    if self._requests is not None:
+                        self._requests.take(1, now)
+                    if self._tokens is not None:
+                        self._tokens.take(tokens, now)
+                    self._in_flight += 1
+                    return
+        finally:
+            self._waiting -= 1
+            self._record_metrics()
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._released.set()
+        self._record_metrics()
+
+    def _on_success(self) -> None:
+        # Additive increase: about one extra slot per round of calls
+        self._consecutive_throttles = 0
+        self._limit = min(
+            float(self.limits.max_concurrency), self._limit + 1.0 / self._limit
+        )
+
+    def _on_throttled(self, retry_after: float | None) -> None:
+        now = self._clock()
+        # Multiplicative decrease, once per backoff period so a burst of
+        # rejections from calls already in flight counts as one signal
+        if now - self._last_decrease >= self.limits.base_backoff_seconds:
+            self._limit = max(float(self.limits.min_concurrency), self._limit / 2)
+            self._last_decrease = now
+
+        self._consecutive_throttles += 1
+        ceiling = min(
+            self.limits.max_backoff_seconds,
+            self.limits.base_backoff_seconds * 2 ** (self._consecutive_throttles - 1),
+        )
+        delay = (retry_after or 0.0) + ceiling * self._jitter()
+        self._backoff_until = max(self._backoff_until, now + delay)
+
+        logger.warning(
+            "Knowledge service throttled requests",
+            extra={
+                "knowledge_service_id": self.name,
+                "concurrency_limit": self.concurrency_limit,
+                "backoff_seconds": delay,
+            },
+        )
+
+    def _record_metrics(self) -> None:
+        if not self._gauges:
+            return
+        self._gauges["queue_depth"].set(self._waiting)
+        self._gauges["in_flight"].set(self._in_flight)
+        self._gauges["concurrency_limit"].set(self.concurrency_limit)
+
+
+class RateLimiterRegistry:
+    """Shared rate limiters, one per knowledge service."""
+
+    def __init__(
+        self,
+        limits: RateLimits | None = None,
+        metric_meter: "MetricMeter | None" = None,
+    ) -> None:
+        self._limits = limits
+        self._metric_meter = metric_meter
+        self._limiters: dict[str, KnowledgeServiceRateLimiter] = {}
+
+    def get(self, config: "KnowledgeServiceConfig") -> KnowledgeServiceRateLimiter:
+        """Return the limiter for a knowledge service, creating it if needed."""
+        limiter = self._limiters.get(config.knowledge_service_id)
+        if limiter is None:
+            limiter = KnowledgeServiceRateLimiter(
+                config.knowledge_service_id,
+                self._limits or RateLimits.from_env(),
+                metric_meter=self._metric_meter,
+            )
+            self._limiters[config.knowledge_service_id] = limiter
+        return limiter
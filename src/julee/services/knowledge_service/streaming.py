@@ -0,0 +1,346 @@
+"""
+Streaming support for knowledge service queries.
+
+Structured answers are normally parsed once the whole completion has
+arrived, so a malformed or runaway answer is only noticed after paying for
+all of its tokens. Streamed answers can instead be checked as they arrive:
+IncrementalJSONValidator follows the JSON text character by character and
+raises as soon as no continuation could parse or conform to the output
+schema - a value of the wrong type, a property the schema does not allow,
+a completed value that fails its schema, or text after the JSON value.
+
+Services report the progress of streamed queries through
+report_query_progress. Callers interested in it, such as Temporal
+activities that heartbeat, register a listener for the duration of a call
+with listen_to_query_progress.
+"""
+
+import json
+import re
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+import jsonschema
+from jsonpointer import JsonPointer  # type: ignore[import-untyped]
+
+
+class StreamAbortedError(ValueError):
+    """A streamed answer was abandoned because it cannot be valid."""
+
+
+@dataclass(frozen=True)
+class QueryProgress:
+    """Progress of one streamed query."""
+
+    query_id: str
+    output_chars: int
+    time_to_first_token_ms: int | None
+
+
+_progress_listener: ContextVar[Callable[[QueryProgress], None] | None] = ContextVar(
+    "query_progress_listener", default=None
+)
+
+
+@contextmanager
+def listen_to_query_progress(
+    listener: Callable[[QueryProgress], None],
+) -> Iterator[None]:
+    """Receive the progress of queries streamed within this context."""
+    token = _progress_listener.set(listener)
+    try:
+        yield
+    finally:
+        _progress_listener.reset(token)
+
+
+def report_query_progress(progress: QueryProgress) -> None:
+    """Pass a streamed query's progress to the current listener, if any."""
+    listener = _progress_listener.get()
+    if listener is not None:
+        listener(progress)
+
+
+# JSON type of a value, by its first character
+_VALUE_TYPES = {
+    "{": "object",
+    "[": "array",
+    '"': "string",
+    "t": "boolean",
+    "f": "boolean",
+    "n": "null",
+    "-": "number",
+    **dict.fromkeys("0123456789", "number"),
+}
+
+_LITERALS = {"t": "true", "f": "false", "n": "null"}
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_WHITESPACE = frozenset(" \t\n\r")
+
+# Bound on $ref chains followed while descending the schema
+_MAX_REF_DEPTH = 16
+
+
+@dataclass
+class _Container:
+    kind: str  # "object" or "array"
+    schema: Any
+    value: Any
+    state: str
+    key: str | None = None
+
+
+@dataclass
+class _Scalar:
+    kind: str  # "string", "key", "number" or "literal"
+    schema: Any
+    chars: list[str] = field(default_factory=list)
+    escaped: bool = False
+    literal: str = ""
+
+
+class IncrementalJSONValidator:
+    """Checks a JSON answer against a schema while it is being streamed.
+
+    Only answers that are provably invalid are rejected: parts of the
+    schema that cannot be checked before the answer is complete (such as
+    pattern properties) are left to the final validation.
+    """
+
+    def __init__(self, schema: Mapping[str, Any] | None) -> None:
+        self._root = schema
+        self._validator = (
+            jsonschema.validators.validator_for(schema)(schema)
+            if isinstance(schema, Mapping)
+            else None
+        )
+        self._stack: list[_Container] = []
+        self._scalar: _Scalar | None = None
+        self._complete = False
+
+    @property
+    def complete(self) -> bool:
+        """Whether a whole JSON value has been received."""
+        return self._complete
+
+    def feed(self, text: str) -> None:
+        """Check the next part of the answer.
+
+        Raises:
+            StreamAbortedError: If the answer can no longer be valid
+        """
+        for char in text:
+            self._feed_char(char)
+
+    def _feed_char(self, char: str) -> None:
+        scalar = self._scalar
+        if scalar is not None:
+            if scalar.kind in ("string", "key"):
+                self._feed_string(scalar, char)
+                return
+            if scalar.kind == "literal":
+                scalar.chars.append(char)
+                text = "".join(scalar.chars)
+                if not scalar.literal.startswith(text):
+                    raise StreamAbortedError(f"Invalid JSON literal: {text!r}")
+                if text == scalar.literal:
+                    self._scalar = None
+                    self._complete_value(json.loads(text), scalar.schema)
+                return
+            if char in _NUMBER_CHARS:
+                scalar.chars.append(char)
+                return
+            # A number ends at the first character that cannot continue it
+            self._scalar = None
+            text = "".join(scalar.chars)
+            try:
+                number = json.loads(text)
+            except json.JSONDecodeError:
+                raise StreamAbortedError(f"Invalid JSON number: {text!r}") from None
+            self._complete_value(number, scalar.schema)
+
+        if char in _WHITESPACE:
+            return
+        if self._complete:
+            raise StreamAbortedError("Unexpected text after the JSON value")
+        if not self._stack:
+            self._start_value(char, self._root)
+            return
+
+        container = self._stack[-1]
+        state = container.state
+        if container.kind == "object":
+            if state in ("first_key", "key") and char == '"':
+                self._scalar = _Scalar("key", None)
+            elif state in ("first_key", "next") and char == "}":
+                self._close()
+            elif state == "colon" and char == ":":
+                container.state = "value"
+            elif state == "value":
+                self._start_value(
+                    char, self._property_schema(container.schema, container.key)
+                )
+            elif state == "next" and char == ",":
+                container.state = "key"
+            else:
+                raise StreamAbortedError(f"Unexpected {char!r} in JSON object")
+        else:
+            if state in ("first_value", "next") and char == "]":
+                self._close()
+            elif state in ("first_value", "value"):
+                self._start_value(
+                    char, self._item_schema(container.schema, len(container.value))
+                )
+            elif state == "next" and char == ",":
+                container.state = "value"
+            else:
+                raise StreamAbortedError(f"Unexpected {char!r} in JSON array")
+
+    def _feed_string(self, scalar: _Scalar, char: str) -> None:
+        if scalar.escaped:
+            scalar.escaped = False
+        elif char == "\\":
+            scalar.escaped = True
+        elif char == '"':
+            self._scalar = None
+            try:
+                value = json.loads('"' + "".join(scalar.chars) + '"')
+            except json.JSONDecodeError:
+                raise StreamAbortedError("Invalid JSON string") from None
+            if scalar.kind == "key":
+                self._complete_key(value)
+            else:
+                self._complete_value(value, scalar.schema)
+            return
+        elif char < " ":
+            raise StreamAbortedError("Control character in JSON string")
+        scalar.chars.append(char)
+
+    def _start_value(self, char: str, schema: Any) -> None:
+        value_type = _VALUE_TYPES.get(char)
+        if value_type is None:
+            raise StreamAbortedError(f"Unexpected {char!r} where a value should be")
+        if schema is False:
+            raise StreamAbortedError("Value where the schema allows none")
+        self._check_type(value_type, schema)
+
+        if char == "{":
+            self._stack.append(_Container("object", schema, {}, "first_key"))
+        elif char == "[":
+            self._stack.append(_Container("array", schema, [], "first_value"))
+        elif char == '"':
+            self._scalar = _Scalar("string", schema)
+        elif value_type == "number":
+            self._scalar = _Scalar("number", schema, [char])
+        else:
+            self._scalar = _Scalar("literal", schema, [char], literal=_LITERALS[char])
+
+    def _complete_key(self, key: str) -> None:
+        container = self._stack[-1]
+        schema = self._resolve(container.schema)
+        if (
+            isinstance(schema, Mapping)
+            and schema.get("additionalProperties") is False
+            and key not in schema.get("properties", {})
+            and not self._matches_pattern_property(schema, key)
+        ):
+            raise StreamAbortedError(f"Property not allowed by the schema: {key!r}")
+        container.key = key
+        container.state = "colon"
+
+    def _complete_value(self, value: Any, schema: Any) -> None:
+        if not self._is_valid(value, schema):
+            raise StreamAbortedError(
+                f"Value does not conform to the schema: {json.dumps(value)[:100]}"
+            )
+        if not self._stack:
+            self._complete = True
+            return
+        container = self._stack[-1]
+        if container.kind == "object":
+            container.value[container.key] = value
+        else:
+            container.value.append(value)
+            resolved = self._resolve(container.schema)
+            max_items = (
+                resolved.get("maxItems") if isinstance(resolved, Mapping) else None
+            )
+            if isinstance(max_items, int) and len(container.value) > max_items:
+                raise StreamAbortedError(f"Array longer than maxItems {max_items}")
+        container.state = "next"
+
+    def _close(self) -> None:
+        container = self._stack.pop()
+        self._complete_value(container.value, container.schema)
+
+    def _check_type(self, value_type: str, schema: Any) -> None:
+        resolved = self._resolve(schema)
+        if not isinstance(resolved, Mapping) or "type" not in resolved:
+            return
+        allowed = resolved["type"]
+        allowed = {allowed} if isinstance(allowed, str) else set(allowed)
+        if "integer" in allowed:
+            allowed.add("number")
+        if value_type not in allowed:
+            raise StreamAbortedError(
+                f"Expected {' or '.join(sorted(allowed))}, got {value_type}"
+            )
+
+    def _is_valid(self, value: Any, schema: Any) -> bool:
+        if schema is None or schema is True or self._validator is None:
+            return True
+        try:
+            return bool(self._validator.evolve(schema=schema).is_valid(value))
+        except Exception:
+            # Schemas whose references cannot be resolved here accept anything
+            return True
+
+    def _resolve(self, schema: Any) -> Any:
+        """Follow local $refs to the schema they point at."""
+        for _ in range(_MAX_REF_DEPTH):
+            if not isinstance(schema, Mapping):
+                return schema
+            ref = schema.get("$ref")
+            if not isinstance(ref, str) or not ref.startswith("#"):
+                return schema
+            try:
+                schema = JsonPointer(ref[1:]).resolve(self._root)
+            except Exception:
+                return None
+        return None
+
+    @staticmethod
+    def _matches_pattern_property(schema: Mapping[str, Any], key: str) -> bool:
+        return any(
+            re.search(pattern, key) for pattern in schema.get("patternProperties", {})
+        )
+
+    def _property_schema(self, schema: Any, key: str | None) -> Any:
+        """Schema that a property's value must conform to, if known."""
+        resolved = self._resolve(schema)
+        if not isinstance(resolved, Mapping) or key is None:
+            return None
+        properties = resolved.get("properties", {})
+        if key in properties:
+            return properties[key]
+        if self._matches_pattern_property(resolved, key):
+            return None
+        return resolved.get("additionalProperties")
+
+    def _item_schema(self, schema: Any, index: int) -> Any:
+        """Schema that an array's item at an index must conform to, if known."""
+        resolved = self._resolve(schema)
+        if not isinstance(resolved, Mapping):
+            return None
+        prefix = resolved.get("prefixItems")
+        items = resolved.get("items")
+        if isinstance(prefix, list):
+            return prefix[index] if index < len(prefix) else items
+        if isinstance(items, list):
+            if index < len(items):
+                return items[index]
+            return resolved.get("additionalItems")
+        return items
@@ -25,6 +25,9 @@ from julee.services.knowledge_service.anthropic import (
 from julee.services.knowledge_service.factory import (
     knowledge_service_factory,
 )
+from julee.services.knowledge_service.openai_compatible import (
+    OpenAICompatibleKnowledgeService,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -74,6 +77,19 @@ class TestKnowledgeServiceFactory:
 
             assert isinstance(service, AnthropicKnowledgeService)
 
+    def test_factory_creates_openai_compatible_service(self) -> None:
+        """Test factory creates the OpenAI-compatible service for its API."""
+        config = KnowledgeServiceConfig(
+            knowledge_service_id="ks-local-test",
+            name="Test Local Service",
+            description="Local inference server for testing",
+            service_api=ServiceApi.OPENAI_COMPATIBLE,
+        )
+
+        service = knowledge_service_factory(config)
+
+        assert isinstance(service, OpenAICompatibleKnowledgeService)
+
     def test_factory_returns_validated_service(
         self,
         anthropic_config: KnowledgeServiceConfig,
@@ -0,0 +1,152 @@
+"""
+Tests for hedged knowledge service queries.
+"""
+
+import asyncio
+
+import pytest
+
+from julee.contrib.ceap.domain.models.knowledge_service_config import (
+    HedgingPolicy,
+)
+
+from .hedging import LatencyHistogram, QueryHedger
+
+pytestmark = pytest.mark.unit
+
+
+def make_hedger(samples: int = 20, latency: float = 0.01) -> QueryHedger:
+    """Create a hedger that has already observed some fast queries."""
+    hedger = QueryHedger("ks-test")
+    for _ in range(samples):
+        hedger.latencies.record(latency)
+    return hedger
+
+
+def scripted(*behaviours):
+    """Operation whose successive calls follow the given behaviours.
+
+    Each behaviour is (delay_seconds, result_or_exception).
+    """
+    calls = iter(behaviours)
+    cancelled = []
+
+    async def operation():
+        delay, outcome = next(calls)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(outcome)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return operation, cancelled
+
+
+POLICY = HedgingPolicy(max_hedge_fraction=1.0, min_delay_seconds=0)
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    def test_percentile(self) -> None:
+        histogram = LatencyHistogram(window=100)
+        for value in range(1, 101):
+            histogram.record(float(value))
+
+        assert histogram.percentile(50) == 50.0
+        assert histogram.percentile(99) == 99.0
+        assert LatencyHistogram().percentile(50) is None
+
+    def test_window_keeps_recent_samples(self) -> None:
+        histogram = LatencyHistogram(window=2)
+        for value in (100.0, 1.0, 2.0):
+            histogram.record(value)
+
+        assert histogram.percentile(100) == 2.0
+
+
+class TestQueryHedger:
+    """Test cases for QueryHedger."""
+
+    async def test_slow_query_is_hedged(self) -> None:
+        """The hedge's result wins and the slow primary is cancelled."""
+        hedger = make_hedger()
+        operation, cancelled = scripted((10, "primary"), (0, "hedge"))
+
+        assert await hedger.run(POLICY, operation) == "hedge"
+        assert cancelled == ["primary"]
+        assert hedger.hedged_count == 1
+
+    async def test_failed_hedge_falls_back_to_primary(self) -> None:
+        """A copy that fails does not win over one that succeeds."""
+        hedger = make_hedger()
+        operation, _ = scripted((0.1, "primary"), (0, ValueError("invalid JSON")))
+
+        assert await hedger.run(POLICY, operation) == "primary"
+
+    async def test_primary_error_raised_when_both_fail(self) -> None:
+        hedger = make_hedger()
+        operation, _ = scripted(
+            (0.05, RuntimeError("primary")), (0, ValueError("hedge"))
+        )
+
+        with pytest.raises(RuntimeError, match="primary"):
+            await hedger.run(POLICY, operation)
+
+    async def test_no_hedging_without_enough_samples(self) -> None:
+        hedger = make_hedger(samples=5)
+        operation, _ = scripted((0.05, "primary"))
+
+        assert await hedger.run(POLICY, operation) == "primary"
+        assert hedger.hedged_count == 0
+        assert len(hedger.latencies) == 6
+
+    async def test_budget_limits_hedges(self) -> None:
+        """Hedges are limited to the configured fraction of queries."""
+        hedger = make_hedger()
+        policy = HedgingPolicy(max_hedge_fraction=0.5, min_delay_seconds=0)
+        operation, _ = scripted((0.05, "first"), (10, "second"), (0, "hedge"))
+
+        # Half a hedge is earned per query: the first slow query is not
+        # hedged, the second one is
+        assert await hedger.run(policy, operation) == "first"
+        assert hedger.hedged_count == 0
+        assert await hedger.run(policy, operation) == "hedge"
+        assert hedger.hedged_count == 1
+
+    async def test_disabled_without_policy(self) -> None:
+        hedger = make_hedger()
+        operation, _ = scripted((0.05, "primary"))
+
+        assert await hedger.run(None, operation) == "primary"
+        assert hedger.hedged_count == 0
+
+    async def test_queueing_is_not_latency(self) -> None:
+        """Calls are timed, and hedged, only once admitted."""
+        hedger = make_hedger(latency=0.05)
+        operation, cancelled = scripted((0.01, "primary"))
+
+        async def admit(call):
+            await asyncio.sleep(0.2)
+            return await call()
+
+        assert await hedger.run(POLICY, operation, admit) == "primary"
+        assert hedger.hedged_count == 0
+        assert cancelled == []
+        assert hedger.latencies.percentile(100) < 0.1
+
+    async def test_admitted_slow_query_is_hedged(self) -> None:
+        hedger = make_hedger()
+        operation, cancelled = scripted((10, "primary"), (0, "hedge"))
+        admissions = []
+
+        async def admit(call):
+            admissions.append(call)
+            return await call()
+
+        assert await hedger.run(POLICY, operation, admit) == "hedge"
+        assert len(admissions) == 2
+        assert cancelled == ["primary"]
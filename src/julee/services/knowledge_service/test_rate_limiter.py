@@ -0,0 +1,204 @@
+"""
+Tests for the knowledge service rate limiter.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from julee.contrib.ceap.domain.models.knowledge_service_config import (
+    KnowledgeServiceConfig,
+    ServiceApi,
+)
+
+from .factory import ConfigurableKnowledgeService
+from .knowledge_service import QueryResult
+from .rate_limiter import KnowledgeServiceRateLimiter, RateLimiterRegistry, RateLimits
+
+pytestmark = pytest.mark.unit
+
+
+class ThrottledError(Exception):
+    """Error shaped like an SDK status error."""
+
+    def __init__(self, status_code: int = 429, retry_after: str | None = None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = MagicMock(
+            headers={"retry-after": retry_after} if retry_after else {}
+        )
+
+
+class FakeClock:
+    """Clock whose sleeps advance time instantly."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def make_limiter(clock: FakeClock, **limits) -> KnowledgeServiceRateLimiter:
+    return KnowledgeServiceRateLimiter(
+        "ks-test",
+        RateLimits(**limits),
+        clock=clock,
+        sleep=clock.sleep,
+        jitter=lambda: 0.5,
+    )
+
+
+class TestKnowledgeServiceRateLimiter:
+    """Test cases for KnowledgeServiceRateLimiter."""
+
+    async def test_throttling_halves_limit_and_retries(self, clock: FakeClock) -> None:
+        """A 429 halves concurrency, backs off with jitter, then retries."""
+        limiter = make_limiter(clock, max_concurrency=8)
+        operation = AsyncMock(side_effect=[ThrottledError(retry_after="2"), "ok"])
+
+        assert await limiter.call(operation) == "ok"
+
+        assert operation.await_count == 2
+        assert clock.sleeps == [2.5]  # retry-after plus jittered backoff
+        # Halved to 4, then one success adds a quarter slot
+        assert limiter.concurrency_limit == 4
+
+    async def test_success_grows_limit_additively(self, clock: FakeClock) -> None:
+        """Successful calls raise the limit by about one per round."""
+        limiter = make_limiter(clock, max_concurrency=8)
+        limiter._limit = 2.0
+
+        for _ in range(4):
+            await limiter.call(AsyncMock(return_value=None))
+
+        assert limiter.concurrency_limit == 3
+
+    async def test_gives_up_after_max_retries(self, clock: FakeClock) -> None:
+        """Persistent throttling is raised once the retries are spent."""
+        limiter = make_limiter(
+            clock, max_concurrency=4, max_throttle_retries=2, min_concurrency=2
+        )
+        operation = AsyncMock(side_effect=ThrottledError(529))
+
+        with pytest.raises(ThrottledError):
+            await limiter.call(operation)
+
+        assert operation.await_count == 3
+        assert clock.sleeps == [0.5, 1.0]  # exponential, jittered
+        assert limiter.concurrency_limit == 2
+
+    async def test_other_errors_are_not_retried(self, clock: FakeClock) -> None:
+        """Only throttling is retried by the limiter."""
+        limiter = make_limiter(clock)
+        operation = AsyncMock(side_effect=ThrottledError(500))
+
+        with pytest.raises(ThrottledError):
+            await limiter.call(operation)
+
+        assert operation.await_count == 1
+        assert limiter.in_flight == 0
+
+    async def test_request_budget(self, clock: FakeClock) -> None:
+        """Calls beyond the requests/min budget wait for it to refill."""
+        limiter = make_limiter(clock, requests_per_minute=2)
+
+        for _ in range(3):
+            await limiter.call(AsyncMock(return_value=None))
+
+        assert clock.sleeps == [pytest.approx(30.0)]
+
+    async def test_token_budget_uses_reported_usage(self, clock: FakeClock) -> None:
+        """Tokens reported by a response are charged against the budget."""
+        limiter = make_limiter(clock, tokens_per_minute=600)
+
+        await limiter.call(
+            AsyncMock(return_value=600), estimated_tokens=10, tokens_used=lambda r: r
+        )
+        await limiter.call(AsyncMock(return_value=0), estimated_tokens=10)
+
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    async def test_concurrency_limit_queues_callers(self, clock: FakeClock) -> None:
+        """Callers beyond the concurrency limit wait and are counted."""
+        limiter = make_limiter(clock, max_concurrency=2)
+        release = asyncio.Event()
+        peak = 0
+
+        async def operation() -> None:
+            nonlocal peak
+            peak = max(peak, limiter.in_flight)
+            await release.wait()
+
+        calls = [asyncio.create_task(limiter.call(operation)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert (limiter.in_flight, limiter.queue_depth) == (2, 1)
+
+        release.set()
+        await asyncio.gather(*calls)
+
+        assert peak == 2
+        assert (limiter.in_flight, limiter.queue_depth) == (0, 0)
+
+    async def test_reports_metrics(self, clock: FakeClock) -> None:
+        """Queue depth and concurrency are reported as gauges."""
+        meter = MagicMock()
+        gauges = {}
+        meter.with_additional_attributes.return_value.create_gauge.side_effect = (
+            lambda name, description: gauges.setdefault(name, MagicMock())
+        )
+        limiter = KnowledgeServiceRateLimiter(
+            "ks-test", RateLimits(), metric_meter=meter, clock=clock
+        )
+
+        await limiter.call(AsyncMock(return_value=None))
+
+        meter.with_additional_attributes.assert_called_once_with(
+            {"knowledge_service_id": "ks-test"}
+        )
+        gauges["julee_knowledge_service_queue_depth"].set.assert_called_with(0)
+        gauges["julee_knowledge_service_in_flight"].set.assert_called_with(0)
+
+
+class TestConfigurableKnowledgeServiceRateLimiting:
+    """Test that ConfigurableKnowledgeService routes calls through limiters."""
+
+    async def test_queries_share_limiter_per_service(self) -> None:
+        config = KnowledgeServiceConfig(
+            knowledge_service_id="ks-1",
+            name="Service",
+            description="Service",
+            service_api=ServiceApi.ANTHROPIC,
+        )
+        service = AsyncMock()
+        service.execute_query.return_value = QueryResult(
+            query_id="q",
+            query_text="Q?",
+            result_data={"usage": {"input_tokens": 70, "output_tokens": 30}},
+        )
+        registry = RateLimiterRegistry(RateLimits(tokens_per_minute=1000))
+        configurable = ConfigurableKnowledgeService(rate_limiters=registry)
+
+        with patch(
+            "julee.services.knowledge_service.factory.knowledge_service_factory",
+            return_value=service,
+        ):
+            await configurable.execute_query(config, "Q?")
+            await configurable.execute_query(config, "Q?")
+
+        limiter = registry.get(config)
+        assert limiter is registry.get(config)
+        assert limiter._tokens is not None
+        assert limiter._tokens.available == pytest.approx(800, abs=1)
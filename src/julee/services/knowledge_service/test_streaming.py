@@ -0,0 +1,106 @@
+"""
+Tests for incremental validation of streamed knowledge service answers.
+"""
+
+import pytest
+
+from julee.services.knowledge_service.streaming import (
+    IncrementalJSONValidator,
+    QueryProgress,
+    StreamAbortedError,
+    listen_to_query_progress,
+    report_query_progress,
+)
+
+pytestmark = pytest.mark.unit
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "year": {"type": "integer", "minimum": 1900},
+        "attendees": {
+            "type": "array",
+            "items": {"$ref": "#/$defs/person"},
+            "maxItems": 2,
+        },
+    },
+    "additionalProperties": False,
+    "$defs": {
+        "person": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "required": ["name"],
+        }
+    },
+}
+
+
+def feed_in_chunks(validator: IncrementalJSONValidator, text: str) -> None:
+    for start in range(0, len(text), 3):
+        validator.feed(text[start : start + 3])
+
+
+class TestIncrementalJSONValidator:
+    """Test cases for IncrementalJSONValidator."""
+
+    def test_valid_answer_accepted(self) -> None:
+        validator = IncrementalJSONValidator(SCHEMA)
+
+        feed_in_chunks(
+            validator,
+            '{"title": "Board \\"Q3\\" review", "year": 2024,\n'
+            ' "attendees": [{"name": "Ana"}, {"name": "Ben"}]}\n',
+        )
+
+        assert validator.complete
+
+    def test_incomplete_answer_is_not_rejected(self) -> None:
+        validator = IncrementalJSONValidator(SCHEMA)
+
+        validator.feed('{"title": "Board review", "attendees": [{"na')
+
+        assert not validator.complete
+
+    @pytest.mark.parametrize(
+        "text,reason",
+        [
+            ("```json", "Unexpected '`'"),
+            ('{"title": 12', "Expected string"),
+            ('{"summary"', "Property not allowed"),
+            ('{"year": 1850,', "does not conform"),
+            ('{"attendees": [{"role": "chair"}]', "does not conform"),
+            ('{"attendees": [{"name": "A"}, {"name": "B"}, {"name": "C"}]', "maxItems"),
+            ('{"title": "x"} and more', "after the JSON value"),
+            ('{"title": "x",}', "Unexpected '}'"),
+            ('{"year": true', "Expected integer or number, got boolean"),
+        ],
+    )
+    def test_invalid_answer_rejected_early(self, text: str, reason: str) -> None:
+        validator = IncrementalJSONValidator(SCHEMA)
+
+        with pytest.raises(StreamAbortedError, match=reason):
+            feed_in_chunks(validator, text)
+
+    def test_without_schema_only_syntax_is_checked(self) -> None:
+        validator = IncrementalJSONValidator(None)
+
+        validator.feed('[1, "two", {"three": null}]')
+
+        assert validator.complete
+        with pytest.raises(StreamAbortedError):
+            validator.feed("]")
+        with pytest.raises(StreamAbortedError, match="Invalid JSON literal"):
+            IncrementalJSONValidator(None).feed("[tru3")
+
+
+class TestQueryProgress:
+    def test_progress_reaches_listener_within_context(self) -> None:
+        received: list[QueryProgress] = []
+        progress = QueryProgress("query-1", 10, 250)
+
+        with listen_to_query_progress(received.append):
+            report_query_progress(progress)
+        report_query_progress(progress)
+
+        assert received == [progress]
@@ -11,9 +11,14 @@ The class follows the naming pattern documented in systemPatterns.org:
 - The knowledge service gets its own activity prefix
 """
 
+import asyncio
+import dataclasses
 import io
 import logging
+from typing import Any
 
+from temporalio import activity
+from temporalio.runtime import Runtime
 from typing_extensions import override
 
 from julee.contrib.ceap.domain.models.document import Document
@@ -24,12 +29,18 @@ from julee.contrib.ceap.domain.repositories.document import DocumentRepository
 from julee.services.knowledge_service.factory import (
     ConfigurableKnowledgeService,
 )
+from julee.services.knowledge_service.rate_limiter import RateLimiterRegistry
 from julee.services.temporal.activity_names import (
     KNOWLEDGE_SERVICE_ACTIVITY_BASE,
 )
 from julee.util.temporal.decorators import temporal_activity_registration
 
-from ..knowledge_service import FileRegistrationResult
+from ..knowledge_service import FileRegistrationResult, QueryResult
+from ..knowledge_service.streaming import QueryProgress, listen_to_query_progress
+
+# How often a running query heartbeats when it has no new progress to
+# report; well within the heartbeat timeout of the workflow proxy
+QUERY_HEARTBEAT_INTERVAL_SECONDS = 10.0
 
 
 @temporal_activity_registration(KNOWLEDGE_SERVICE_ACTIVITY_BASE)
@@ -39,10 +50,23 @@ class TemporalKnowledgeService(ConfigurableKnowledgeService):
     This class handles the issue where ContentStream objects don't survive
     Temporal's serialization by re-fetching document content from the
     injected DocumentRepository before performing operations that require it.
+
+    One instance is registered per worker, so its rate limiters are shared
+    by every knowledge service activity the worker runs.
+
+    Queries heartbeat while they run, with the progress of streamed
+    queries as heartbeat details, so that an attempt lost with its worker
+    is retried after the heartbeat timeout rather than the full activity
+    timeout.
     """
 
     def __init__(self, document_repo: DocumentRepository) -> None:
-        super().__init__()
+        # Rate limiter metrics are reported through the worker's runtime
+        super().__init__(
+            rate_limiters=RateLimiterRegistry(
+                metric_meter=Runtime.default().metric_meter
+            )
+        )
         self.logger: logging.Logger = logging.getLogger(__name__)
         self.document_repo: DocumentRepository = document_repo
 
@@ -78,6 +102,53 @@ class TemporalKnowledgeService(ConfigurableKnowledgeService):
         # Now call the parent method with the document that has proper content
         return await super().register_file(config, document)
 
+    @override
+    async def execute_query(
+        self,
+        config: KnowledgeServiceConfig,
+        query_text: str,
+        output_schema: dict[str, Any] | None = None,
+        service_file_ids: list[str] | None = None,
+        query_metadata: dict[str, Any] | None = None,
+        assistant_prompt: str | None = None,
+    ) -> QueryResult:
+        """Execute a query, heartbeating until it returns."""
+        if not activity.in_activity():
+            return await super().execute_query(
+                config,
+                query_text,
+                output_schema,
+                service_file_ids,
+                query_metadata,
+                assistant_prompt,
+            )
+
+        # Latest progress, repeated by every heartbeat until superseded
+        details: list[Any] = []
+
+        def on_progress(progress: QueryProgress) -> None:
+            details[:] = [dataclasses.asdict(progress)]
+            activity.heartbeat(*details)
+
+        async def keep_alive() -> None:
+            while True:
+                activity.heartbeat(*details)
+                await asyncio.sleep(QUERY_HEARTBEAT_INTERVAL_SECONDS)
+
+        heartbeat = asyncio.create_task(keep_alive())
+        try:
+            with listen_to_query_progress(on_progress):
+                return await super().execute_query(
+                    config,
+                    query_text,
+                    output_schema,
+                    service_file_ids,
+                    query_metadata,
+                    assistant_prompt,
+                )
+        finally:
+            heartbeat.cancel()
+
 
 # Export the temporal service classes for use in worker.py
 __all__ = [
@@ -15,8 +15,12 @@ backend code from activities.py.
 # activity registrations and workflow proxies
 KNOWLEDGE_SERVICE_ACTIVITY_BASE = "julee.knowledge_service"
 
+# Task queue for LLM-bound knowledge service activities
+KNOWLEDGE_SERVICE_TASK_QUEUE = "julee-knowledge-service-queue"
+
 
 # Export all constants
 __all__ = [
     "KNOWLEDGE_SERVICE_ACTIVITY_BASE",
+    "KNOWLEDGE_SERVICE_TASK_QUEUE",
 ]
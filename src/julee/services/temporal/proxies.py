@@ -11,11 +11,12 @@ workflow.execute_activity() with the appropriate activity names, timeouts,
 and retry policies.
 """
 
-from julee.services.knowledge_service import KnowledgeService
+from julee.services.knowledge_service import BatchKnowledgeService
 
 # Import activity name bases from shared module
 from julee.services.temporal.activity_names import (
     KNOWLEDGE_SERVICE_ACTIVITY_BASE,
+    KNOWLEDGE_SERVICE_TASK_QUEUE,
 )
 from julee.util.temporal.decorators import temporal_workflow_proxy
 
@@ -23,13 +24,24 @@ from julee.util.temporal.decorators import temporal_workflow_proxy
 @temporal_workflow_proxy(
     activity_base=KNOWLEDGE_SERVICE_ACTIVITY_BASE,
     default_timeout_seconds=300,  # 5 minutes for external service calls
-    retry_methods=["register_file", "execute_query"],
+    retry_methods=[
+        "register_file",
+        "execute_query",
+        "get_query_batch",
+        "get_query_batch_results",
+    ],
+    # A retry after the service accepted a batch would submit (and bill)
+    # the whole batch again
+    single_attempt_methods=["submit_query_batch"],
+    task_queue=KNOWLEDGE_SERVICE_TASK_QUEUE,
+    # Query activities heartbeat while they run (see TemporalKnowledgeService)
+    heartbeat_methods={"execute_query": 60},
 )
-class WorkflowKnowledgeServiceProxy(KnowledgeService):
+class WorkflowKnowledgeServiceProxy(BatchKnowledgeService):
     """
     Workflow implementation of KnowledgeService that calls activities.
     All methods are automatically generated by the @temporal_workflow_proxy
-    decorator.
+    decorator, including the query batch methods.
     """
 
     pass
@@ -0,0 +1,107 @@
+"""
+Tests for the julee Temporal worker pool configuration.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import julee.worker as worker_module
+from julee.repositories.temporal.activity_names import STORAGE_TASK_QUEUE
+from julee.services.temporal.activity_names import KNOWLEDGE_SERVICE_TASK_QUEUE
+from julee.worker import (
+    WORKFLOW_TASK_QUEUE,
+    WorkerPool,
+    build_workers,
+    create_activity_instances,
+    load_pool_configs,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class TestLoadPoolConfigs:
+    """Test environment-driven worker pool configuration."""
+
+    def test_defaults_run_all_pools(self) -> None:
+        """Test that every pool runs on its own queue by default."""
+        configs = load_pool_configs({})
+
+        assert [c.pool for c in configs] == list(WorkerPool)
+        assert {c.task_queue for c in configs} == {
+            WORKFLOW_TASK_QUEUE,
+            STORAGE_TASK_QUEUE,
+            KNOWLEDGE_SERVICE_TASK_QUEUE,
+        }
+
+    def test_selects_pools_and_reads_sizes(self) -> None:
+        """Test pool selection and per-pool concurrency overrides."""
+        configs = load_pool_configs(
+            {
+                "JULEE_WORKER_POOLS": "knowledge_service, storage",
+                "JULEE_KNOWLEDGE_SERVICE_MAX_CONCURRENT_ACTIVITIES": "3",
+                "JULEE_STORAGE_MAX_CONCURRENT_ACTIVITIES": "250",
+            }
+        )
+
+        assert [c.pool for c in configs] == [
+            WorkerPool.KNOWLEDGE_SERVICE,
+            WorkerPool.STORAGE,
+        ]
+        assert configs[0].max_concurrent_activities == 3
+        assert configs[1].max_concurrent_activities == 250
+
+    def test_invalid_sizes_fall_back_to_defaults(self) -> None:
+        """Test that invalid sizes are ignored rather than crashing."""
+        defaults = load_pool_configs({"JULEE_WORKER_POOLS": "storage"})[0]
+        configs = load_pool_configs(
+            {
+                "JULEE_WORKER_POOLS": "storage",
+                "JULEE_STORAGE_MAX_CONCURRENT_ACTIVITIES": "lots",
+                "JULEE_STORAGE_MAX_CONCURRENT_WORKFLOW_TASKS": "0",
+            }
+        )
+
+        assert configs[0] == defaults
+
+    def test_unknown_pool_raises(self) -> None:
+        """Test that a misspelled pool name fails fast."""
+        with pytest.raises(ValueError, match="valid pools"):
+            load_pool_configs({"JULEE_WORKER_POOLS": "llm"})
+
+
+class TestBuildWorkers:
+    """Test routing of workflows and activities to worker pools."""
+
+    def test_routes_activities_by_execution_mode(self) -> None:
+        """Test that each pool registers only the activities it serves."""
+        instances = create_activity_instances(MagicMock())
+
+        with patch.object(worker_module, "Worker") as mock_worker:
+            build_workers(MagicMock(), load_pool_configs({}), instances)
+
+        calls = {
+            call.kwargs["task_queue"]: call.kwargs
+            for call in mock_worker.call_args_list
+        }
+
+        def names(task_queue: str) -> set[str]:
+            return {
+                getattr(a, "__temporal_activity_definition").name
+                for a in calls[task_queue]["activities"]
+            }
+
+        workflow_activities = names(WORKFLOW_TASK_QUEUE)
+        storage_activities = names(STORAGE_TASK_QUEUE)
+        knowledge_activities = names(KNOWLEDGE_SERVICE_TASK_QUEUE)
+
+        assert calls[WORKFLOW_TASK_QUEUE]["workflows"]
+        assert not calls[STORAGE_TASK_QUEUE]["workflows"]
+        assert "julee.knowledge_service_config_repo.minio.get" in workflow_activities
+        assert "julee.document_repo.minio.save" in storage_activities
+        assert "julee.remote_schema_repo.http.fetch" in storage_activities
+        assert not workflow_activities & storage_activities
+        assert all(
+            n.startswith("julee.knowledge_service.") for n in knowledge_activities
+        )
+        assert not any(n.endswith(".generate_id") for n in storage_activities)
@@ -20,6 +20,20 @@ class FileMetadata(BaseModel):
     metadata: dict[str, str] = Field(default_factory=dict)
 
 
+class PresignedUrl(BaseModel):
+    """Time-limited URL for transferring a file directly to or from storage.
+
+    Clients send the file bytes straight to object storage with this URL,
+    so file transfers never pass through workflows or activity payloads.
+    """
+
+    file_id: str
+    url: str
+    method: str  # "PUT" for uploads, "GET" for downloads
+    expires_at: str
+    headers: dict[str, str] = Field(default_factory=dict)
+
+
 class FileUploadArgs(BaseModel):
     """
     Arguments for file upload with security validation.
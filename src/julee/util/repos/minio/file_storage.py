@@ -1,11 +1,12 @@
 import io
 import logging
 import os
+from datetime import datetime, timedelta, timezone
 
 from minio import Minio  # type: ignore[import-untyped]
 from minio.error import S3Error  # type: ignore[import-untyped]
 
-from julee.util.domain import FileMetadata, FileUploadArgs
+from julee.util.domain import FileMetadata, FileUploadArgs, PresignedUrl
 from julee.util.repositories import FileStorageRepository
 
 logger = logging.getLogger(__name__)
@@ -113,7 +114,7 @@ class MinioFileStorageRepository(FileStorageRepository):
                 io.BytesIO(args.data),
                 len(args.data),
                 content_type=args.content_type,
-                metadata=args.metadata,
+                metadata={"filename": args.filename, **args.metadata},
             )
             logger.info(
                 "File uploaded successfully to Minio",
@@ -210,3 +211,70 @@ class MinioFileStorageRepository(FileStorageRepository):
                 extra={"file_id": file_id, "error_code": e.code},
             )
             raise
+
+    async def create_upload_url(
+        self,
+        file_id: str,
+        content_type: str | None = None,
+        expires_seconds: int = 3600,
+        metadata: dict[str, str] | None = None,
+    ) -> PresignedUrl:
+        """Create a presigned PUT URL for uploading a file directly to Minio.
+
+        Metadata is signed into the URL as x-amz-meta-* query parameters,
+        which S3 stores as object metadata, exactly as if the upload had
+        sent them as headers.
+        """
+        client = await self._get_client()
+        expires = timedelta(seconds=expires_seconds)
+        url = client.get_presigned_url(
+            "PUT",
+            self._bucket_name,
+            file_id,
+            expires=expires,
+            extra_query_params=(
+                {f"x-amz-meta-{key}": value for key, value in metadata.items()}
+                if metadata
+                else None
+            ),
+        )
+        logger.info(
+            "Created presigned upload URL",
+            extra={"file_id": file_id, "expires_seconds": expires_seconds},
+        )
+        return PresignedUrl(
+            file_id=file_id,
+            url=url,
+            method="PUT",
+            expires_at=(datetime.now(timezone.utc) + expires).isoformat(),
+            headers={"Content-Type": content_type} if content_type else {},
+        )
+
+    async def create_download_url(
+        self, file_id: str, expires_seconds: int = 3600
+    ) -> PresignedUrl | None:
+        """Create a presigned GET URL for downloading a file from Minio."""
+        client = await self._get_client()
+        try:
+            client.stat_object(self._bucket_name, file_id)
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                logger.warning(
+                    "File not found in Minio, no download URL created",
+                    extra={"file_id": file_id},
+                )
+                return None
+            raise
+
+        expires = timedelta(seconds=expires_seconds)
+        url = client.presigned_get_object(self._bucket_name, file_id, expires=expires)
+        logger.info(
+            "Created presigned download URL",
+            extra={"file_id": file_id, "expires_seconds": expires_seconds},
+        )
+        return PresignedUrl(
+            file_id=file_id,
+            url=url,
+            method="GET",
+            expires_at=(datetime.now(timezone.utc) + expires).isoformat(),
+        )
@@ -1,8 +1,9 @@
 import logging
 
+import httpx
 from temporalio.client import Client
 
-from julee.util.domain import FileMetadata, FileUploadArgs
+from julee.util.domain import FileMetadata, FileUploadArgs, PresignedUrl
 from julee.util.repositories import FileStorageRepository
 
 logger = logging.getLogger(__name__)
@@ -10,58 +11,110 @@ logger = logging.getLogger(__name__)
 
 class TemporalFileStorageRepository(FileStorageRepository):
     """
-    Client-side proxy for FileStorageRepository that calls activities.
-    This proxy ensures that all interactions with the FileStorageRepository
-    are performed via Temporal activities, maintaining workflow determinism.
+    Client-side FileStorageRepository for code running outside workflows.
+
+    File content never passes through Temporal: uploads and downloads go
+    directly to object storage through presigned URLs issued by the concrete
+    repository, and metadata lookups are answered by it directly. Workflows
+    only need to record the file ids (and, through
+    WorkflowFileStorageRepositoryProxy, can hand out URLs themselves), so
+    file throughput scales with object storage rather than the Temporal
+    server and is not capped by payload size limits.
     """
 
     def __init__(
         self,
         client: Client,
         concrete_repo: FileStorageRepository | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        url_expiry_seconds: int = 900,
     ):
+        if concrete_repo is None:
+            raise ValueError(
+                "TemporalFileStorageRepository requires a concrete repository "
+                "to issue presigned URLs"
+            )
         self.client = client
         self.concrete_repo = concrete_repo
+        self.http_client = http_client
+        self.url_expiry_seconds = url_expiry_seconds
         logger.debug("Initialized TemporalFileStorageRepository")
 
     async def upload_file(self, args: FileUploadArgs) -> FileMetadata:
-        """Upload a file via Temporal activity."""
-        logger.debug(f"Client calling activity to upload file: {args.file_id}")
-
-        handle = await self.client.start_workflow(
-            "util.file_storage.minio.upload_file",
-            args,
-            id=f"upload-{args.file_id}",
-            task_queue="order-fulfillment-queue",
+        """Upload a file directly to storage through a presigned URL."""
+        logger.debug(f"Client uploading file through presigned URL: {args.file_id}")
+
+        # Stored as MinioFileStorageRepository.upload_file stores it, so
+        # get_file_metadata reports the filename and metadata
+        presigned = await self.concrete_repo.create_upload_url(
+            args.file_id,
+            args.content_type,
+            self.url_expiry_seconds,
+            {"filename": args.filename, **args.metadata},
         )
+        await self._transfer(presigned, content=args.data)
 
-        result = await handle.result()
-        return result  # type: ignore[no-any-return]
+        return FileMetadata(
+            file_id=args.file_id,
+            filename=args.filename,
+            content_type=args.content_type,
+            size_bytes=len(args.data),
+            metadata=args.metadata,
+        )
 
     async def download_file(self, file_id: str) -> bytes | None:
-        """Download a file via Temporal activity."""
-        logger.debug(f"Client calling activity to download file: {file_id}")
-
-        handle = await self.client.start_workflow(
-            "util.file_storage.minio.download_file",
-            file_id,
-            id=f"download-{file_id}",
-            task_queue="order-fulfillment-queue",
-        )
+        """Download a file directly from storage through a presigned URL."""
+        logger.debug(f"Client downloading file through presigned URL: {file_id}")
 
-        result = await handle.result()
-        return result  # type: ignore[no-any-return]
+        presigned = await self.concrete_repo.create_download_url(
+            file_id, self.url_expiry_seconds
+        )
+        if presigned is None:
+            return None
+        response = await self._transfer(presigned)
+        return response.content
 
     async def get_file_metadata(self, file_id: str) -> FileMetadata | None:
-        """Retrieve file metadata via Temporal activity."""
-        logger.debug(f"Client calling activity to get file metadata: {file_id}")
-
-        handle = await self.client.start_workflow(
-            "util.file_storage.minio.get_file_metadata",
-            file_id,
-            id=f"metadata-{file_id}",
-            task_queue="order-fulfillment-queue",
+        """Retrieve file metadata from the concrete repository."""
+        logger.debug(f"Client getting file metadata: {file_id}")
+        return await self.concrete_repo.get_file_metadata(file_id)
+
+    async def create_upload_url(
+        self,
+        file_id: str,
+        content_type: str | None = None,
+        expires_seconds: int = 3600,
+        metadata: dict[str, str] | None = None,
+    ) -> PresignedUrl:
+        """Create a direct upload URL."""
+        return await self.concrete_repo.create_upload_url(
+            file_id, content_type, expires_seconds, metadata
         )
 
-        result = await handle.result()
-        return result  # type: ignore[no-any-return]
+    async def create_download_url(
+        self, file_id: str, expires_seconds: int = 3600
+    ) -> PresignedUrl | None:
+        """Create a direct download URL."""
+        return await self.concrete_repo.create_download_url(file_id, expires_seconds)
+
+    async def _transfer(
+        self, presigned: PresignedUrl, content: bytes | None = None
+    ) -> httpx.Response:
+        """Perform the HTTP request described by a presigned URL."""
+        if self.http_client is not None:
+            response = await self.http_client.request(
+                presigned.method,
+                presigned.url,
+                headers=presigned.headers,
+                content=content,
+            )
+        else:
+            async with httpx.AsyncClient() as http_client:
+                response = await http_client.request(
+                    presigned.method,
+                    presigned.url,
+                    headers=presigned.headers,
+                    content=content,
+                )
+        response.raise_for_status()
+        return response
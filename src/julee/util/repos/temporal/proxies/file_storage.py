@@ -1,8 +1,9 @@
 import logging
+from datetime import timedelta
 
 from temporalio import workflow
 
-from julee.util.domain import FileMetadata, FileUploadArgs
+from julee.util.domain import FileMetadata, FileUploadArgs, PresignedUrl
 from julee.util.repositories import FileStorageRepository
 
 logger = logging.getLogger(__name__)
@@ -19,7 +20,9 @@ class WorkflowFileStorageRepositoryProxy(FileStorageRepository):
         # Activity timeout can be configured, but for simplicity, we use a
         # default here or could retrieve from workflow config.
         # This timeout should be generous enough for large file transfers.
-        self.activity_timeout = workflow.timedelta(seconds=600)  # 10 minutes
+        self.activity_timeout = timedelta(seconds=600)  # 10 minutes
+        # Presigning only signs a URL, so it needs no transfer allowance.
+        self.presign_timeout = timedelta(seconds=30)
         logger.debug("Initialized WorkflowFileStorageRepositoryProxy")
 
     async def upload_file(self, args: FileUploadArgs) -> FileMetadata:
@@ -55,3 +58,37 @@ class WorkflowFileStorageRepositoryProxy(FileStorageRepository):
         if result is None:
             return None
         return FileMetadata.model_validate(result)
+
+    async def create_upload_url(
+        self,
+        file_id: str,
+        content_type: str | None = None,
+        expires_seconds: int = 3600,
+        metadata: dict[str, str] | None = None,
+    ) -> PresignedUrl:
+        """Create a direct upload URL via Temporal activity.
+
+        Only the URL passes through the workflow; the client uploads the
+        content straight to storage.
+        """
+        logger.debug(f"Workflow calling activity to presign upload: {file_id}")
+        result = await workflow.execute_activity(
+            "util.file_storage.minio.create_upload_url",
+            args=[file_id, content_type, expires_seconds, metadata],
+            start_to_close_timeout=self.presign_timeout,
+        )
+        return PresignedUrl.model_validate(result)
+
+    async def create_download_url(
+        self, file_id: str, expires_seconds: int = 3600
+    ) -> PresignedUrl | None:
+        """Create a direct download URL via Temporal activity."""
+        logger.debug(f"Workflow calling activity to presign download: {file_id}")
+        result = await workflow.execute_activity(
+            "util.file_storage.minio.create_download_url",
+            args=[file_id, expires_seconds],
+            start_to_close_timeout=self.presign_timeout,
+        )
+        if result is None:
+            return None
+        return PresignedUrl.model_validate(result)
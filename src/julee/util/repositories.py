@@ -1,6 +1,6 @@
 from typing import Protocol, runtime_checkable
 
-from julee.util.domain import FileMetadata, FileUploadArgs
+from julee.util.domain import FileMetadata, FileUploadArgs, PresignedUrl
 
 
 @runtime_checkable
@@ -52,3 +52,46 @@ class FileStorageRepository(Protocol):
             FileMetadata object if found, None otherwise.
         """
         ...
+
+    async def create_upload_url(
+        self,
+        file_id: str,
+        content_type: str | None = None,
+        expires_seconds: int = 3600,
+        metadata: dict[str, str] | None = None,
+    ) -> PresignedUrl:
+        """Create a URL through which a client can upload a file directly.
+
+        Args:
+            file_id: Unique identifier the uploaded file will be stored under.
+            content_type: Content type the client should declare on upload.
+            expires_seconds: How long the URL remains valid.
+            metadata: Metadata to store with the uploaded file, as
+                get_file_metadata returns it.
+
+        Returns:
+            PresignedUrl for an HTTP PUT of the file content, including any
+            headers the client must send.
+
+        Implementation Notes:
+        - Must not transfer any file content itself.
+        - The upload through the URL must be idempotent per file_id.
+        - The metadata must be bound to the URL (e.g. signed into it), so
+          the upload stores it without the client sending it separately.
+        """
+        ...
+
+    async def create_download_url(
+        self, file_id: str, expires_seconds: int = 3600
+    ) -> PresignedUrl | None:
+        """Create a URL through which a client can download a file directly.
+
+        Args:
+            file_id: Unique identifier of the file.
+            expires_seconds: How long the URL remains valid.
+
+        Returns:
+            PresignedUrl for an HTTP GET of the file content if the file
+            exists, None otherwise.
+        """
+        ...
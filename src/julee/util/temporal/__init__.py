@@ -6,17 +6,21 @@ Temporal workflows and activities.
 """
 
 from .activities import (
+    ExecutionMode,
     collect_activities_from_instances,
     discover_protocol_methods,
 )
 from .decorators import (
     temporal_activity_registration,
     temporal_workflow_proxy,
+    workflow_prefixed_id,
 )
 
 __all__ = [
+    "ExecutionMode",
     "collect_activities_from_instances",
     "discover_protocol_methods",
     "temporal_activity_registration",
     "temporal_workflow_proxy",
+    "workflow_prefixed_id",
 ]
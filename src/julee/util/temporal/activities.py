@@ -8,11 +8,38 @@ for manual activity registration boilerplate.
 
 import inspect
 import logging
+from collections.abc import Iterable
+from enum import Enum
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+class ExecutionMode(str, Enum):
+    """How a workflow proxy method is executed."""
+
+    ACTIVITY = "activity"
+    LOCAL_ACTIVITY = "local_activity"
+    WORKFLOW_LOCAL = "workflow_local"
+
+
+# Execution modes declared by workflow proxies, keyed by activity base. Only
+# methods that deviate from ExecutionMode.ACTIVITY are recorded.
+_execution_modes: dict[str, dict[str, ExecutionMode]] = {}
+
+
+def register_execution_modes(
+    activity_base: str, modes: dict[str, ExecutionMode]
+) -> None:
+    """Record the per-method execution modes declared for an activity base."""
+    _execution_modes[activity_base] = dict(modes)
+
+
+def get_execution_modes(activity_base: str) -> dict[str, ExecutionMode]:
+    """Return the non-default execution modes declared for an activity base."""
+    return dict(_execution_modes.get(activity_base, {}))
+
+
 def discover_protocol_methods(
     cls_hierarchy: tuple[type, ...],
 ) -> dict[str, Any]:
@@ -69,7 +96,9 @@ def discover_protocol_methods(
     return methods_to_wrap
 
 
-def collect_activities_from_instances(*instances: Any) -> list[Any]:
+def collect_activities_from_instances(
+    *instances: Any, modes: Iterable[ExecutionMode] | None = None
+) -> list[Any]:
     """Automatically collect all activity methods from decorated instances.
 
     Uses protocol method discovery to find and collect all methods that have
@@ -77,9 +106,17 @@ def collect_activities_from_instances(*instances: Any) -> list[Any]:
     decorator. This ensures we don't miss any activities and eliminates
     boilerplate registration code.
 
+    Methods that a workflow proxy declared as ExecutionMode.WORKFLOW_LOCAL
+    never run as activities and are skipped. Local activities are still
+    collected: Temporal resolves them from the same worker registration.
+
     Args:
         *instances: Repository and service instances decorated with
             @temporal_activity_registration
+        modes: Only collect methods declared with one of these execution
+            modes (undeclared methods count as ExecutionMode.ACTIVITY).
+            Useful when local activities must be registered on the
+            workflow worker and regular activities on a separate pool.
 
     Returns:
         List of activity methods ready for Worker registration
@@ -101,13 +138,28 @@ def collect_activities_from_instances(*instances: Any) -> list[Any]:
         )
     """
     activities = []
+    skipped = 0
+    wanted = set(modes) if modes is not None else None
 
     for instance in instances:
         # Use the same discovery logic as the decorator
         methods_to_collect = discover_protocol_methods(instance.__class__.__mro__)
 
+        activity_prefix = getattr(instance.__class__, "_temporal_activity_prefix", None)
+        declared = get_execution_modes(activity_prefix) if activity_prefix else {}
+
         # Get the actual bound methods from the instance
         for method_name in methods_to_collect:
+            mode = declared.get(method_name, ExecutionMode.ACTIVITY)
+            if mode is ExecutionMode.WORKFLOW_LOCAL or (
+                wanted is not None and mode not in wanted
+            ):
+                skipped += 1
+                logger.debug(
+                    f"Skipping {mode.value} method: "
+                    f"{instance.__class__.__name__}.{method_name}"
+                )
+                continue
             if hasattr(instance, method_name):
                 bound_method = getattr(instance, method_name)
                 activities.append(bound_method)
@@ -117,7 +169,8 @@ def collect_activities_from_instances(*instances: Any) -> list[Any]:
                 )
 
     logger.info(
-        f"Collected {len(activities)} activities from " f"{len(instances)} instances"
+        f"Collected {len(activities)} activities from " f"{len(instances)} instances",
+        extra={"skipped_methods": skipped},
     )
 
     return activities
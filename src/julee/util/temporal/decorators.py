@@ -10,11 +10,13 @@ Both reduce boilerplate and ensure consistent patterns.
 import functools
 import inspect
 import logging
-from collections.abc import Callable
+import types
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 from typing import (
     Any,
     TypeVar,
+    Union,
     get_args,
     get_origin,
 )
@@ -25,10 +27,18 @@ from temporalio.common import RetryPolicy
 
 from julee.repositories.base import BaseRepository
 
-from .activities import discover_protocol_methods
+from .activities import (
+    ExecutionMode,
+    discover_protocol_methods,
+    register_execution_modes,
+)
 
 logger = logging.getLogger(__name__)
 
+# workflow.execute_activity and workflow.execute_local_activity, called by
+# activity name with positional args and keyword options
+ActivityExecutor = Callable[..., Awaitable[Any]]
+
 T = TypeVar("T")
 
 
@@ -85,6 +95,9 @@ def _substitute_typevar_with_concrete(annotation: Any, concrete_type: type) -> A
         return concrete_type
 
     origin = get_origin(annotation)
+    # X | Y unions cannot be subscripted; rebuild them as typing.Union
+    if origin is types.UnionType:
+        origin = Union
     if origin is not None:
         args = get_args(annotation)
         if args:
@@ -187,6 +200,9 @@ def temporal_activity_registration(
 
             wrapped_methods.append(name)
 
+        # Lets collect_activities_from_instances look up declared modes
+        cls._temporal_activity_prefix = activity_prefix  # type: ignore[attr-defined]
+
         logger.info(
             f"Temporal activity registration decorator applied to {cls.__name__}",
             extra={
@@ -204,6 +220,12 @@ def temporal_workflow_proxy(
     activity_base: str,
     default_timeout_seconds: int = 30,
     retry_methods: list[str] | None = None,
+    workflow_local_methods: dict[str, Callable[..., Any]] | None = None,
+    local_activity_methods: list[str] | None = None,
+    local_activity_timeout_seconds: int = 5,
+    task_queue: str | None = None,
+    heartbeat_methods: dict[str, int] | None = None,
+    single_attempt_methods: list[str] | None = None,
 ) -> Callable[[type[T]], type[T]]:
     """
     Class decorator that automatically creates workflow proxy methods that
@@ -213,10 +235,45 @@ def temporal_workflow_proxy(
     generates methods that call workflow.execute_activity with the appropriate
     activity names, timeouts, and retry policies.
 
+    Methods listed in workflow_local_methods are not sent to an activity at
+    all: the given callable runs inside the workflow with the method's
+    positional arguments. It must be deterministic (e.g. use
+    workflow.uuid4() rather than uuid.uuid4()), which makes it suitable for
+    cheap, side-effect free methods such as generate_id().
+
+    Methods listed in local_activity_methods run as local activities: the
+    worker executing the workflow task calls them directly, skipping the
+    task-queue dispatch and server round-trip of a regular activity. They
+    get their own, shorter timeout and retry policy, so they suit quick
+    metadata reads rather than long-running or large-payload calls.
+
+    Methods listed in heartbeat_methods run as activities with a heartbeat
+    timeout: an attempt that stops heartbeating (say, because its worker
+    died) is retried after that long, rather than at the end of the whole
+    activity timeout. Their activity implementations must heartbeat.
+
+    Methods listed in single_attempt_methods are never retried, for calls
+    whose side effects a retry would repeat (such as submitting work that
+    is billed). Other methods outside retry_methods get Temporal's default,
+    unlimited retries.
+
     Args:
         activity_base: Base activity name (e.g., "julee.document_repo.minio")
         default_timeout_seconds: Default timeout for activities in seconds
         retry_methods: List of method names that should use retry policies
+        workflow_local_methods: Mapping of method names to deterministic
+            callables that implement them inside the workflow
+        local_activity_methods: List of method names to run as local
+            activities
+        local_activity_timeout_seconds: Timeout for local activities in
+            seconds
+        task_queue: Task queue that regular activities are dispatched to.
+            Defaults to the workflow's own task queue. Local activities
+            always run on the workflow's worker.
+        heartbeat_methods: Mapping of method names to heartbeat timeouts
+            in seconds, for long-running activities that heartbeat
+        single_attempt_methods: List of method names whose activities are
+            attempted once
 
     Returns:
         The decorated class with all protocol methods implemented as workflow
@@ -235,12 +292,40 @@ def temporal_workflow_proxy(
         # - get() -> calls "julee.document_repo.minio.get" activity
         # - save() -> calls "julee.document_repo.minio.save" with retry
         # - generate_id() -> calls "julee.document_repo.minio.generate_id" with retry
+
+        @temporal_workflow_proxy(
+            "julee.document_repo.minio",
+            retry_methods=["save"],
+            workflow_local_methods={"generate_id": workflow_prefixed_id("doc")},
+        )
+        class WorkflowDocumentRepositoryProxy(DocumentRepository):
+            pass
+
+        # - generate_id() -> returns "doc-<uuid>" without scheduling an activity
     """
 
     def decorator(cls: type[T]) -> type[T]:
         logger.debug(f"Applying temporal_workflow_proxy decorator to {cls.__name__}")
 
         retry_methods_set = set(retry_methods or [])
+        local_methods = dict(workflow_local_methods or {})
+        local_activity_set = set(local_activity_methods or [])
+        heartbeat_timeouts = dict(heartbeat_methods or {})
+        single_attempt_set = set(single_attempt_methods or [])
+
+        overlap = sorted(single_attempt_set & retry_methods_set)
+        if overlap:
+            raise ValueError(
+                f"Methods of {cls.__name__} declared both retried and "
+                f"single attempt: {overlap}"
+            )
+
+        overlap = sorted(local_activity_set & set(local_methods))
+        if overlap:
+            raise ValueError(
+                f"Methods of {cls.__name__} declared both workflow-local and "
+                f"local activity: {overlap}"
+            )
 
         # Create default retry policy for methods that need it
         default_retry_policy = RetryPolicy(
@@ -250,13 +335,55 @@ def temporal_workflow_proxy(
             maximum_interval=timedelta(seconds=1),
         )
 
+        # Local activities retry within the workflow task, so keep the
+        # backoff short
+        local_retry_policy = RetryPolicy(
+            initial_interval=timedelta(milliseconds=100),
+            maximum_attempts=3,
+            backoff_coefficient=2.0,
+            maximum_interval=timedelta(seconds=1),
+        )
+
+        single_attempt_policy = RetryPolicy(maximum_attempts=1)
+
         # Use method discovery - for workflow proxies, wrap protocol methods
         methods_to_implement = discover_protocol_methods(cls.__mro__)
 
+        unknown = sorted(
+            (
+                set(local_methods)
+                | local_activity_set
+                | set(heartbeat_timeouts)
+                | single_attempt_set
+            )
+            - set(methods_to_implement)
+        )
+        if unknown:
+            raise ValueError(
+                f"Execution modes for {cls.__name__} name methods that "
+                f"are not part of its protocol: {unknown}"
+            )
+
+        execution_modes = dict.fromkeys(
+            local_methods, ExecutionMode.WORKFLOW_LOCAL
+        ) | dict.fromkeys(local_activity_set, ExecutionMode.LOCAL_ACTIVITY)
+        register_execution_modes(activity_base, execution_modes)
+
         # Generate workflow proxy methods
         wrapped_methods = []
 
         for method_name, original_method in methods_to_implement.items():
+            if method_name in local_methods:
+                setattr(
+                    cls,
+                    method_name,
+                    _create_workflow_local_method(
+                        method_name, local_methods[method_name], original_method
+                    ),
+                )
+                wrapped_methods.append(method_name)
+                continue
+
             logger.debug(
                 f"Creating workflow proxy method {method_name} -> "
                 f"{activity_base}.{method_name}"
@@ -303,6 +430,7 @@ def temporal_workflow_proxy(
                 is_optional: bool,
                 inner_type: Any,
                 original_method: Any,
+                is_local_activity: bool,
             ) -> Callable[..., Any]:
                 @functools.wraps(original_method)
                 async def workflow_method(self: Any, *args: Any, **kwargs: Any) -> Any:
@@ -310,18 +438,30 @@ def temporal_workflow_proxy(
                     activity_name = f"{activity_base}.{method_name}"
 
                     # Set up activity options
-                    activity_timeout = timedelta(seconds=default_timeout_seconds)
-                    retry_policy = None
+                    execute: ActivityExecutor
+                    if is_local_activity:
+                        execute = workflow.execute_local_activity
+                        activity_timeout = timedelta(
+                            seconds=local_activity_timeout_seconds
+                        )
+                        retry_policy = local_retry_policy
+                    else:
+                        execute = workflow.execute_activity
+                        activity_timeout = timedelta(seconds=default_timeout_seconds)
+                        retry_policy = None
 
-                    # Add retry policy if this method needs it
-                    if method_name in retry_methods_set:
-                        retry_policy = default_retry_policy
+                        # Add retry policy if this method needs it
+                        if method_name in retry_methods_set:
+                            retry_policy = default_retry_policy
+                        elif method_name in single_attempt_set:
+                            retry_policy = single_attempt_policy
 
                     # Log the call
                     logger.debug(
                         f"Workflow: Calling {method_name} activity",
                         extra={
                             "activity_name": activity_name,
+                            "local_activity": is_local_activity,
                             "args_count": len(args),
                             "kwargs_count": len(kwargs),
                         },
@@ -340,19 +480,30 @@ def temporal_workflow_proxy(
                             f"arguments instead of: {list(kwargs.keys())}"
                         )
 
+                    # Route regular activities to their own task queue
+                    options: dict[str, Any] = {}
+                    if task_queue is not None and not is_local_activity:
+                        options["task_queue"] = task_queue
+                    if method_name in heartbeat_timeouts and not is_local_activity:
+                        options["heartbeat_timeout"] = timedelta(
+                            seconds=heartbeat_timeouts[method_name]
+                        )
+
                     # Execute the activity
                     if activity_args:
-                        raw_result = await workflow.execute_activity(
+                        raw_result = await execute(
                             activity_name,
                             args=activity_args,
                             start_to_close_timeout=activity_timeout,
                             retry_policy=retry_policy,
+                            **options,
                         )
                     else:
-                        raw_result = await workflow.execute_activity(
+                        raw_result = await execute(
                             activity_name,
                             start_to_close_timeout=activity_timeout,
                             retry_policy=retry_policy,
+                            **options,
                         )
 
                     # Handle return value validation
@@ -398,6 +549,7 @@ def temporal_workflow_proxy(
                     is_optional,
                     inner_type,
                     original_method,
+                    method_name in local_activity_set,
                 ),
             )
             wrapped_methods.append(method_name)
@@ -412,6 +564,8 @@ def temporal_workflow_proxy(
             logger.debug(f"Initialized {cls.__name__}")
 
         cls.__init__ = __init__
+        cls.execution_modes = execution_modes  # type: ignore[attr-defined]
+        cls.task_queue = task_queue  # type: ignore[attr-defined]
 
         logger.info(
             f"Temporal workflow proxy decorator applied to {cls.__name__}",
@@ -420,6 +574,10 @@ def temporal_workflow_proxy(
                 "activity_base": activity_base,
                 "default_timeout_seconds": default_timeout_seconds,
                 "retry_methods": list(retry_methods_set),
+                "single_attempt_methods": list(single_attempt_set),
+                "workflow_local_methods": list(local_methods),
+                "local_activity_methods": list(local_activity_set),
+                "task_queue": task_queue,
             },
         )
 
@@ -428,6 +586,57 @@ def temporal_workflow_proxy(
     return decorator
 
 
+def _create_workflow_local_method(
+    method_name: str,
+    local_impl: Callable[..., Any],
+    original_method: Any,
+) -> Callable[..., Any]:
+    """Build a proxy method that runs local_impl inside the workflow."""
+
+    @functools.wraps(original_method)
+    async def workflow_method(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            raise ValueError(
+                f"Keyword arguments not supported in workflow "
+                f"proxy for {method_name}. Please modify the calling code "
+                f"to use positional arguments instead of: {list(kwargs.keys())}"
+            )
+
+        result = local_impl(*args)
+        if inspect.isawaitable(result):
+            result = await result
+
+        logger.debug(
+            f"Workflow: {method_name} completed in workflow",
+            extra={"result_type": type(result).__name__},
+        )
+
+        return result
+
+    return workflow_method
+
+
+def workflow_prefixed_id(prefix: str) -> Callable[[], str]:
+    """Deterministic in-workflow replacement for generate_id_with_prefix.
+
+    Produces ids in the same "{prefix}-{uuid}" format as
+    MinioRepositoryMixin.generate_id_with_prefix, but draws the uuid from
+    workflow.uuid4() so the value is recorded by the workflow's random seed
+    and replays identically.
+
+    Args:
+        prefix: Prefix for the generated ID (e.g., "doc", "assembly")
+
+    Returns:
+        Zero-argument callable for use in workflow_local_methods
+    """
+
+    def generate_id() -> str:
+        return f"{prefix}-{workflow.uuid4()}"
+
+    return generate_id
+
+
 def _needs_pydantic_validation(annotation: Any) -> bool:
     """Check if a type annotation indicates a Pydantic model."""
     if annotation is None or annotation == inspect.Signature.empty:
@@ -8,6 +8,7 @@ async methods as Temporal activities and handle type substitution correctly.
 # Standard library imports
 import asyncio
 import inspect
+import uuid
 from typing import (
     Any,
     Protocol,
@@ -26,12 +27,17 @@ from temporalio import activity
 # Project imports
 import julee.util.temporal.decorators as decorators_module
 from julee.repositories.base import BaseRepository
+from julee.util.temporal.activities import (
+    ExecutionMode,
+    collect_activities_from_instances,
+)
 from julee.util.temporal.decorators import (
     _extract_concrete_type_from_base,
     _needs_pydantic_validation,
     _substitute_typevar_with_concrete,
     temporal_activity_registration,
     temporal_workflow_proxy,
+    workflow_prefixed_id,
 )
 
 pytestmark = pytest.mark.unit
@@ -549,6 +555,14 @@ class TestTypeSubstitution:
         assert MockDocument in inner_args
         assert type(None) in inner_args
 
+    def test_substitutes_in_concrete_optional(self) -> None:
+        """Test X | None unions of concrete types, which are not subscriptable."""
+        result = _substitute_typevar_with_concrete(
+            MockDocument | None, MockAssemblySpecification
+        )
+
+        assert set(get_args(result)) == {MockDocument, type(None)}
+
     def test_returns_non_generic_types_unchanged(self) -> None:
         """Test that non-generic types are returned unchanged."""
         result_str = _substitute_typevar_with_concrete(str, MockAssemblySpecification)
@@ -727,6 +741,229 @@ class TestWorkflowProxyIntegration:
         assert concrete_type is None
 
 
+class TestWorkflowLocalMethods:
+    """Tests for methods that run inside the workflow instead of an activity."""
+
+    @pytest.mark.asyncio
+    async def test_local_method_does_not_execute_activity(self) -> None:
+        """Test that workflow-local methods never schedule an activity."""
+
+        @temporal_workflow_proxy(
+            activity_base="test.document_repo.minio",
+            workflow_local_methods={"generate_id": lambda: "doc-fixed"},
+        )
+        class TestLocalProxy(MockDocumentRepository):
+            pass
+
+        proxy = TestLocalProxy()  # type: ignore[abstract]
+
+        with patch.object(
+            decorators_module.workflow, "execute_activity"
+        ) as mock_execute:
+            result = await proxy.generate_id()
+
+        assert result == "doc-fixed"
+        mock_execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_local_method_receives_positional_args(self) -> None:
+        """Test that positional arguments are passed to the local callable."""
+
+        async def local_get(document_id: str) -> MockDocument:
+            return MockDocument(document_id=document_id, title="t", content="c")
+
+        @temporal_workflow_proxy(
+            activity_base="test.document_repo.minio",
+            workflow_local_methods={"get": local_get},
+        )
+        class TestLocalProxy(MockDocumentRepository):
+            pass
+
+        proxy = TestLocalProxy()  # type: ignore[abstract]
+        result = await proxy.get("doc-1")
+
+        assert result.document_id == "doc-1"
+        with pytest.raises(ValueError, match="Keyword arguments"):
+            await proxy.get(document_id="doc-1")
+
+    @pytest.mark.asyncio
+    async def test_other_methods_still_execute_activities(self) -> None:
+        """Test that only declared methods are made workflow-local."""
+
+        @temporal_workflow_proxy(
+            activity_base="test.document_repo.minio",
+            workflow_local_methods={"generate_id": lambda: "doc-fixed"},
+        )
+        class TestLocalProxy(MockDocumentRepository):
+            pass
+
+        proxy = TestLocalProxy()  # type: ignore[abstract]
+
+        with patch.object(
+            decorators_module.workflow, "execute_activity", return_value=None
+        ) as mock_execute:
+            await proxy.get("doc-1")
+
+        assert mock_execute.call_args.args[0] == "test.document_repo.minio.get"
+
+    def test_unknown_local_method_raises(self) -> None:
+        """Test that declaring a method outside the protocol fails fast."""
+        with pytest.raises(ValueError, match="not part of its protocol"):
+
+            @temporal_workflow_proxy(
+                activity_base="test.document_repo.minio",
+                workflow_local_methods={"mint_id": lambda: "x"},
+            )
+            class TestLocalProxy(MockDocumentRepository):
+                pass
+
+    def test_workflow_prefixed_id_uses_workflow_uuid(self) -> None:
+        """Test that prefixed ids draw from the deterministic workflow uuid."""
+        fixed = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        generate_id = workflow_prefixed_id("assembly")
+
+        with patch.object(decorators_module.workflow, "uuid4", return_value=fixed):
+            assert generate_id() == f"assembly-{fixed}"
+
+
+class TestLocalActivityMethods:
+    """Tests for methods executed as Temporal local activities."""
+
+    @pytest.mark.asyncio
+    async def test_local_activity_method_uses_local_activity(self) -> None:
+        """Test that declared methods call execute_local_activity."""
+
+        @temporal_workflow_proxy(
+            activity_base="test.local_repo.minio",
+            retry_methods=["get"],
+            local_activity_methods=["get"],
+            local_activity_timeout_seconds=3,
+        )
+        class TestLocalActivityProxy(MockDocumentRepository):
+            pass
+
+        proxy = TestLocalActivityProxy()  # type: ignore[abstract]
+
+        with (
+            patch.object(
+                decorators_module.workflow, "execute_local_activity", return_value=None
+            ) as mock_local,
+            patch.object(decorators_module.workflow, "execute_activity") as mock_remote,
+        ):
+            await proxy.get("doc-1")
+
+        mock_remote.assert_not_called()
+        assert mock_local.call_args.args[0] == "test.local_repo.minio.get"
+        kwargs = mock_local.call_args.kwargs
+        assert kwargs["args"] == ("doc-1",)
+        assert kwargs["start_to_close_timeout"].total_seconds() == 3
+        assert kwargs["retry_policy"].maximum_attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_method_gets_heartbeat_timeout(self) -> None:
+        """Test that declared methods are scheduled with a heartbeat timeout."""
+
+        @temporal_workflow_proxy(
+            activity_base="test.heartbeat_repo.minio",
+            heartbeat_methods={"save": 20},
+        )
+        class TestHeartbeatProxy(MockDocumentRepository):
+            pass
+
+        proxy = TestHeartbeatProxy()  # type: ignore[abstract]
+
+        with patch.object(
+            decorators_module.workflow, "execute_activity", return_value=None
+        ) as mock_execute:
+            await proxy.save(MockDocument(document_id="d", title="t", content="c"))
+            await proxy.get("doc-1")
+
+        save_call, get_call = mock_execute.call_args_list
+        assert save_call.kwargs["heartbeat_timeout"].total_seconds() == 20
+        assert "heartbeat_timeout" not in get_call.kwargs
+
+    @pytest.mark.asyncio
+    async def test_single_attempt_method_is_not_retried(self) -> None:
+        """Test that declared methods are scheduled with one attempt."""
+
+        @temporal_workflow_proxy(
+            activity_base="test.single_attempt_repo.minio",
+            single_attempt_methods=["save"],
+        )
+        class TestSingleAttemptProxy(MockDocumentRepository):
+            pass
+
+        proxy = TestSingleAttemptProxy()  # type: ignore[abstract]
+
+        with patch.object(
+            decorators_module.workflow, "execute_activity", return_value=None
+        ) as mock_execute:
+            await proxy.save(MockDocument(document_id="d", title="t", content="c"))
+
+        assert mock_execute.call_args.kwargs["retry_policy"].maximum_attempts == 1
+
+    def test_retried_single_attempt_method_raises(self) -> None:
+        """Test that a method cannot be both retried and single attempt."""
+        with pytest.raises(ValueError, match="both retried and single attempt"):
+
+            @temporal_workflow_proxy(
+                activity_base="test.single_attempt_repo.minio",
+                retry_methods=["save"],
+                single_attempt_methods=["save"],
+            )
+            class TestSingleAttemptProxy(MockDocumentRepository):
+                pass
+
+    def test_execution_modes_are_recorded(self) -> None:
+        """Test that the proxy exposes its non-default execution modes."""
+
+        @temporal_workflow_proxy(
+            activity_base="test.modes_repo.minio",
+            workflow_local_methods={"generate_id": lambda: "x"},
+            local_activity_methods=["get"],
+        )
+        class TestModesProxy(MockDocumentRepository):
+            pass
+
+        assert TestModesProxy.execution_modes == {  # type: ignore[attr-defined]
+            "generate_id": ExecutionMode.WORKFLOW_LOCAL,
+            "get": ExecutionMode.LOCAL_ACTIVITY,
+        }
+
+    def test_conflicting_modes_raise(self) -> None:
+        """Test that a method cannot be both workflow-local and local activity."""
+        with pytest.raises(ValueError, match="both workflow-local"):
+
+            @temporal_workflow_proxy(
+                activity_base="test.document_repo.minio",
+                workflow_local_methods={"get": lambda document_id: None},
+                local_activity_methods=["get"],
+            )
+            class TestConflictProxy(MockDocumentRepository):
+                pass
+
+    def test_collect_skips_workflow_local_methods(self) -> None:
+        """Test that worker registration omits workflow-local methods."""
+
+        @temporal_workflow_proxy(
+            activity_base="test.collect_repo.minio",
+            workflow_local_methods={"base_async_method": lambda arg1: arg1},
+            local_activity_methods=["get_payment"],
+        )
+        class TestCollectProxy(MockRepositoryProtocol):
+            pass
+
+        @temporal_activity_registration("test.collect_repo.minio")
+        class TestCollectActivities(MockRepository):
+            pass
+
+        activities = collect_activities_from_instances(TestCollectActivities())
+        names = {a.__name__ for a in activities}
+
+        assert "base_async_method" not in names
+        assert {"get_payment", "process_payment", "refund_payment"} <= names
+
+
 class TestEndToEndTypeSubstitution:
     """End-to-end tests demonstrating the complete type substitution fix."""
 
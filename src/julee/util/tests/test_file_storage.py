@@ -0,0 +1,211 @@
+"""
+Tests for presigned-URL file storage.
+
+These tests check that file content is transferred directly through
+presigned URLs rather than through Temporal, and that the Minio repository
+issues URLs for the right objects.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import parse_qsl, urlparse
+
+import httpx
+import pytest
+from minio import Minio
+from minio.datatypes import Object
+from minio.error import S3Error
+
+from julee.util.domain import FileUploadArgs, PresignedUrl
+from julee.util.repos.minio.file_storage import MinioFileStorageRepository
+from julee.util.repos.temporal.client_proxies.file_storage import (
+    TemporalFileStorageRepository,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def concrete_repo() -> AsyncMock:
+    repo = AsyncMock()
+    repo.create_upload_url.return_value = PresignedUrl(
+        file_id="file-1",
+        url="http://storage.test/file-storage/file-1?X-Amz-Signature=up",
+        method="PUT",
+        expires_at="2030-01-01T00:00:00+00:00",
+        headers={"Content-Type": "text/plain"},
+    )
+    repo.create_download_url.return_value = PresignedUrl(
+        file_id="file-1",
+        url="http://storage.test/file-storage/file-1?X-Amz-Signature=down",
+        method="GET",
+        expires_at="2030-01-01T00:00:00+00:00",
+    )
+    return repo
+
+
+class TestTemporalFileStorageRepository:
+    """File transfers go straight to storage through presigned URLs."""
+
+    async def test_upload_puts_content_to_presigned_url(
+        self, concrete_repo: AsyncMock
+    ) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        repo = TemporalFileStorageRepository(
+            MagicMock(), concrete_repo, http_client=http_client
+        )
+
+        metadata = await repo.upload_file(
+            FileUploadArgs(
+                file_id="file-1",
+                filename="notes.txt",
+                data=b"hello storage",
+                content_type="text/plain",
+            )
+        )
+
+        assert metadata.size_bytes == len(b"hello storage")
+        assert [(r.method, r.url.params["X-Amz-Signature"]) for r in requests] == [
+            ("PUT", "up")
+        ]
+        assert requests[0].content == b"hello storage"
+        assert requests[0].headers["Content-Type"] == "text/plain"
+        concrete_repo.create_upload_url.assert_awaited_once_with(
+            "file-1", "text/plain", 900, {"filename": "notes.txt"}
+        )
+
+    async def test_download_gets_content_from_presigned_url(
+        self, concrete_repo: AsyncMock
+    ) -> None:
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=b"stored bytes")
+            )
+        )
+        repo = TemporalFileStorageRepository(
+            MagicMock(), concrete_repo, http_client=http_client
+        )
+
+        assert await repo.download_file("file-1") == b"stored bytes"
+
+    async def test_download_missing_file(self, concrete_repo: AsyncMock) -> None:
+        concrete_repo.create_download_url.return_value = None
+        repo = TemporalFileStorageRepository(MagicMock(), concrete_repo)
+
+        assert await repo.download_file("missing") is None
+
+    def test_requires_concrete_repository(self) -> None:
+        with pytest.raises(ValueError, match="concrete repository"):
+            TemporalFileStorageRepository(MagicMock())
+
+
+class TestMinioFileStoragePresignedUrls:
+    """Presigned URLs are signed locally for the configured bucket."""
+
+    @pytest.fixture
+    def repo(self) -> MinioFileStorageRepository:
+        repo = MinioFileStorageRepository(
+            endpoint="storage.test:9000",
+            access_key="access",
+            secret_key="secret-key",
+            bucket_name="files",
+        )
+        # A region avoids the bucket-location lookup, so signing is offline
+        repo._client = Minio(
+            "storage.test:9000",
+            access_key="access",
+            secret_key="secret-key",
+            secure=False,
+            region="us-east-1",
+        )
+        return repo
+
+    async def test_create_upload_url(self, repo: MinioFileStorageRepository) -> None:
+        presigned = await repo.create_upload_url("file-1", "application/pdf", 60)
+
+        url = urlparse(presigned.url)
+        assert presigned.method == "PUT"
+        assert url.path == "/files/file-1"
+        assert "X-Amz-Signature=" in url.query
+        assert "X-Amz-Expires=60" in url.query
+        assert presigned.headers == {"Content-Type": "application/pdf"}
+
+    async def test_upload_url_signs_metadata(
+        self, repo: MinioFileStorageRepository
+    ) -> None:
+        presigned = await repo.create_upload_url(
+            "file-1", "text/plain", 60, {"filename": "notes.txt"}
+        )
+
+        query = dict(parse_qsl(urlparse(presigned.url).query))
+        assert query["x-amz-meta-filename"] == "notes.txt"
+        # Signed after the metadata, so it cannot be altered
+        assert list(query)[-1] == "X-Amz-Signature"
+
+    async def test_uploaded_metadata_is_reported(
+        self, repo: MinioFileStorageRepository
+    ) -> None:
+        """A file uploaded through a presigned URL keeps its filename and
+        metadata, as Minio stores the signed x-amz-meta-* parameters."""
+        stored: dict[str, Object] = {}
+
+        def storage(request: httpx.Request) -> httpx.Response:
+            stored[request.url.path.rsplit("/", 1)[-1]] = Object(
+                "files",
+                "file-1",
+                last_modified=datetime.now(timezone.utc),
+                size=len(request.content),
+                content_type=request.headers["Content-Type"],
+                metadata={
+                    key.replace("x-amz-meta-", "X-Amz-Meta-").title(): value
+                    for key, value in request.url.params.items()
+                    if key.startswith("x-amz-meta-")
+                },
+            )
+            return httpx.Response(200)
+
+        client_repo = TemporalFileStorageRepository(
+            MagicMock(),
+            repo,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(storage)),
+        )
+        await client_repo.upload_file(
+            FileUploadArgs(
+                file_id="file-1",
+                filename="notes.txt",
+                data=b"hello storage",
+                content_type="text/plain",
+                metadata={"source": "upload"},
+            )
+        )
+        signing_client = repo._client
+        repo._client = MagicMock(wraps=signing_client)
+        repo._client.stat_object.side_effect = lambda bucket, name: stored[name]
+
+        metadata = await client_repo.get_file_metadata("file-1")
+
+        assert metadata is not None
+        assert metadata.filename == "notes.txt"
+        assert metadata.metadata == {"Filename": "notes.txt", "Source": "upload"}
+        assert metadata.size_bytes == len(b"hello storage")
+
+    async def test_create_download_url_for_missing_file(
+        self, repo: MinioFileStorageRepository
+    ) -> None:
+        repo._client = MagicMock()
+        repo._client.stat_object.side_effect = S3Error(
+            code="NoSuchKey",
+            message="missing",
+            resource="file-1",
+            request_id="req",
+            host_id="host",
+            response=MagicMock(),
+        )
+
+        assert await repo.create_download_url("file-1") is None
@@ -3,23 +3,47 @@ Temporal worker for julee domain workflows and activities.
 
 This worker runs workflows and activities for document processing,
 assembly, and knowledge service operations within the julee domain.
+
+Work is split across worker pools, each polling its own task queue:
+
+- workflow: both workflows plus the local activities they call
+- storage: MinIO and remote schema repository activities
+- knowledge_service: LLM-bound knowledge service activities
+
+so slow LLM calls cannot starve fast storage activities. Pools are sized
+from the environment, and JULEE_WORKER_PROCESSES starts several worker
+processes on one host. Setting JULEE_WORKER_METRICS_PORT exports Temporal
+and knowledge service rate limiter metrics to Prometheus, one port per
+worker process starting at the given one.
 """
 
 import asyncio
 import logging
+import multiprocessing
 import os
+import signal
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
 
 from minio import Minio
 from temporalio.client import Client
+from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 from temporalio.service import RPCError
 from temporalio.worker import Worker
 
 from julee.contrib.ceap.apps.worker import (
+    BatchExtractAssembleWorkflow,
     ExtractAssembleWorkflow,
+    ExtractQueryGroupWorkflow,
     ValidateDocumentWorkflow,
 )
 from julee.repositories.minio.client import MinioClient
 from julee.repositories.temporal.activities import (
+    TemporalHttpRemoteSchemaRepository,
     TemporalMinioAssemblyRepository,
     TemporalMinioAssemblySpecificationRepository,
     TemporalMinioDocumentPolicyValidationRepository,
@@ -28,14 +52,115 @@ from julee.repositories.temporal.activities import (
     TemporalMinioKnowledgeServiceQueryRepository,
     TemporalMinioPolicyRepository,
 )
+from julee.repositories.temporal.activity_names import STORAGE_TASK_QUEUE
 from julee.services.temporal.activities import (
     TemporalKnowledgeService,
 )
+from julee.services.temporal.activity_names import KNOWLEDGE_SERVICE_TASK_QUEUE
 from julee.util.repos.temporal.data_converter import temporal_data_converter
-from julee.util.temporal.activities import collect_activities_from_instances
+from julee.util.temporal.activities import (
+    ExecutionMode,
+    collect_activities_from_instances,
+)
 
 logger = logging.getLogger(__name__)
 
+WORKFLOW_TASK_QUEUE = "julee-extract-assemble-queue"
+
+
+class WorkerPool(str, Enum):
+    """Worker pools, each serving one task queue."""
+
+    WORKFLOW = "workflow"
+    STORAGE = "storage"
+    KNOWLEDGE_SERVICE = "knowledge_service"
+
+
+@dataclass(frozen=True)
+class WorkerPoolConfig:
+    """Task queue and concurrency limits for one worker pool."""
+
+    pool: WorkerPool
+    task_queue: str
+    max_concurrent_activities: int
+    max_concurrent_local_activities: int
+    max_concurrent_workflow_tasks: int
+
+
+# Defaults: storage calls are short and plentiful, LLM calls are long and
+# rate limited, so the knowledge service pool is kept small.
+_POOL_DEFAULTS: dict[WorkerPool, tuple[str, int, int, int]] = {
+    WorkerPool.WORKFLOW: (WORKFLOW_TASK_QUEUE, 1, 50, 50),
+    WorkerPool.STORAGE: (STORAGE_TASK_QUEUE, 100, 1, 1),
+    WorkerPool.KNOWLEDGE_SERVICE: (KNOWLEDGE_SERVICE_TASK_QUEUE, 8, 1, 1),
+}
+
+
+def _env_int(environ: Mapping[str, str], name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    raw = environ.get(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(f"Invalid integer for {name}: {raw!r}, using {default}")
+        return default
+    if value < 1:
+        logger.warning(f"{name} must be at least 1, using {default}")
+        return default
+    return value
+
+
+def load_pool_configs(
+    environ: Mapping[str, str] = os.environ,
+) -> list[WorkerPoolConfig]:
+    """Build worker pool configs from the environment.
+
+    JULEE_WORKER_POOLS selects which pools this process runs (comma
+    separated, default all). Each pool reads
+    JULEE_<POOL>_MAX_CONCURRENT_ACTIVITIES,
+    JULEE_<POOL>_MAX_CONCURRENT_LOCAL_ACTIVITIES and
+    JULEE_<POOL>_MAX_CONCURRENT_WORKFLOW_TASKS, where <POOL> is the upper
+    case pool name (e.g. JULEE_STORAGE_MAX_CONCURRENT_ACTIVITIES).
+    """
+    selected = environ.get("JULEE_WORKER_POOLS", "")
+    if selected.strip():
+        try:
+            pools = [WorkerPool(name.strip()) for name in selected.split(",")]
+        except ValueError as e:
+            valid = ", ".join(p.value for p in WorkerPool)
+            raise ValueError(
+                f"Invalid JULEE_WORKER_POOLS={selected!r}; valid pools: {valid}"
+            ) from e
+    else:
+        pools = list(WorkerPool)
+
+    configs = []
+    for pool in dict.fromkeys(pools):
+        task_queue, activities, local_activities, workflow_tasks = _POOL_DEFAULTS[pool]
+        prefix = f"JULEE_{pool.value.upper()}"
+        configs.append(
+            WorkerPoolConfig(
+                pool=pool,
+                task_queue=task_queue,
+                max_concurrent_activities=_env_int(
+                    environ, f"{prefix}_MAX_CONCURRENT_ACTIVITIES", activities
+                ),
+                max_concurrent_local_activities=_env_int(
+                    environ,
+                    f"{prefix}_MAX_CONCURRENT_LOCAL_ACTIVITIES",
+                    local_activities,
+                ),
+                max_concurrent_workflow_tasks=_env_int(
+                    environ,
+                    f"{prefix}_MAX_CONCURRENT_WORKFLOW_TASKS",
+                    workflow_tasks,
+                ),
+            )
+        )
+    return configs
+
 
 def setup_logging() -> None:
     """Configure logging based on environment variables"""
@@ -62,6 +187,27 @@ def setup_logging() -> None:
     )
 
 
+def configure_metrics(environ: Mapping[str, str], process_index: int = 0) -> None:
+    """Export runtime metrics to Prometheus if JULEE_WORKER_METRICS_PORT is set.
+
+    Must run before the Temporal client and activity instances are created,
+    as both take their metric meter from the default runtime.
+    """
+    base_port = _env_int(environ, "JULEE_WORKER_METRICS_PORT", 0)
+    if not base_port:
+        return
+    bind_address = f"0.0.0.0:{base_port + process_index}"
+    Runtime.set_default(
+        Runtime(
+            telemetry=TelemetryConfig(
+                metrics=PrometheusConfig(bind_address=bind_address)
+            )
+        ),
+        error_if_already_set=False,
+    )
+    logger.info("Exporting worker metrics", extra={"bind_address": bind_address})
+
+
 async def get_temporal_client_with_retries(
     endpoint: str, attempts: int = 10, delay: int = 5
 ) -> Client:
@@ -117,16 +263,114 @@ async def get_temporal_client_with_retries(
     raise RuntimeError("Failed to connect to Temporal after all attempts")
 
 
-async def run_worker() -> None:
-    """Run the Temporal worker for julee domain"""
+def create_activity_instances(
+    minio_client: MinioClient,
+) -> dict[WorkerPool, list[Any]]:
+    """Instantiate the activity implementations served by each pool."""
+    logger.debug("Creating Temporal Activity repository implementations")
+    temporal_document_repo = TemporalMinioDocumentRepository(client=minio_client)
+
+    storage_instances = [
+        TemporalMinioAssemblyRepository(client=minio_client),
+        TemporalMinioAssemblySpecificationRepository(client=minio_client),
+        temporal_document_repo,
+        TemporalMinioKnowledgeServiceConfigRepository(client=minio_client),
+        TemporalMinioKnowledgeServiceQueryRepository(client=minio_client),
+        TemporalMinioPolicyRepository(client=minio_client),
+        TemporalMinioDocumentPolicyValidationRepository(client=minio_client),
+        TemporalHttpRemoteSchemaRepository(),
+    ]
+
+    # Create temporal knowledge service for activity registration
+    # Pass the document repository for dependency injection
+    temporal_knowledge_service = TemporalKnowledgeService(
+        document_repo=temporal_document_repo
+    )
+
+    return {
+        # Local activities execute on the worker that runs the workflow
+        WorkerPool.WORKFLOW: storage_instances,
+        WorkerPool.STORAGE: storage_instances,
+        WorkerPool.KNOWLEDGE_SERVICE: [temporal_knowledge_service],
+    }
+
+
+def build_workers(
+    client: Client,
+    configs: list[WorkerPoolConfig],
+    instances: Mapping[WorkerPool, list[Any]],
+) -> list[Worker]:
+    """Create one Temporal worker per configured pool."""
+    workers = []
+    for config in configs:
+        workflows: list[type] = []
+        if config.pool is WorkerPool.WORKFLOW:
+            workflows = [
+                BatchExtractAssembleWorkflow,
+                ExtractAssembleWorkflow,
+                ExtractQueryGroupWorkflow,
+                ValidateDocumentWorkflow,
+            ]
+            modes = [ExecutionMode.LOCAL_ACTIVITY]
+        else:
+            modes = [ExecutionMode.ACTIVITY]
+
+        # Automatically collect activities from decorated instances, using
+        # the execution modes the workflow proxies declared
+        activities = collect_activities_from_instances(
+            *instances.get(config.pool, []), modes=modes
+        )
+
+        logger.info(
+            "Creating Temporal worker",
+            extra={
+                "pool": config.pool.value,
+                "task_queue": config.task_queue,
+                "workflow_count": len(workflows),
+                "activity_count": len(activities),
+                "max_concurrent_activities": config.max_concurrent_activities,
+                "max_concurrent_local_activities": (
+                    config.max_concurrent_local_activities
+                ),
+                "max_concurrent_workflow_tasks": (config.max_concurrent_workflow_tasks),
+                "data_converter_type": type(client.data_converter).__name__,
+            },
+        )
+
+        workers.append(
+            Worker(
+                client,
+                task_queue=config.task_queue,
+                workflows=workflows,
+                activities=activities,  # type: ignore[arg-type]
+                max_concurrent_activities=config.max_concurrent_activities,
+                max_concurrent_local_activities=(
+                    config.max_concurrent_local_activities
+                ),
+                max_concurrent_workflow_tasks=config.max_concurrent_workflow_tasks,
+            )
+        )
+    return workers
+
+
+async def run_worker(process_index: int = 0) -> None:
+    """Run the Temporal worker pools for julee domain"""
     # Setup logging first
     setup_logging()
+    configure_metrics(os.environ, process_index)
+
+    # CPU-bound steps inside activities (e.g. content hashing) are offloaded
+    # with asyncio.to_thread, which uses the loop's default executor
+    cpu_threads = _env_int(os.environ, "JULEE_WORKER_CPU_THREADS", os.cpu_count() or 4)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=cpu_threads, thread_name_prefix="julee-cpu")
+    )
 
     # Connect to Temporal server using environment variable
     temporal_endpoint = os.environ.get("TEMPORAL_ENDPOINT", "localhost:7234")
     logger.info(
         "Starting julee Temporal worker",
-        extra={"temporal_endpoint": temporal_endpoint},
+        extra={"temporal_endpoint": temporal_endpoint, "cpu_threads": cpu_threads},
     )
 
     client = await get_temporal_client_with_retries(temporal_endpoint)
@@ -144,69 +388,61 @@ async def run_worker() -> None:
         secure=False,
     )
 
-    # Instantiate temporal repository classes for activity registration
-    logger.debug("Creating Temporal Activity repository implementations")
-    temporal_assembly_repo = TemporalMinioAssemblyRepository(client=minio_client)
-    temporal_assembly_spec_repo = TemporalMinioAssemblySpecificationRepository(
-        client=minio_client
-    )
-    temporal_document_repo = TemporalMinioDocumentRepository(client=minio_client)
-    temporal_knowledge_config_repo = TemporalMinioKnowledgeServiceConfigRepository(
-        client=minio_client
-    )
-    temporal_knowledge_query_repo = TemporalMinioKnowledgeServiceQueryRepository(
-        client=minio_client
+    workers = build_workers(
+        client, load_pool_configs(), create_activity_instances(minio_client)
     )
 
-    # Create policy repositories for validation workflow
-    temporal_policy_repo = TemporalMinioPolicyRepository(client=minio_client)
-    temporal_document_policy_validation_repo = (
-        TemporalMinioDocumentPolicyValidationRepository(client=minio_client)
+    logger.info(
+        "Starting julee worker execution",
+        extra={"worker_count": len(workers)},
     )
 
-    # Create temporal knowledge service for activity registration
-    # Pass the document repository for dependency injection
-    temporal_knowledge_service = TemporalKnowledgeService(
-        document_repo=temporal_document_repo
-    )
+    # Run all pools until one of them stops
+    await asyncio.gather(*(worker.run() for worker in workers))
 
-    # Automatically collect all activities from decorated instances
-    # This uses the same _discover_protocol_methods that the decorator uses,
-    # ensuring we never miss activities and eliminating boilerplate
-    activities = collect_activities_from_instances(
-        temporal_assembly_repo,
-        temporal_assembly_spec_repo,
-        temporal_document_repo,
-        temporal_knowledge_config_repo,
-        temporal_knowledge_query_repo,
-        temporal_policy_repo,
-        temporal_document_policy_validation_repo,
-        temporal_knowledge_service,
-    )
 
-    logger.info(
-        "Creating Temporal worker for julee domain",
-        extra={
-            "task_queue": "julee-extract-assemble-queue",
-            "workflow_count": 2,
-            "activity_count": len(activities),
-            "data_converter_type": type(client.data_converter).__name__,
-        },
-    )
+def _run_worker_process(process_index: int = 0) -> None:
+    """Entry point for a single worker process."""
+    asyncio.run(run_worker(process_index))
 
-    # Create worker with workflow retry policy
-    worker = Worker(
-        client,
-        task_queue="julee-extract-assemble-queue",
-        workflows=[ExtractAssembleWorkflow, ValidateDocumentWorkflow],
-        activities=activities,  # type: ignore[arg-type]
-    )
 
-    logger.info("Starting julee worker execution")
+def main() -> None:
+    """Run the worker, forking JULEE_WORKER_PROCESSES processes if set."""
+    processes = _env_int(os.environ, "JULEE_WORKER_PROCESSES", 1)
+    if processes == 1:
+        _run_worker_process()
+        return
+
+    # Spawn rather than fork so each child builds its own event loop and
+    # Temporal client from scratch
+    context = multiprocessing.get_context("spawn")
+    children = [
+        context.Process(target=_run_worker_process, args=(i,), name=f"julee-worker-{i}")
+        for i in range(processes)
+    ]
+    for child in children:
+        child.start()
+
+    def terminate_children(signum: int, frame: Any) -> None:
+        for child in children:
+            if child.is_alive():
+                child.terminate()
+
+    signal.signal(signal.SIGTERM, terminate_children)
+    signal.signal(signal.SIGINT, terminate_children)
+
+    # If any worker exits, stop the rest so the supervisor can restart us
+    exit_code = 0
+    while children:
+        for child in list(children):
+            child.join(timeout=1.0)
+            if child.exitcode is not None:
+                children.remove(child)
+                exit_code = exit_code or child.exitcode
+                terminate_children(signal.SIGTERM, None)
 
-    # Run the worker
-    await worker.run()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
-    asyncio.run(run_worker())
+    main()